@@ -886,6 +886,24 @@ function Add-DefaultEnvComments {
         '# AGILAB_POOL_MAX_WORKERS=""',
         '# AGILAB_POOL_ITEM_TIMEOUT=""',
         '# AGILAB_POOL_EXECUTOR="auto"',
+        '# AGILAB_POOL_RESULT_TRANSPORT="pipe"',
+        '# AGILAB_POOL_RESULT_DIR=""',
+        '# AGILAB_POOL_STREAM_ITEMS=""',
+        '# AGILAB_POOL_BATCHING="fixed"',
+        '# AGILAB_POOL_ITEM_MEMORY_MB=""',
+        '# AGILAB_POOL_MEMORY_LIMIT_MB=""',
+        '# AGILAB_POOL_ITEM_RETRIES="0"',
+        '# AGILAB_POOL_RETRY_BACKOFF="1.0"',
+        '# AGILAB_POOL_CHECKPOINT_DIR=""',
+        '# AGILAB_PARTITION_TIME_BUDGET=""',
+        '# AGILAB_DISPATCH_MODE="static"',
+        '# AGILAB_DASK_KEEPALIVE_TTL="0"',
+        '# AGILAB_WORKER_EVENTS="1"',
+        '# AGILAB_DELTA_DEPLOY="1"',
+        '# AGILAB_SERVICE_QUEUE_NOTIFY="1"',
+        '# AGILAB_SERVICE_CLAIM_BATCH="1"',
+        '# AGILAB_SERVICE_PRIORITY_AGING_SECONDS="30"',
+        '# AGILAB_SERVICE_HEARTBEAT_INTERVAL="1"',
         '# AGILAB_RUNTIME_AUTO_INSTALL="0"',
         '# AGILAB_DISABLE_BACKGROUND_SERVICES="0"',
         '# AGILAB_DISABLE_HARDWARE_PROBES="0"',
@@ -899,6 +917,11 @@ function Add-DefaultEnvComments {
         '# AGILAB_NOTEBOOK_EXPORT_ALLOW_WORKSPACE_SIBLINGS="0"',
         '# AGILAB_NOTEBOOK_REUSE_REFRESH_SECONDS="8"',
         '# AGILAB_PIPELINE_LOCK_TTL_SEC="21600"',
+        '# AGILAB_RUNNER_STATE_JOURNAL="0"',
+        '# AGILAB_RUNNER_STATE_COMPACT_EVERY="64"',
+        '# AGILAB_DAG_STAGE_CACHE="0"',
+        '# AGILAB_DAG_STAGE_CACHE_MAX_MB="2048"',
+        '# AGILAB_DAG_STAGE_RUNNER_POOL="0"',
         '# AGILAB_PREVIEW_MAX_SEARCH_FILES="1000"',
         '# AGILAB_PREVIEW_MAX_FILE_BYTES="26214400"',
         '# AGILAB_GENERATED_CODE_SANDBOX=""',
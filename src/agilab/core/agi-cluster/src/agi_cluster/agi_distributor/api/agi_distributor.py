@@ -48,6 +48,8 @@ from agi_cluster.agi_distributor import (
     uv_source_support,
 )
 from agi_cluster.agi_distributor.run_request_support import RunRequest
+from agi_cluster.agi_distributor.runtime import worker_progress_support
+from agi_cluster.agi_distributor.service.service_autoscale_support import ServiceAutoscalePolicy
 
 
 logger = logging.getLogger(__name__)
@@ -177,6 +179,7 @@ class AGI:
     _capacity_data_file: Optional[Path] = None
     _capacity_model_file: Optional[Path] = None
     _capacity_predictor: Optional[Any] = None
+    _hardware_profile: Dict[str, Dict[str, Any]] = {}
     _worker_default: Dict[str, int] = _workers_default
     _run_time: Dict[str, Any] = {}
     _run_type: Optional[str] = None
@@ -184,9 +187,13 @@ class AGI:
     _target_built: Optional[Any] = None
     _module_to_clean: List[str] = []
     _ssh_connections = {}
+    _deploy_transfer_stats: Dict[str, Dict[str, Any]] = {}
     _best_mode: Dict[str, Any] = {}
     _work_plan: Optional[Any] = None
     _work_plan_metadata: Optional[Any] = None
+    _pull_dispatch_history: Optional[List[Dict[str, Any]]] = None
+    _warm_cluster: Optional[Any] = None
+    _worker_progress: Optional[Any] = None
     debug: Optional[bool] = None  # Cache with default local IPs
     _dask_log_level: str = os.environ.get("AGI_DASK_LOG_LEVEL", "critical").strip()
     env: Optional[AgiEnv] = None
@@ -213,6 +220,8 @@ class AGI:
     _service_worker_args: Dict[str, Any] = {}
     _service_cleanup_unproven: bool = False
     _service_runtime_shutdown_proven: bool = False
+    _service_autoscale_policy: Optional[Any] = None
+    _service_autoscale_state: Dict[str, Any] = {}
     # ``AGI`` keeps a class-based compatibility surface.  These fields are
     # managed by lifecycle_guard_support so concurrent event loops/threads and
     # separate processes cannot cross-wire that shared mutable state.
@@ -394,6 +403,10 @@ class AGI:
     def _service_queue_counts() -> Dict[str, int]:
         return service_runtime_support.service_queue_counts(AGI)
 
+    @staticmethod
+    def _service_queue_latency() -> Dict[str, Any]:
+        return service_runtime_support.service_queue_latency(AGI)
+
     @staticmethod
     def _recover_orphaned_service_tasks() -> Dict[str, int]:
         return service_runtime_support.recover_orphaned_service_tasks(AGI)
@@ -481,6 +494,14 @@ class AGI:
             client,
         )
 
+    @staticmethod
+    def _service_start_local_workers(count: int) -> List[str]:
+        return runtime_distribution_support.start_local_workers(AGI, count, log=logger)
+
+    @staticmethod
+    async def _service_autoscale(env: AgiEnv, client: Client) -> Dict[str, Any]:
+        return await service_runtime_support.service_autoscale(AGI, env, client, log=logger)
+
     @staticmethod
     async def serve(
             env: AgiEnv,
@@ -502,6 +523,7 @@ class AGI:
             cleanup_failed_max_files: Optional[int] = None,
             cleanup_heartbeat_max_files: Optional[int] = None,
             health_output_path: Optional[Union[str, Path]] = None,
+            autoscale: Optional[Union[ServiceAutoscalePolicy, Dict[str, Any]]] = None,
             **args: Any,
     ) -> Dict[str, Any]:
         command = (action or "start").lower()
@@ -534,6 +556,7 @@ class AGI:
                     cleanup_failed_max_files=cleanup_failed_max_files,
                     cleanup_heartbeat_max_files=cleanup_heartbeat_max_files,
                     health_output_path=health_output_path,
+                    autoscale=autoscale,
                     background_job_manager_factory=bg.BackgroundJobManager,
                     wait_fn=wait,
                     log=logger,
@@ -583,6 +606,8 @@ class AGI:
             work_plan_metadata: Optional[Any] = None,
             task_id: Optional[str] = None,
             task_name: Optional[str] = None,
+            task_priority: int = 0,
+            task_deadline: Optional[Any] = None,
             **args: Any,
     ) -> Dict[str, Any]:
         effective_env = env or AGI.env
@@ -604,6 +629,8 @@ class AGI:
                     work_plan_metadata=work_plan_metadata,
                     task_id=task_id,
                     task_name=task_name,
+                    task_priority=task_priority,
+                    task_deadline=task_deadline,
                     **args,
                 )
             except BaseException:
@@ -619,6 +646,60 @@ class AGI:
             operation.retain_for_service()
             return result
 
+    @staticmethod
+    async def submit_many(
+            requests: List[Dict[str, Any]],
+            env: Optional[AgiEnv] = None,
+            workers: Optional[Dict[str, int]] = None,
+            cleanup: bool = False,
+    ) -> Dict[str, Any]:
+        """Queue several service requests, planning once per distinct args.
+
+        Each request holds the keyword arguments of :meth:`submit`. Done and
+        failed artifacts are only cleaned up when ``cleanup`` is true.
+        """
+        effective_env = env or AGI.env
+        if effective_env is None:
+            raise ValueError("env is required when AGI has not been initialised yet")
+        operation = lifecycle_guard_support.LifecycleOperation(
+            AGI,
+            effective_env,
+            "submit",
+            service_command=True,
+        )
+        async with operation:
+            try:
+                result = await service_runtime_support.submit_many(
+                    AGI,
+                    list(requests),
+                    env=env,
+                    workers=workers,
+                    cleanup=cleanup,
+                )
+            except BaseException:
+                if (
+                    AGI._service_cleanup_unproven
+                    or AGI._service_futures
+                    or AGI._service_workers
+                    or AGI._dask_client is not None
+                    or bool(getattr(getattr(AGI, "_jobs", None), "running", None))
+                ):
+                    operation.retain_for_service_on_error()
+                raise
+            operation.retain_for_service()
+            return result
+
+    @staticmethod
+    def worker_progress(env: Optional[AgiEnv] = None, since: int = 0) -> Optional[Dict[str, Any]]:
+        """Return the live worker log/progress snapshot of the current or last DASK run.
+
+        Without ``env`` the snapshot of this process's dispatch is returned;
+        with ``env`` the last ``worker_progress.json`` written for it is read,
+        which works from another process. Only log records whose ``seq`` is
+        greater than ``since`` are included.
+        """
+        return worker_progress_support.worker_progress(AGI, env, since=since)
+
     @staticmethod
     async def _benchmark(
             env: AgiEnv,
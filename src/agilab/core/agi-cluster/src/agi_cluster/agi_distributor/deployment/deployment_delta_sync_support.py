@@ -0,0 +1,226 @@
+"""Content-addressed delta upload of worker artifacts to remote nodes.
+
+``deploy_remote_worker`` ships the worker egg (and, in source environments,
+the ``agi_env``/``agi_node`` wheels) to every remote node. Instead of one
+``scp`` process per batch and a full re-send on every install, the artifacts
+are uploaded over the pooled asyncssh connection (``get_ssh_connection``)
+with SFTP, and only when the node does not already hold the same content.
+
+Each worker environment keeps a manifest, ``<wenv>/.agilab-deploy-manifest.json``,
+mapping the remote path of every uploaded artifact to its SHA-256 and size.
+A file is skipped when the manifest entry matches the local digest and the
+remote file still has the recorded size. Local digests are cached per
+``(path, size, mtime)`` so a redeploy to many nodes hashes each artifact once.
+
+Set ``AGILAB_DELTA_DEPLOY=0`` to always send with ``scp``; SFTP failures also
+fall back to ``scp``. Transfer counters are kept per node in
+``agi_cls._deploy_transfer_stats`` and, with ``AGILAB_PERF_TRACE=1``, added to
+the deploy timing trace under ``remote_transfers``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+import asyncssh
+
+from agi_cluster.agi_distributor.deployment.deployment_local_support import PERF_TRACE_ENV
+from agi_cluster.agi_distributor.deployment.deployment_stage_cache_support import (
+    _deploy_path_key,
+    _deploy_timing_trace_path,
+    _env_truthy,
+    _env_value,
+    _record_deploy_transfer_trace,
+)
+
+logger = logging.getLogger(__name__)
+
+DELTA_DEPLOY_ENV = "AGILAB_DELTA_DEPLOY"
+DELTA_MANIFEST_SCHEMA = "agilab-deploy-manifest-v1"
+DELTA_MANIFEST_FILENAME = ".agilab-deploy-manifest.json"
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+_DISABLED_VALUES = {"0", "false", "no", "off"}
+_SFTP_EXCEPTIONS = (asyncssh.Error, OSError)
+
+# Resolved local path -> (size, mtime_ns, sha256).
+_DIGEST_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def delta_deploy_enabled(envars: Any) -> bool:
+    raw = _env_value(envars, DELTA_DEPLOY_ENV)
+    return raw is None or raw.lower() not in _DISABLED_VALUES
+
+
+def file_digest(path: Path) -> dict[str, Any]:
+    """Return ``{"sha256", "size"}`` of ``path``, reusing the digest of an unchanged file."""
+    stat_result = path.stat()
+    key = _deploy_path_key(path)
+    cached = _DIGEST_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat_result.st_size, stat_result.st_mtime_ns):
+        return {"sha256": cached[2], "size": stat_result.st_size}
+    digest = hashlib.sha256()
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    sha256 = digest.hexdigest()
+    _DIGEST_CACHE[key] = (stat_result.st_size, stat_result.st_mtime_ns, sha256)
+    return {"sha256": sha256, "size": stat_result.st_size}
+
+
+async def _read_remote_manifest(sftp: Any, path: PurePosixPath) -> dict[str, dict[str, Any]]:
+    try:
+        async with sftp.open(path.as_posix(), "r") as stream:
+            payload = json.loads(await stream.read())
+    except (asyncssh.SFTPError, OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema") != DELTA_MANIFEST_SCHEMA:
+        return {}
+    files = payload.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {str(name): dict(entry) for name, entry in files.items() if isinstance(entry, dict)}
+
+
+async def _write_remote_manifest(
+    sftp: Any,
+    path: PurePosixPath,
+    files: dict[str, dict[str, Any]],
+) -> None:
+    # A torn manifest fails to parse and only costs a full re-send next time.
+    payload = {"schema": DELTA_MANIFEST_SCHEMA, "files": files}
+    async with sftp.open(path.as_posix(), "w") as stream:
+        await stream.write(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+async def _remote_size(sftp: Any, path: str) -> int | None:
+    try:
+        attrs = await sftp.stat(path)
+    except asyncssh.SFTPError:
+        return None
+    return attrs.size
+
+
+async def sync_remote_files(
+    agi_cls: Any,
+    ip: str,
+    transfers: list[tuple[Path, PurePosixPath]],
+    *,
+    manifest_path: PurePosixPath,
+    log: Any = logger,
+) -> dict[str, Any]:
+    """Upload the ``(local file, remote directory)`` pairs ``ip`` does not already hold."""
+    started_at = time.perf_counter()
+    stats: dict[str, Any] = {
+        "files_sent": 0,
+        "files_skipped": 0,
+        "bytes_sent": 0,
+        "bytes_skipped": 0,
+    }
+    async with agi_cls.get_ssh_connection(ip) as conn:
+        async with conn.start_sftp_client() as sftp:
+            manifest = await _read_remote_manifest(sftp, manifest_path)
+            created_dirs: set[str] = set()
+            for local_path, remote_dir in transfers:
+                digest = file_digest(local_path)
+                remote_path = (remote_dir / local_path.name).as_posix()
+                if (
+                    manifest.get(remote_path) == digest
+                    and await _remote_size(sftp, remote_path) == digest["size"]
+                ):
+                    stats["files_skipped"] += 1
+                    stats["bytes_skipped"] += digest["size"]
+                    continue
+                if remote_dir.as_posix() not in created_dirs:
+                    await sftp.makedirs(remote_dir.as_posix(), exist_ok=True)
+                    created_dirs.add(remote_dir.as_posix())
+                log.info(f"[{ip}] sftp {local_path.name} -> {remote_path}")
+                await sftp.put(str(local_path), remote_path)
+                manifest[remote_path] = digest
+                stats["files_sent"] += 1
+                stats["bytes_sent"] += digest["size"]
+            await _write_remote_manifest(sftp, manifest_path, manifest)
+    stats["seconds"] = time.perf_counter() - started_at
+    return stats
+
+
+def record_transfer_stats(agi_cls: Any, env: Any, ip: str, stats: dict[str, Any]) -> None:
+    stats_by_ip = getattr(agi_cls, "_deploy_transfer_stats", None)
+    if not isinstance(stats_by_ip, dict):
+        stats_by_ip = {}
+        agi_cls._deploy_transfer_stats = stats_by_ip
+    stats_by_ip[ip] = dict(stats)
+    wenv_abs = getattr(env, "wenv_abs", None)
+    if wenv_abs and _env_truthy(getattr(env, "envars", {}), PERF_TRACE_ENV):
+        _record_deploy_transfer_trace(_deploy_timing_trace_path(Path(wenv_abs)), ip, stats)
+
+
+async def send_worker_artifacts(
+    agi_cls: Any,
+    ip: str,
+    env: Any,
+    batches: list[tuple[list[Path], Path]],
+    *,
+    log: Any = logger,
+) -> None:
+    """Send each ``(files, remote directory)`` batch, skipping content ``ip`` already has."""
+    if delta_deploy_enabled(getattr(env, "envars", {})):
+        transfers = [
+            (Path(local_path), PurePosixPath(Path(remote_dir).as_posix()))
+            for files, remote_dir in batches
+            for local_path in files
+        ]
+        manifest_path = PurePosixPath(env.wenv_rel.as_posix()) / DELTA_MANIFEST_FILENAME
+        try:
+            stats = await sync_remote_files(
+                agi_cls, ip, transfers, manifest_path=manifest_path, log=log
+            )
+        except _SFTP_EXCEPTIONS as exc:
+            log.warning("[%s] SFTP delta deploy failed (%s); falling back to scp.", ip, exc)
+        else:
+            log.info(
+                "[%s] delta deploy: sent %d file(s) (%d bytes), skipped %d (%d bytes) in %.2fs",
+                ip,
+                stats["files_sent"],
+                stats["bytes_sent"],
+                stats["files_skipped"],
+                stats["bytes_skipped"],
+                stats["seconds"],
+            )
+            record_transfer_stats(agi_cls, env, ip, stats)
+            return
+
+    started_at = time.perf_counter()
+    sent_bytes = 0
+    for files, remote_dir in batches:
+        await agi_cls.send_files(env, ip, files, remote_dir)
+        sent_bytes += sum(Path(local_path).stat().st_size for local_path in files)
+    record_transfer_stats(
+        agi_cls,
+        env,
+        ip,
+        {
+            "files_sent": sum(len(files) for files, _ in batches),
+            "files_skipped": 0,
+            "bytes_sent": sent_bytes,
+            "bytes_skipped": 0,
+            "seconds": time.perf_counter() - started_at,
+        },
+    )
+
+
+__all__ = [
+    "DELTA_DEPLOY_ENV",
+    "DELTA_MANIFEST_FILENAME",
+    "DELTA_MANIFEST_SCHEMA",
+    "delta_deploy_enabled",
+    "file_digest",
+    "record_transfer_stats",
+    "send_worker_artifacts",
+    "sync_remote_files",
+]
@@ -57,6 +57,7 @@ def reset_deploy_state(agi_cls: Any) -> None:
     agi_cls._install_done_local = False
     agi_cls._install_done = False
     agi_cls._worker_init_error = False
+    agi_cls._deploy_transfer_stats = {}
 
 
 async def deploy_application(
@@ -13,6 +13,7 @@ from typing import Any, Callable, Union
 from asyncssh.process import ProcessError
 
 from agi_cluster.agi_distributor import deployment_dask_support
+from agi_cluster.agi_distributor.deployment import deployment_delta_sync_support
 from agi_cluster.agi_distributor.deployment.deployment_build_support import (
     _latest_glob_match as _latest_artifact_match,
     _resolved_cython_directives_spec,
@@ -817,10 +818,17 @@ async def deploy_remote_worker(
         dist_remote = wenv_rel / "dist"
         log.info(f"mkdir {dist_remote}")
         await agi_cls.exec_ssh(ip, f"mkdir -p {_remote_arg(dist_remote)}")
-        await agi_cls.send_files(env, ip, [egg_file], wenv_rel)
-        await agi_cls.send_files(env, ip, [node_whl, env_whl], dist_remote)
+        await deployment_delta_sync_support.send_worker_artifacts(
+            agi_cls,
+            ip,
+            env,
+            [([egg_file], wenv_rel), ([node_whl, env_whl], dist_remote)],
+            log=log,
+        )
     else:
-        await agi_cls.send_files(env, ip, [egg_file], wenv_rel)
+        await deployment_delta_sync_support.send_worker_artifacts(
+            agi_cls, ip, env, [([egg_file], wenv_rel)], log=log
+        )
         env_whl = None
         node_whl = None
 
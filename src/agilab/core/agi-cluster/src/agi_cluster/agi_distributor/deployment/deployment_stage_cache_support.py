@@ -119,6 +119,25 @@ def _write_deploy_timing_trace(
         return
 
 
+def _record_deploy_transfer_trace(path: Path, ip: str, stats: dict[str, Any]) -> None:
+    """Merge the artifact transfer counters of remote node ``ip`` into the trace."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        payload = {}
+    if not isinstance(payload, dict) or payload.get("schema") != DEPLOY_TIMING_TRACE_SCHEMA:
+        payload = {"schema": DEPLOY_TIMING_TRACE_SCHEMA, "stages": [], "results": {}}
+    transfers = payload.get("remote_transfers")
+    if not isinstance(transfers, dict):
+        transfers = {}
+    transfers[ip] = dict(stats)
+    payload["remote_transfers"] = transfers
+    try:
+        _atomic_write_json(path, payload)
+    except OSError:
+        return
+
+
 def _deploy_path_key(path: Path) -> str:
     try:
         return path.expanduser().resolve(strict=False).as_posix()
@@ -16,6 +16,7 @@ import polars as pl
 from agi_env import AgiEnv
 from agi_cluster.agi_distributor import runtime_misc_support
 from agi_cluster.agi_distributor.run_request_support import RunRequest
+from agi_cluster.agi_distributor.runtime import hardware_profile_support, online_capacity_support
 from agi_cluster.agi_distributor.runtime.worker_endpoint_support import worker_host
 from agi_node.agi_dispatcher.base_worker import BaseWorker
 
@@ -625,27 +626,69 @@ async def benchmark_dask_modes(
         await agi_cls._stop()
 
 
+def _pop_hardware_profiles(agi_cls: Any, gathered: Any, *, now: float) -> dict[str, dict[str, Any]]:
+    """Move worker microbenchmark results out of the feature rows, keyed by host."""
+    measured: dict[str, dict[str, Any]] = {}
+    for res in gathered:
+        for worker, info in res.items():
+            hardware = info.pop("hardware", None) if isinstance(info, dict) else None
+            if not isinstance(hardware, dict):
+                continue
+            ipport = str(worker).split("/")[-1]
+            profile = {**hardware, "measured_at": now, "worker": ipport}
+            transfer = hardware_profile_support.measure_transfer_mbps(agi_cls._dask_client, ipport)
+            if transfer is not None:
+                profile["transfer_mbps"] = transfer
+            measured[_worker_host(ipport)] = profile
+    return measured
+
+
 async def calibration(agi_cls: Any, log: Any = logger) -> None:
     now = time.time()
     if _restore_calibration_cache(agi_cls, now=now):
         log.info("Reusing cached worker capacity calibration.")
         return
 
+    env = getattr(agi_cls, "env", None)
+    profile_ttl = hardware_profile_support.resolve_profile_ttl(env)
+    profiles_path = hardware_profile_support.profile_path(env) if profile_ttl > 0 else None
+    profiles = hardware_profile_support.load_profiles(profiles_path)
+    hardware_workers = (
+        hardware_profile_support.stale_benchmark_workers(
+            [str(worker).split("/")[-1] for worker in (agi_cls._dask_workers or [])],
+            profiles,
+            now=now,
+            ttl=profile_ttl,
+        )
+        if profile_ttl > 0
+        else []
+    )
+
     def _collect_workers_info() -> Any:
-        return agi_cls._dask_client.gather(
+        gathered = agi_cls._dask_client.gather(
             [
                 agi_cls._dask_client.run(
                     BaseWorker._get_worker_info,
                     BaseWorker._worker_id,
+                    hardware_workers,
                     workers=agi_cls._dask_workers,
                 )
             ]
         )
+        measured = _pop_hardware_profiles(agi_cls, gathered, now=now)
+        profiles.update(measured)
+        if measured:
+            hardware_profile_support.save_profiles(profiles_path, profiles)
+        return gathered
 
     # The sync Dask client blocks the calling thread; keep the event loop free
     # for the asyncssh worker channels while calibration data is gathered.
     res_workers_info = await asyncio.to_thread(_collect_workers_info)
 
+    host_estimates = online_capacity_support.load_host_estimates(
+        getattr(agi_cls, "_capacity_data_file", None)
+    )
+
     infos = {}
     for res in res_workers_info:
         for worker, info in res.items():
@@ -674,16 +717,23 @@ async def calibration(agi_cls: Any, log: Any = logger) -> None:
                 host,
             )
             continue
-        values = [_feature_scalar(value) for value in info.values()]
-        if len(values) != 5:
+        features = [feature for feature in _CAPACITY_UPDATE_FEATURES[:-1] if feature in info]
+        if len(features) != len(info) or len(features) != 5:
             log.warning(
                 "Skipping capacity prediction for Dask worker %s: expected 5 feature values, got %s.",
                 ipport,
-                len(values),
+                len(info),
             )
             continue
-        data = np.array([[worker_count, *values]], dtype=float)
-        agi_cls._capacity[ipport] = agi_cls._capacity_predictor.predict(data)[0]
+        values = [_feature_scalar(info[feature]) for feature in features]
+        # Hosts seen by previous runs use their online estimate; the regressor
+        # only covers hosts without feedback yet.
+        estimate = host_estimates.get(host)
+        if estimate is not None:
+            agi_cls._capacity[ipport] = estimate
+        else:
+            data = np.array([[worker_count, *values]], dtype=float)
+            agi_cls._capacity[ipport] = agi_cls._capacity_predictor.predict(data)[0]
         info["label"] = agi_cls._capacity[ipport]
         workers_info[ipport] = info
 
@@ -708,6 +758,13 @@ async def calibration(agi_cls: Any, log: Any = logger) -> None:
             agi_cls.workers_info = {ipport: {"label": 1.0} for ipport in fallback_keys}
         agi_cls._capacity = {ipport: 1.0 for ipport in fallback_keys}
 
+    if profile_ttl > 0:
+        hosts = sorted({_worker_host(ipport) for ipport in agi_cls._capacity})
+        scores = hardware_profile_support.hardware_scores(profiles, hosts)
+        agi_cls._hardware_profile = {host: profiles[host] for host in hosts if host in profiles}
+        for ipport, pred_cap in list(agi_cls._capacity.items()):
+            agi_cls._capacity[ipport] = pred_cap * scores.get(_worker_host(ipport), 1.0)
+
     cap_min = min(agi_cls._capacity.values()) if agi_cls._capacity else 1.0
     workers_capacity = {}
     for ipport, pred_cap in agi_cls._capacity.items():
@@ -719,36 +776,47 @@ async def calibration(agi_cls: Any, log: Any = logger) -> None:
     _store_calibration_cache(agi_cls, now=now)
 
 
-def train_capacity(agi_cls: Any, train_home: Path, log: Any = logger) -> None:
+def train_capacity(agi_cls: Any, train_home: Path, log: Any = logger) -> float:
+    """Fit the fallback capacity regressor and return its holdout R².
+
+    The training set is the seed balancer CSV plus the bounded online history,
+    so the cost of a refit does not grow with the number of past runs.
+    """
     from sklearn.ensemble import RandomForestRegressor
     from sklearn.model_selection import train_test_split
 
     data_file = train_home / agi_cls._capacity_data_file
-    if data_file.exists():
-        balancer_csv = data_file
-    else:
+    history = online_capacity_support.OnlineCapacityModel.load(
+        online_capacity_support.history_path(data_file)
+    )
+    history_X, history_y = history.history()
+    if not data_file.exists() and not len(history_y):
         raise FileNotFoundError(data_file)
 
-    schema = {
-        "nb_workers": pl.Int64,
-        "ram_total": pl.Float64,
-        "ram_available": pl.Float64,
-        "cpu_count": pl.Float64,
-        "cpu_frequency": pl.Float64,
-        "network_speed": pl.Float64,
-        "label": pl.Float64,
-    }
-
-    df = pl.read_csv(
-        balancer_csv,
-        has_header=True,
-        skip_rows_after_header=2,
-        schema_overrides=schema,
-        ignore_errors=False,
-    )
-    columns = df.columns
-    X = df.select(columns[:-1]).to_numpy()
-    y = df.select(columns[-1]).to_numpy().ravel()
+    X_parts = [history_X]
+    y_parts = [history_y]
+    if data_file.exists():
+        schema = {
+            "nb_workers": pl.Int64,
+            "ram_total": pl.Float64,
+            "ram_available": pl.Float64,
+            "cpu_count": pl.Float64,
+            "cpu_frequency": pl.Float64,
+            "network_speed": pl.Float64,
+            "label": pl.Float64,
+        }
+        df = pl.read_csv(
+            data_file,
+            has_header=True,
+            skip_rows_after_header=2,
+            schema_overrides=schema,
+            ignore_errors=False,
+        )
+        columns = df.columns
+        X_parts.insert(0, df.select(columns[:-1]).to_numpy().astype(float))
+        y_parts.insert(0, df.select(columns[-1]).to_numpy().ravel().astype(float))
+    X = np.concatenate(X_parts)
+    y = np.concatenate(y_parts)
 
     X_train, X_test, y_train, y_test = train_test_split(
         X,
@@ -757,29 +825,26 @@ def train_capacity(agi_cls: Any, train_home: Path, log: Any = logger) -> None:
         random_state=42,
     )
     agi_cls._capacity_predictor = RandomForestRegressor().fit(X_train, y_train)
+    score = float(agi_cls._capacity_predictor.score(X_test, y_test))
 
     log.info(
         "AGI.balancer_train_mode - Accuracy of the prediction of the workers capacity = %s",
-        agi_cls._capacity_predictor.score(X_test, y_test),
+        score,
     )
 
     capacity_model = os.path.join(train_home, agi_cls._capacity_model_file)
     with open(capacity_model, "wb") as handle:
         pickle.dump(agi_cls._capacity_predictor, handle)
     runtime_misc_support.write_capacity_model_manifest(Path(capacity_model))
+    return score
 
 
-def update_capacity(agi_cls: Any) -> None:
+def update_capacity(
+    agi_cls: Any,
+    *,
+    refit_every: int = online_capacity_support.DEFAULT_REFIT_EVERY_ROWS,
+) -> None:
     workers_rt: dict[str, dict[str, Any]] = {}
-    balancer_cols = [
-        "nb_workers",
-        "ram_total",
-        "ram_available",
-        "cpu_count",
-        "cpu_frequency",
-        "network_speed",
-        "label",
-    ]
 
     for wrt in agi_cls._run_time:
         if isinstance(wrt, str):
@@ -797,8 +862,7 @@ def update_capacity(agi_cls: Any) -> None:
 
     if not workers_rt:
         # No per-worker run-time feedback was collected for this run; there is
-        # nothing to append to the balancer CSV, so skip the (expensive)
-        # RandomForest retrain instead of refitting on unchanged data.
+        # nothing to feed the online capacity model.
         return
 
     current_state = deepcopy(workers_rt)
@@ -814,32 +878,27 @@ def update_capacity(agi_cls: Any) -> None:
                     0.1 * worker_cap * delta / worker_rt / (len(current_state) - 1)
                 )
 
-    appended_rows = 0
+    data_file = Path(agi_cls._capacity_data_file)
+    model_path = online_capacity_support.history_path(data_file)
+    model = online_capacity_support.OnlineCapacityModel.load(model_path, refit_every=refit_every)
+    observed = 0
     for worker_name, data in workers_rt.items():
         del data["run_time"]
-        df = pl.DataFrame(data)
-        df = df[balancer_cols]
-
-        if df[0, -1] and df[0, -1] != float("inf"):
-            # Force UTF-8 so polars can re-read the CSV cross-platform; the
-            # system default on Windows is CP1252 which polars rejects.
-            with open(
-                agi_cls._capacity_data_file,
-                "a",
-                encoding="utf-8",
-                newline="",
-            ) as handle:
-                df.write_csv(
-                    handle,
-                    include_header=False,
-                    line_terminator="\r",
-                )
-            appended_rows += 1
+        label = data["label"]
+        if label and np.isfinite(label) and label > 0:
+            model.observe(_worker_host(worker_name), data)
+            observed += 1
         else:
             logger.warning(
                 "Skipping capacity update for %s: adjusted label is non-finite or non-positive.",
                 worker_name,
             )
 
-    if appended_rows:
-        agi_cls._train_capacity(Path(agi_cls.env.home_abs))
+    if not observed:
+        return
+    if model.refit_due():
+        # The refit reads the history from disk; persist the new rows first.
+        model.save(model_path)
+        model.mark_refit(agi_cls._train_capacity(Path(agi_cls.env.home_abs)))
+    model.save(model_path)
+    model.write_report(online_capacity_support.report_path(data_file))
@@ -0,0 +1,186 @@
+"""Per-host hardware profiles that refine the calibrated worker capacity.
+
+During ``calibration`` one Dask worker per host whose cached profile is stale
+runs the microbenchmarks of
+``agi_node.agi_dispatcher.hardware_benchmark_support`` (CPU, memory bandwidth,
+``fsync``'d share-path disk throughput), and the manager times a payload
+round-trip to it for the manager-to-worker transfer bandwidth. Profiles are
+stored per host in ``<resources>/hardware_profile.json`` and reused until
+``AGILAB_HARDWARE_PROFILE_TTL_SECONDS`` (default one day) elapses; ``0``
+disables the microbenchmarks and leaves the predictor capacities untouched.
+
+:func:`hardware_scores` turns the profiles into a relative speed factor per
+host: the weighted geometric mean of each metric divided by its median
+across the hosts of the run. The capacity predicted for a worker is
+multiplied by the factor of its host before normalisation.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import statistics
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable
+
+from agi_env.runtime.atomic_write_support import atomic_write_text
+from agi_cluster.agi_distributor.runtime.worker_endpoint_support import worker_host
+
+logger = logging.getLogger(__name__)
+
+HARDWARE_PROFILE_TTL_ENV = "AGILAB_HARDWARE_PROFILE_TTL_SECONDS"
+DEFAULT_HARDWARE_PROFILE_TTL_SECONDS = 86400.0
+HARDWARE_PROFILE_FILENAME = "hardware_profile.json"
+
+#: Relative weight of each metric in the host speed factor.
+METRIC_WEIGHTS = {
+    "cpu_gflops": 0.45,
+    "memory_gbps": 0.2,
+    "disk_write_mbps": 0.1,
+    "disk_read_mbps": 0.1,
+    "transfer_mbps": 0.15,
+}
+
+_TRANSFER_PAYLOAD_BYTES = 8 * 1024 * 1024
+_TRANSFER_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TimeoutError, TypeError, ValueError)
+
+
+def resolve_profile_ttl(env: Any) -> float:
+    raw = os.environ.get(HARDWARE_PROFILE_TTL_ENV)
+    if raw is None:
+        envars = getattr(env, "envars", None)
+        if isinstance(envars, Mapping):
+            raw = envars.get(HARDWARE_PROFILE_TTL_ENV)
+    if raw is None or str(raw).strip() == "":
+        return DEFAULT_HARDWARE_PROFILE_TTL_SECONDS
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        value = math.nan
+    if not math.isfinite(value) or value < 0:
+        logger.warning("Ignoring invalid %s=%r", HARDWARE_PROFILE_TTL_ENV, raw)
+        return DEFAULT_HARDWARE_PROFILE_TTL_SECONDS
+    return value
+
+
+def profile_path(env: Any) -> Path | None:
+    resources_path = getattr(env, "resources_path", None)
+    return Path(resources_path) / HARDWARE_PROFILE_FILENAME if resources_path else None
+
+
+def load_profiles(path: Path | None) -> dict[str, dict[str, Any]]:
+    if path is None:
+        return {}
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    hosts = payload.get("hosts") if isinstance(payload, dict) else None
+    if not isinstance(hosts, dict):
+        return {}
+    return {str(host): dict(profile) for host, profile in hosts.items() if isinstance(profile, dict)}
+
+
+def save_profiles(path: Path | None, profiles: Mapping[str, Mapping[str, Any]]) -> None:
+    if path is None:
+        return
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps({"hosts": profiles}, indent=2, sort_keys=True))
+    except OSError as exc:
+        logger.warning("Could not save hardware profiles to %s: %s", path, exc)
+
+
+def _is_fresh(profile: Mapping[str, Any] | None, *, now: float, ttl: float) -> bool:
+    if not profile:
+        return False
+    try:
+        return now - float(profile.get("measured_at", -math.inf)) <= ttl
+    except (TypeError, ValueError):
+        return False
+
+
+def stale_benchmark_workers(
+    dask_workers: list[str],
+    profiles: Mapping[str, Mapping[str, Any]],
+    *,
+    now: float,
+    ttl: float,
+) -> list[str]:
+    """Return one worker for every host whose profile is missing or expired."""
+    selected: dict[str, str] = {}
+    for worker in dask_workers:
+        host = worker_host(worker)
+        if host and host not in selected and not _is_fresh(profiles.get(host), now=now, ttl=ttl):
+            selected[host] = worker
+    return list(selected.values())
+
+
+def measure_transfer_mbps(
+    client: Any,
+    worker: str,
+    *,
+    payload_bytes: int = _TRANSFER_PAYLOAD_BYTES,
+    clock: Callable[[], float] = time.perf_counter,
+) -> float | None:
+    """Time a manager-to-worker payload round-trip, net of a tiny-task baseline."""
+
+    def _round_trip(payload: bytes) -> float:
+        started_at = clock()
+        client.gather([client.submit(len, payload, workers=[worker], pure=False)])
+        return clock() - started_at
+
+    try:
+        baseline = _round_trip(b"x")
+        elapsed = _round_trip(os.urandom(payload_bytes))
+    except _TRANSFER_EXCEPTIONS as exc:
+        logger.debug("transfer probe to %s failed: %s", worker, exc)
+        return None
+    return payload_bytes / 1e6 / max(elapsed - baseline, 1e-6)
+
+
+def hardware_scores(
+    profiles: Mapping[str, Mapping[str, Any]],
+    hosts: list[str],
+) -> dict[str, float]:
+    """Return each host's speed factor relative to the median host of the run."""
+    scores = {host: 1.0 for host in hosts}
+    known = [host for host in hosts if profiles.get(host)]
+    if len(known) < 2:
+        return scores
+    for host in known:
+        log_sum = 0.0
+        weight_sum = 0.0
+        for metric, weight in METRIC_WEIGHTS.items():
+            values = [
+                float(profiles[other][metric])
+                for other in known
+                if isinstance(profiles[other].get(metric), (int, float)) and profiles[other][metric] > 0
+            ]
+            value = profiles[host].get(metric)
+            if len(values) < 2 or not isinstance(value, (int, float)) or value <= 0:
+                continue
+            log_sum += weight * math.log(float(value) / statistics.median(values))
+            weight_sum += weight
+        if weight_sum:
+            scores[host] = math.exp(log_sum / weight_sum)
+    return scores
+
+
+__all__ = [
+    "DEFAULT_HARDWARE_PROFILE_TTL_SECONDS",
+    "HARDWARE_PROFILE_FILENAME",
+    "HARDWARE_PROFILE_TTL_ENV",
+    "METRIC_WEIGHTS",
+    "hardware_scores",
+    "load_profiles",
+    "measure_transfer_mbps",
+    "profile_path",
+    "resolve_profile_ttl",
+    "save_profiles",
+    "stale_benchmark_workers",
+]
@@ -0,0 +1,216 @@
+"""Incremental capacity model updated after every distributed run.
+
+``update_capacity`` used to append each run's rows to the balancer CSV and
+refit the RandomForest capacity predictor on the whole file, so post-run
+overhead grew with the history. The online model keeps instead:
+
+* an exponentially weighted capacity estimate per host, updated in O(1) per
+  row and used by ``calibration`` in place of the regressor once a host has
+  been observed;
+* a bounded ring buffer of the last :data:`DEFAULT_HISTORY_ROWS` feature rows;
+  the fallback regressor is refit on the seed CSV plus that history only
+  every :data:`DEFAULT_REFIT_EVERY_ROWS` new rows;
+* a prequential evaluation (each estimate is scored against the next
+  observed label before it is updated) written as a small JSON report.
+
+Everything is persisted in a single ``.npz`` file next to the balancer CSV.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from agi_env.runtime.atomic_write_support import atomic_write_bytes, atomic_write_text
+
+CAPACITY_HISTORY_FILENAME = "balancer_history.npz"
+CAPACITY_REPORT_FILENAME = "balancer_report.json"
+FEATURE_COLUMNS = (
+    "nb_workers",
+    "ram_total",
+    "ram_available",
+    "cpu_count",
+    "cpu_frequency",
+    "network_speed",
+)
+LABEL_COLUMN = "label"
+DEFAULT_HISTORY_ROWS = 20_000
+DEFAULT_EWMA_ALPHA = 0.3
+DEFAULT_REFIT_EVERY_ROWS = 500
+
+_COLUMNS = (*FEATURE_COLUMNS, LABEL_COLUMN)
+
+
+def history_path(capacity_data_file: Any) -> Path:
+    return Path(capacity_data_file).with_name(CAPACITY_HISTORY_FILENAME)
+
+
+def report_path(capacity_data_file: Any) -> Path:
+    return Path(capacity_data_file).with_name(CAPACITY_REPORT_FILENAME)
+
+
+@dataclass
+class OnlineCapacityModel:
+    """Per-host EWMA estimates plus a bounded history for scheduled refits."""
+
+    max_rows: int = DEFAULT_HISTORY_ROWS
+    alpha: float = DEFAULT_EWMA_ALPHA
+    refit_every: int = DEFAULT_REFIT_EVERY_ROWS
+    rows: np.ndarray = field(default_factory=lambda: np.empty((0, len(_COLUMNS))))
+    cursor: int = 0
+    total_rows: int = 0
+    rows_since_refit: int = 0
+    refits: int = 0
+    refit_score: float | None = None
+    hosts: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def _append(self, row: np.ndarray) -> None:
+        if len(self.rows) < self.max_rows:
+            self.rows = np.vstack([self.rows, row[None, :]]) if len(self.rows) else row[None, :].copy()
+            self.cursor = len(self.rows) % self.max_rows
+            return
+        self.rows[self.cursor] = row
+        self.cursor = (self.cursor + 1) % self.max_rows
+
+    def observe(self, host: str, values: Mapping[str, Any], *, now: float | None = None) -> None:
+        row = np.array([float(values[column]) for column in _COLUMNS], dtype=float)
+        if not np.all(np.isfinite(row)):
+            return
+        label = row[-1]
+        state = self.hosts.setdefault(
+            host,
+            {"estimate": label, "observations": 0, "abs_error_sum": 0.0},
+        )
+        if state["observations"]:
+            state["abs_error_sum"] += abs(state["estimate"] - label)
+            state["estimate"] += self.alpha * (label - state["estimate"])
+        state["observations"] += 1
+        state["last_seen"] = time.time() if now is None else now
+        self._append(row)
+        self.total_rows += 1
+        self.rows_since_refit += 1
+
+    def estimate(self, host: str) -> float | None:
+        state = self.hosts.get(host)
+        if not state or not state.get("observations"):
+            return None
+        value = float(state["estimate"])
+        return value if math.isfinite(value) and value > 0 else None
+
+    def history(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(features, labels)`` of the retained rows, oldest first."""
+        ordered = np.roll(self.rows, -self.cursor, axis=0) if len(self.rows) == self.max_rows else self.rows
+        return ordered[:, :-1], ordered[:, -1]
+
+    def refit_due(self) -> bool:
+        return self.rows_since_refit >= self.refit_every
+
+    def mark_refit(self, score: float | None) -> None:
+        self.refits += 1
+        self.rows_since_refit = 0
+        self.refit_score = score
+
+    def report(self) -> dict[str, Any]:
+        hosts = {}
+        errors = 0.0
+        scored = 0
+        for host, state in sorted(self.hosts.items()):
+            scored_rows = max(int(state["observations"]) - 1, 0)
+            errors += state["abs_error_sum"]
+            scored += scored_rows
+            hosts[host] = {
+                "estimate": state["estimate"],
+                "observations": state["observations"],
+                "mae": state["abs_error_sum"] / scored_rows if scored_rows else None,
+            }
+        return {
+            "total_rows": self.total_rows,
+            "history_rows": int(len(self.rows)),
+            "max_history_rows": self.max_rows,
+            "ewma_alpha": self.alpha,
+            "ewma_mae": errors / scored if scored else None,
+            "regressor": {
+                "refits": self.refits,
+                "rows_since_refit": self.rows_since_refit,
+                "refit_every": self.refit_every,
+                "holdout_r2": self.refit_score,
+            },
+            "hosts": hosts,
+        }
+
+    def _meta(self) -> dict[str, Any]:
+        return {
+            "cursor": self.cursor,
+            "total_rows": self.total_rows,
+            "rows_since_refit": self.rows_since_refit,
+            "refits": self.refits,
+            "refit_score": self.refit_score,
+            "hosts": self.hosts,
+        }
+
+    def save(self, path: Path) -> None:
+        meta = np.array(json.dumps(self._meta()))
+        atomic_write_bytes(path, lambda handle: np.savez(handle, rows=self.rows, meta=meta))
+
+    @classmethod
+    def load(cls, path: Path, **kwargs: Any) -> "OnlineCapacityModel":
+        model = cls(**kwargs)
+        try:
+            with np.load(path, allow_pickle=False) as payload:
+                rows = np.asarray(payload["rows"], dtype=float)
+                meta = json.loads(str(payload["meta"]))
+        except (OSError, KeyError, ValueError):
+            return model
+        if rows.ndim != 2 or rows.shape[1] != len(_COLUMNS):
+            return model
+        if len(rows) > model.max_rows:
+            # A smaller bound than the stored history: keep the newest rows.
+            cursor = int(meta.get("cursor", 0)) if len(rows) else 0
+            rows = np.roll(rows, -cursor, axis=0)[-model.max_rows:]
+            meta["cursor"] = 0
+        model.rows = rows
+        model.cursor = int(meta.get("cursor", 0)) % model.max_rows
+        model.total_rows = int(meta.get("total_rows", len(rows)))
+        model.rows_since_refit = int(meta.get("rows_since_refit", 0))
+        model.refits = int(meta.get("refits", 0))
+        model.refit_score = meta.get("refit_score")
+        model.hosts = {str(host): dict(state) for host, state in (meta.get("hosts") or {}).items()}
+        return model
+
+    def write_report(self, path: Path) -> None:
+        atomic_write_text(path, json.dumps(self.report(), indent=2, sort_keys=True))
+
+
+def load_host_estimates(capacity_data_file: Any) -> dict[str, float]:
+    """Return the EWMA capacity of every observed host, without the history rows."""
+    if capacity_data_file is None:
+        return {}
+    try:
+        with np.load(history_path(capacity_data_file), allow_pickle=False) as payload:
+            meta = json.loads(str(payload["meta"]))
+    except (OSError, KeyError, ValueError):
+        return {}
+    model = OnlineCapacityModel(hosts={str(h): dict(s) for h, s in (meta.get("hosts") or {}).items()})
+    return {host: value for host in model.hosts if (value := model.estimate(host)) is not None}
+
+
+__all__ = [
+    "CAPACITY_HISTORY_FILENAME",
+    "CAPACITY_REPORT_FILENAME",
+    "DEFAULT_EWMA_ALPHA",
+    "DEFAULT_HISTORY_ROWS",
+    "DEFAULT_REFIT_EVERY_ROWS",
+    "FEATURE_COLUMNS",
+    "LABEL_COLUMN",
+    "OnlineCapacityModel",
+    "history_path",
+    "load_host_estimates",
+    "report_path",
+]
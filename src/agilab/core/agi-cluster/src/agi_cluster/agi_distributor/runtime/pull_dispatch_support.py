@@ -0,0 +1,358 @@
+"""Pull-based dispatch of a distribution plan across Dask workers.
+
+The default ``static`` dispatch submits each worker's whole plan chunk once, so
+the slowest worker sets the makespan. In ``pull`` mode the manager keeps the
+plan in per-worker deques seeded from ``build_distribution`` (so the planner's
+placement and data locality are the starting point) and every worker runs a
+loop that pulls its next batch as soon as the previous one finished:
+
+* a worker takes from the front of its own deque; once empty it steals from
+  the back of the deque with the most remaining weight;
+* batch size follows guided self-scheduling: each pull takes roughly
+  ``remaining weight / (2 * workers)``, so batches shrink towards the end of
+  the run and the tail stays short;
+* a pulled batch never spans two plan batches, and it carries that plan
+  batch's metadata unchanged.
+
+Work items are executed by whichever worker pulled them. Every pulled payload
+carries each item's ``(planned worker, plan batch, index)`` origin, which the
+worker uses as the item's output label instead of its position in the pulled
+batch, and :class:`PullQueue` records the planned and executing worker of
+each batch for the run summary. Payloads also carry the run's
+``work_done_run`` token so a worker keeps numbering its ``work_done`` outputs
+across the batches it pulls instead of overwriting them.
+
+Each worker keeps its next batch queued behind the running one: the next
+payload names the running batch's future under ``after_batch``, so Dask starts
+it on the same worker as soon as the running batch finishes, without waiting
+for the manager's round trip, and never runs two batches of one worker at
+once. Pull mode assumes the items of a plan batch are independent of one
+another.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from numbers import Real
+from typing import Any, Callable
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_MODE_ENV = "AGILAB_DISPATCH_MODE"
+DISPATCH_MODES = ("static", "pull")
+DEFAULT_DISPATCH_MODE = "static"
+
+_GUIDED_DIVISOR = 2
+
+
+def resolve_dispatch_mode(env: Any) -> str:
+    """Return the dispatch mode from ``AGILAB_DISPATCH_MODE`` or ``env.envars``."""
+    raw = os.environ.get(DISPATCH_MODE_ENV)
+    if raw is None:
+        envars = getattr(env, "envars", None)
+        if isinstance(envars, Mapping):
+            raw = envars.get(DISPATCH_MODE_ENV)
+    if raw is None or str(raw).strip() == "":
+        return DEFAULT_DISPATCH_MODE
+    mode = str(raw).strip().lower()
+    if mode not in DISPATCH_MODES:
+        logger.warning(
+            "Ignoring %s=%r; expected one of %s",
+            DISPATCH_MODE_ENV,
+            raw,
+            ", ".join(DISPATCH_MODES),
+        )
+        return DEFAULT_DISPATCH_MODE
+    return mode
+
+
+@dataclass
+class _PlanBatch:
+    """Remaining items of one ``build_distribution`` batch."""
+
+    origin_worker: int
+    origin_batch: int
+    metadata: Any
+    #: ``(index in the plan batch, item)`` pairs still to pull.
+    items: deque
+    item_weight: float
+    splittable: bool
+
+    @property
+    def remaining_weight(self) -> float:
+        return self.item_weight * len(self.items)
+
+
+@dataclass
+class PulledBatch:
+    """One batch handed to a worker, with its provenance."""
+
+    items: Any
+    metadata: Any
+    origin_worker: int
+    origin_batch: int
+    weight: float
+    stolen: bool = False
+    item_indices: list[int] = field(default_factory=list)
+
+    @property
+    def item_origins(self) -> list[tuple[int, int, int]]:
+        """``(planned worker, plan batch, index)`` of every pulled item."""
+        return [(self.origin_worker, self.origin_batch, idx) for idx in self.item_indices]
+
+
+def _is_weight(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool) and value >= 0
+
+
+def _batch_weight(batch: Any, metadata: Any) -> float:
+    """Best-effort weight of a plan batch.
+
+    ``(label, size)`` items sum their sizes; otherwise a metadata mapping with
+    exactly one numeric value (``{"file": ..., "size_kb": 42}``) supplies it;
+    otherwise every item weighs 1.
+    """
+    if isinstance(batch, list) and batch and all(
+        isinstance(item, (list, tuple)) and len(item) == 2 and _is_weight(item[1])
+        for item in batch
+    ):
+        return float(sum(item[1] for item in batch))
+    if isinstance(metadata, Mapping):
+        numeric = [value for value in metadata.values() if _is_weight(value)]
+        if len(numeric) == 1:
+            return float(numeric[0])
+    return float(len(batch)) if isinstance(batch, list) else 1.0
+
+
+@dataclass
+class PullQueue:
+    """Manager-side work queue with per-worker deques and tail stealing."""
+
+    workers_plan: list[Any]
+    workers_plan_metadata: list[Any]
+    worker_count: int
+    history: list[dict[str, Any]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._deques: list[deque[_PlanBatch]] = [deque() for _ in range(self.worker_count)]
+        for worker_idx, chunk in enumerate(self.workers_plan or []):
+            if worker_idx >= self.worker_count:
+                raise RuntimeError(
+                    "Distribution produced more non-empty worker chunks than retained Dask workers"
+                )
+            metadata_chunk = (
+                self.workers_plan_metadata[worker_idx]
+                if worker_idx < len(self.workers_plan_metadata or [])
+                else []
+            )
+            for batch_idx, batch in enumerate(chunk or []):
+                metadata = (
+                    metadata_chunk[batch_idx]
+                    if isinstance(metadata_chunk, list) and batch_idx < len(metadata_chunk)
+                    else None
+                )
+                splittable = isinstance(batch, list)
+                if splittable and not batch:
+                    continue
+                items = deque(enumerate(batch)) if splittable else deque([(0, batch)])
+                self._deques[worker_idx].append(
+                    _PlanBatch(
+                        origin_worker=worker_idx,
+                        origin_batch=batch_idx,
+                        metadata=metadata,
+                        items=items,
+                        item_weight=_batch_weight(batch, metadata) / len(items),
+                        splittable=splittable,
+                    )
+                )
+
+    def remaining_weight(self, worker_idx: int | None = None) -> float:
+        deques = self._deques if worker_idx is None else [self._deques[worker_idx]]
+        return sum(batch.remaining_weight for queue in deques for batch in queue)
+
+    def next_batch(self, worker_idx: int) -> PulledBatch | None:
+        """Pop the next batch for ``worker_idx``, stealing when its deque is empty."""
+        own = self._deques[worker_idx]
+        stolen = not own
+        if stolen:
+            victims = [idx for idx in range(self.worker_count) if self._deques[idx]]
+            if not victims:
+                return None
+            victim = max(
+                victims,
+                key=lambda idx: (self.remaining_weight(idx), len(self._deques[idx])),
+            )
+            source, plan_batch = self._deques[victim], self._deques[victim][-1]
+        else:
+            source, plan_batch = own, own[0]
+
+        target = self.remaining_weight() / (_GUIDED_DIVISOR * max(self.worker_count, 1))
+        count = 1
+        if plan_batch.item_weight > 0:
+            count = max(1, int(target // plan_batch.item_weight))
+        count = min(count, len(plan_batch.items))
+        if stolen:
+            # Steal from the tail so the victim keeps the work it is about to pull.
+            taken = [plan_batch.items.pop() for _ in range(count)][::-1]
+        else:
+            taken = [plan_batch.items.popleft() for _ in range(count)]
+        if not plan_batch.items:
+            if stolen:
+                source.pop()
+            else:
+                source.popleft()
+
+        pulled = PulledBatch(
+            items=[item for _idx, item in taken] if plan_batch.splittable else taken[0][1],
+            metadata=plan_batch.metadata,
+            origin_worker=plan_batch.origin_worker,
+            origin_batch=plan_batch.origin_batch,
+            weight=plan_batch.item_weight * count,
+            stolen=stolen,
+            item_indices=[idx for idx, _item in taken],
+        )
+        self.history.append(
+            {
+                "worker": worker_idx,
+                "origin_worker": pulled.origin_worker,
+                "origin_batch": pulled.origin_batch,
+                "items": count,
+                "weight": pulled.weight,
+                "stolen": stolen,
+            }
+        )
+        return pulled
+
+    def summary(self) -> dict[str, Any]:
+        executed = [0.0] * self.worker_count
+        for entry in self.history:
+            executed[entry["worker"]] += entry["weight"]
+        return {
+            "batches": len(self.history),
+            "stolen_batches": sum(1 for entry in self.history if entry["stolen"]),
+            "executed_weight_by_worker": executed,
+        }
+
+
+def _pulled_payload(
+    pulled: PulledBatch,
+    worker_idx: int,
+    worker_count: int,
+    *,
+    metadata: bool,
+    run_token: str,
+    after: Any = None,
+) -> dict[str, Any]:
+    payload = {
+        "__agi_worker_chunk__": True,
+        "chunk": [pulled.metadata] if metadata else [pulled.items],
+        "total_workers": worker_count,
+        "worker_idx": worker_idx,
+        "work_done_run": run_token,
+        "item_origins": [pulled.item_origins],
+    }
+    if after is not None:
+        # Dask resolves the nested future before the task starts, which
+        # orders this batch after the running one on the same worker.
+        payload["after_batch"] = after
+    return payload
+
+
+async def run_pull_dispatch(
+    client: Any,
+    *,
+    dask_workers: list[str],
+    workers_plan: list[Any],
+    workers_plan_metadata: list[Any],
+    do_works: Callable[..., Any],
+    log: Any = logger,
+) -> tuple[dict[str, str], PullQueue]:
+    """Run ``workers_plan`` with every Dask worker pulling batches until done.
+
+    Returns the concatenated log of each worker address and the drained
+    queue (whose ``history`` records the provenance of every batch).
+    """
+    queue = PullQueue(list(workers_plan or []), list(workers_plan_metadata or []), len(dask_workers))
+    worker_logs: dict[str, list[str]] = {worker: [] for worker in dask_workers}
+    loop = asyncio.get_running_loop()
+    run_token = uuid4().hex
+    failed = False
+
+    with ThreadPoolExecutor(
+        max_workers=max(len(dask_workers), 1),
+        thread_name_prefix="agilab-pull-dispatch",
+    ) as gather_pool:
+
+        def _submit(worker_idx: int, worker_addr: str, pulled: PulledBatch, after: Any) -> Any:
+            return client.submit(
+                do_works,
+                _pulled_payload(
+                    pulled,
+                    worker_idx,
+                    len(dask_workers),
+                    metadata=False,
+                    run_token=run_token,
+                    after=after,
+                ),
+                _pulled_payload(
+                    pulled, worker_idx, len(dask_workers), metadata=True, run_token=run_token
+                ),
+                workers=[worker_addr],
+                pure=False,
+            )
+
+        async def _worker_loop(worker_idx: int, worker_addr: str) -> None:
+            nonlocal failed
+            running = None
+            while True:
+                pulled = None if failed else queue.next_batch(worker_idx)
+                queued = (
+                    _submit(worker_idx, worker_addr, pulled, running) if pulled is not None else None
+                )
+                if running is not None:
+                    try:
+                        gathered = await loop.run_in_executor(gather_pool, client.gather, [running])
+                    except BaseException:
+                        # Stop handing out batches; the queued batch depends on
+                        # the failed one and does not run.
+                        failed = True
+                        raise
+                    worker_logs[worker_addr].append((gathered[0] if gathered else "") or "")
+                if queued is None:
+                    return
+                running = queued
+
+        outcomes = await asyncio.gather(
+            *(_worker_loop(idx, addr) for idx, addr in enumerate(dask_workers)),
+            return_exceptions=True,
+        )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+    summary = queue.summary()
+    log.info(
+        "pull dispatch ran %s batches (%s stolen); executed weight by worker: %s",
+        summary["batches"],
+        summary["stolen_batches"],
+        dict(zip(dask_workers, summary["executed_weight_by_worker"])),
+    )
+    return {worker: "".join(parts) for worker, parts in worker_logs.items()}, queue
+
+
+__all__ = [
+    "DEFAULT_DISPATCH_MODE",
+    "DISPATCH_MODES",
+    "DISPATCH_MODE_ENV",
+    "PullQueue",
+    "PulledBatch",
+    "resolve_dispatch_mode",
+    "run_pull_dispatch",
+]
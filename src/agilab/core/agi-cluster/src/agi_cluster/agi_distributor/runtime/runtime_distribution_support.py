@@ -15,7 +15,12 @@ from zipfile import BadZipFile, ZipFile
 import psutil
 
 from agi_cluster.agi_distributor import background_jobs_support, deployment_remote_support
-from agi_cluster.agi_distributor.runtime import manager_mlflow_support
+from agi_cluster.agi_distributor.runtime import (
+    manager_mlflow_support,
+    pull_dispatch_support,
+    warm_cluster_support,
+    worker_progress_support,
+)
 from agi_cluster.agi_distributor.runtime.worker_endpoint_support import worker_host
 from agi_env.process_support import project_virtualenv_script_path
 
@@ -178,12 +183,22 @@ def _remote_dask_worker_command(
     )
 
 
-def _record_phase_timing(agi_cls: Any, phase: str, seconds: float) -> None:
+def _record_phase_timing(agi_cls: Any, phase: str, seconds: float, **extra: Any) -> None:
     timings = getattr(agi_cls, "_phase_timings", None)
     if not isinstance(timings, list):
         timings = []
         setattr(agi_cls, "_phase_timings", timings)
-    timings.append({"phase": phase, "seconds": round(float(seconds), 6)})
+    entry = {"phase": phase, "seconds": round(float(seconds), 6)}
+    for key, value in extra.items():
+        entry[key] = round(float(value), 6) if isinstance(value, float) else value
+    timings.append(entry)
+
+
+def _last_phase_seconds(agi_cls: Any, phase: str) -> float:
+    for entry in reversed(getattr(agi_cls, "_phase_timings", None) or []):
+        if entry.get("phase") == phase:
+            return float(entry.get("seconds", 0.0))
+    return 0.0
 
 
 async def _run_timed_phase(
@@ -495,6 +510,10 @@ async def start(
     env = agi_cls.env
     dask_env = dask_env_prefix(agi_cls)
 
+    # A parked warm cluster holds the scheduler port and the worker pid files
+    # a cold start is about to reuse.
+    warm_cluster_support.discard_parked("cold start")
+
     # Establish task ownership before any scheduler/worker process is spawned
     # so partial startup can always cancel and await every launch operation.
     agi_cls._scheduler_launch_tasks = set()
@@ -600,6 +619,36 @@ async def start(
     return True
 
 
+def start_local_workers(agi_cls: Any, count: int, *, log: Any = logger) -> list[str]:
+    """Launch ``count`` more local Dask workers on the running scheduler.
+
+    Used by the service autoscaler; the workers are owned background jobs, so
+    runtime shutdown stops them like the ones launched by :func:`start`.
+    Returns the pid file names of the launched workers.
+    """
+    env = agi_cls.env
+    scheduler_ip = agi_cls._scheduler_ip or "127.0.0.1"
+    process_env = background_jobs_support.background_env_from_prefixes(
+        env.envars.get(f"{scheduler_ip}_CMD_PREFIX", ""),
+        dask_env_prefix(agi_cls),
+    )
+    worker_port = _worker_port_range(env)
+    pid_files: list[str] = []
+    for _ in range(max(count, 0)):
+        pid_file = f"dask_worker_autoscale_{os.getpid()}_{time.time_ns()}.pid"
+        log.info(f"Starting autoscaled service worker on [{scheduler_ip}]")
+        local_cmd = _local_dask_worker_command(
+            str(env.uv),
+            env.wenv_abs,
+            agi_cls._scheduler,
+            pid_file,
+            worker_port=worker_port,
+        )
+        agi_cls._exec_bg(local_cmd, str(env.wenv_abs), env=process_env)
+        pid_files.append(pid_file)
+    return pid_files
+
+
 async def sync(
     agi_cls: Any,
     *,
@@ -766,6 +815,46 @@ def _ordered_worker_capacities(
     return [float(normalized_capacity.get(worker, 1.0)) for worker in dask_workers]
 
 
+async def _dispatch_static_plan(
+    agi_cls: Any,
+    client: Any,
+    *,
+    dask_workers: list[str],
+    workers_plan: Any,
+    workers_plan_metadata: Any,
+    base_worker_cls: Any,
+) -> Dict[str, str]:
+    """Submit each worker's whole plan chunk once and gather every log."""
+    futures = {}
+    for worker_idx, worker_addr in enumerate(dask_workers):
+        plan_payload = agi_cls._wrap_worker_chunk(workers_plan or [], worker_idx)
+        metadata_payload = agi_cls._wrap_worker_chunk(workers_plan_metadata or [], worker_idx)
+        futures[worker_addr] = client.submit(
+            base_worker_cls._do_works,
+            plan_payload,
+            metadata_payload,
+            workers=[worker_addr],
+        )
+
+    if workers_plan and not futures:
+        raise RuntimeError(
+            "Distribution produced a non-empty workload but submitted no worker futures"
+        )
+
+    gathered_logs = (
+        await _call_client_blocking(client.gather, list(futures.values()))
+        if futures
+        else []
+    )
+    worker_logs: Dict[str, str] = {}
+    for idx, worker_addr in enumerate(futures.keys()):
+        log_value = gathered_logs[idx] if idx < len(gathered_logs) else ""
+        worker_logs[worker_addr] = log_value or ""
+    if agi_cls.debug and not worker_logs:
+        worker_logs = {worker: "" for worker in dask_workers}
+    return worker_logs
+
+
 async def distribute(
     agi_cls: Any,
     *,
@@ -790,7 +879,25 @@ async def distribute(
     dask_workers = list(agi_cls._dask_workers)
     client = agi_cls._dask_client
 
-    if dask_workers:
+    warm = getattr(agi_cls, "_warm_cluster", None)
+    init_key = (
+        warm_cluster_support.worker_init_key(agi_cls, dask_workers, _worker_startup_args(agi_cls))
+        if warm is not None
+        else None
+    )
+    if dask_workers and init_key is not None and warm.worker_init_key == init_key:
+        # The warm workers still hold BaseWorker instances built from the same
+        # app, mode and arguments; reuse them and their calibrated capacity.
+        agi_cls._capacity = warm.capacity
+        _record_phase_timing(
+            agi_cls,
+            "worker-init",
+            0.0,
+            reused=True,
+            saved_seconds=warm.worker_init_seconds,
+        )
+    elif dask_workers:
+        init_started_at = time_fn()
         await _call_client_blocking(
             agi_cls._dask_client.gather,
             [
@@ -812,6 +919,11 @@ async def distribute(
         # Capacity collection depends on initialized BaseWorker state, but must
         # precede build_distribution so the normal (non-benchmark) plan uses it.
         await agi_cls._calibration()
+        if warm is not None:
+            warm.worker_init_key = init_key
+            warm.worker_init_seconds = time_fn() - init_started_at
+            warm.capacity = getattr(agi_cls, "_capacity", None)
+            _record_phase_timing(agi_cls, "worker-init", warm.worker_init_seconds)
     else:
         agi_cls._capacity = {}
 
@@ -842,34 +954,39 @@ async def distribute(
         )
 
     started_at = time_fn()
-    futures = {}
-    for worker_idx, worker_addr in enumerate(dask_workers):
-        plan_payload = agi_cls._wrap_worker_chunk(workers_plan or [], worker_idx)
-        metadata_payload = agi_cls._wrap_worker_chunk(workers_plan_metadata or [], worker_idx)
-        futures[worker_addr] = client.submit(
-            base_worker_cls._do_works,
-            plan_payload,
-            metadata_payload,
-            workers=[worker_addr],
-        )
-
-    if workers_plan and not futures:
-        raise RuntimeError(
-            "Distribution produced a non-empty workload but submitted no worker futures"
+    # Workers stream their logs and item progress while the plan runs; the
+    # monitor exposes them through AGI.worker_progress() and a wenv snapshot.
+    progress_monitor = worker_progress_support.start_monitor(agi_cls, client, dask_workers, log=log)
+    dispatch_status = "failed"
+    try:
+        if workers_plan and pull_dispatch_support.resolve_dispatch_mode(env) == "pull":
+            worker_logs, pull_queue = await pull_dispatch_support.run_pull_dispatch(
+                client,
+                dask_workers=dask_workers,
+                workers_plan=workers_plan,
+                workers_plan_metadata=workers_plan_metadata,
+                do_works=base_worker_cls._do_works,
+                log=log,
+            )
+            agi_cls._pull_dispatch_history = pull_queue.history
+        else:
+            worker_logs = await _dispatch_static_plan(
+                agi_cls,
+                client,
+                dask_workers=dask_workers,
+                workers_plan=workers_plan,
+                workers_plan_metadata=workers_plan_metadata,
+                base_worker_cls=base_worker_cls,
+            )
+        dispatch_status = "done"
+    finally:
+        await worker_progress_support.stop_monitor(
+            client,
+            progress_monitor,
+            status=dispatch_status,
+            log=log,
         )
 
-    gathered_logs = (
-        await _call_client_blocking(client.gather, list(futures.values()))
-        if futures
-        else []
-    )
-    worker_logs: Dict[str, str] = {}
-    for idx, worker_addr in enumerate(futures.keys()):
-        log_value = gathered_logs[idx] if idx < len(gathered_logs) else ""
-        worker_logs[worker_addr] = log_value or ""
-    if agi_cls.debug and not worker_logs:
-        worker_logs = {worker: "" for worker in dask_workers}
-
     for worker, worker_log in worker_logs.items():
         log.info(f"\n=== Worker {worker} logs ===\n{worker_log}")
 
@@ -923,15 +1040,36 @@ async def main(
         res = time_fn() - started_at
     elif agi_cls._mode & agi_cls.DASK_MODE:
         agi_cls._startup_in_progress = True
+        warm_key = warm_cluster_support.cluster_key(agi_cls, scheduler)
+        expected_workers = sum((agi_cls._workers or {}).values())
+        warm = warm_cluster_support.claim(warm_key, expected_workers=expected_workers)
+        succeeded = False
         try:
-            started = await _run_timed_phase(
-                agi_cls,
-                "start-dask",
-                lambda: agi_cls._start(scheduler),
-                time_fn=time_fn,
-            )
-            if started is False:
-                raise RuntimeError("Dask startup did not complete")
+            if warm is not None:
+                _resume_warm_cluster(agi_cls, warm)
+                _record_phase_timing(
+                    agi_cls,
+                    "start-dask",
+                    0.0,
+                    reused=True,
+                    saved_seconds=warm.start_seconds,
+                )
+            else:
+                started = await _run_timed_phase(
+                    agi_cls,
+                    "start-dask",
+                    lambda: agi_cls._start(scheduler),
+                    time_fn=time_fn,
+                )
+                if started is False:
+                    raise RuntimeError("Dask startup did not complete")
+                if warm_key is not None:
+                    agi_cls._warm_cluster = _new_warm_cluster(
+                        agi_cls,
+                        warm_key,
+                        worker_count=expected_workers,
+                        start_seconds=_last_phase_seconds(agi_cls, "start-dask"),
+                    )
             agi_cls._startup_in_progress = False
             res = await _run_timed_phase(
                 agi_cls,
@@ -940,20 +1078,24 @@ async def main(
                 time_fn=time_fn,
             )
             agi_cls._update_capacity()
+            succeeded = True
         finally:
             # Always tear the cluster down (dask client shutdown, worker
             # retirement, SSH/connection cleanup) even when _distribute or
             # _update_capacity raise; otherwise scheduler/workers/ports and
             # SSH connections leak. _stop() still honors the _mode_auto
-            # benchmark skip internally.
+            # benchmark skip internally. Only a cluster that just completed a
+            # run is kept warm.
             try:
-                await _run_timed_phase(
-                    agi_cls,
-                    "stop-dask",
-                    lambda: agi_cls._stop(),
-                    time_fn=time_fn,
-                )
+                if not (succeeded and _park_warm_cluster(agi_cls)):
+                    await _run_timed_phase(
+                        agi_cls,
+                        "stop-dask",
+                        lambda: agi_cls._stop(),
+                        time_fn=time_fn,
+                    )
             finally:
+                agi_cls._warm_cluster = None
                 agi_cls._startup_in_progress = False
     else:
         res = await agi_cls._run()
@@ -962,6 +1104,89 @@ async def main(
     return res
 
 
+def _new_warm_cluster(
+    agi_cls: Any,
+    key: str,
+    *,
+    worker_count: int,
+    start_seconds: float,
+) -> warm_cluster_support.WarmCluster:
+    return warm_cluster_support.WarmCluster(
+        key=key,
+        client=agi_cls._dask_client,
+        scheduler=agi_cls._scheduler,
+        scheduler_ip=agi_cls._scheduler_ip,
+        scheduler_port=agi_cls._scheduler_port,
+        jobs=agi_cls._jobs,
+        worker_count=worker_count,
+        start_seconds=start_seconds,
+        shutdown_fn=_shutdown_warm_cluster,
+    )
+
+
+def _resume_warm_cluster(agi_cls: Any, warm: warm_cluster_support.WarmCluster) -> None:
+    agi_cls._warm_cluster = warm
+    agi_cls._dask_client = warm.client
+    agi_cls._scheduler = warm.scheduler
+    agi_cls._scheduler_ip = warm.scheduler_ip
+    agi_cls._scheduler_port = warm.scheduler_port
+    agi_cls._jobs = warm.jobs
+    agi_cls._install_done = True
+
+
+def _park_warm_cluster(agi_cls: Any, *, log: Any = logger) -> bool:
+    """Hand a healthy cluster to the warm pool instead of stopping it."""
+    warm = getattr(agi_cls, "_warm_cluster", None)
+    if warm is None or warm.client is not getattr(agi_cls, "_dask_client", None):
+        return False
+    live_workers = warm_cluster_support.live_worker_count(warm.client)
+    if live_workers != warm.worker_count:
+        log.info(
+            "Not keeping the Dask cluster warm: %s of %s workers are still attached",
+            live_workers,
+            warm.worker_count,
+        )
+        return False
+    warm.dask_workers = list(getattr(agi_cls, "_dask_workers", None) or [])
+    warm_cluster_support.park(warm, ttl=warm_cluster_support.resolve_keepalive_ttl(agi_cls.env))
+    _record_phase_timing(agi_cls, "stop-dask", 0.0, kept_warm=True)
+    # The parked cluster is owned by the warm pool now; a later stop() or
+    # service call must not see this client or its background jobs.
+    agi_cls._dask_client = None
+    agi_cls._jobs = None
+    return True
+
+
+def _shutdown_warm_cluster(warm: warm_cluster_support.WarmCluster, *, timeout: float = 3.0) -> None:
+    """Synchronously stop a parked cluster (TTL timer, atexit or cold start)."""
+    try:
+        result = warm.client.shutdown()
+        if inspect.iscoroutine(result):
+            result.close()
+    except _STOP_RETRY_EXCEPTIONS as exc:
+        logger.warning("Warm Dask client shutdown failed: %s", exc)
+    manager = warm.jobs
+    jobs = {
+        id(job): job
+        for field in ("owned", "running")
+        for job in list(getattr(manager, field, None) or [])
+    }
+    for job in jobs.values():
+        try:
+            if _background_job_ownership_token(job) is None:
+                process = getattr(job, "process", None)
+                if process is not None and process.poll() is None:
+                    process.terminate()
+            elif os.name == "posix":
+                _terminate_posix_owned_process_tree(job, timeout=timeout)
+            else:
+                _terminate_token_process_tree(job, timeout=timeout)
+        except _BACKGROUND_TREE_CLEANUP_EXCEPTIONS as exc:
+            logger.warning("Warm Dask process cleanup failed: %s", exc)
+            continue
+        _forget_owned_background_job(manager, job)
+
+
 def clean_job(agi_cls: Any, cond_clean: bool) -> None:
     if agi_cls._jobs and cond_clean:
         if agi_cls.verbose:
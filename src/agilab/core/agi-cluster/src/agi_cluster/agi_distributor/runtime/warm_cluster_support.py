@@ -0,0 +1,260 @@
+"""Keep a local Dask cluster warm between ``AGI.run`` invocations.
+
+With ``AGILAB_DASK_KEEPALIVE_TTL`` set to a positive number of seconds, a
+successful DASK run parks its scheduler, workers and client instead of
+stopping them. The next run claims the parked cluster when its cluster key
+matches (same workers, scheduler, mode, worker environment and unchanged app
+sources) and skips ``start-dask``; when the worker startup arguments match as
+well, the ``BaseWorker._new`` initialisation and calibration are skipped too.
+An idle cluster is shut down once the TTL expires, at interpreter exit, or as
+soon as a regular cold start needs the scheduler port back.
+
+Only all-local topologies are kept warm: remote scheduler and worker hosts are
+guarded by per-run target leases that must not outlive the run.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+DASK_KEEPALIVE_TTL_ENV = "AGILAB_DASK_KEEPALIVE_TTL"
+DEFAULT_DASK_KEEPALIVE_TTL = 0.0
+
+_PROBE_EXCEPTIONS = (AttributeError, KeyError, OSError, RuntimeError, TimeoutError, TypeError)
+
+
+def resolve_keepalive_ttl(env: Any) -> float:
+    """Return the idle TTL in seconds; ``0`` disables the warm cluster."""
+    raw = os.environ.get(DASK_KEEPALIVE_TTL_ENV)
+    if raw is None:
+        envars = getattr(env, "envars", None)
+        if isinstance(envars, Mapping):
+            raw = envars.get(DASK_KEEPALIVE_TTL_ENV)
+    if raw is None or str(raw).strip() == "":
+        return DEFAULT_DASK_KEEPALIVE_TTL
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        value = math.nan
+    if not math.isfinite(value) or value < 0:
+        logger.warning("Ignoring invalid %s=%r", DASK_KEEPALIVE_TTL_ENV, raw)
+        return DEFAULT_DASK_KEEPALIVE_TTL
+    return value
+
+
+@dataclass
+class WarmCluster:
+    """A started cluster owned by this process, parked between runs."""
+
+    key: str
+    client: Any
+    scheduler: str | None
+    scheduler_ip: str | None
+    scheduler_port: int | None
+    jobs: Any
+    worker_count: int
+    start_seconds: float
+    shutdown_fn: Callable[[WarmCluster], None]
+    worker_init_key: str | None = None
+    worker_init_seconds: float = 0.0
+    dask_workers: list[str] = field(default_factory=list)
+    capacity: Any = None
+    runs: int = 0
+
+
+def _fingerprint(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _source_signature(root: Any) -> list[tuple[str, int, int]]:
+    if not root:
+        return []
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    signature = []
+    for path in sorted(root.rglob("*")):
+        if "__pycache__" in path.parts:
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if path.is_file():
+            signature.append((path.relative_to(root).as_posix(), stat.st_size, stat.st_mtime_ns))
+    return signature
+
+
+def _all_local(agi_cls: Any, scheduler: str | None) -> bool:
+    env = agi_cls.env
+    workers = getattr(agi_cls, "_workers", None) or {}
+    if not workers or not all(env.is_local(ip) for ip in workers):
+        return False
+    if scheduler is None:
+        return True
+    return bool(env.is_local(agi_cls._get_scheduler(scheduler)[0]))
+
+
+def cluster_key(agi_cls: Any, scheduler: str | None) -> str | None:
+    """Return the reuse key of this run's cluster, or ``None`` if it cannot stay warm."""
+    env = agi_cls.env
+    if resolve_keepalive_ttl(env) <= 0 or getattr(agi_cls, "_mode_auto", False):
+        return None
+    if not _all_local(agi_cls, scheduler):
+        return None
+    active_app = getattr(env, "active_app", None)
+    wenv_abs = getattr(env, "wenv_abs", None)
+    return _fingerprint(
+        {
+            "scheduler": scheduler,
+            "workers": sorted((agi_cls._workers or {}).items()),
+            "mode": agi_cls._mode,
+            "app": getattr(env, "app", None),
+            "wenv": str(wenv_abs),
+            "dask_log_level": getattr(agi_cls, "_dask_log_level", None),
+            "app_sources": _source_signature(Path(active_app) / "src" if active_app else None),
+            "worker_dist": _source_signature(Path(wenv_abs) / "dist" if wenv_abs else None),
+        }
+    )
+
+
+def worker_init_key(agi_cls: Any, dask_workers: list[str], worker_args: Mapping[str, Any]) -> str:
+    """Return the fingerprint of the ``BaseWorker._new`` call of every worker."""
+    env = agi_cls.env
+    return _fingerprint(
+        {
+            "app": getattr(env, "app", None),
+            "debug": bool(getattr(env, "debug", False)),
+            "mode": agi_cls._mode,
+            "verbose": getattr(agi_cls, "verbose", None),
+            "dask_workers": list(dask_workers),
+            "args": dict(worker_args),
+        }
+    )
+
+
+def live_worker_count(client: Any) -> int | None:
+    """Return how many workers the client's scheduler reports, or ``None`` if unreachable."""
+    try:
+        if getattr(client, "status", "running") != "running":
+            return None
+        return len(client.scheduler_info()["workers"])
+    except _PROBE_EXCEPTIONS:
+        return None
+
+
+_LOCK = threading.Lock()
+_PARKED: WarmCluster | None = None
+_TIMER: threading.Timer | None = None
+_ATEXIT_REGISTERED = False
+
+
+def _take_parked() -> WarmCluster | None:
+    global _PARKED, _TIMER
+    with _LOCK:
+        warm, _PARKED = _PARKED, None
+        if _TIMER is not None:
+            _TIMER.cancel()
+            _TIMER = None
+    return warm
+
+
+def _shutdown(warm: WarmCluster, reason: str) -> None:
+    logger.info("Shutting down warm Dask cluster %s (%s)", warm.scheduler, reason)
+    try:
+        warm.shutdown_fn(warm)
+    except _PROBE_EXCEPTIONS as exc:
+        logger.warning("Warm Dask cluster shutdown failed: %s", exc)
+
+
+def parked() -> WarmCluster | None:
+    """Return the parked cluster without claiming it."""
+    with _LOCK:
+        return _PARKED
+
+
+def claim(key: str | None, *, expected_workers: int) -> WarmCluster | None:
+    """Take the parked cluster if it matches ``key`` and is still healthy.
+
+    A parked cluster that does not match is shut down, so the cold start that
+    follows finds its scheduler port and worker environment free.
+    """
+    warm = _take_parked()
+    if warm is None:
+        return None
+    if key is None or warm.key != key:
+        _shutdown(warm, "configuration changed")
+        return None
+    if live_worker_count(warm.client) != expected_workers:
+        _shutdown(warm, "workers lost while idle")
+        return None
+    warm.runs += 1
+    return warm
+
+
+def _expire(warm: WarmCluster) -> None:
+    global _PARKED, _TIMER
+    with _LOCK:
+        if _PARKED is not warm:
+            return
+        _PARKED, _TIMER = None, None
+    _shutdown(warm, "idle TTL expired")
+
+
+def park(warm: WarmCluster, *, ttl: float) -> None:
+    """Park ``warm`` for at most ``ttl`` idle seconds, replacing any parked cluster."""
+    global _PARKED, _TIMER, _ATEXIT_REGISTERED
+    previous = _take_parked()
+    if previous is not None and previous is not warm:
+        _shutdown(previous, "replaced")
+    timer = threading.Timer(ttl, _expire, args=(warm,))
+    timer.daemon = True
+    with _LOCK:
+        _PARKED, _TIMER = warm, timer
+        if not _ATEXIT_REGISTERED:
+            atexit.register(discard_parked)
+            _ATEXIT_REGISTERED = True
+    timer.start()
+    logger.info(
+        "Keeping Dask cluster %s warm for %.0fs (%s workers)",
+        warm.scheduler,
+        ttl,
+        warm.worker_count,
+    )
+
+
+def discard_parked(reason: str = "released") -> bool:
+    """Shut the parked cluster down; return whether there was one."""
+    warm = _take_parked()
+    if warm is None:
+        return False
+    _shutdown(warm, reason)
+    return True
+
+
+__all__ = [
+    "DASK_KEEPALIVE_TTL_ENV",
+    "DEFAULT_DASK_KEEPALIVE_TTL",
+    "WarmCluster",
+    "claim",
+    "cluster_key",
+    "discard_parked",
+    "live_worker_count",
+    "park",
+    "parked",
+    "resolve_keepalive_ttl",
+    "worker_init_key",
+]
@@ -0,0 +1,291 @@
+"""Live view of worker logs and progress during a DASK ``distribute``.
+
+Workers stream batches of log records and item counters on
+``agi_node.agi_dispatcher.worker_event_support.WORKER_EVENT_TOPIC``.
+:class:`WorkerProgressMonitor` subscribes the manager's Dask client to that
+topic for the duration of the dispatch, keeps the most recent log records in
+a bounded buffer and the latest counters of every worker, and periodically
+writes a JSON snapshot next to the worker environment
+(``<wenv>/worker_progress.json``). ``AGI.worker_progress()`` returns the live
+snapshot in-process; other processes such as the ORCHESTRATE page poll the
+file with :func:`read_worker_progress`.
+
+A worker is flagged as a straggler while its item rate stays below
+:data:`STRAGGLER_RATE_RATIO` of the median rate of the workers that report
+items.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+
+from agi_env.runtime.atomic_write_support import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+WORKER_EVENT_TOPIC = "agilab.worker_events"
+WORKER_PROGRESS_SCHEMA = "agilab.worker_progress.v1"
+WORKER_PROGRESS_FILENAME = "worker_progress.json"
+
+DEFAULT_MAX_LOG_RECORDS = 5000
+DEFAULT_SNAPSHOT_INTERVAL = 1.0
+DEFAULT_DRAIN_TIMEOUT = 2.0
+STRAGGLER_RATE_RATIO = 0.5
+
+_SNAPSHOT_LOG_RECORDS = 200
+_SUBSCRIBE_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TimeoutError, TypeError, ValueError)
+
+
+def worker_progress_path(env: Any) -> Path | None:
+    wenv_abs = getattr(env, "wenv_abs", None)
+    return Path(wenv_abs) / WORKER_PROGRESS_FILENAME if wenv_abs else None
+
+
+def read_worker_progress(path: Path | str | None) -> dict[str, Any] | None:
+    """Return the last snapshot written at ``path``, or ``None`` if unavailable."""
+    if path is None:
+        return None
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("schema") != WORKER_PROGRESS_SCHEMA:
+        return None
+    return payload
+
+
+class WorkerProgressMonitor:
+    """Collect the worker event stream of one dispatch."""
+
+    def __init__(
+        self,
+        workers: list[str],
+        *,
+        snapshot_path: Path | None = None,
+        max_log_records: int = DEFAULT_MAX_LOG_RECORDS,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        time_fn: Callable[[], float] = time.time,
+        log: Any = logger,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._time = time_fn
+        self._log = log
+        self.snapshot_path = snapshot_path
+        self._snapshot_interval = snapshot_interval
+        self._last_snapshot = 0.0
+        self._records: deque[dict[str, Any]] = deque(maxlen=max(int(max_log_records), 1))
+        self._sequence = 0
+        self.dropped_records = 0
+        self.started_at = time_fn()
+        self.finished_at: float | None = None
+        self.status = "running"
+        self._workers: dict[str, dict[str, Any]] = {
+            str(worker): self._new_worker_state(str(worker), None) for worker in workers
+        }
+
+    @staticmethod
+    def _new_worker_state(worker: str, worker_id: Any) -> dict[str, Any]:
+        return {
+            "worker": worker,
+            "worker_id": worker_id,
+            "status": "pending",
+            "items_total": 0,
+            "items_done": 0,
+            "items_failed": 0,
+            "first_event_at": None,
+            "last_event_at": None,
+            "dropped_records": 0,
+        }
+
+    def handle_event(self, event: Any) -> None:
+        """Dask topic handler; ``event`` is ``(scheduler timestamp, message)``."""
+        message = event[1] if isinstance(event, (list, tuple)) and len(event) == 2 else event
+        if not isinstance(message, dict):
+            return
+        worker = str(message.get("worker") or message.get("worker_id"))
+        received = self._time()
+        with self._lock:
+            state = self._workers.setdefault(
+                worker, self._new_worker_state(worker, message.get("worker_id"))
+            )
+            state["worker_id"] = message.get("worker_id", state["worker_id"])
+            if state["first_event_at"] is None:
+                state["first_event_at"] = received
+            state["last_event_at"] = received
+            progress = message.get("progress") or {}
+            for key in ("items_total", "items_done", "items_failed"):
+                if key in progress:
+                    state[key] = int(progress[key])
+            dropped = int(message.get("dropped") or 0)
+            state["dropped_records"] += dropped
+            self.dropped_records += dropped
+            state["status"] = message.get("status") or "running"
+            for record in message.get("events") or []:
+                if not isinstance(record, dict) or record.get("kind") != "log":
+                    continue
+                self._sequence += 1
+                if len(self._records) == self._records.maxlen:
+                    self.dropped_records += 1
+                self._records.append({"seq": self._sequence, "worker": worker, **record})
+        self._maybe_write_snapshot()
+
+    def finish(self, status: str) -> None:
+        with self._lock:
+            self.status = status
+            self.finished_at = self._time()
+        self.write_snapshot()
+
+    def all_reported(self) -> bool:
+        with self._lock:
+            return all(
+                state["status"] in ("done", "failed")
+                for state in self._workers.values()
+                if state["first_event_at"] is not None
+            )
+
+    def _worker_rows(self, now: float) -> list[dict[str, Any]]:
+        rows = []
+        for state in self._workers.values():
+            row = dict(state)
+            first = state["first_event_at"]
+            end = state["last_event_at"] if state["status"] in ("done", "failed") else now
+            elapsed = (end - first) if first is not None and end is not None else 0.0
+            row["items_per_second"] = state["items_done"] / elapsed if elapsed > 0 else 0.0
+            remaining = max(state["items_total"] - state["items_done"] - state["items_failed"], 0)
+            row["eta_seconds"] = (
+                remaining / row["items_per_second"] if row["items_per_second"] > 0 and remaining else None
+            )
+            row["straggler"] = False
+            rows.append(row)
+        rates = [row["items_per_second"] for row in rows if row["items_total"] > 0]
+        if len(rates) > 1:
+            median = statistics.median(rates)
+            for row in rows:
+                row["straggler"] = (
+                    row["items_total"] > 0
+                    and row["status"] not in ("done", "failed")
+                    and row["items_per_second"] < STRAGGLER_RATE_RATIO * median
+                )
+        return rows
+
+    def snapshot(self, since: int = 0, *, max_records: int | None = None) -> dict[str, Any]:
+        """Return the progress of every worker and the log records after ``since``."""
+        now = self._time()
+        with self._lock:
+            rows = self._worker_rows(now)
+            records = [record for record in self._records if record["seq"] > since]
+            if max_records is not None:
+                records = records[-max_records:]
+            elapsed = (self.finished_at or now) - self.started_at
+            done = sum(row["items_done"] for row in rows)
+            return {
+                "schema": WORKER_PROGRESS_SCHEMA,
+                "status": self.status,
+                "started_at": self.started_at,
+                "updated_at": now,
+                "elapsed_seconds": elapsed,
+                "items_total": sum(row["items_total"] for row in rows),
+                "items_done": done,
+                "items_failed": sum(row["items_failed"] for row in rows),
+                "items_per_second": done / elapsed if elapsed > 0 else 0.0,
+                "workers": rows,
+                "stragglers": [row["worker"] for row in rows if row["straggler"]],
+                "dropped_records": self.dropped_records,
+                "last_seq": self._sequence,
+                "logs": records,
+            }
+
+    def _maybe_write_snapshot(self) -> None:
+        if self._time() - self._last_snapshot >= self._snapshot_interval:
+            self.write_snapshot()
+
+    def write_snapshot(self) -> None:
+        if self.snapshot_path is None:
+            return
+        self._last_snapshot = self._time()
+        payload = self.snapshot(max_records=_SNAPSHOT_LOG_RECORDS)
+        try:
+            atomic_write_text(self.snapshot_path, json.dumps(payload, indent=2), encoding="utf-8")
+        except OSError as exc:
+            self._log.warning("Could not write worker progress to %s: %s", self.snapshot_path, exc)
+
+
+def start_monitor(
+    agi_cls: Any,
+    client: Any,
+    dask_workers: list[str],
+    *,
+    log: Any = logger,
+) -> WorkerProgressMonitor | None:
+    """Subscribe a new monitor to the worker event topic of ``client``."""
+    subscribe = getattr(client, "subscribe_topic", None)
+    if not callable(subscribe):
+        return None
+    monitor = WorkerProgressMonitor(
+        list(dask_workers),
+        snapshot_path=worker_progress_path(agi_cls.env),
+        log=log,
+    )
+    try:
+        subscribe(WORKER_EVENT_TOPIC, monitor.handle_event)
+    except _SUBSCRIBE_EXCEPTIONS as exc:
+        log.warning("Live worker progress unavailable: %s", exc)
+        return None
+    agi_cls._worker_progress = monitor
+    monitor.write_snapshot()
+    return monitor
+
+
+async def stop_monitor(
+    client: Any,
+    monitor: WorkerProgressMonitor | None,
+    *,
+    status: str,
+    drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+    sleep_fn: Callable[[float], Any] = asyncio.sleep,
+    log: Any = logger,
+) -> None:
+    """Wait briefly for the final worker batches, then unsubscribe."""
+    if monitor is None:
+        return
+    deadline = time.monotonic() + drain_timeout
+    while not monitor.all_reported() and time.monotonic() < deadline:
+        await sleep_fn(0.05)
+    try:
+        client.unsubscribe_topic(WORKER_EVENT_TOPIC)
+    except _SUBSCRIBE_EXCEPTIONS as exc:
+        log.debug("worker event unsubscribe failed: %s", exc)
+    monitor.finish(status)
+
+
+def worker_progress(agi_cls: Any, env: Any = None, *, since: int = 0) -> dict[str, Any] | None:
+    """Return the live snapshot of this process, else the last one written for ``env``."""
+    monitor = getattr(agi_cls, "_worker_progress", None)
+    if isinstance(monitor, WorkerProgressMonitor) and env is None:
+        return monitor.snapshot(since)
+    payload = read_worker_progress(worker_progress_path(env or getattr(agi_cls, "env", None)))
+    if payload is not None and since:
+        payload["logs"] = [record for record in payload.get("logs", []) if record.get("seq", 0) > since]
+    return payload
+
+
+__all__ = [
+    "STRAGGLER_RATE_RATIO",
+    "WORKER_EVENT_TOPIC",
+    "WORKER_PROGRESS_FILENAME",
+    "WORKER_PROGRESS_SCHEMA",
+    "WorkerProgressMonitor",
+    "read_worker_progress",
+    "start_monitor",
+    "stop_monitor",
+    "worker_progress",
+    "worker_progress_path",
+]
@@ -0,0 +1,256 @@
+"""Queue-depth driven sizing of the local service worker pool.
+
+``AGI.serve(action="start")`` used to fix the number of service loops for the
+lifetime of the service. With an :class:`ServiceAutoscalePolicy`, every
+``AGI.serve(action="status")`` (the call health probes already poll) runs one
+autoscaling step:
+
+* the backlog (pending plus running tasks) above ``pending_per_worker`` per
+  healthy worker, or a claim latency p90 above ``latency_p90_sec`` while tasks
+  wait, adds local Dask workers and their service loops, up to
+  ``max_workers``;
+* an empty queue for ``idle_retire_sec`` retires one worker at a time, down to
+  ``min_workers``;
+* no decision other than restoring the bounds is taken within
+  ``cooldown_sec`` of the previous scaling action.
+
+Tasks are queued per worker, so the tasks still waiting in a retired worker's
+directory are handed over to the survivors, and a scale-up moves part of the
+backlog to the new workers.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+SERVICE_TASK_SUFFIX = ".task.json"
+DEFAULT_PENDING_PER_WORKER = 4.0
+DEFAULT_IDLE_RETIRE_SEC = 120.0
+DEFAULT_COOLDOWN_SEC = 30.0
+DEFAULT_SPAWN_TIMEOUT_SEC = 60.0
+
+
+@dataclass(frozen=True)
+class ServiceAutoscalePolicy:
+    """Bounds and thresholds of the service worker autoscaler."""
+
+    min_workers: int
+    max_workers: int
+    pending_per_worker: float = DEFAULT_PENDING_PER_WORKER
+    latency_p90_sec: Optional[float] = None
+    idle_retire_sec: float = DEFAULT_IDLE_RETIRE_SEC
+    cooldown_sec: float = DEFAULT_COOLDOWN_SEC
+    spawn_timeout_sec: float = DEFAULT_SPAWN_TIMEOUT_SEC
+
+    def __post_init__(self) -> None:
+        if self.min_workers < 1:
+            raise ValueError("autoscale min_workers must be at least 1")
+        if self.max_workers < self.min_workers:
+            raise ValueError("autoscale max_workers must be >= min_workers")
+        if self.pending_per_worker <= 0:
+            raise ValueError("autoscale pending_per_worker must be positive")
+        if self.latency_p90_sec is not None and self.latency_p90_sec <= 0:
+            raise ValueError("autoscale latency_p90_sec must be positive")
+        for name in ("idle_retire_sec", "cooldown_sec", "spawn_timeout_sec"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"autoscale {name} must be >= 0")
+
+    @classmethod
+    def from_value(cls, value: Any) -> Optional["ServiceAutoscalePolicy"]:
+        """Accept a policy, a mapping of its fields (``serve`` and state files), or ``None``."""
+        if value is None or isinstance(value, cls):
+            return value
+        if not isinstance(value, Mapping):
+            raise TypeError("autoscale must be a ServiceAutoscalePolicy or a mapping of its fields")
+        unknown = set(value) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown autoscale setting(s): {', '.join(sorted(unknown))}")
+        return cls(**dict(value))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class ServiceAutoscaleDecision:
+    target: int
+    reason: str
+
+
+def autoscale_decision(
+    policy: ServiceAutoscalePolicy,
+    *,
+    workers: int,
+    healthy: int,
+    queue: Mapping[str, Any],
+    latency: Mapping[str, Any],
+    idle_since: Optional[float],
+    last_scale_at: Optional[float],
+    now: float,
+) -> ServiceAutoscaleDecision:
+    """Return the worker count the service should run with, and why."""
+    if workers < policy.min_workers:
+        return ServiceAutoscaleDecision(policy.min_workers, "below_min")
+    if workers > policy.max_workers:
+        return ServiceAutoscaleDecision(policy.max_workers, "above_max")
+    if last_scale_at is not None and now - last_scale_at < policy.cooldown_sec:
+        return ServiceAutoscaleDecision(workers, "cooldown")
+
+    pending = int(queue.get("pending", 0) or 0)
+    backlog = pending + int(queue.get("running", 0) or 0)
+    if workers < policy.max_workers:
+        if pending and backlog > policy.pending_per_worker * max(healthy, 1):
+            wanted = math.ceil(backlog / policy.pending_per_worker)
+            # Unhealthy workers hold a slot but drain nothing.
+            wanted += workers - healthy
+            return ServiceAutoscaleDecision(
+                min(max(wanted, workers + 1), policy.max_workers),
+                "queue_depth",
+            )
+        p90 = latency.get("p90_sec")
+        if (
+            pending
+            and policy.latency_p90_sec is not None
+            and p90 is not None
+            and float(p90) > policy.latency_p90_sec
+        ):
+            return ServiceAutoscaleDecision(workers + 1, "claim_latency")
+
+    if (
+        workers > policy.min_workers
+        and backlog == 0
+        and idle_since is not None
+        and now - idle_since >= policy.idle_retire_sec
+    ):
+        return ServiceAutoscaleDecision(workers - 1, "idle")
+    return ServiceAutoscaleDecision(workers, "steady")
+
+
+def retire_candidates(
+    workers: Sequence[str],
+    count: int,
+    *,
+    added: Sequence[str] = (),
+    unhealthy: Sequence[str] = (),
+) -> List[str]:
+    """Pick ``count`` workers to retire: unhealthy first, then the most recently added."""
+    order = [worker for worker in unhealthy if worker in workers]
+    order += [worker for worker in reversed(added) if worker in workers]
+    order += list(reversed(workers))
+    return list(dict.fromkeys(order))[: max(count, 0)]
+
+
+def pending_tasks_by_worker(
+    pending_dir: Optional[Path],
+    workers: Sequence[str],
+    *,
+    safe_name: Any,
+) -> Dict[str, List[Path]]:
+    """Return the queued task files of each worker, in submit order."""
+    if pending_dir is None:
+        return {worker: [] for worker in workers}
+    return {
+        worker: sorted(
+            (pending_dir / safe_name(worker)).glob(f"*{SERVICE_TASK_SUFFIX}"),
+            key=lambda path: path.name,
+        )
+        for worker in workers
+    }
+
+
+def plan_rebalance(
+    tasks: Mapping[str, Sequence[Path]],
+    *,
+    sources: Sequence[str],
+    targets: Sequence[str],
+    drain: bool,
+) -> List[tuple[Path, str]]:
+    """Plan ``(task file, new worker)`` moves from ``sources`` to ``targets``.
+
+    ``drain`` empties the sources (retired workers); otherwise the newest tasks
+    of the busiest sources move until every target holds its fair share.
+    """
+    if not targets:
+        return []
+    loads = {worker: len(tasks.get(worker, ())) for worker in targets}
+    moves: List[tuple[Path, str]] = []
+    if drain:
+        for source in sources:
+            for task_path in tasks.get(source, ()):
+                target = min(targets, key=lambda worker: (loads[worker], worker))
+                loads[target] += 1
+                moves.append((task_path, target))
+        return moves
+
+    remaining = {source: list(tasks.get(source, ())) for source in sources}
+    total = sum(len(paths) for paths in remaining.values()) + sum(loads.values())
+    share = total // (len(remaining) + len(targets))
+    for target in targets:
+        while loads[target] < share:
+            source = max(remaining, key=lambda worker: len(remaining[worker]), default=None)
+            if source is None or len(remaining[source]) <= share:
+                break
+            moves.append((remaining[source].pop(), target))
+            loads[target] += 1
+    return moves
+
+
+def rehome_pending_tasks(
+    moves: Sequence[tuple[Path, str]],
+    *,
+    pending_dir: Path,
+    safe_name: Any,
+    log: Any = logger,
+) -> int:
+    """Readdress pending tasks to another worker; return how many moved.
+
+    Each task is first renamed to a hidden name in place, which a worker scan
+    ignores, so it is either claimed by its current worker or moved, never both.
+    """
+    moved = 0
+    for task_path, worker in moves:
+        hidden = task_path.with_name(f".{task_path.name}.rehome-{uuid.uuid4().hex}.tmp")
+        try:
+            os.replace(task_path, hidden)
+        except FileNotFoundError:
+            continue
+        try:
+            payload = json.loads(hidden.read_text(encoding="utf-8"))
+            payload["worker"] = str(worker)
+            target_dir = pending_dir / safe_name(worker)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            target = target_dir / task_path.name
+            tmp_path = target.with_suffix(target.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, target)
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            log.warning("Could not hand service task %s to %s: %s", task_path.name, worker, exc)
+            os.replace(hidden, task_path)
+            continue
+        hidden.unlink()
+        moved += 1
+    return moved
+
+
+__all__ = [
+    "DEFAULT_COOLDOWN_SEC",
+    "DEFAULT_IDLE_RETIRE_SEC",
+    "DEFAULT_PENDING_PER_WORKER",
+    "DEFAULT_SPAWN_TIMEOUT_SEC",
+    "ServiceAutoscaleDecision",
+    "ServiceAutoscalePolicy",
+    "autoscale_decision",
+    "pending_tasks_by_worker",
+    "plan_rebalance",
+    "rehome_pending_tasks",
+    "retire_candidates",
+]
@@ -0,0 +1,164 @@
+"""In-memory view of service worker heartbeats.
+
+Health checks used to open and parse every file of the heartbeat directory,
+twice per ``AGI.serve(action="status")``. :class:`ServiceHeartbeatView` keeps
+the latest payload of every worker in memory, fed by two channels:
+
+* the Dask events service workers publish on :data:`SERVICE_HEARTBEAT_TOPIC`
+  (``Worker.log_event``), which the manager's client subscribes to once per
+  service runtime;
+* the heartbeat files, which still back recovery by a new controller and
+  workers outside Dask. A file is only parsed again when its inode, size or
+  mtime changed.
+
+While every service worker has an event fresher than half the heartbeat
+timeout, a health query reads the view only and never touches the queue
+directory.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from agi_node.agi_dispatcher.base_worker_service_support import SERVICE_HEARTBEAT_TOPIC
+
+logger = logging.getLogger(__name__)
+
+_SUBSCRIBE_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TimeoutError, TypeError, ValueError)
+_READ_EXCEPTIONS = (OSError, ValueError, TypeError, json.JSONDecodeError)
+
+
+def _beat_timestamp(payload: Any) -> float:
+    if not isinstance(payload, dict):
+        return 0.0
+    try:
+        return float(payload.get("timestamp", 0.0) or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class ServiceHeartbeatView:
+    """Latest heartbeat payload of every worker of one heartbeat directory."""
+
+    def __init__(self, heartbeat_dir: Optional[Path]) -> None:
+        self.heartbeat_dir = heartbeat_dir
+        self.subscribed_client: Any = None
+        self.events_received = 0
+        self._lock = threading.Lock()
+        self._events: Dict[str, Dict[str, Any]] = {}
+        # Heartbeat file path -> ((inode, size, mtime_ns), parsed payload or None).
+        self._files: Dict[str, Tuple[Tuple[int, int, int], Optional[Dict[str, Any]]]] = {}
+
+    def record(self, payload: Any) -> bool:
+        """Keep an event ``payload`` if it is the newest beat of its worker."""
+        timestamp = _beat_timestamp(payload)
+        worker = str(payload.get("worker", "")).strip() if isinstance(payload, dict) else ""
+        if not worker or timestamp <= 0:
+            return False
+        with self._lock:
+            if _beat_timestamp(self._events.get(worker)) >= timestamp:
+                return False
+            self._events[worker] = dict(payload)
+        return True
+
+    def handle_event(self, event: Any) -> None:
+        """``Client.subscribe_topic`` handler; ``event`` is ``(timestamp, message)``."""
+        try:
+            _scheduler_time, message = event
+        except (TypeError, ValueError):
+            return
+        if self.record(message):
+            self.events_received += 1
+
+    def refresh_files(self) -> None:
+        """Parse the heartbeat files created or rewritten since the last refresh."""
+        heartbeat_dir = self.heartbeat_dir
+        if heartbeat_dir is None or not heartbeat_dir.exists():
+            self._files.clear()
+            return
+        files: Dict[str, Tuple[Tuple[int, int, int], Optional[Dict[str, Any]]]] = {}
+        for beat_file in sorted(heartbeat_dir.glob("*.json"), key=lambda candidate: candidate.name):
+            key = str(beat_file)
+            try:
+                stat_result = beat_file.stat()
+            except OSError:
+                continue
+            signature = (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+            cached = self._files.get(key)
+            if cached is not None and cached[0] == signature:
+                files[key] = cached
+                continue
+            try:
+                with open(beat_file, "r", encoding="utf-8") as stream:
+                    payload = json.load(stream)
+            except _READ_EXCEPTIONS:
+                payload = None
+            files[key] = (signature, payload if isinstance(payload, dict) else None)
+        # Removed files (heartbeat cleanup) drop out of the view with their entry.
+        self._files = files
+
+    def fresh_for(self, workers: Iterable[str], *, now: float, max_age: float) -> bool:
+        """Whether events alone give a recent beat of every worker in ``workers``."""
+        if self.subscribed_client is None:
+            return False
+        workers = list(workers)
+        with self._lock:
+            return bool(workers) and all(
+                now - _beat_timestamp(self._events.get(worker)) <= max_age for worker in workers
+            )
+
+    def payloads(self) -> Dict[str, Dict[str, Any]]:
+        """Newest beat per worker across the cached files and the received events."""
+        merged: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            candidates = [payload for _signature, payload in self._files.values()]
+            candidates.extend(self._events.values())
+        for payload in candidates:
+            timestamp = _beat_timestamp(payload)
+            worker = str(payload.get("worker", "")).strip() if isinstance(payload, dict) else ""
+            if not worker or timestamp <= 0:
+                continue
+            if _beat_timestamp(merged.get(worker)) < timestamp:
+                merged[worker] = payload
+        return {worker: dict(payload) for worker, payload in merged.items()}
+
+
+def service_heartbeat_view(agi_cls: Any) -> ServiceHeartbeatView:
+    """Return the view of the current heartbeat directory, replacing a stale one."""
+    heartbeat_dir = getattr(agi_cls, "_service_queue_heartbeats", None)
+    view = getattr(agi_cls, "_service_heartbeat_view", None)
+    if not isinstance(view, ServiceHeartbeatView) or view.heartbeat_dir != heartbeat_dir:
+        view = ServiceHeartbeatView(heartbeat_dir)
+        agi_cls._service_heartbeat_view = view
+    return view
+
+
+def subscribe_service_heartbeats(agi_cls: Any, client: Any, *, log: Any = logger) -> bool:
+    """Subscribe ``client`` to the heartbeat events of the service workers once."""
+    view = service_heartbeat_view(agi_cls)
+    if client is None:
+        return False
+    if view.subscribed_client is client:
+        return True
+    subscribe = getattr(client, "subscribe_topic", None)
+    if not callable(subscribe):
+        return False
+    try:
+        subscribe(SERVICE_HEARTBEAT_TOPIC, view.handle_event)
+    except _SUBSCRIBE_EXCEPTIONS as exc:
+        log.debug("Service heartbeat events unavailable, reading files: %s", exc)
+        return False
+    view.subscribed_client = client
+    return True
+
+
+__all__ = [
+    "SERVICE_HEARTBEAT_TOPIC",
+    "ServiceHeartbeatView",
+    "service_heartbeat_view",
+    "subscribe_service_heartbeats",
+]
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from dask.distributed import Client
 
 from agi_cluster.agi_distributor import runtime_misc_support
+from agi_cluster.agi_distributor.service import service_autoscale_support, service_heartbeat_support
 from agi_env import AgiEnv
 from agi_node.agi_dispatcher import BaseWorker, WorkDispatcher
 
@@ -100,6 +101,8 @@ def _prepare_service_worker_args(agi_cls: Any, env: AgiEnv) -> Dict[str, Any]:
         **(agi_cls._args or {}),
         "_agi_service_mode": True,
         "_agi_service_queue_dir": str(agi_cls._service_queue_root),
+        # Four coalesced beats per timeout keep a healthy worker well inside it.
+        "_agi_service_heartbeat_interval": agi_cls._service_heartbeat_timeout_value() / 4.0,
     }
     return dict(agi_cls._service_worker_args)
 
@@ -607,6 +610,10 @@ async def service_recover(
             "cleanup_heartbeat_max_files",
             agi_cls._service_cleanup_heartbeat_max_files,
         )
+        agi_cls._service_autoscale_policy = (
+            service_autoscale_support.ServiceAutoscalePolicy.from_value(state.get("autoscale"))
+        )
+        agi_cls._service_autoscale_state = {}
         started_at = state.get("started_at")
         agi_cls._service_started_at = (
             float(started_at)
@@ -951,6 +958,275 @@ async def service_auto_restart_unhealthy(
     return {"restarted": restarted, "reasons": reasons}
 
 
+def _service_rebalance_pending(
+    agi_cls: Any,
+    *,
+    sources: List[str],
+    targets: List[str],
+    drain: bool,
+    log: Any = logger,
+) -> int:
+    pending_dir = agi_cls._service_queue_pending
+    if pending_dir is None:
+        return 0
+    tasks = service_autoscale_support.pending_tasks_by_worker(
+        pending_dir,
+        [*sources, *targets],
+        safe_name=agi_cls._service_safe_worker_name,
+    )
+    moves = service_autoscale_support.plan_rebalance(
+        tasks,
+        sources=sources,
+        targets=targets,
+        drain=drain,
+    )
+    return service_autoscale_support.rehome_pending_tasks(
+        moves,
+        pending_dir=pending_dir,
+        safe_name=agi_cls._service_safe_worker_name,
+        log=log,
+    )
+
+
+async def _service_scale_up(
+    agi_cls: Any,
+    env: AgiEnv,
+    client: Client,
+    count: int,
+    *,
+    policy: service_autoscale_support.ServiceAutoscalePolicy,
+    wait_fn: Any,
+    sleep_fn: Any,
+    log: Any,
+) -> List[str]:
+    known = set(await agi_cls._service_connected_workers(client)) | set(agi_cls._service_workers)
+    agi_cls._service_start_local_workers(count)
+
+    deadline = time.monotonic() + policy.spawn_timeout_sec
+    new_workers: List[str] = []
+    while True:
+        connected = await agi_cls._service_connected_workers(client)
+        new_workers = [worker for worker in connected if worker not in known][:count]
+        if len(new_workers) >= count or time.monotonic() >= deadline:
+            break
+        await sleep_fn(0.5)
+    if not new_workers:
+        log.warning("Autoscaled service workers did not connect within %ss", policy.spawn_timeout_sec)
+        return []
+
+    prior_futures = dict(agi_cls._service_futures)
+    prior_workers = list(agi_cls._service_workers)
+    added_futures: Dict[str, Any] = {}
+    try:
+        _submit_service_worker_inits(
+            agi_cls,
+            env,
+            client,
+            new_workers,
+            key_prefix="agi-serve-autoscale",
+        )
+        _submit_service_loops(
+            agi_cls,
+            env,
+            client,
+            new_workers,
+            key_prefix="agi-serve-autoscale",
+            service_futures=added_futures,
+        )
+        agi_cls._service_futures = {**prior_futures, **added_futures}
+        agi_cls._service_write_state(env, agi_cls._service_state_payload(env))
+    except BaseException:
+        pending_added = dict(added_futures)
+        if added_futures:
+            try:
+                pending_added = await _stop_owned_service_loops(
+                    agi_cls,
+                    env,
+                    added_futures,
+                    wait_fn=wait_fn,
+                    client=client,
+                    log=log,
+                )
+            except BaseException as cleanup_exc:
+                log.warning("Autoscaled service-loop cleanup failed: %s", cleanup_exc)
+        # Loops that could not be stopped stay owned so action='stop' reaches them.
+        agi_cls._service_futures = {**prior_futures, **pending_added}
+        agi_cls._service_workers = list(dict.fromkeys([*prior_workers, *pending_added]))
+        if pending_added:
+            agi_cls._service_cleanup_unproven = True
+        raise
+
+    _service_rebalance_pending(
+        agi_cls,
+        sources=prior_workers,
+        targets=new_workers,
+        drain=False,
+        log=log,
+    )
+    return new_workers
+
+
+async def _service_scale_down(
+    agi_cls: Any,
+    env: AgiEnv,
+    client: Client,
+    count: int,
+    *,
+    added: List[str],
+    unhealthy: List[str],
+    wait_fn: Any,
+    log: Any,
+) -> List[str]:
+    candidates = service_autoscale_support.retire_candidates(
+        agi_cls._service_workers,
+        count,
+        added=added,
+        unhealthy=unhealthy,
+    )
+    owned = {
+        worker: agi_cls._service_futures[worker]
+        for worker in candidates
+        if worker in agi_cls._service_futures
+    }
+    still_running = await _stop_owned_service_loops(
+        agi_cls,
+        env,
+        owned,
+        wait_fn=wait_fn,
+        client=client,
+        log=log,
+    )
+    retired = [worker for worker in candidates if worker not in still_running]
+    if still_running:
+        log.warning(
+            "Service loops did not stop in time and stay owned: %s",
+            ", ".join(still_running),
+        )
+    if not retired:
+        return []
+
+    agi_cls._service_futures = {
+        worker: future
+        for worker, future in agi_cls._service_futures.items()
+        if worker not in retired
+    }
+    agi_cls._service_workers = [
+        worker for worker in agi_cls._service_workers if worker not in retired
+    ]
+    agi_cls._service_write_state(env, agi_cls._service_state_payload(env))
+    # Tasks submitted to a retired worker after the idle check, and claims it
+    # handed back when its loop stopped, go to the surviving workers.
+    _service_rebalance_pending(
+        agi_cls,
+        sources=retired,
+        targets=list(agi_cls._service_workers),
+        drain=True,
+        log=log,
+    )
+    try:
+        retire = client.retire_workers(
+            workers=[worker if "://" in worker else f"tcp://{worker}" for worker in retired],
+            close_workers=True,
+        )
+        if asyncio.iscoroutine(retire) or isinstance(retire, asyncio.Future):
+            await retire
+    except _SERVICE_RECOVERABLE_EXCEPTIONS as exc:
+        # The loop is gone; an idle Dask worker left behind is stopped with the runtime.
+        log.warning("Failed to retire Dask workers %s: %s", retired, exc)
+    return retired
+
+
+async def service_autoscale(
+    agi_cls: Any,
+    env: AgiEnv,
+    client: Client,
+    *,
+    now: Optional[float] = None,
+    wait_fn: Any = None,
+    sleep_fn: Any = asyncio.sleep,
+    log: Any = logger,
+) -> Dict[str, Any]:
+    """Run one autoscaling step of the service worker pool.
+
+    Adds local Dask workers and service loops while the backlog or the claim
+    latency exceeds the policy, and retires idle ones, within its bounds.
+    """
+    policy = agi_cls._service_autoscale_policy
+    if policy is None:
+        return {"enabled": False}
+    if wait_fn is None:
+        from dask.distributed import wait as wait_fn
+
+    current_time = time.time() if now is None else float(now)
+    state = agi_cls._service_autoscale_state
+    queue = agi_cls._service_queue_counts()
+    if queue.get("pending", 0) or queue.get("running", 0):
+        state["idle_since"] = None
+    elif state.get("idle_since") is None:
+        state["idle_since"] = current_time
+
+    workers = list(agi_cls._service_workers)
+    unhealthy = list(agi_cls._service_unhealthy_workers(workers)) if workers else []
+    latency = agi_cls._service_queue_latency()
+    decision = service_autoscale_support.autoscale_decision(
+        policy,
+        workers=len(workers),
+        healthy=len(workers) - len(unhealthy),
+        queue=queue,
+        latency=latency,
+        idle_since=state.get("idle_since"),
+        last_scale_at=state.get("last_scale_at"),
+        now=current_time,
+    )
+    result: Dict[str, Any] = {
+        "enabled": True,
+        "workers": len(workers),
+        "target": decision.target,
+        "reason": decision.reason,
+        "min_workers": policy.min_workers,
+        "max_workers": policy.max_workers,
+        "added": [],
+        "retired": [],
+    }
+    added_workers = [worker for worker in state.get("added", []) if worker in workers]
+    if decision.target > len(workers):
+        result["added"] = await _service_scale_up(
+            agi_cls,
+            env,
+            client,
+            decision.target - len(workers),
+            policy=policy,
+            wait_fn=wait_fn,
+            sleep_fn=sleep_fn,
+            log=log,
+        )
+        added_workers += result["added"]
+    elif decision.target < len(workers):
+        result["retired"] = await _service_scale_down(
+            agi_cls,
+            env,
+            client,
+            len(workers) - decision.target,
+            added=added_workers,
+            unhealthy=unhealthy,
+            wait_fn=wait_fn,
+            log=log,
+        )
+        added_workers = [worker for worker in added_workers if worker not in result["retired"]]
+    state["added"] = added_workers
+    if result["added"] or result["retired"]:
+        state["last_scale_at"] = current_time
+        state["idle_since"] = None if result["added"] else current_time
+        log.info(
+            "Service autoscale (%s): added %s, retired %s",
+            decision.reason,
+            result["added"],
+            result["retired"],
+        )
+    result["workers"] = len(agi_cls._service_workers)
+    return result
+
+
 async def serve(
     agi_cls: Any,
     env: AgiEnv,
@@ -973,6 +1249,7 @@ async def serve(
     cleanup_failed_max_files: Optional[int] = None,
     cleanup_heartbeat_max_files: Optional[int] = None,
     health_output_path: Optional[Union[str, Path]] = None,
+    autoscale: Optional[Union[service_autoscale_support.ServiceAutoscalePolicy, Dict[str, Any]]] = None,
     background_job_manager_factory: Any,
     wait_fn: Any = None,
     log: Any = logger,
@@ -1075,10 +1352,21 @@ async def serve(
 
         restart_info: Dict[str, Any] = {"restarted": [], "reasons": {}}
         if client is not None and agi_cls._service_workers:
+            # A recovered controller starts following the heartbeat events here.
+            service_heartbeat_support.subscribe_service_heartbeats(agi_cls, client, log=log)
             restart_info = await agi_cls._service_auto_restart_unhealthy(env, client)
 
+        autoscale_info: Dict[str, Any] = {"enabled": agi_cls._service_autoscale_policy is not None}
+        if client is not None and agi_cls._service_workers and autoscale_info["enabled"]:
+            try:
+                autoscale_info = await agi_cls._service_autoscale(env, client)
+            except _SERVICE_RECOVERABLE_EXCEPTIONS as exc:
+                log.warning("Service autoscale step failed: %s", exc)
+                autoscale_info = {"enabled": True, "error": str(exc)}
+
         cleanup_info = agi_cls._service_cleanup_artifacts()
         queue_state = agi_cls._service_queue_counts()
+        queue_latency = agi_cls._service_queue_latency()
         queue_dir = str(agi_cls._service_queue_root) if agi_cls._service_queue_root else None
         workers_snapshot = list(agi_cls._service_workers)
         worker_health = agi_cls._service_worker_health(workers_snapshot) if workers_snapshot else []
@@ -1093,12 +1381,14 @@ async def serve(
                     "pending": [],
                     "client_status": client_status,
                     "queue": queue_state,
+                    "queue_latency": queue_latency,
                     "queue_dir": queue_dir,
                     "cleanup": cleanup_info,
                     "heartbeat_timeout_sec": agi_cls._service_heartbeat_timeout_value(),
                     "worker_health": worker_health,
                     "restarted_workers": restart_info["restarted"],
                     "restart_reasons": restart_info["reasons"],
+                    "autoscale": autoscale_info,
                 },
                 health_output_path=health_output_path,
                 health_only=health_only,
@@ -1114,12 +1404,14 @@ async def serve(
                     "pending": pending,
                     "client_status": "missing",
                     "queue": queue_state,
+                    "queue_latency": queue_latency,
                     "queue_dir": queue_dir,
                     "cleanup": cleanup_info,
                     "heartbeat_timeout_sec": agi_cls._service_heartbeat_timeout_value(),
                     "worker_health": worker_health,
                     "restarted_workers": restart_info["restarted"],
                     "restart_reasons": restart_info["reasons"],
+                    "autoscale": autoscale_info,
                 },
                 health_output_path=health_output_path,
                 health_only=health_only,
@@ -1154,12 +1446,14 @@ async def serve(
                 "pending": pending_workers,
                 "client_status": getattr(client, "status", None),
                 "queue": queue_state,
+                "queue_latency": queue_latency,
                 "queue_dir": queue_dir,
                 "cleanup": cleanup_info,
                 "heartbeat_timeout_sec": agi_cls._service_heartbeat_timeout_value(),
                 "worker_health": worker_health,
                 "restarted_workers": restart_info["restarted"],
                 "restart_reasons": restart_info["reasons"],
+                "autoscale": autoscale_info,
             },
             health_output_path=health_output_path,
             health_only=health_only,
@@ -1497,6 +1791,7 @@ async def serve(
                 "workers": list(agi_cls._service_workers),
                 "pending": [],
                 "queue": agi_cls._service_queue_counts(),
+                "queue_latency": agi_cls._service_queue_latency(),
                 "queue_dir": str(agi_cls._service_queue_root) if agi_cls._service_queue_root else None,
                 "cleanup": cleanup_info,
                 "heartbeat_timeout_sec": agi_cls._service_heartbeat_timeout_value(),
@@ -1523,6 +1818,7 @@ async def serve(
         workers = agi_cls._worker_default
     elif not isinstance(workers, dict):
         raise ValueError("workers must be a dict. {'ip-address':nb-worker}")
+    autoscale_policy = service_autoscale_support.ServiceAutoscalePolicy.from_value(autoscale)
 
     agi_cls._jobs = background_job_manager_factory()
     runtime_misc_support.initialize_runtime_state(
@@ -1587,6 +1883,7 @@ async def serve(
 
         dask_workers = list(agi_cls._dask_workers)
         queue_paths = agi_cls._init_service_queue(env, service_queue_dir=service_queue_dir)
+        service_heartbeat_support.subscribe_service_heartbeats(agi_cls, client, log=log)
         recovery_info = agi_cls._recover_orphaned_service_tasks()
         cleanup_info = agi_cls._service_cleanup_artifacts()
         _prepare_service_worker_args(agi_cls, env)
@@ -1609,6 +1906,8 @@ async def serve(
         agi_cls._service_futures = owned_service_futures
         agi_cls._service_workers = dask_workers
         agi_cls._service_started_at = time.time()
+        agi_cls._service_autoscale_policy = autoscale_policy
+        agi_cls._service_autoscale_state = {}
         agi_cls._service_heartbeat_timeout = agi_cls._service_heartbeat_timeout_value()
         agi_cls._service_write_state(env, agi_cls._service_state_payload(env))
 
@@ -1642,17 +1941,12 @@ async def serve(
         raise
 
 
-async def submit(
+async def _prepare_service_submission(
     agi_cls: Any,
-    env: Optional[AgiEnv] = None,
-    *,
-    workers: Optional[Dict[str, int]] = None,
-    work_plan: Optional[Any] = None,
-    work_plan_metadata: Optional[Any] = None,
-    task_id: Optional[str] = None,
-    task_name: Optional[str] = None,
-    **args: Any,
-) -> Dict[str, Any]:
+    env: Optional[AgiEnv],
+    workers: Optional[Dict[str, int]],
+) -> tuple[AgiEnv, Dict[str, int], List[str]]:
+    """Check the service is accepting tasks; return env, worker layout and loop workers."""
     env = env or agi_cls.env
     if env is None:
         raise ValueError("env is required when AGI has not been initialised yet")
@@ -1676,6 +1970,134 @@ async def submit(
     elif not isinstance(workers, dict):
         raise ValueError("workers must be a dict. {'ip-address':nb-worker}")
 
+    service_workers = list(agi_cls._service_workers or agi_cls._service_futures.keys())
+    if not service_workers and agi_cls._dask_client is not None:
+        service_workers = await agi_cls._service_connected_workers(agi_cls._dask_client)
+        agi_cls._service_workers = list(service_workers)
+    return env, workers, service_workers
+
+
+def _service_task_entries(
+    agi_cls: Any,
+    service_workers: List[str],
+    *,
+    submit_seq: int,
+    batch_id: str,
+    batch_name: str,
+    work_plan: Any,
+    work_plan_metadata: Any,
+    effective_args: Dict[str, Any],
+    priority: int = 0,
+    deadline: Optional[float] = None,
+) -> List[tuple[Path, Dict[str, Any]]]:
+    pending_dir = agi_cls._service_queue_pending
+    entries: List[tuple[Path, Dict[str, Any]]] = []
+    plan_names = WorkDispatcher._convert_functions_to_names(work_plan or [])
+    created_at = time.time()
+
+    for worker_idx, worker_addr in enumerate(service_workers):
+        safe_worker = agi_cls._service_safe_worker_name(worker_addr)
+
+        filename = f"{submit_seq:06d}-{batch_id}-{worker_idx:03d}-{safe_worker}{SERVICE_TASK_SUFFIX}"
+        # Each worker only scans (and is woken for) its own pending subdirectory.
+        task_path = pending_dir / safe_worker / filename
+        entries.append(
+            (
+                task_path,
+                {
+                    "schema": SERVICE_TASK_SCHEMA,
+                    "task_id": batch_id,
+                    "task_name": batch_name,
+                    "created_at": created_at,
+                    # Workers claim higher priorities first (aged by waiting
+                    # time), then earlier deadlines, then submit order.
+                    "priority": priority,
+                    "deadline": deadline,
+                    # Target tasks by worker name only: positional ids drift after
+                    # service_recover/restart reorders _service_workers, while the
+                    # worker process keeps the id frozen at init time. worker_idx=None
+                    # makes _task_matches_worker rely on the stable name match.
+                    "worker_idx": None,
+                    "worker": str(worker_addr),
+                    "plan": agi_cls._wrap_worker_chunk(plan_names, worker_idx),
+                    "metadata": agi_cls._wrap_worker_chunk(work_plan_metadata or [], worker_idx),
+                    "args": effective_args,
+                },
+            )
+        )
+    return entries
+
+
+def _write_service_tasks(
+    entries: List[tuple[Path, Dict[str, Any]]],
+    *,
+    compact: bool = False,
+) -> List[str]:
+    """Publish task files, each through a temporary file and an atomic rename."""
+    dump_options: Dict[str, Any] = (
+        {"separators": (",", ":")} if compact else {"sort_keys": True}
+    )
+    for task_path in {task_path.parent for task_path, _ in entries}:
+        task_path.mkdir(parents=True, exist_ok=True)
+    queued_files: List[str] = []
+    for task_path, payload in entries:
+        tmp_path = task_path.with_suffix(task_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as stream:
+            json.dump(payload, stream, default=_service_task_json_default, **dump_options)
+        os.replace(tmp_path, task_path)
+        queued_files.append(str(task_path))
+    return queued_files
+
+
+def _service_task_schedule(priority: Any, deadline: Any) -> tuple[int, Optional[float]]:
+    """Validate ``task_priority``/``task_deadline`` (a UNIX timestamp)."""
+    try:
+        priority_value = int(priority or 0)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"task_priority must be an integer, got {priority!r}") from exc
+    if deadline is None:
+        return priority_value, None
+    if isinstance(deadline, datetime.datetime):
+        return priority_value, deadline.timestamp()
+    try:
+        deadline_value = float(deadline)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            f"task_deadline must be a UNIX timestamp or datetime, got {deadline!r}"
+        ) from exc
+    return priority_value, deadline_value
+
+
+def _service_queue_dir(agi_cls: Any) -> str:
+    if agi_cls._service_queue_root:
+        return str(agi_cls._service_queue_root)
+    return str(agi_cls._service_queue_pending.parent)
+
+
+def _service_plan_key(args: Dict[str, Any]) -> str:
+    return json.dumps(
+        WorkDispatcher._normalize_cache_value(args),
+        sort_keys=True,
+        default=_service_task_json_default,
+    )
+
+
+async def submit(
+    agi_cls: Any,
+    env: Optional[AgiEnv] = None,
+    *,
+    workers: Optional[Dict[str, int]] = None,
+    work_plan: Optional[Any] = None,
+    work_plan_metadata: Optional[Any] = None,
+    task_id: Optional[str] = None,
+    task_name: Optional[str] = None,
+    task_priority: int = 0,
+    task_deadline: Optional[Any] = None,
+    **args: Any,
+) -> Dict[str, Any]:
+    priority, deadline = _service_task_schedule(task_priority, task_deadline)
+    env, workers, service_workers = await _prepare_service_submission(agi_cls, env, workers)
+
     effective_args = agi_cls._service_public_args(dict(args) if args else dict(agi_cls._args or {}))
 
     if work_plan is None or work_plan_metadata is None:
@@ -1692,10 +2114,6 @@ async def submit(
     agi_cls._work_plan = work_plan
     agi_cls._work_plan_metadata = work_plan_metadata
 
-    service_workers = list(agi_cls._service_workers or agi_cls._service_futures.keys())
-    if not service_workers and agi_cls._dask_client is not None:
-        service_workers = await agi_cls._service_connected_workers(agi_cls._dask_client)
-        agi_cls._service_workers = list(service_workers)
     if not service_workers:
         raise RuntimeError("No active service workers available for submission.")
 
@@ -1705,54 +2123,140 @@ async def submit(
     batch_name = task_name or "service-workplan"
     cleanup_info = agi_cls._service_cleanup_artifacts()
 
-    pending_dir = agi_cls._service_queue_pending
-    queued_files: List[str] = []
-
-    for worker_idx, worker_addr in enumerate(service_workers):
-        safe_worker = agi_cls._service_safe_worker_name(worker_addr)
-
-        filename = f"{submit_seq:06d}-{batch_id}-{worker_idx:03d}-{safe_worker}{SERVICE_TASK_SUFFIX}"
-        task_path = pending_dir / filename
-        tmp_path = task_path.with_suffix(task_path.suffix + ".tmp")
-
-        payload = {
-            "schema": SERVICE_TASK_SCHEMA,
-            "task_id": batch_id,
-            "task_name": batch_name,
-            "created_at": time.time(),
-            # Target tasks by worker name only: positional ids drift after
-            # service_recover/restart reorders _service_workers, while the
-            # worker process keeps the id frozen at init time. worker_idx=None
-            # makes _task_matches_worker rely on the stable name match.
-            "worker_idx": None,
-            "worker": str(worker_addr),
-            "plan": agi_cls._wrap_worker_chunk(
-                WorkDispatcher._convert_functions_to_names(work_plan or []),
-                worker_idx,
-            ),
-            "metadata": agi_cls._wrap_worker_chunk(work_plan_metadata or [], worker_idx),
-            "args": effective_args,
-        }
-
-        with open(tmp_path, "w", encoding="utf-8") as stream:
-            json.dump(payload, stream, default=_service_task_json_default, sort_keys=True)
-        os.replace(tmp_path, task_path)
-        queued_files.append(str(task_path))
+    queued_files = _write_service_tasks(
+        _service_task_entries(
+            agi_cls,
+            service_workers,
+            submit_seq=submit_seq,
+            batch_id=batch_id,
+            batch_name=batch_name,
+            work_plan=work_plan,
+            work_plan_metadata=work_plan_metadata,
+            effective_args=effective_args,
+            priority=priority,
+            deadline=deadline,
+        )
+    )
 
     logger.info(
         "Queued service batch %s (%s) for %s workers in %s",
         batch_id,
         batch_name,
         len(service_workers),
-        pending_dir,
+        agi_cls._service_queue_pending,
     )
 
     return {
         "status": "queued",
         "task_id": batch_id,
         "task_name": batch_name,
+        "priority": priority,
+        "deadline": deadline,
         "workers": service_workers,
         "queued_files": queued_files,
-        "queue_dir": str(agi_cls._service_queue_root) if agi_cls._service_queue_root else str(pending_dir.parent),
+        "queue_dir": _service_queue_dir(agi_cls),
+        "cleanup": cleanup_info,
+    }
+
+
+async def submit_many(
+    agi_cls: Any,
+    requests: List[Dict[str, Any]],
+    env: Optional[AgiEnv] = None,
+    *,
+    workers: Optional[Dict[str, int]] = None,
+    cleanup: bool = False,
+) -> Dict[str, Any]:
+    """Queue several service requests with one planning pass per distinct args.
+
+    Each request is a mapping of the keyword arguments accepted by
+    :func:`submit` (``work_plan``, ``work_plan_metadata``, ``task_id``,
+    ``task_name`` and the target args). Requests whose args match share the
+    plan built for the first of them, so the target module is loaded, its
+    inputs fingerprinted and its work planned once per distinct args. All
+    task files are written in one pass with a compact JSON encoding, and
+    done/failed artifact cleanup only runs when ``cleanup`` is true.
+    """
+    env, workers, service_workers = await _prepare_service_submission(agi_cls, env, workers)
+    if not service_workers:
+        raise RuntimeError("No active service workers available for submission.")
+
+    plans: Dict[str, tuple[Any, Any]] = {}
+    planned = 0
+    entries: List[tuple[Path, Dict[str, Any]]] = []
+    tasks: List[Dict[str, Any]] = []
+    for request in requests:
+        request_args = dict(request)
+        work_plan = request_args.pop("work_plan", None)
+        work_plan_metadata = request_args.pop("work_plan_metadata", None)
+        task_id = request_args.pop("task_id", None)
+        task_name = request_args.pop("task_name", None)
+        priority, deadline = _service_task_schedule(
+            request_args.pop("task_priority", 0),
+            request_args.pop("task_deadline", None),
+        )
+        effective_args = agi_cls._service_public_args(
+            request_args if request_args else dict(agi_cls._args or {})
+        )
+
+        if work_plan is None or work_plan_metadata is None:
+            plan_key = _service_plan_key(effective_args)
+            if plan_key not in plans:
+                agi_cls._workers, generated_plan, generated_metadata = await WorkDispatcher._do_distrib(
+                    env,
+                    workers,
+                    effective_args,
+                )
+                plans[plan_key] = (generated_plan, generated_metadata)
+                planned += 1
+            generated_plan, generated_metadata = plans[plan_key]
+            if work_plan is None:
+                work_plan = generated_plan
+            if work_plan_metadata is None:
+                work_plan_metadata = generated_metadata
+
+        agi_cls._service_submit_counter += 1
+        batch_id = task_id or f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+        batch_name = task_name or "service-workplan"
+        task_entries = _service_task_entries(
+            agi_cls,
+            service_workers,
+            submit_seq=agi_cls._service_submit_counter,
+            batch_id=batch_id,
+            batch_name=batch_name,
+            work_plan=work_plan,
+            work_plan_metadata=work_plan_metadata,
+            effective_args=effective_args,
+            priority=priority,
+            deadline=deadline,
+        )
+        entries.extend(task_entries)
+        tasks.append(
+            {
+                "task_id": batch_id,
+                "task_name": batch_name,
+                "priority": priority,
+                "deadline": deadline,
+                "queued_files": [str(task_path) for task_path, _ in task_entries],
+            }
+        )
+
+    _write_service_tasks(entries, compact=True)
+    cleanup_info = agi_cls._service_cleanup_artifacts() if cleanup else None
+
+    logger.info(
+        "Queued %s service requests (%s planned) for %s workers in %s",
+        len(tasks),
+        planned,
+        len(service_workers),
+        agi_cls._service_queue_pending,
+    )
+
+    return {
+        "status": "queued",
+        "tasks": tasks,
+        "planned": planned,
+        "workers": service_workers,
+        "queue_dir": _service_queue_dir(agi_cls),
         "cleanup": cleanup_info,
     }
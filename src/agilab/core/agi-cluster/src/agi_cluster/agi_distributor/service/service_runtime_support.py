@@ -3,9 +3,11 @@ from __future__ import annotations
 from agi_cluster.agi_distributor.service_lifecycle_support import (
     serve,
     service_auto_restart_unhealthy,
+    service_autoscale,
     service_recover,
     service_restart_workers,
     submit,
+    submit_many,
     wrap_worker_chunk,
 )
 from agi_cluster.agi_distributor.service_state_support import (
@@ -23,6 +25,7 @@ from agi_cluster.agi_distributor.service_state_support import (
     service_heartbeat_timeout_value,
     service_public_args,
     service_queue_counts,
+    service_queue_latency,
     service_queue_paths,
     service_read_heartbeat_payloads,
     service_read_heartbeats,
@@ -44,6 +47,7 @@ __all__ = [
     "service_apply_queue_root",
     "service_apply_runtime_config",
     "service_auto_restart_unhealthy",
+    "service_autoscale",
     "service_cleanup_artifacts",
     "service_clear_state",
     "service_connected_workers",
@@ -53,6 +57,7 @@ __all__ = [
     "service_heartbeat_timeout_value",
     "service_public_args",
     "service_queue_counts",
+    "service_queue_latency",
     "service_queue_paths",
     "service_read_heartbeat_payloads",
     "service_read_heartbeats",
@@ -67,5 +72,6 @@ __all__ = [
     "service_write_health_payload",
     "service_write_state",
     "submit",
+    "submit_many",
     "wrap_worker_chunk",
 ]
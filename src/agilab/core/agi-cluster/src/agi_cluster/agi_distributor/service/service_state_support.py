@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     # stays cheap for non-Dask runs.
     from dask.distributed import Client
 
+from agi_cluster.agi_distributor.service import service_heartbeat_support
 from agi_env import AgiEnv
 from agi_env.runtime.atomic_write_support import run_with_windows_file_sharing_retry
 
@@ -27,6 +28,11 @@ _SERVICE_EXPORT_EXCEPTIONS = _SERVICE_IO_EXCEPTIONS + (RuntimeError,)
 SERVICE_TASK_SCHEMA = "agi.service.task.v1"
 SERVICE_TASK_SUFFIX = ".task.json"
 LEGACY_SERVICE_TASK_SUFFIX = ".task.pkl"
+#: Most recent terminal tasks summarised by :func:`service_queue_latency`.
+SERVICE_LATENCY_SAMPLE = 512
+_LATENCY_PERCENTILES = (50, 90, 99)
+# Terminal task path -> (queue wait seconds, deadline missed), or None when unusable.
+_TASK_LATENCY_CACHE: Dict[str, Optional[Tuple[float, bool]]] = {}
 
 
 class ServiceStateUnavailableError(RuntimeError):
@@ -265,6 +271,12 @@ def service_health_payload(env: AgiEnv, result_payload: Dict[str, Any]) -> Dict[
     cleanup = result_payload.get("cleanup")
     if isinstance(cleanup, dict):
         health_payload["cleanup"] = cleanup
+    queue_latency = result_payload.get("queue_latency")
+    if isinstance(queue_latency, dict):
+        health_payload["queue_latency"] = queue_latency
+    autoscale = result_payload.get("autoscale")
+    if isinstance(autoscale, dict):
+        health_payload["autoscale"] = autoscale
     if worker_health_rows:
         health_payload["worker_health"] = worker_health_rows
 
@@ -339,6 +351,9 @@ def reset_service_queue_state(agi_cls: Any) -> None:
     agi_cls._service_started_at = None
     agi_cls._service_submit_counter = 0
     agi_cls._service_worker_args = {}
+    agi_cls._service_autoscale_policy = None
+    agi_cls._service_autoscale_state = {}
+    agi_cls._service_heartbeat_view = None
 
 
 def init_service_queue(
@@ -658,14 +673,83 @@ def service_queue_counts(agi_cls: Any) -> Dict[str, int]:
 
     for name, path in mapping.items():
         if path and path.exists():
-            counts[name] = sum(
-                1
-                for pattern in (f"*{SERVICE_TASK_SUFFIX}", f"*{LEGACY_SERVICE_TASK_SUFFIX}")
-                for _ in path.glob(pattern)
-            )
+            # Pending tasks are also queued in one subdirectory per worker.
+            patterns = (f"*{SERVICE_TASK_SUFFIX}", f"*{LEGACY_SERVICE_TASK_SUFFIX}")
+            if name == "pending":
+                patterns += tuple(f"*/{pattern}" for pattern in patterns)
+            counts[name] = sum(1 for pattern in patterns for _ in path.glob(pattern))
     return counts
 
 
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    position = (len(sorted_values) - 1) * pct / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _task_queue_wait(payload: Any) -> Optional[Tuple[float, bool]]:
+    """Return ``(seconds from submit to start, deadline missed)`` of a terminal task."""
+    if not isinstance(payload, dict):
+        return None
+    claim = payload.get("claim") if isinstance(payload.get("claim"), dict) else {}
+    started_at = payload.get("started_at", claim.get("claimed_at"))
+    created_at = payload.get("created_at")
+    try:
+        wait = float(started_at) - float(created_at)
+    except (TypeError, ValueError):
+        return None
+    # Manager and worker clocks may differ slightly on remote hosts.
+    return max(wait, 0.0), bool(payload.get("deadline_missed"))
+
+
+def service_queue_latency(
+    agi_cls: Any,
+    *,
+    sample: int = SERVICE_LATENCY_SAMPLE,
+) -> Dict[str, Any]:
+    """Summarise the queue wait of the ``sample`` most recently finished tasks."""
+    terminal: List[Tuple[float, Path]] = []
+    for path in (agi_cls._service_queue_done, agi_cls._service_queue_failed):
+        if not path or not path.exists():
+            continue
+        for task_path in path.glob(f"*{SERVICE_TASK_SUFFIX}"):
+            try:
+                terminal.append((task_path.stat().st_mtime, task_path))
+            except FileNotFoundError:
+                continue
+    terminal.sort(key=lambda item: item[0])
+
+    waits: List[float] = []
+    deadline_missed = 0
+    sampled = set()
+    for _mtime, task_path in terminal[-max(int(sample), 1):]:
+        key = str(task_path)
+        sampled.add(key)
+        if key not in _TASK_LATENCY_CACHE:
+            try:
+                payload = json.loads(task_path.read_text(encoding="utf-8"))
+            except _SERVICE_IO_EXCEPTIONS:
+                continue
+            # Terminal task files are written once, so the result is cached.
+            _TASK_LATENCY_CACHE[key] = _task_queue_wait(payload)
+        entry = _TASK_LATENCY_CACHE[key]
+        if entry is None:
+            continue
+        waits.append(entry[0])
+        deadline_missed += int(entry[1])
+    for key in _TASK_LATENCY_CACHE.keys() - sampled:
+        del _TASK_LATENCY_CACHE[key]
+
+    summary: Dict[str, Any] = {"samples": len(waits), "deadline_missed": deadline_missed}
+    if waits:
+        waits.sort()
+        for pct in _LATENCY_PERCENTILES:
+            summary[f"p{pct}_sec"] = _percentile(waits, pct)
+        summary["max_sec"] = waits[-1]
+    return summary
+
+
 def service_cleanup_artifacts(agi_cls: Any) -> Dict[str, int]:
     def _cleanup_dir(
         path: Optional[Path],
@@ -795,6 +879,7 @@ def service_state_payload(agi_cls: Any, env: AgiEnv) -> Dict[str, Any]:
         for worker, future in agi_cls._service_futures.items()
         if (key := getattr(future, "key", None)) not in (None, "")
     }
+    autoscale_policy = agi_cls._service_autoscale_policy
     return {
         "schema": "agi.service.state.v1",
         "target": env.target,
@@ -819,56 +904,32 @@ def service_state_payload(agi_cls: Any, env: AgiEnv) -> Dict[str, Any]:
         "cleanup_done_max_files": agi_cls._service_cleanup_done_max_files,
         "cleanup_failed_max_files": agi_cls._service_cleanup_failed_max_files,
         "cleanup_heartbeat_max_files": agi_cls._service_cleanup_heartbeat_max_files,
+        "autoscale": autoscale_policy.as_dict() if autoscale_policy is not None else None,
         "started_at": agi_cls._service_started_at or time.time(),
         "owner_pid": os.getpid(),
     }
 
 
 def service_read_heartbeats(agi_cls: Any) -> Dict[str, float]:
-    heartbeat_dir = agi_cls._service_queue_heartbeats
-    if heartbeat_dir is None or not heartbeat_dir.exists():
-        return {}
-
-    beats: Dict[str, float] = {}
-    for beat_file in sorted(heartbeat_dir.glob("*.json"), key=lambda candidate: candidate.name):
-        try:
-            with open(beat_file, "r", encoding="utf-8") as stream:
-                payload = json.load(stream)
-            if not isinstance(payload, dict):
-                continue
-            worker = str(payload.get("worker", "")).strip()
-            timestamp = float(payload.get("timestamp", 0.0) or 0.0)
-            if not worker or timestamp <= 0:
-                continue
-            previous = beats.get(worker)
-            beats[worker] = max(previous, timestamp) if previous else timestamp
-        except _SERVICE_IO_EXCEPTIONS:
-            continue
-    return beats
+    return {
+        worker: float(payload.get("timestamp", 0.0) or 0.0)
+        for worker, payload in agi_cls._service_read_heartbeat_payloads().items()
+    }
 
 
 def service_read_heartbeat_payloads(agi_cls: Any) -> Dict[str, Dict[str, Any]]:
-    heartbeat_dir = agi_cls._service_queue_heartbeats
-    if heartbeat_dir is None or not heartbeat_dir.exists():
+    view = service_heartbeat_support.service_heartbeat_view(agi_cls)
+    if view.heartbeat_dir is None:
         return {}
-
-    payloads: Dict[str, Dict[str, Any]] = {}
-    for beat_file in sorted(heartbeat_dir.glob("*.json"), key=lambda candidate: candidate.name):
-        try:
-            with open(beat_file, "r", encoding="utf-8") as stream:
-                payload = json.load(stream)
-            if not isinstance(payload, dict):
-                continue
-            worker = str(payload.get("worker", "")).strip()
-            timestamp = float(payload.get("timestamp", 0.0) or 0.0)
-            if not worker or timestamp <= 0:
-                continue
-            previous = payloads.get(worker)
-            if previous is None or float(previous.get("timestamp", 0.0) or 0.0) < timestamp:
-                payloads[worker] = payload
-        except _SERVICE_IO_EXCEPTIONS:
-            continue
-    return payloads
+    # Heartbeat events fresher than half the timeout answer the query on their
+    # own; the directory is only scanned when a worker is silent on the bus.
+    if view.subscribed_client is None or not view.fresh_for(
+        list(agi_cls._service_workers or []),
+        now=time.time(),
+        max_age=agi_cls._service_heartbeat_timeout_value() / 2.0,
+    ):
+        view.refresh_files()
+    return view.payloads()
 
 
 def service_worker_health(agi_cls: Any, workers: List[str]) -> List[Dict[str, Any]]:
@@ -38,8 +38,10 @@ from agi_env.runtime.atomic_write_support import atomic_write_text
 
 from .distribution_cache_support import (
     DISTRIBUTION_CACHE_SCHEMA,
+    FingerprintIndex,
     build_cache_context,
 )
+from .partition_support import anytime_partition
 
 logger = logging.getLogger(__name__)
 workers_default = {"127.0.0.1": 1}
@@ -185,6 +187,12 @@ class WorkDispatcher:
             return None
         return workers_plan, workers_plan_metadata
 
+    @staticmethod
+    def _fingerprint_index_path(file):
+        """Return the input fingerprint index stored next to ``file``."""
+        file = Path(file)
+        return file.with_name(f"{file.stem}.fingerprints.json")
+
     @staticmethod
     def _write_distribution_cache(file, data):
         serialized = json.dumps(
@@ -230,9 +238,13 @@ class WorkDispatcher:
         WorkDispatcher._apply_run_stages(target_inst, run_stages)
 
         file = env.distribution_tree
+        fingerprint_index = FingerprintIndex.load(
+            WorkDispatcher._fingerprint_index_path(file)
+        )
         cache_context = build_cache_context(
             target_inst,
             capacities=active_capacities,
+            fingerprint_index=fingerprint_index,
         )
         cached_distribution = None
         if file.exists():
@@ -262,6 +274,7 @@ class WorkDispatcher:
             cache_context_after = build_cache_context(
                 target_inst,
                 capacities=active_capacities,
+                fingerprint_index=fingerprint_index,
             )
             if cache_context != cache_context_after:
                 raise RuntimeError(
@@ -296,6 +309,12 @@ class WorkDispatcher:
             workers_plan = normalized["work_plan"]
             workers_plan_metadata = normalized["work_plan_metadata"]
 
+        fingerprint_index.save()
+        logger.info(
+            "distribution input fingerprints: %(hits)d reused, %(misses)d hashed",
+            fingerprint_index.stats(),
+        )
+
         loaded_workers = {}
         workers_work_item_tree_iter = iter(workers_plan)
         for ip, nb_workers in workers.items():
@@ -365,6 +384,7 @@ class WorkDispatcher:
         workers: Dict = None,  # ty: ignore[invalid-parameter-default]
         verbose: int = 0,
         threshold: int = 12,
+        time_budget: Optional[float] = None,
     ) -> List[List[List[Any]]]:
         """Partitions the nchunk2 weighted into n chuncks, in a smart way
         chunks and chunks_sizes must be left to None
@@ -379,8 +399,12 @@ class WorkDispatcher:
           capacities: the list of workers capacity (Default value = None)
           verbose: whether to display run detail or not (Default value = 0)
           threshold: maximum number of works for which the optimal (exponential)
-            algorithm is used; at or above it the suboptimal LPT heuristic runs
+            algorithm is used; at or above it the anytime partitioner runs
             instead (Default value = 12)
+          time_budget: seconds the anytime partitioner may spend improving its
+            seed plan; defaults to ``AGILAB_PARTITION_TIME_BUDGET``. Without
+            a budget a fixed number of improvement steps runs, so the plan is
+            deterministic; ``0`` keeps the best of the LPT/Karmarkar-Karp seeds
 
 
         Returns:
@@ -412,8 +436,8 @@ class WorkDispatcher:
                 logging.info(f"optimal - workers capacities {capacities} - {nwork} works to be done")
                 chunks = WorkDispatcher._make_chunks_optimal(weights, capacities)  # ty: ignore[invalid-argument-type]
             else:
-                logging.info(f"fastest - workers capacities {capacities} - {nwork} works to be done")
-                chunks = WorkDispatcher._make_chunks_fastest(weights, capacities)  # ty: ignore[invalid-argument-type]
+                logging.info(f"anytime - workers capacities {capacities} - {nwork} works to be done")
+                chunks = WorkDispatcher._make_chunks_anytime(weights, capacities, time_budget)  # ty: ignore[invalid-argument-type]
 
             return chunks
 
@@ -533,6 +557,26 @@ class WorkDispatcher:
             return best_chunks
         return [best_chunks, best_size]
 
+    @staticmethod
+    def _make_chunks_anytime(
+        subsets: List[Any],
+        chk_weights: List[Any],
+        time_budget: Optional[float] = None,
+    ) -> List[List[Any]]:
+        """Partitions subsets with the anytime Karmarkar-Karp/LPT refinement.
+
+        Args:
+          subsets: list of tuples ('label', size)
+          chk_weights: list containing the relative capacity of each worker
+          time_budget: improvement budget in seconds (Default value = None)
+
+        Returns:
+          : list of chunk weighted
+
+        """
+        capacities = WorkDispatcher._normalize_worker_capacities(chk_weights, {})
+        return anytime_partition(subsets, capacities, time_budget=time_budget)
+
     @staticmethod
     def _make_chunks_fastest(subsets: List[Any], chk_weights: List[Any]) -> List[List[Any]]:
         """Partitions subsets using capacity-normalized LPT scheduling.
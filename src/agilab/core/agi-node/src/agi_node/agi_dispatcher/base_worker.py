@@ -54,6 +54,8 @@ from . import base_worker_execution_support as execution_support
 from . import base_worker_path_support as path_support
 from . import base_worker_runtime_support as runtime_support
 from . import base_worker_service_support as service_support
+from . import worker_event_support
+from . import worker_pool_support
 
 logger = AgiLogger.get_logger(__name__)
 _WORKER_HOOK_BOUNDARY_EXCEPTIONS: tuple[type[Exception], ...] = (Exception,)
@@ -656,6 +658,10 @@ class BaseWorker(ArtifactContract, abc.ABC):
                 json_module=json,
                 os_module=os,
                 time_module=time,
+                min_interval=service_support.resolve_service_heartbeat_interval(worker_args),
+                publish_fn=worker_event_support.dask_event_publisher(
+                    service_support.SERVICE_HEARTBEAT_TOPIC
+                ),
             )  # ty: ignore[invalid-assignment]
 
         start_time = time.time()
@@ -670,21 +676,26 @@ class BaseWorker(ArtifactContract, abc.ABC):
         try:
             if not callable(loop_fn):
                 if queue_root is not None:
-                    payload = service_support.run_service_queue(
-                        stop_event=stop_event,
-                        queue_root=queue_root,
-                        worker_id=worker_id,
-                        worker_name=BaseWorker._worker,
-                        poll=poll,
-                        do_works_fn=BaseWorker._do_works,
-                        write_heartbeat=_write_heartbeat,
-                        logger_obj=logger,
-                        path_cls=Path,
-                        open_fn=open,
-                        os_module=os,
-                        time_module=time,
-                        traceback_module=traceback,
-                    )
+                    # Claimed tasks share one in-worker pool for the whole loop
+                    # instead of spawning (and pool_init-ing) one per task.
+                    with worker_pool_support.warm_pool_scope():
+                        payload = service_support.run_service_queue(
+                            stop_event=stop_event,
+                            queue_root=queue_root,
+                            worker_id=worker_id,
+                            worker_name=BaseWorker._worker,
+                            poll=poll,
+                            do_works_fn=BaseWorker._do_works,
+                            write_heartbeat=_write_heartbeat,
+                            logger_obj=logger,
+                            path_cls=Path,
+                            open_fn=open,
+                            os_module=os,
+                            time_module=time,
+                            traceback_module=traceback,
+                            claim_batch=service_support.resolve_service_claim_batch(worker_args),
+                            priority_aging=service_support.resolve_service_priority_aging(),
+                        )
                     payload["runtime"] = time.time() - start_time
                     return payload
 
@@ -1262,11 +1273,12 @@ class BaseWorker(ArtifactContract, abc.ABC):
         )
 
     @staticmethod
-    def _get_worker_info(worker_id):
+    def _get_worker_info(worker_id, hardware_workers=None):
         """def get_worker_info():
 
         Args:
           worker_id:
+          hardware_workers: workers that also run the hardware microbenchmarks
         Returns:
         """
         return execution_support.collect_worker_info(
@@ -1278,6 +1290,7 @@ class BaseWorker(ArtifactContract, abc.ABC):
             tempfile_module=tempfile,
             os_module=os,
             time_module=time,
+            hardware_benchmark=str(BaseWorker._worker) in set(hardware_workers or ()),
         )
 
     @staticmethod
@@ -7,7 +7,7 @@ import shutil
 from pathlib import Path
 from typing import Any, Callable, cast
 
-from . import worker_tracking_support
+from . import hardware_benchmark_support, worker_event_support, worker_tracking_support
 
 BUILD_ARTIFACT_EXCEPTIONS = (
     FileNotFoundError,
@@ -449,7 +449,9 @@ def collect_worker_info(
     os_module: Any,
     time_module: Any,
     open_fn: Callable[..., Any] = open,
-) -> dict[str, list[float]]:
+    hardware_benchmark: bool = False,
+    hardware_benchmark_fn: Callable[..., dict[str, Any]] = hardware_benchmark_support.run_hardware_benchmark,
+) -> dict[str, Any]:
     ram = psutil_module.virtual_memory()
     ram_total = [ram.total / 10 ** 9]
     ram_available = [ram.available / 10 ** 9]
@@ -475,13 +477,21 @@ def collect_worker_info(
         open_fn=open_fn,
     )
 
-    return {
+    info: dict[str, Any] = {
         "ram_total": ram_total,
         "ram_available": ram_available,
         "cpu_count": cpu_count,
         "cpu_frequency": cpu_frequency,
         "network_speed": write_speed,
     }
+    if hardware_benchmark:
+        # Only one worker per host is asked to run the microbenchmarks; the
+        # manager caches the result per host.
+        try:
+            info["hardware"] = hardware_benchmark_fn(path, worker=worker)
+        except OSError as exc:
+            logger_obj.warning("hardware benchmark failed on %s: %s", worker, exc)
+    return info
 
 
 def _log_build_worker_context(
@@ -744,8 +754,14 @@ def _attach_worker_log_capture(
     logging_module: Any = logging,
     io_module: Any = io,
     root_logger: logging.Logger | None = None,
+    tail_records: int | None = None,
 ) -> tuple[Any, Any, Any]:
-    log_stream = cast(io.StringIO, io_module.StringIO())
+    # Once records are streamed to the manager, only a bounded tail is kept.
+    log_stream = (
+        worker_event_support.LogTail(tail_records)
+        if tail_records is not None
+        else cast(io.StringIO, io_module.StringIO())
+    )
     handler = cast(logging.Handler, logging_module.StreamHandler(log_stream))
     active_root_logger = cast(logging.Logger, root_logger or logging_module.getLogger())
     active_root_logger.addHandler(handler)
@@ -800,6 +816,15 @@ def _execute_initialized_worker_plan(
         path_cls=path_cls,
     )
 
+    # Pull dispatch calls works() once per pulled batch; the run token lets
+    # run_works keep numbering work_done outputs across those calls, and the
+    # item origins keep each item's planned-worker label.
+    insts[worker_id]._work_done_run = (
+        workers_plan.get("work_done_run") if isinstance(workers_plan, dict) else None
+    )
+    insts[worker_id]._work_item_origins = (
+        workers_plan.get("item_origins") if isinstance(workers_plan, dict) else None
+    )
     with worker_tracking_support.worker_tracking_run(
         worker_id=worker_id,
         worker_name=worker_name,
@@ -833,38 +858,54 @@ def execute_worker_plan(
     io_module: Any = io,
     path_cls: type[Path] = Path,
     root_logger: logging.Logger | None = None,
+    event_stream_factory: Callable[..., Any] = worker_event_support.worker_event_stream,
 ) -> str:
-    log_stream, handler, active_root_logger = _attach_worker_log_capture(
-        logging_module=logging_module,
-        io_module=io_module,
-        root_logger=root_logger,
-    )
+    with event_stream_factory(worker_id=worker_id, worker=worker_name) as event_stream:
+        log_stream, handler, active_root_logger = _attach_worker_log_capture(
+            logging_module=logging_module,
+            io_module=io_module,
+            root_logger=root_logger,
+            tail_records=(
+                worker_event_support.DEFAULT_LOG_TAIL_RECORDS
+                if event_stream is not None
+                else None
+            ),
+        )
+        event_handler = None
+        if event_stream is not None:
+            event_handler = worker_event_support.WorkerEventLogHandler(event_stream)
+            active_root_logger.addHandler(event_handler)
 
-    try:
-        if worker_id is not None:
-            _execute_initialized_worker_plan(
-                workers_plan=workers_plan,
-                workers_plan_metadata=workers_plan_metadata,
-                worker_id=worker_id,
-                worker_name=worker_name,
-                insts=insts,
-                expand_chunk_fn=expand_chunk_fn,
-                logger_obj=logger_obj,
-                file_path=file_path,
-                path_cls=path_cls,
+        try:
+            if worker_id is not None:
+                _execute_initialized_worker_plan(
+                    workers_plan=workers_plan,
+                    workers_plan_metadata=workers_plan_metadata,
+                    worker_id=worker_id,
+                    worker_name=worker_name,
+                    insts=insts,
+                    expand_chunk_fn=expand_chunk_fn,
+                    logger_obj=logger_obj,
+                    file_path=file_path,
+                    path_cls=path_cls,
+                )
+            else:
+                logger_obj.error("this worker is not initialized")
+                raise RuntimeError("failed to do_works")
+        except WORKER_CODE_BOUNDARY_EXCEPTIONS:
+            # ``works(...)`` executes arbitrary worker code; keep the runtime logging boundary here.
+            logger_obj.error(traceback_module.format_exc())
+            raise
+        finally:
+            if event_handler is not None:
+                _detach_worker_log_capture(
+                    active_root_logger=active_root_logger,
+                    handler=event_handler,
+                )
+            _detach_worker_log_capture(
+                active_root_logger=active_root_logger,
+                handler=handler,
             )
-        else:
-            logger_obj.error("this worker is not initialized")
-            raise RuntimeError("failed to do_works")
-    except WORKER_CODE_BOUNDARY_EXCEPTIONS:
-        # ``works(...)`` executes arbitrary worker code; keep the runtime logging boundary here.
-        logger_obj.error(traceback_module.format_exc())
-        raise
-    finally:
-        _detach_worker_log_capture(
-            active_root_logger=active_root_logger,
-            handler=handler,
-        )
 
     return cast(str, log_stream.getvalue())
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import logging
+import math
 import os
 import re
 import threading
@@ -11,11 +13,37 @@ from contextlib import suppress
 from pathlib import Path
 from typing import Any, Callable
 
+from agi_node.agi_dispatcher.service_queue_wakeup_support import ServiceQueueWaiter
+
 SERVICE_TASK_SCHEMA = "agi.service.task.v1"
 SERVICE_TASK_SUFFIX = ".task.json"
 LEGACY_SERVICE_TASK_SUFFIX = ".task.pkl"
 SERVICE_TASK_EXECUTION_EXCEPTIONS: tuple[type[Exception], ...] = (Exception,)
 
+#: Maximum number of queued tasks a service worker claims per queue scan.
+#: Read from ``worker.args`` first, then the environment. Batching is opt-in;
+#: a task queued after the scan still runs before lower-ranked claims.
+SERVICE_CLAIM_BATCH_ENV = "AGILAB_SERVICE_CLAIM_BATCH"
+SERVICE_CLAIM_BATCH_ARG = "service_claim_batch"
+DEFAULT_SERVICE_CLAIM_BATCH = 1
+
+#: Waiting time, in seconds, that raises a pending task's priority by one
+#: level so low-priority work is not starved; ``0`` disables aging.
+SERVICE_PRIORITY_AGING_ENV = "AGILAB_SERVICE_PRIORITY_AGING_SECONDS"
+DEFAULT_SERVICE_PRIORITY_AGING_SECONDS = 30.0
+
+#: Minimum seconds between two heartbeat writes of a service worker. The
+#: manager derives it from its heartbeat timeout and passes it in the worker
+#: args; the environment variable overrides the default otherwise.
+SERVICE_HEARTBEAT_INTERVAL_ENV = "AGILAB_SERVICE_HEARTBEAT_INTERVAL"
+SERVICE_HEARTBEAT_INTERVAL_ARG = "_agi_service_heartbeat_interval"
+DEFAULT_SERVICE_HEARTBEAT_INTERVAL = 1.0
+#: Dask event topic service heartbeats are published on, next to the file.
+SERVICE_HEARTBEAT_TOPIC = "agilab.service_heartbeats"
+_TERMINAL_HEARTBEAT_STATES = frozenset({"stopped"})
+
+logger = logging.getLogger(__name__)
+
 
 def _flush_and_fsync(stream: Any, *, os_module: Any = os) -> None:
     """Flush one temp file and fsync it when the platform supports that."""
@@ -79,6 +107,80 @@ def resolve_service_queue_root(
     return path_cls(str(service_queue_dir)).expanduser().resolve(strict=False)
 
 
+def resolve_service_claim_batch(worker_args: Any) -> int:
+    raw = getattr(worker_args, SERVICE_CLAIM_BATCH_ARG, None)
+    if raw is None and hasattr(worker_args, "get"):
+        raw = worker_args.get(SERVICE_CLAIM_BATCH_ARG)
+    if raw is None or raw == "":
+        raw = os.environ.get(SERVICE_CLAIM_BATCH_ENV, "")
+    if raw is None or str(raw).strip() == "":
+        return DEFAULT_SERVICE_CLAIM_BATCH
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = 0
+    if value < 1:
+        logger.warning("Ignoring invalid service claim batch %r (expected a positive integer)", raw)
+        return DEFAULT_SERVICE_CLAIM_BATCH
+    return value
+
+
+def resolve_service_priority_aging() -> float:
+    raw = os.environ.get(SERVICE_PRIORITY_AGING_ENV, "")
+    if not raw.strip():
+        return DEFAULT_SERVICE_PRIORITY_AGING_SECONDS
+    value = _number_or(raw, -1.0)
+    if value < 0:
+        logger.warning("Ignoring invalid %s=%r", SERVICE_PRIORITY_AGING_ENV, raw)
+        return DEFAULT_SERVICE_PRIORITY_AGING_SECONDS
+    return value
+
+
+def resolve_service_heartbeat_interval(worker_args: Any) -> float:
+    raw = getattr(worker_args, SERVICE_HEARTBEAT_INTERVAL_ARG, None)
+    if raw is None and hasattr(worker_args, "get"):
+        raw = worker_args.get(SERVICE_HEARTBEAT_INTERVAL_ARG)
+    if raw is None or raw == "":
+        raw = os.environ.get(SERVICE_HEARTBEAT_INTERVAL_ENV, "")
+    if raw is None or str(raw).strip() == "":
+        return DEFAULT_SERVICE_HEARTBEAT_INTERVAL
+    value = _number_or(raw, -1.0)
+    if value < 0:
+        logger.warning("Ignoring invalid service heartbeat interval %r", raw)
+        return DEFAULT_SERVICE_HEARTBEAT_INTERVAL
+    return value
+
+
+def _number_or(value: Any, default: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return default
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    return number if math.isfinite(number) else default
+
+
+def service_task_rank(
+    payload: dict[str, Any],
+    *,
+    now: float,
+    aging_seconds: float,
+) -> tuple[float, float]:
+    """Sort key of a pending task: highest aged priority, then earliest deadline.
+
+    Every ``aging_seconds`` spent in the queue adds one priority level, so a
+    burst of high-priority work delays low-priority tasks without starving
+    them. Ties (including tasks without priority or deadline) keep submit
+    order through the file name the caller sorts on next.
+    """
+    priority = _number_or(payload.get("priority"), 0.0)
+    if aging_seconds > 0:
+        waited = now - _number_or(payload.get("created_at"), now)
+        priority += math.floor(max(waited, 0.0) / aging_seconds)
+    return (-priority, _number_or(payload.get("deadline"), math.inf))
+
+
 def make_heartbeat_writer(
     queue_root: Path,
     *,
@@ -91,21 +193,44 @@ def make_heartbeat_writer(
     os_module: Any = os,
     time_module: Any = time,
     pid_factory: Callable[[], int] = os.getpid,
+    min_interval: float = 0.0,
+    publish_fn: Callable[[dict[str, Any]], None] | None = None,
 ) -> Callable[[str], None]:
+    """Build the heartbeat callback of one service worker.
+
+    Beats repeating the last written state within ``min_interval`` seconds
+    are coalesced: the loop and the processing pulse may call it as often as
+    they like, the file is rewritten (and fsync'd) at most once per interval
+    while the state holds. The first beat and every state change (including
+    ``"stopped"``) are always written. Every written payload is also handed
+    to ``publish_fn`` (a Dask event) when given.
+    """
     heartbeat_dir = queue_root / "heartbeats"
     heartbeat_dir.mkdir(parents=True, exist_ok=True)
     safe_worker = re.sub(r"[^a-zA-Z0-9_.-]+", "-", str(worker_name or worker_id)).strip("-")
     heartbeat_file = heartbeat_dir / f"{worker_id:03d}-{safe_worker or 'worker'}.json"
     worker_incarnation = uuid.uuid4().hex
+    write_lock = threading.Lock()
+    last_write: list[Any] = []
 
     def _write_heartbeat(state: str) -> None:
+        now = time_module.time()
+        with write_lock:
+            if (
+                last_write
+                and state == last_write[1]
+                and state not in _TERMINAL_HEARTBEAT_STATES
+                and now - last_write[0] < min_interval
+            ):
+                return
+            last_write[:] = [now, state]
         process_pid = pid_factory()
         payload = {
             "worker_id": worker_id,
             "worker": str(worker_name),
             "pid": process_pid,
             "worker_incarnation": worker_incarnation,
-            "timestamp": time_module.time(),
+            "timestamp": now,
             "state": state,
         }
         tmp = heartbeat_file.with_suffix(
@@ -125,6 +250,15 @@ def make_heartbeat_writer(
                 worker_id,
                 exc_info=True,
             )
+        if publish_fn is not None:
+            try:
+                publish_fn(payload)
+            except (OSError, RuntimeError, TypeError, ValueError):
+                logger_obj.debug(
+                    "worker #%s: failed to publish service heartbeat",
+                    worker_id,
+                    exc_info=True,
+                )
 
     # The queue consumer binds every running claim to the same unique token.
     # Recovery can therefore distinguish a live claimant from a replacement
@@ -207,6 +341,20 @@ def _reject_legacy_service_task(
         pending_path.replace(failed_path)
 
 
+def service_worker_queue_name(worker_name: str | None) -> str:
+    """Name of the ``pending`` subdirectory holding the tasks addressed to a worker."""
+    safe = re.sub(r"[^a-zA-Z0-9_.-]+", "-", str(worker_name)).strip("-")
+    return safe or "worker"
+
+
+def _pending_service_tasks(pending_dirs: list[Path], suffix: str) -> list[Path]:
+    """Return the queued tasks of ``pending_dirs`` in submit (file name) order."""
+    return sorted(
+        (path for pending_dir in pending_dirs for path in pending_dir.glob(f"*{suffix}")),
+        key=lambda path: path.name,
+    )
+
+
 def _task_matches_worker(
     payload: dict[str, Any],
     *,
@@ -239,11 +387,14 @@ def run_service_queue(
     os_module: Any = os,
     time_module: Any = time,
     traceback_module: Any = traceback,
+    claim_batch: int = 1,
+    priority_aging: float = DEFAULT_SERVICE_PRIORITY_AGING_SECONDS,
 ) -> dict[str, Any]:
     queue_dirs = _ensure_service_queue_dirs(queue_root, path_cls=path_cls)
     processed = 0
     failures = 0
     idle_wait = poll if poll > 0 else 0.05
+    claim_batch = max(int(claim_batch), 1)
     json_decode_error = getattr(json_module, "JSONDecodeError", ValueError)
     read_errors = (
         OSError,
@@ -255,155 +406,233 @@ def run_service_queue(
         getattr(write_heartbeat, "worker_incarnation", "") or uuid.uuid4().hex
     )
 
-    write_heartbeat("running")
-    while not stop_event.is_set():
-        write_heartbeat("running")
-        claimed = False
-        for legacy_path in sorted(queue_dirs["pending"].glob(f"*{LEGACY_SERVICE_TASK_SUFFIX}")):
-            _reject_legacy_service_task(
-                legacy_path,
-                failed_dir=queue_dirs["failed"],
-                worker_id=worker_id,
-                logger_obj=logger_obj,
-            )
-
-        for pending_path in sorted(queue_dirs["pending"].glob(f"*{SERVICE_TASK_SUFFIX}")):
-            try:
-                payload = _load_service_payload(
-                    pending_path,
-                    open_fn=open_fn,
-                    json_module=json_module,
-                )
-            except FileNotFoundError:
-                continue
-            except read_errors as exc:
-                logger_obj.error(
-                    "worker #%s: cannot read service task %s: %s",
-                    worker_id,
-                    pending_path,
-                    exc,
-                )
-                failed_path = queue_dirs["failed"] / pending_path.name
-                with suppress(FileNotFoundError):
-                    pending_path.replace(failed_path)
-                continue
-
-            if not _task_matches_worker(
-                payload,
-                worker_id=worker_id,
-                worker_name=worker_name,
-            ):
-                continue
+    def _execute_claimed_task(
+        pending_path: Path,
+        running_path: Path,
+        payload: dict[str, Any],
+    ) -> str | None:
+        """Run one claimed task and publish it; ``None`` when publication failed."""
+        heartbeat_stop = threading.Event()
+        heartbeat_interval = min(max(idle_wait, 0.1), 5.0)
+        publication_succeeded = False
+
+        def _pulse_processing_heartbeat() -> None:
+            while not heartbeat_stop.wait(heartbeat_interval):
+                write_heartbeat("processing")
 
-            task_basename = pending_path.name[: -len(SERVICE_TASK_SUFFIX)]
-            running_path = queue_dirs["running"] / (
-                f"{task_basename}.claim-{uuid.uuid4().hex}{SERVICE_TASK_SUFFIX}"
+        heartbeat_thread = threading.Thread(
+            target=_pulse_processing_heartbeat,
+            name=f"agi-service-heartbeat-{worker_id}",
+            daemon=True,
+        )
+        task_start = time_module.time()
+        payload["started_at"] = task_start
+        try:
+            write_heartbeat("processing")
+            heartbeat_thread.start()
+            logs = do_works_fn(
+                payload.get("plan", []),
+                payload.get("metadata", []),
             )
-            try:
-                pending_path.replace(running_path)
-            except FileNotFoundError:
-                continue
-            _fsync_directory(running_path.parent, os_module=os_module)
-            _fsync_directory(pending_path.parent, os_module=os_module)
-
-            claimed = True
-            task_start = time_module.time()
-            payload["claim"] = {
-                "worker_id": worker_id,
-                "worker": str(worker_name),
-                "worker_incarnation": worker_incarnation,
-                "claimed_at": task_start,
-                "task_filename": pending_path.name,
-            }
-            # Publish the ownership binding before work begins.  A crash after
-            # this point leaves a claim that can be matched only by this worker
-            # incarnation, never by a later worker reusing the same name.
+            payload["status"] = "done"
+            payload["finished_at"] = time_module.time()
+            payload["runtime"] = time_module.time() - task_start
+            payload["worker_id"] = worker_id
+            payload["worker_name"] = worker_name
+            payload["logs"] = logs
+        # Worker code can fail arbitrarily; persist the failure and keep the queue alive.
+        except SERVICE_TASK_EXECUTION_EXCEPTIONS as exc:
+            payload["status"] = "failed"
+            payload["finished_at"] = time_module.time()
+            payload["runtime"] = time_module.time() - task_start
+            payload["worker_id"] = worker_id
+            payload["worker_name"] = worker_name
+            payload["error"] = str(exc)
+            payload["traceback"] = traceback_module.format_exc()
+            destination = queue_dirs["failed"] / pending_path.name
+            logger_obj.exception(
+                "worker #%s: service task failed (%s)",
+                worker_id,
+                pending_path.name,
+            )
+        else:
+            destination = queue_dirs["done"] / pending_path.name
+        deadline = _number_or(payload.get("deadline"), None)
+        if deadline is not None and payload["finished_at"] > deadline:
+            payload["deadline_missed"] = True
+
+        try:
             _dump_service_payload(
-                running_path,
+                destination,
                 payload,
                 open_fn=open_fn,
                 json_module=json_module,
                 pickle_module=pickle_module,
                 os_module=os_module,
             )
-            heartbeat_stop = threading.Event()
-            heartbeat_interval = min(max(idle_wait, 0.1), 5.0)
-            publication_succeeded = False
-
-            def _pulse_processing_heartbeat() -> None:
-                while not heartbeat_stop.wait(heartbeat_interval):
-                    write_heartbeat("processing")
-
-            heartbeat_thread = threading.Thread(
-                target=_pulse_processing_heartbeat,
-                name=f"agi-service-heartbeat-{worker_id}",
-                daemon=True,
+            publication_succeeded = True
+        except SERVICE_TASK_EXECUTION_EXCEPTIONS:
+            logger_obj.exception(
+                "worker #%s: failed to publish terminal service task %s; "
+                "preserving the running claim",
+                worker_id,
+                pending_path.name,
             )
-            try:
-                write_heartbeat("processing")
-                heartbeat_thread.start()
-                logs = do_works_fn(
-                    payload.get("plan", []),
-                    payload.get("metadata", []),
-                )
-                payload["status"] = "done"
-                payload["finished_at"] = time_module.time()
-                payload["runtime"] = time_module.time() - task_start
-                payload["worker_id"] = worker_id
-                payload["worker_name"] = worker_name
-                payload["logs"] = logs
-            # Worker code can fail arbitrarily; persist the failure and keep the queue alive.
-            except SERVICE_TASK_EXECUTION_EXCEPTIONS as exc:
-                payload["status"] = "failed"
-                payload["finished_at"] = time_module.time()
-                payload["runtime"] = time_module.time() - task_start
-                payload["worker_id"] = worker_id
-                payload["worker_name"] = worker_name
-                payload["error"] = str(exc)
-                payload["traceback"] = traceback_module.format_exc()
-                destination = queue_dirs["failed"] / pending_path.name
-                logger_obj.exception(
-                    "worker #%s: service task failed (%s)",
-                    worker_id,
+        finally:
+            heartbeat_stop.set()
+            if heartbeat_thread.is_alive():
+                heartbeat_thread.join(timeout=heartbeat_interval + 0.5)
+            write_heartbeat("running")
+            if publication_succeeded:
+                with suppress(FileNotFoundError):
+                    running_path.unlink()
+                _fsync_directory(running_path.parent, os_module=os_module)
+        return payload["status"] if publication_succeeded else None
+
+    # Tasks addressed to this worker live in its own pending subdirectory, so
+    # the scan never parses tasks queued for other workers; the shared
+    # directory only holds untargeted (and older-layout) tasks.
+    worker_pending = queue_dirs["pending"] / service_worker_queue_name(worker_name)
+    worker_pending.mkdir(parents=True, exist_ok=True)
+    pending_dirs = [worker_pending, queue_dirs["pending"]]
+    waiter = ServiceQueueWaiter(stop_event, pending_dirs, log=logger_obj)
+    task_cache: dict[Path, dict[str, Any]] = {}
+    def _ranked_candidates(
+        scan_time: float,
+    ) -> list[tuple[tuple[float, float], str, Path, dict[str, Any]]]:
+        """Pending tasks this worker may run, best rank first."""
+        pending_paths = _pending_service_tasks(pending_dirs, SERVICE_TASK_SUFFIX)
+        for stale_path in task_cache.keys() - set(pending_paths):
+            del task_cache[stale_path]
+        candidates: list[tuple[tuple[float, float], str, Path, dict[str, Any]]] = []
+        for pending_path in pending_paths:
+            payload = task_cache.get(pending_path)
+            if payload is None:
+                try:
+                    payload = _load_service_payload(
+                        pending_path,
+                        open_fn=open_fn,
+                        json_module=json_module,
+                    )
+                except FileNotFoundError:
+                    continue
+                except read_errors as exc:
+                    logger_obj.error(
+                        "worker #%s: cannot read service task %s: %s",
+                        worker_id,
+                        pending_path,
+                        exc,
+                    )
+                    failed_path = queue_dirs["failed"] / pending_path.name
+                    with suppress(FileNotFoundError):
+                        pending_path.replace(failed_path)
+                    continue
+                # Published tasks are never rewritten in place, so each
+                # file is parsed once while it stays pending.
+                task_cache[pending_path] = payload
+
+            if not _task_matches_worker(
+                payload,
+                worker_id=worker_id,
+                worker_name=worker_name,
+            ):
+                continue
+            candidates.append(
+                (
+                    service_task_rank(
+                        payload,
+                        now=scan_time,
+                        aging_seconds=priority_aging,
+                    ),
                     pending_path.name,
+                    pending_path,
+                    payload,
                 )
-            else:
-                destination = queue_dirs["done"] / pending_path.name
+            )
+        candidates.sort(key=lambda candidate: candidate[:2])
+        return candidates
+
+    def _outranked_by_pending(pending_path: Path, payload: dict[str, Any]) -> bool:
+        """Whether a task queued since the claim scan should run before this claim."""
+        scan_time = time_module.time()
+        candidates = _ranked_candidates(scan_time)
+        if not candidates:
+            return False
+        claim_rank = service_task_rank(payload, now=scan_time, aging_seconds=priority_aging)
+        return candidates[0][:2] < (claim_rank, pending_path.name)
 
-            try:
+    try:
+        write_heartbeat("running")
+        while not stop_event.is_set():
+            write_heartbeat("running")
+            for legacy_path in _pending_service_tasks(pending_dirs, LEGACY_SERVICE_TASK_SUFFIX):
+                _reject_legacy_service_task(
+                    legacy_path,
+                    failed_dir=queue_dirs["failed"],
+                    worker_id=worker_id,
+                    logger_obj=logger_obj,
+                )
+
+            candidates = _ranked_candidates(time_module.time())
+
+            claims: list[tuple[Path, Path, dict[str, Any]]] = []
+            for _rank, _name, pending_path, cached_payload in candidates:
+                if len(claims) >= claim_batch:
+                    break
+                task_cache.pop(pending_path, None)
+                payload = dict(cached_payload)
+                task_basename = pending_path.name[: -len(SERVICE_TASK_SUFFIX)]
+                running_path = queue_dirs["running"] / (
+                    f"{task_basename}.claim-{uuid.uuid4().hex}{SERVICE_TASK_SUFFIX}"
+                )
+                try:
+                    pending_path.replace(running_path)
+                except FileNotFoundError:
+                    continue
+                _fsync_directory(running_path.parent, os_module=os_module)
+                _fsync_directory(pending_path.parent, os_module=os_module)
+
+                payload["claim"] = {
+                    "worker_id": worker_id,
+                    "worker": str(worker_name),
+                    "worker_incarnation": worker_incarnation,
+                    "claimed_at": time_module.time(),
+                    "task_filename": pending_path.name,
+                }
+                # Publish the ownership binding before work begins.  A crash after
+                # this point leaves a claim that can be matched only by this worker
+                # incarnation, never by a later worker reusing the same name.
                 _dump_service_payload(
-                    destination,
+                    running_path,
                     payload,
                     open_fn=open_fn,
                     json_module=json_module,
                     pickle_module=pickle_module,
                     os_module=os_module,
                 )
-                publication_succeeded = True
-                if payload["status"] == "done":
+                claims.append((pending_path, running_path, payload))
+
+            for claim_idx, (pending_path, running_path, payload) in enumerate(claims):
+                if stop_event.is_set() or (
+                    claim_idx > 0 and _outranked_by_pending(pending_path, payload)
+                ):
+                    # Hand the claims that have not started back to the queue;
+                    # the next scan ranks them against the newer tasks.
+                    for unstarted_pending, unstarted_running, _payload in claims[claim_idx:]:
+                        with suppress(FileNotFoundError):
+                            unstarted_running.replace(unstarted_pending)
+                    _fsync_directory(queue_dirs["running"], os_module=os_module)
+                    break
+                status = _execute_claimed_task(pending_path, running_path, payload)
+                if status == "done":
                     processed += 1
-                else:
+                elif status == "failed":
                     failures += 1
-            except SERVICE_TASK_EXECUTION_EXCEPTIONS:
-                logger_obj.exception(
-                    "worker #%s: failed to publish terminal service task %s; "
-                    "preserving the running claim",
-                    worker_id,
-                    pending_path.name,
-                )
-            finally:
-                heartbeat_stop.set()
-                if heartbeat_thread.is_alive():
-                    heartbeat_thread.join(timeout=heartbeat_interval + 0.5)
-                write_heartbeat("running")
-                if publication_succeeded:
-                    with suppress(FileNotFoundError):
-                        running_path.unlink()
-                    _fsync_directory(running_path.parent, os_module=os_module)
-            break
 
-        if not claimed:
-            stop_event.wait(idle_wait)
+            if not claims:
+                waiter.wait(idle_wait)
+    finally:
+        waiter.close()
 
     write_heartbeat("stopped")
     return {
@@ -414,7 +643,21 @@ def run_service_queue(
 
 
 __all__ = [
+    "DEFAULT_SERVICE_CLAIM_BATCH",
+    "DEFAULT_SERVICE_HEARTBEAT_INTERVAL",
+    "DEFAULT_SERVICE_PRIORITY_AGING_SECONDS",
+    "SERVICE_CLAIM_BATCH_ARG",
+    "SERVICE_CLAIM_BATCH_ENV",
+    "SERVICE_HEARTBEAT_INTERVAL_ARG",
+    "SERVICE_HEARTBEAT_INTERVAL_ENV",
+    "SERVICE_HEARTBEAT_TOPIC",
+    "SERVICE_PRIORITY_AGING_ENV",
     "make_heartbeat_writer",
+    "resolve_service_claim_batch",
+    "resolve_service_heartbeat_interval",
+    "resolve_service_priority_aging",
     "resolve_service_queue_root",
     "run_service_queue",
+    "service_task_rank",
+    "service_worker_queue_name",
 ]
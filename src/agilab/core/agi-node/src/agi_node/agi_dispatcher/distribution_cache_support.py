@@ -5,13 +5,27 @@ from __future__ import annotations
 import hashlib
 import inspect
 import json
+import logging
+import time
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import CodeType
 from typing import Any
 
+from agi_env.runtime.atomic_write_support import atomic_write_text
+
+
+logger = logging.getLogger(__name__)
 
 DISTRIBUTION_CACHE_SCHEMA = "agilab.distribution_tree.v2"
+FINGERPRINT_INDEX_SCHEMA = "agilab.fingerprint_index.v1"
+
+# An indexed digest is only trusted when the file was last modified/changed
+# comfortably before the digest was taken: a rewrite that lands inside the
+# filesystem timestamp granularity keeps the same size and mtime, so such
+# "racily clean" entries are rehashed instead of reused.
+_RACY_WINDOW_NS = 2_000_000_000
 
 _INPUT_PATH_FIELD_NAMES = {
     "data_in",
@@ -132,13 +146,134 @@ def _file_sha256(path: Path) -> tuple[str, Any]:
     return digest.hexdigest(), after
 
 
-def _path_fingerprint(path: Path) -> dict[str, Any]:
+def _stat_key(stat_result: Any) -> list[int]:
+    return [
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+        stat_result.st_ino,
+        stat_result.st_ctime_ns,
+    ]
+
+
+class FingerprintIndex:
+    """Persistent ``path -> sha256`` index keyed by file stat identity.
+
+    A file is rehashed only when its ``(size, mtime_ns, inode, ctime_ns)``
+    differs from the indexed entry, or when the entry was recorded too close
+    to the file's last change to rule out a same-timestamp rewrite. ``hits``
+    and ``misses`` count reused and recomputed digests.
+    """
+
+    def __init__(self, path: Path | None = None, entries: Mapping[str, Any] | None = None):
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self._seen: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "FingerprintIndex":
+        """Load the index stored at ``path``; unreadable indexes start empty."""
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, UnicodeError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable fingerprint index %s: %s", path, exc)
+            return cls(path)
+        if (
+            not isinstance(data, dict)
+            or data.get("schema") != FINGERPRINT_INDEX_SCHEMA
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return cls(path)
+        return cls(path, data["entries"])
+
+    def lookup(self, path: Path, stat_result: Any) -> str | None:
+        key = path.as_posix()
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if not isinstance(entry, dict) or entry.get("stat") != _stat_key(stat_result):
+            return None
+        recorded_ns = entry.get("recorded_ns")
+        digest = entry.get("sha256")
+        if not isinstance(recorded_ns, int) or not isinstance(digest, str):
+            return None
+        last_change_ns = max(stat_result.st_mtime_ns, stat_result.st_ctime_ns)
+        if recorded_ns - last_change_ns < _RACY_WINDOW_NS:
+            return None
+        return digest
+
+    def record(self, path: Path, stat_result: Any, digest: str, recorded_ns: int) -> None:
+        key = path.as_posix()
+        self._seen.add(key)
+        self._entries[key] = {
+            "stat": _stat_key(stat_result),
+            "sha256": digest,
+            "recorded_ns": recorded_ns,
+        }
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def save(self) -> None:
+        """Persist the entries seen since loading, dropping stale paths."""
+
+        if self.path is None:
+            return
+        entries = {key: self._entries[key] for key in sorted(self._seen) if key in self._entries}
+        serialized = json.dumps(
+            {"schema": FINGERPRINT_INDEX_SCHEMA, "entries": entries},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        try:
+            atomic_write_text(self.path, f"{serialized}\n", encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Unable to persist fingerprint index %s: %s", self.path, exc)
+
+
+def _hash_files(
+    paths: list[Path],
+    index: FingerprintIndex | None,
+) -> dict[Path, tuple[str, Any]]:
+    """Return ``(sha256, stat)`` per file, reusing indexed digests when valid."""
+
+    results: dict[Path, tuple[str, Any]] = {}
+    pending: list[Path] = []
+    for path in paths:
+        if index is not None:
+            stat_result = path.stat()
+            digest = index.lookup(path, stat_result)
+            if digest is not None:
+                index.hits += 1
+                results[path] = (digest, stat_result)
+                continue
+        pending.append(path)
+
+    recorded_ns = time.time_ns()
+    if len(pending) > 1:
+        # hashlib releases the GIL on large updates, so threads overlap I/O and hashing.
+        with ThreadPoolExecutor(thread_name_prefix="agilab-fingerprint") as executor:
+            hashed = list(executor.map(_file_sha256, pending))
+    else:
+        hashed = [_file_sha256(path) for path in pending]
+    for path, (digest, stat_result) in zip(pending, hashed):
+        results[path] = (digest, stat_result)
+        if index is not None:
+            index.misses += 1
+            index.record(path, stat_result, digest, recorded_ns)
+    return results
+
+
+def _path_fingerprint(path: Path, index: FingerprintIndex | None = None) -> dict[str, Any]:
     root_payload: dict[str, Any] = {"path": path.as_posix()}
     if not path.exists():
         root_payload["kind"] = "missing"
         return root_payload
     if path.is_file():
-        digest, stat_result = _file_sha256(path)
+        digest, stat_result = _hash_files([path], index)[path]
         root_payload.update(
             {
                 "kind": "file",
@@ -158,11 +293,13 @@ def _path_fingerprint(path: Path) -> dict[str, Any]:
         )
         return root_payload
 
+    candidates = sorted(path.rglob("*"), key=lambda item: item.as_posix())
+    file_digests = _hash_files([item for item in candidates if item.is_file()], index)
     entries: list[dict[str, Any]] = []
-    for candidate in sorted(path.rglob("*"), key=lambda item: item.as_posix()):
+    for candidate in candidates:
         relative = candidate.relative_to(path).as_posix()
-        if candidate.is_file():
-            digest, stat_result = _file_sha256(candidate)
+        if candidate in file_digests:
+            digest, stat_result = file_digests[candidate]
             entries.append(
                 {
                     "path": relative,
@@ -266,11 +403,18 @@ def build_cache_context(
     target_inst: Any,
     *,
     capacities: Iterable[float] | None,
+    fingerprint_index: FingerprintIndex | None = None,
 ) -> dict[str, Any]:
-    """Return the deterministic context that makes a cached plan reusable."""
+    """Return the deterministic context that makes a cached plan reusable.
+
+    ``fingerprint_index`` lets unchanged input files reuse their digest from
+    a previous run; the returned context is identical with or without it.
+    """
 
     input_roots = _discover_input_paths(target_inst)
-    input_fingerprints = [_path_fingerprint(path) for path in input_roots]
+    input_fingerprints = [
+        _path_fingerprint(path, fingerprint_index) for path in input_roots
+    ]
     input_digest = hashlib.sha256(
         json.dumps(
             input_fingerprints,
@@ -292,4 +436,9 @@ def build_cache_context(
     return {**payload, "digest_sha256": digest}
 
 
-__all__ = ["DISTRIBUTION_CACHE_SCHEMA", "build_cache_context"]
+__all__ = [
+    "DISTRIBUTION_CACHE_SCHEMA",
+    "FINGERPRINT_INDEX_SCHEMA",
+    "FingerprintIndex",
+    "build_cache_context",
+]
@@ -0,0 +1,149 @@
+"""Short hardware microbenchmarks run by one worker per host during calibration.
+
+The legacy ``network_speed`` calibration feature writes zeros without
+``fsync`` and therefore mostly measures the page cache. These probes measure
+what a worker actually sustains:
+
+* ``cpu_gflops``: a single-threaded, cache-resident polynomial kernel
+  (Horner evaluation, two flops per coefficient and element),
+* ``memory_gbps``: large array copies (bytes read plus bytes written),
+* ``disk_write_mbps`` / ``disk_read_mbps``: an ``fsync``'d write then a read of
+  a probe file on the worker's share path, dropping it from the page cache
+  first where the platform allows.
+
+Every probe is bounded by a small time or size budget so the whole suite
+takes well under two seconds. The manager caches the results per host (see
+``agi_cluster.agi_distributor.runtime.hardware_profile_support``).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+DEFAULT_CPU_SECONDS = 0.25
+DEFAULT_MEMORY_MB = 64
+DEFAULT_DISK_MB = 32
+
+_CPU_ELEMENTS = 16_384
+_CPU_DEGREE = 16
+_DISK_BLOCK = 1024 * 1024
+
+
+def _elapsed(clock: Callable[[], float], started_at: float) -> float:
+    return max(clock() - started_at, 1e-9)
+
+
+def measure_cpu_gflops(
+    *,
+    seconds: float = DEFAULT_CPU_SECONDS,
+    clock: Callable[[], float] = time.perf_counter,
+) -> float:
+    values = np.linspace(0.0, 1.0, _CPU_ELEMENTS)
+    coefficients = np.linspace(1.0, 0.5, _CPU_DEGREE)
+    result = np.empty_like(values)
+    flops = 0
+    started_at = clock()
+    while True:
+        result.fill(coefficients[0])
+        for coefficient in coefficients[1:]:
+            np.multiply(result, values, out=result)
+            np.add(result, coefficient, out=result)
+        flops += 2 * (_CPU_DEGREE - 1) * _CPU_ELEMENTS
+        if clock() - started_at >= seconds:
+            break
+    return flops / _elapsed(clock, started_at) / 1e9
+
+
+def measure_memory_gbps(
+    *,
+    size_mb: int = DEFAULT_MEMORY_MB,
+    repeats: int = 3,
+    clock: Callable[[], float] = time.perf_counter,
+) -> float:
+    source = np.ones(size_mb * 1024 * 1024 // 8)
+    target = np.empty_like(source)
+    np.copyto(target, source)  # fault the pages in before timing
+    best = float("inf")
+    for _ in range(max(repeats, 1)):
+        started_at = clock()
+        np.copyto(target, source)
+        best = min(best, _elapsed(clock, started_at))
+    return 2 * source.nbytes / best / 1e9
+
+
+def _drop_from_page_cache(fd: int) -> None:
+    advise = getattr(os, "posix_fadvise", None)
+    if advise is not None:
+        try:
+            advise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def measure_disk_mbps(
+    path: str | Path,
+    *,
+    name: str = "agilab-disk-probe",
+    size_mb: int = DEFAULT_DISK_MB,
+    clock: Callable[[], float] = time.perf_counter,
+) -> tuple[float, float]:
+    """Return ``(write, read)`` throughput in MB/s for a probe file under ``path``."""
+    probe = Path(path) / f".{name}.bin"
+    block = os.urandom(_DISK_BLOCK)
+    size = max(int(size_mb), 1) * _DISK_BLOCK
+    try:
+        started_at = clock()
+        with open(probe, "wb", buffering=0) as stream:
+            for _ in range(size // _DISK_BLOCK):
+                stream.write(block)
+            os.fsync(stream.fileno())
+            _drop_from_page_cache(stream.fileno())
+        write_seconds = _elapsed(clock, started_at)
+
+        started_at = clock()
+        with open(probe, "rb", buffering=0) as stream:
+            while stream.read(_DISK_BLOCK):
+                pass
+        read_seconds = _elapsed(clock, started_at)
+    finally:
+        try:
+            probe.unlink()
+        except OSError:
+            pass
+    megabytes = size / 1e6
+    return megabytes / write_seconds, megabytes / read_seconds
+
+
+def run_hardware_benchmark(
+    path: str | Path,
+    *,
+    worker: str = "worker",
+    clock: Callable[[], float] = time.perf_counter,
+) -> dict[str, Any]:
+    """Run every probe; disk probes target ``path`` (the worker's share path)."""
+    started_at = clock()
+    disk_write, disk_read = measure_disk_mbps(
+        path,
+        name=f"agilab-disk-probe-{str(worker).replace(':', '_')}",
+        clock=clock,
+    )
+    return {
+        "cpu_gflops": measure_cpu_gflops(clock=clock),
+        "memory_gbps": measure_memory_gbps(clock=clock),
+        "disk_write_mbps": disk_write,
+        "disk_read_mbps": disk_read,
+        "benchmark_seconds": clock() - started_at,
+    }
+
+
+__all__ = [
+    "measure_cpu_gflops",
+    "measure_disk_mbps",
+    "measure_memory_gbps",
+    "run_hardware_benchmark",
+]
@@ -0,0 +1,360 @@
+"""Anytime capacity-aware partitioning for large distribution plans.
+
+``WorkDispatcher.make_chunks`` keeps its exact branch-and-bound for small work
+lists; above its threshold the plan is built here instead of by plain LPT:
+
+* capacity-normalized LPT seeds the plan; when all workers share the same
+  capacity, multi-way Karmarkar-Karp largest differencing is computed too and
+  the seed with the smaller makespan is kept;
+* the seed is then improved by moving or swapping work items off the most
+  loaded worker until no improving step remains, the makespan is within
+  :data:`PARTITION_GAP_TOLERANCE` of the capacity lower bound, or the
+  refinement limit is hit: a fixed number of improvement
+  steps by default, so the same input always yields the same plan, or an
+  opt-in wall-clock budget.
+
+Loads are always compared normalized by worker capacity, like the LPT and
+optimal partitioners.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+import math
+import os
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PARTITION_TIME_BUDGET_ENV = "AGILAB_PARTITION_TIME_BUDGET"
+DEFAULT_PARTITION_TIME_BUDGET: float | None = None
+#: Improvement steps the refinement may take when no time budget is set.
+DEFAULT_PARTITION_MAX_STEPS = 256
+
+#: Relative gap to the capacity lower bound at which a plan is good enough;
+#: large plans usually reach it from the seed alone and skip refinement.
+PARTITION_GAP_TOLERANCE = 1e-4
+
+_RELATIVE_TOLERANCE = 1e-12
+#: Largest items of the most loaded worker tried per swap target.
+_SWAP_CANDIDATES = 64
+
+
+def resolve_time_budget(time_budget: float | None = None) -> float | None:
+    """Return the improvement budget in seconds, or ``None`` when unset.
+
+    An explicit ``time_budget`` wins, then ``AGILAB_PARTITION_TIME_BUDGET``,
+    then :data:`DEFAULT_PARTITION_TIME_BUDGET`. ``0`` keeps the best seed;
+    ``None`` bounds the refinement by :data:`DEFAULT_PARTITION_MAX_STEPS`
+    instead of the clock.
+    """
+    candidates: list[Any] = [time_budget, os.environ.get(PARTITION_TIME_BUDGET_ENV)]
+    for raw in candidates:
+        if raw is None or raw == "":
+            continue
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            value = math.nan
+        if math.isfinite(value) and value >= 0:
+            return value
+        logger.warning("Ignoring invalid partition time budget %r", raw)
+    return DEFAULT_PARTITION_TIME_BUDGET
+
+
+def _item_weights(items: Sequence[Any]) -> list[float]:
+    weights = [float(item[1]) for item in items]
+    if not all(math.isfinite(weight) and weight >= 0 for weight in weights):
+        raise ValueError("work item weights must be finite non-negative values")
+    return weights
+
+
+def lpt_assignment(weights: Sequence[float], capacities: np.ndarray) -> list[int]:
+    """Return the capacity-normalized LPT worker index of every item."""
+    assignment = [0] * len(weights)
+    loads = np.zeros(len(capacities), dtype=float)
+    for index in sorted(range(len(weights)), key=lambda i: -weights[i]):
+        projected = loads + weights[index] / capacities
+        worker = int(np.argmin(projected))
+        assignment[index] = worker
+        loads[worker] = projected[worker]
+    return assignment
+
+
+def _flatten(node: Any, into: list[int]) -> None:
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current is None:
+            continue
+        if isinstance(current, tuple):
+            stack.extend(current)
+        else:
+            into.append(current)
+
+
+def karmarkar_karp_assignment(
+    weights: Sequence[float],
+    capacities: np.ndarray,
+    deadline: float | None = None,
+) -> list[int] | None:
+    """Return a multi-way largest-differencing worker index of every item.
+
+    Each partial solution is a ``k``-tuple of subset sums kept in descending
+    order; the two tuples with the largest spread are merged by pairing the
+    largest sums of one with the smallest of the other. The final subsets are
+    handed to workers in descending capacity order. Returns ``None`` when
+    ``deadline`` passes before the differencing finishes.
+    """
+    nchk = len(capacities)
+    heap: list[tuple[float, int, list[float], list[Any]]] = []
+    for index, weight in enumerate(weights):
+        sums = [weight] + [0.0] * (nchk - 1)
+        nodes: list[Any] = [index] + [None] * (nchk - 1)
+        heap.append((-weight, index, sums, nodes))
+    heapq.heapify(heap)
+    counter = len(weights)
+    while len(heap) > 1:
+        merges = counter - len(weights)
+        if deadline is not None and merges % 1024 == 0 and time.perf_counter() >= deadline:
+            return None
+        _, _, left_sums, left_nodes = heapq.heappop(heap)
+        _, _, right_sums, right_nodes = heapq.heappop(heap)
+        merged = sorted(
+            (
+                (
+                    left_sums[slot] + right_sums[nchk - 1 - slot],
+                    _merge_nodes(left_nodes[slot], right_nodes[nchk - 1 - slot]),
+                )
+                for slot in range(nchk)
+            ),
+            key=lambda pair: -pair[0],
+        )
+        sums = [pair[0] for pair in merged]
+        nodes = [pair[1] for pair in merged]
+        heapq.heappush(heap, (sums[-1] - sums[0], counter, sums, nodes))
+        counter += 1
+
+    assignment = [0] * len(weights)
+    if not heap:
+        return assignment
+    _, _, _, nodes = heap[0]
+    workers_by_capacity = sorted(range(nchk), key=lambda worker: -capacities[worker])
+    for worker, node in zip(workers_by_capacity, nodes):
+        members: list[int] = []
+        _flatten(node, members)
+        for index in members:
+            assignment[index] = worker
+    return assignment
+
+
+def _merge_nodes(left: Any, right: Any) -> Any:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return (left, right)
+
+
+def _makespan(weights: Sequence[float], assignment: Sequence[int], capacities: np.ndarray) -> float:
+    sums = np.zeros(len(capacities), dtype=float)
+    np.add.at(sums, np.asarray(assignment, dtype=int), np.asarray(weights, dtype=float))
+    return float(np.max(sums / capacities))
+
+
+def makespan_lower_bound(weights: Sequence[float], capacities: np.ndarray) -> float:
+    """Return a bound no capacity-normalized partition can beat."""
+    if not weights:
+        return 0.0
+    return max(sum(weights) / float(np.sum(capacities)), max(weights) / float(np.max(capacities)))
+
+
+class _LocalSearch:
+    """Move/swap refinement of the most loaded worker's items."""
+
+    def __init__(self, weights: Sequence[float], assignment: Sequence[int], capacities: np.ndarray):
+        self.weights = weights
+        self.capacities = [float(value) for value in capacities]
+        self.buckets: list[list[tuple[float, int]]] = [[] for _ in self.capacities]
+        self.sums = [0.0] * len(self.capacities)
+        for index, worker in enumerate(assignment):
+            self.buckets[worker].append((weights[index], index))
+            self.sums[worker] += weights[index]
+        for bucket in self.buckets:
+            bucket.sort()
+
+    def load(self, worker: int) -> float:
+        return self.sums[worker] / self.capacities[worker]
+
+    def makespan(self) -> float:
+        return max(self.load(worker) for worker in range(len(self.capacities)))
+
+    def _transfer(self, source: int, target: int, entry: tuple[float, int]) -> None:
+        bucket = self.buckets[source]
+        del bucket[bisect.bisect_left(bucket, entry)]
+        bisect.insort(self.buckets[target], entry)
+        self.sums[source] -= entry[0]
+        self.sums[target] += entry[0]
+
+    def _pair_peak(self, source: int, target: int, delta: float) -> float:
+        return max(
+            (self.sums[source] - delta) / self.capacities[source],
+            (self.sums[target] + delta) / self.capacities[target],
+        )
+
+    def _best_move(self, source: int) -> tuple[float, int, tuple[float, int]] | None:
+        bucket = self.buckets[source]
+        best = None
+        for target in range(len(self.capacities)):
+            if target == source:
+                continue
+            ideal = self._ideal_delta(source, target)
+            position = bisect.bisect_left(bucket, (ideal, -1))
+            for candidate in bucket[max(position - 1, 0) : position + 1]:
+                if candidate[0] <= 0:
+                    continue
+                peak = self._pair_peak(source, target, candidate[0])
+                if best is None or peak < best[0]:
+                    best = (peak, target, candidate)
+        return best
+
+    def _best_swap(
+        self, source: int, deadline: float | None
+    ) -> tuple[float, int, tuple[float, int], tuple[float, int]] | None:
+        bucket = self.buckets[source]
+        best = None
+        for target in range(len(self.capacities)):
+            if target == source or (deadline is not None and time.perf_counter() >= deadline):
+                continue
+            others = self.buckets[target]
+            if not others:
+                continue
+            ideal = self._ideal_delta(source, target)
+            for outgoing in bucket[-_SWAP_CANDIDATES:]:
+                position = bisect.bisect_left(others, (outgoing[0] - ideal, -1))
+                for incoming in others[max(position - 1, 0) : position + 1]:
+                    delta = outgoing[0] - incoming[0]
+                    if delta <= 0:
+                        continue
+                    peak = self._pair_peak(source, target, delta)
+                    if best is None or peak < best[0]:
+                        best = (peak, target, outgoing, incoming)
+        return best
+
+    def _ideal_delta(self, source: int, target: int) -> float:
+        # Weight that, moved from ``source`` to ``target``, equalizes both loads.
+        source_capacity = self.capacities[source]
+        target_capacity = self.capacities[target]
+        return (
+            (self.load(source) - self.load(target))
+            * source_capacity
+            * target_capacity
+            / (source_capacity + target_capacity)
+        )
+
+    def improve(self, deadline: float | None, lower_bound: float, max_steps: int | None = None) -> None:
+        steps = 0
+        while deadline is None or time.perf_counter() < deadline:
+            if max_steps is not None and steps >= max_steps:
+                return
+            steps += 1
+            source = max(range(len(self.capacities)), key=self.load)
+            current = self.load(source)
+            if current <= lower_bound * (1 + PARTITION_GAP_TOLERANCE):
+                return
+            threshold = current * (1 - _RELATIVE_TOLERANCE)
+            move = self._best_move(source)
+            if move is not None and move[0] < threshold:
+                self._transfer(source, move[1], move[2])
+                continue
+            swap = self._best_swap(source, deadline)
+            if swap is not None and swap[0] < threshold:
+                _, target, outgoing, incoming = swap
+                self._transfer(source, target, outgoing)
+                self._transfer(target, source, incoming)
+                continue
+            return
+
+    def assignment(self) -> list[int]:
+        assignment = [0] * len(self.weights)
+        for worker, bucket in enumerate(self.buckets):
+            for _weight, index in bucket:
+                assignment[index] = worker
+        return assignment
+
+
+def anytime_partition(
+    items: Sequence[Any],
+    capacities: np.ndarray,
+    *,
+    time_budget: float | None = None,
+    max_steps: int = DEFAULT_PARTITION_MAX_STEPS,
+) -> list[list[Any]]:
+    """Partition ``(label, size)`` items over workers with the given capacities.
+
+    Returns one chunk per capacity, each ordered by descending size, minimizing
+    the largest ``sum(size) / capacity`` found within ``time_budget`` seconds,
+    or within ``max_steps`` improvement steps when no budget is configured.
+    """
+    budget = resolve_time_budget(time_budget)
+    started = time.perf_counter()
+    deadline = None if budget is None else started + budget
+    capacities = np.asarray(capacities, dtype=float)
+    weights = _item_weights(items)
+
+    lower_bound = makespan_lower_bound(weights, capacities)
+    good_enough = lower_bound * (1 + PARTITION_GAP_TOLERANCE)
+    final = lpt_assignment(weights, capacities)
+    seed_makespan = final_makespan = _makespan(weights, final, capacities)
+    # Differencing balances raw subset sums, which only pays off when every
+    # worker has the same capacity; with mixed capacities LPT is the better seed.
+    if (
+        seed_makespan > good_enough
+        and len(capacities) > 1
+        and budget != 0
+        and np.all(capacities == capacities[0])
+    ):
+        differencing = karmarkar_karp_assignment(weights, capacities, deadline)
+        if differencing is not None:
+            differencing_makespan = _makespan(weights, differencing, capacities)
+            if differencing_makespan < seed_makespan:
+                final, seed_makespan = differencing, differencing_makespan
+                final_makespan = seed_makespan
+    if seed_makespan > good_enough and budget != 0:
+        search = _LocalSearch(weights, final, capacities)
+        search.improve(deadline, lower_bound, max_steps if deadline is None else None)
+        final, final_makespan = search.assignment(), search.makespan()
+    logger.info(
+        "anytime partition of %s works over %s workers: makespan %.6g (seed %.6g, "
+        "lower bound %.6g) in %.3fs",
+        len(weights),
+        len(capacities),
+        final_makespan,
+        seed_makespan,
+        lower_bound,
+        time.perf_counter() - started,
+    )
+
+    chunks: list[list[Any]] = [[] for _ in capacities]
+    for index in sorted(range(len(items)), key=lambda i: -weights[i]):
+        chunks[final[index]].append(items[index])
+    return chunks
+
+
+__all__ = [
+    "DEFAULT_PARTITION_MAX_STEPS",
+    "DEFAULT_PARTITION_TIME_BUDGET",
+    "PARTITION_GAP_TOLERANCE",
+    "PARTITION_TIME_BUDGET_ENV",
+    "anytime_partition",
+    "karmarkar_karp_assignment",
+    "lpt_assignment",
+    "makespan_lower_bound",
+    "resolve_time_budget",
+]
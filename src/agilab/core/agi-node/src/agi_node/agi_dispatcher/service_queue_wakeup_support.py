@@ -0,0 +1,126 @@
+"""Wake an idle service worker as soon as a task lands in its queue directory.
+
+``run_service_queue`` used to sleep ``poll`` seconds between scans, so the
+submit-to-start latency of a service task was bounded below by the poll
+interval. :class:`ServiceQueueWaiter` waits on Linux ``inotify`` for tasks
+renamed or written into the watched directories and returns immediately;
+the poll interval only remains as the rescan period, which is still needed on
+shared filesystems (NFS, SSHFS) where writes from other hosts raise no local
+events. Elsewhere, or with ``AGILAB_SERVICE_QUEUE_NOTIFY=0``, it falls back to
+waiting on the stop event like before.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+#: Set to ``0``/``false``/``off`` to rescan the queue on the poll interval only.
+SERVICE_QUEUE_NOTIFY_ENV = "AGILAB_SERVICE_QUEUE_NOTIFY"
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+# Upper bound on how long a notified wait goes without checking the stop event.
+_STOP_CHECK_SECONDS = 0.1
+_DISABLED_VALUES = {"0", "false", "no", "off"}
+
+
+def service_queue_notify_enabled() -> bool:
+    raw = os.environ.get(SERVICE_QUEUE_NOTIFY_ENV, "")
+    return raw.strip().lower() not in _DISABLED_VALUES
+
+
+class _InotifyWatch:
+    """Minimal ``inotify`` reader for a few directories (Linux only)."""
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            for path in paths:
+                if libc.inotify_add_watch(self._fd, os.fsencode(str(path)), _WATCH_MASK) < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}", str(path))
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def wait(self, timeout: float) -> bool:
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0.0))
+        if not ready:
+            return False
+        while True:
+            try:
+                if not os.read(self._fd, 64 * 1024):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class ServiceQueueWaiter:
+    """Wait until a watched directory changes, the stop event is set, or ``timeout`` elapses."""
+
+    def __init__(self, stop_event: Any, paths: Iterable[Path], *, log: Any = logger) -> None:
+        self._stop_event = stop_event
+        self._watch: _InotifyWatch | None = None
+        if service_queue_notify_enabled() and hasattr(select, "select"):
+            try:
+                self._watch = _InotifyWatch(list(paths))
+            except (AttributeError, OSError, TypeError) as exc:
+                log.debug("service queue notifications unavailable, polling: %s", exc)
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._watch is not None else "poll"
+
+    def wait(self, timeout: float) -> bool:
+        """Return ``True`` when woken by a queue change, ``False`` otherwise."""
+        if self._watch is None:
+            self._stop_event.wait(timeout)
+            return False
+        deadline = time.monotonic() + timeout
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._watch.wait(min(remaining, _STOP_CHECK_SECONDS)):
+                return True
+        return False
+
+    def close(self) -> None:
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+
+    def __enter__(self) -> "ServiceQueueWaiter":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+
+__all__ = [
+    "SERVICE_QUEUE_NOTIFY_ENV",
+    "ServiceQueueWaiter",
+    "service_queue_notify_enabled",
+]
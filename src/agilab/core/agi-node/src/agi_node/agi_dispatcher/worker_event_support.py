@@ -0,0 +1,296 @@
+"""Incremental log and progress events from a Dask worker to the manager.
+
+``BaseWorker._do_works`` used to hand its whole captured log back only when
+the plan finished. Inside a Dask worker it now also streams:
+
+* every log record it captures (``kind="log"``),
+* per-item progress of the dataframe pool engine (``items_done`` /
+  ``items_failed`` against ``items_total``),
+* the run status (``done`` or ``failed``) on the final batch,
+
+as Dask events on :data:`WORKER_EVENT_TOPIC` (``Worker.log_event``), which the
+manager subscribes to. Events are kept in a bounded buffer and published in
+batches at most every :data:`DEFAULT_FLUSH_INTERVAL` seconds, by the next
+event or by a background timer so records logged before a long work item
+still arrive on time; when the buffer
+overflows the oldest log records are dropped and counted, progress is always
+coalesced into its latest value. Because the full log already reached the
+manager, the string returned by ``_do_works`` only keeps a bounded tail.
+
+Set ``AGILAB_WORKER_EVENTS=0`` to turn streaming off. Outside a Dask worker
+every function here is a no-op.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+WORKER_EVENT_TOPIC = "agilab.worker_events"
+
+#: Set to ``0``/``false``/``off`` to disable worker event streaming.
+WORKER_EVENTS_ENV = "AGILAB_WORKER_EVENTS"
+
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_MAX_BUFFERED_EVENTS = 1000
+DEFAULT_LOG_TAIL_RECORDS = 2000
+
+_DISABLED_VALUES = {"0", "false", "no", "off"}
+
+# The stream of the ``_do_works`` call running on this thread.
+_ACTIVE = threading.local()
+
+
+def worker_events_enabled() -> bool:
+    raw = os.environ.get(WORKER_EVENTS_ENV, "")
+    return raw.strip().lower() not in _DISABLED_VALUES
+
+
+class WorkerEventStream:
+    """Bounded, batching publisher of one ``_do_works`` call's events."""
+
+    def __init__(
+        self,
+        publish: Callable[[dict[str, Any]], None],
+        *,
+        worker_id: int | None,
+        worker: str | None,
+        max_buffered: int = DEFAULT_MAX_BUFFERED_EVENTS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        time_fn: Callable[[], float] = time.time,
+    ) -> None:
+        self._publish = publish
+        self.worker_id = worker_id
+        self.worker = worker
+        self._max_buffered = max(int(max_buffered), 1)
+        self._flush_interval = flush_interval
+        self._time = time_fn
+        self._lock = threading.RLock()
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._dropped = 0
+        self._publishing = False
+        self._progress_dirty = False
+        self._last_flush = time_fn()
+        self._flusher: threading.Thread | None = None
+        self._flusher_stop = threading.Event()
+        self.items_total = 0
+        self.items_done = 0
+        self.items_failed = 0
+
+    def _append(self, event: dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._buffer) >= self._max_buffered:
+                self._buffer.popleft()
+                self._dropped += 1
+            self._buffer.append(event)
+        self._maybe_flush()
+
+    def log(self, record: logging.LogRecord, message: str) -> None:
+        self._append(
+            {
+                "kind": "log",
+                "t": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "message": message,
+            }
+        )
+
+    def plan(self, items_total: int) -> None:
+        with self._lock:
+            self.items_total += max(int(items_total), 0)
+            self._progress_dirty = True
+        self._maybe_flush()
+
+    def items(self, done: int = 1, failed: int = 0) -> None:
+        with self._lock:
+            self.items_done += max(int(done), 0)
+            self.items_failed += max(int(failed), 0)
+            self._progress_dirty = True
+        self._maybe_flush()
+
+    def start_flusher(self) -> None:
+        """Flush buffered events every ``flush_interval`` from a daemon thread."""
+        if self._flusher is not None or self._flush_interval <= 0:
+            return
+        self._flusher_stop.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name=f"agi-worker-events-{self.worker_id}",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def stop_flusher(self) -> None:
+        flusher, self._flusher = self._flusher, None
+        if flusher is None:
+            return
+        self._flusher_stop.set()
+        flusher.join(timeout=self._flush_interval + 1.0)
+
+    def _flush_periodically(self) -> None:
+        while not self._flusher_stop.wait(self._flush_interval):
+            self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self._time() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self, *, status: str | None = None) -> None:
+        with self._lock:
+            # Publishing may itself log (e.g. from distributed); those records
+            # are buffered for the next batch instead of recursing.
+            if self._publishing:
+                return
+            if not self._buffer and not self._progress_dirty and status is None:
+                self._last_flush = self._time()
+                return
+            message: dict[str, Any] = {
+                "worker_id": self.worker_id,
+                "worker": self.worker,
+                "t": self._time(),
+                "events": list(self._buffer),
+                "dropped": self._dropped,
+                "progress": {
+                    "items_total": self.items_total,
+                    "items_done": self.items_done,
+                    "items_failed": self.items_failed,
+                },
+            }
+            if status is not None:
+                message["status"] = status
+            self._buffer.clear()
+            self._dropped = 0
+            self._progress_dirty = False
+            self._last_flush = message["t"]
+            self._publishing = True
+        try:
+            self._publish(message)
+        except (OSError, RuntimeError, TypeError, ValueError) as exc:
+            logger.debug("dropping worker event batch: %s", exc)
+        finally:
+            with self._lock:
+                self._publishing = False
+
+
+class WorkerEventLogHandler(logging.Handler):
+    """Forward captured log records to a :class:`WorkerEventStream`."""
+
+    def __init__(self, stream: WorkerEventStream, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self._stream = stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._stream.log(record, self.format(record))
+        except (RuntimeError, TypeError, ValueError):
+            self.handleError(record)
+
+
+class LogTail:
+    """Write-only text sink keeping the last ``max_records`` writes."""
+
+    def __init__(self, max_records: int = DEFAULT_LOG_TAIL_RECORDS) -> None:
+        self._records: deque[str] = deque(maxlen=max(int(max_records), 1))
+        self._written = 0
+
+    def write(self, text: str) -> int:
+        self._records.append(text)
+        self._written += 1
+        return len(text)
+
+    def flush(self) -> None:
+        return None
+
+    def getvalue(self) -> str:
+        skipped = self._written - len(self._records)
+        prefix = (
+            f"... {skipped} earlier log record(s) were streamed to the manager ...\n"
+            if skipped > 0
+            else ""
+        )
+        return prefix + "".join(self._records)
+
+
+def _dask_publisher(topic: str = WORKER_EVENT_TOPIC) -> Callable[[dict[str, Any]], None] | None:
+    try:
+        from distributed import get_worker
+    except ImportError:
+        return None
+    try:
+        dask_worker = get_worker()
+    except ValueError:
+        return None
+    return lambda message: dask_worker.log_event(topic, message)
+
+
+def dask_event_publisher(topic: str) -> Callable[[dict[str, Any]], None] | None:
+    """Publisher of ``topic`` events from the current Dask worker, if streaming is on."""
+    return _dask_publisher(topic) if worker_events_enabled() else None
+
+
+@contextmanager
+def worker_event_stream(
+    *,
+    worker_id: int | None,
+    worker: str | None,
+    publisher_factory: Callable[[], Callable[[dict[str, Any]], None] | None] = _dask_publisher,
+) -> Iterator[WorkerEventStream | None]:
+    """Stream this block's events when running inside a Dask worker.
+
+    The final batch carries ``status`` ``"done"`` or ``"failed"``.
+    """
+    publish = publisher_factory() if worker_events_enabled() else None
+    if publish is None:
+        yield None
+        return
+    stream = WorkerEventStream(publish, worker_id=worker_id, worker=worker)
+    previous = getattr(_ACTIVE, "stream", None)
+    _ACTIVE.stream = stream
+    status = "failed"
+    stream.start_flusher()
+    try:
+        yield stream
+        status = "done"
+    finally:
+        _ACTIVE.stream = previous
+        stream.stop_flusher()
+        stream.flush(status=status)
+
+
+def plan_items(count: int) -> None:
+    """Announce ``count`` more work items for the active stream, if any."""
+    stream = getattr(_ACTIVE, "stream", None)
+    if stream is not None:
+        stream.plan(count)
+
+
+def items_done(done: int = 1, failed: int = 0) -> None:
+    """Report finished (and failed) work items to the active stream, if any."""
+    stream = getattr(_ACTIVE, "stream", None)
+    if stream is not None:
+        stream.items(done, failed)
+
+
+__all__ = [
+    "DEFAULT_FLUSH_INTERVAL",
+    "DEFAULT_LOG_TAIL_RECORDS",
+    "DEFAULT_MAX_BUFFERED_EVENTS",
+    "LogTail",
+    "WORKER_EVENTS_ENV",
+    "WORKER_EVENT_TOPIC",
+    "WorkerEventLogHandler",
+    "WorkerEventStream",
+    "dask_event_publisher",
+    "items_done",
+    "plan_items",
+    "worker_event_stream",
+    "worker_events_enabled",
+]
@@ -11,13 +11,25 @@ copy-pasted across :class:`PandasWorker`, :class:`PolarsWorker` and
 :class:`FireducksWorker`:
 
 * mode dispatch (pool vs mono) via one named mask,
-* one warm executor per ``works()`` call (instead of one per chunk),
+* one warm executor per ``works()`` call (instead of one per chunk), kept
+  across calls for the lifetime of a service loop by :func:`warm_pool_scope`,
 * a module-level pool entry point so the worker instance is shipped to each
   pool child exactly once (through the initializer) instead of being pickled
   per task,
 * batched submission with per-item error context,
 * unified result normalisation, ``worker_id`` labelling and ``work_done``
-  cadence (one call per plan chunk).
+  cadence (one call per plan chunk),
+* an opt-in result transport for process pools that hands frame buffers to
+  the parent through shared memory instead of the executor pipe,
+* an opt-in streaming mode that bounds the batches in flight and persists
+  results every N work items instead of holding a whole chunk in memory,
+* opt-in adaptive batch sizing from the measured cost of each work item,
+* memory-aware pool width and a guard that holds back submission while the
+  pool's resident memory nears a limit, with a per-item estimate measured
+  over the first batch unless one is configured,
+* opt-in per-item retries with exponential backoff, and a checkpoint store
+  that keeps completed item results of an unfinished chunk so the next
+  ``works()`` call only runs the missing items.
 
 Worker families plug in via :class:`PoolFrameHooks` (frame type, executor
 kind, concat/empty semantics).
@@ -25,18 +37,38 @@ kind, concat/empty semantics).
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import math
+import mmap
 import os
+import pickle
 import sys
+import tempfile
 import time
 import traceback
-from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from collections import Counter, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    as_completed,
+    wait,
+)
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Sequence
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, Sequence, TypeVar
+
+import psutil
+
+from . import worker_event_support
 
 logger = logging.getLogger(__name__)
 
+_Number = TypeVar("_Number", int, float)
+
 # In-worker pooling is requested via the pool bit (1). The dask bit (4) is
 # also included because it keeps its historical behavior of pooling inside
 # each dask worker; changing that semantics is deliberately deferred (the UI
@@ -63,6 +95,93 @@ POOL_ITEM_TIMEOUT_ARG = "pool_item_timeout"
 #: thread pool — same parallelism without spawn/pickling costs.
 POOL_EXECUTOR_ENV = "AGILAB_POOL_EXECUTOR"
 
+#: Result transport for process pools. ``pipe`` (default) pickles every
+#: result through the executor pipe. ``shm`` and ``mmap`` pickle results with
+#: protocol 5 and move the out-of-band frame buffers into a
+#: ``multiprocessing.shared_memory`` segment or a memory-mapped file, so the
+#: parent maps them without copying and only a small metadata payload crosses
+#: the pipe. Read from ``worker.args`` first, then the environment.
+POOL_RESULT_TRANSPORT_ENV = "AGILAB_POOL_RESULT_TRANSPORT"
+POOL_RESULT_TRANSPORT_ARG = "pool_result_transport"
+POOL_RESULT_TRANSPORTS = ("pipe", "shm", "mmap")
+
+#: Directory holding ``mmap`` transport files (defaults to the temp dir). Use
+#: it when ``/dev/shm`` is small, e.g. inside default Docker containers.
+POOL_RESULT_DIR_ENV = "AGILAB_POOL_RESULT_DIR"
+
+#: Streaming mode (opt-in): hand results to ``work_done`` every N work items,
+#: in work-item order, instead of once per chunk, with a bounded number of
+#: batches in flight, so peak memory follows the pool width rather than the
+#: chunk size. Read from ``worker.args`` first, then the environment.
+POOL_STREAM_ITEMS_ENV = "AGILAB_POOL_STREAM_ITEMS"
+POOL_STREAM_ITEMS_ARG = "pool_stream_items"
+
+#: Streaming submits at most this many batches per pool slot ahead of the
+#: oldest batch not yet persisted (one running, one queued per slot).
+_STREAM_BATCHES_PER_SLOT = 2
+
+#: Batch sizing: ``fixed`` (default) splits a chunk with :func:`map_chunksize`
+#: and submits it at once; ``adaptive`` submits batches incrementally and
+#: sizes each from the per-item durations measured in the pool children.
+#: Read from ``worker.args`` first, then the environment.
+POOL_BATCHING_ENV = "AGILAB_POOL_BATCHING"
+POOL_BATCHING_ARG = "pool_batching"
+POOL_BATCHINGS = ("fixed", "adaptive")
+
+#: Adaptive batches aim at this much work each: enough to amortise the
+#: executor round trip on tiny items, short enough to rebalance slow ones.
+_ADAPTIVE_BATCH_TARGET_SECONDS = 0.25
+_ADAPTIVE_BATCH_MAX_ITEMS = 1024
+#: Recent item durations the adaptive size is derived from.
+_ADAPTIVE_SAMPLE_ITEMS = 512
+#: Upper bounds (seconds) of the per-item timing histogram buckets.
+_ITEM_SECONDS_BUCKETS = (0.001, 0.01, 0.1, 1.0, 10.0, 60.0)
+
+#: Expected peak memory of one work item in MiB. When known (an app can set
+#: it from its ``build_distribution`` weights), the pool width is bounded by
+#: the memory available on the host. Read from ``worker.args`` first, then the
+#: environment. When unset, the pool measures it from the RSS growth over its
+#: first completed batch and holds back submission accordingly.
+POOL_ITEM_MEMORY_ENV = "AGILAB_POOL_ITEM_MEMORY_MB"
+POOL_ITEM_MEMORY_ARG = "pool_item_memory_mb"
+
+#: Resident memory limit of the pool in MiB, or ``auto`` for a share of the
+#: memory available when the run starts. Batches are submitted incrementally
+#: and held back while the pool children's RSS (the worker process itself for
+#: thread pools) nears the limit. Without it, a measured per-item estimate is
+#: checked against the ``auto`` share.
+POOL_MEMORY_LIMIT_ENV = "AGILAB_POOL_MEMORY_LIMIT_MB"
+POOL_MEMORY_LIMIT_ARG = "pool_memory_limit_mb"
+
+#: Share of the available memory the pool may plan for.
+_POOL_MEMORY_HEADROOM = 0.8
+#: Submission pauses once the pool RSS reaches this share of its limit.
+_POOL_MEMORY_SOFT_LIMIT = 0.9
+#: Minimum seconds between two RSS samples of the pool.
+_POOL_MEMORY_SAMPLE_SECONDS = 0.1
+_MIB = 1024 * 1024
+
+#: Extra attempts of a failing work item, with an exponential backoff
+#: starting at ``AGILAB_POOL_RETRY_BACKOFF`` seconds. Read from
+#: ``worker.args`` first, then the environment; retries happen in the pool
+#: child, which resolves them from its own copy of the worker.
+POOL_ITEM_RETRIES_ENV = "AGILAB_POOL_ITEM_RETRIES"
+POOL_ITEM_RETRIES_ARG = "pool_item_retries"
+POOL_RETRY_BACKOFF_ENV = "AGILAB_POOL_RETRY_BACKOFF"
+POOL_RETRY_BACKOFF_ARG = "pool_retry_backoff"
+_DEFAULT_RETRY_BACKOFF_SECONDS = 1.0
+_MAX_RETRY_BACKOFF_SECONDS = 60.0
+
+#: Directory of the item checkpoint store (opt-in). Completed item results
+#: are pickled there, keyed by item index and input fingerprint, until their
+#: chunk reaches ``work_done``.
+POOL_CHECKPOINT_DIR_ENV = "AGILAB_POOL_CHECKPOINT_DIR"
+POOL_CHECKPOINT_DIR_ARG = "pool_checkpoint_dir"
+
+#: Results whose out-of-band buffers are smaller than this stay on the pipe;
+#: mapping a segment costs more than pickling a few kilobytes.
+_SHARED_RESULT_MIN_BYTES = 64 * 1024
+
 #: Grace added on top of the derived chunk deadline so a timeout reflects a
 #: genuinely stuck item rather than scheduling jitter.
 _POOL_TIMEOUT_GRACE_SECONDS = 5.0
@@ -78,6 +197,11 @@ _POOL_ITEM_BOUNDARY_EXCEPTIONS: tuple[type[Exception], ...] = (Exception,)
 # One in-worker pool runs at a time per process, so a module global is safe.
 _POOL_RUNTIME_WORKER: Any = None
 
+# Nesting depth of :func:`warm_pool_scope` and the idle executor it keeps as
+# ``(key, context manager, executor)``; an executor in use is not in the slot.
+_WARM_POOL_SCOPES = 0
+_WARM_POOL: tuple[tuple[Any, ...], Any, Any] | None = None
+
 
 class _PoolItemTimeoutError(RuntimeError):
     """Internal marker for an executor that has already been abandoned."""
@@ -94,6 +218,9 @@ class PoolFrameHooks:
     is_empty: Callable[[Any], bool]
     concat_labeled: Callable[[Sequence[Any], Sequence[str]], Any]
     empty_frame: Callable[[], Any]
+    # True when results pickle with protocol 5 out-of-band buffers (numpy or
+    # Arrow backed frames), which the shm/mmap result transports rely on.
+    shared_results: bool = False
 
 
 def pool_mode_requested(mode: Any) -> bool:
@@ -110,65 +237,200 @@ def resolve_pool_width(chunk_lengths: Sequence[int], args: Any = None) -> int:
     """Resolve the pool width once per ``works()`` call.
 
     The width is bounded by the largest chunk (extra workers would idle), the
-    machine's CPU count (guarding ``os.cpu_count()`` returning ``None``), and
-    an optional cap from ``args[pool_max_workers]`` or
-    ``AGILAB_POOL_MAX_WORKERS``.
+    machine's CPU count (guarding ``os.cpu_count()`` returning ``None``), the
+    number of items that fit in the available memory when a per-item
+    estimate is configured, and an optional cap from
+    ``args[pool_max_workers]`` or ``AGILAB_POOL_MAX_WORKERS``.
     """
     largest_chunk = max((int(length) for length in chunk_lengths), default=0)
     cpu_count = os.cpu_count() or 1
     width = max(min(largest_chunk, cpu_count), 1)
+    item_memory = resolve_pool_item_memory(args)
+    if item_memory is not None:
+        fitting = int(_available_memory() * _POOL_MEMORY_HEADROOM // item_memory)
+        if fitting < width:
+            logger.info(
+                "Pool width limited to %d by available memory (%.0f MiB per item)",
+                max(fitting, 1),
+                item_memory / _MIB,
+            )
+            width = max(fitting, 1)
     cap = _resolve_pool_cap(args)
     if cap is not None:
         width = max(min(width, cap), 1)
     return width
 
 
-def _resolve_pool_cap(args: Any) -> int | None:
-    """Read the optional pool-width cap from args, then the environment."""
-    candidates = []
+def _available_memory() -> int:
+    return int(psutil.virtual_memory().available)
+
+
+def _pool_setting_values(args: Any, arg_name: str, env_name: str) -> Iterator[Any]:
+    """Yield the set raw values of one pool knob: ``args`` first, then the environment.
+
+    Callers validate each value and move on to the next when it is unusable.
+    """
     getter = getattr(args, "get", None)
-    if callable(getter):
-        candidates.append(getter(POOL_MAX_WORKERS_ARG))
-    candidates.append(os.environ.get(POOL_MAX_WORKERS_ENV))
-    for raw in candidates:
-        if raw is None or raw == "":
+    for raw in (
+        getter(arg_name) if callable(getter) else None,
+        os.environ.get(env_name),
+    ):
+        if raw is not None and raw != "":
+            yield raw
+
+
+def _resolve_megabytes(args: Any, arg_name: str, env_name: str, *, allow_auto: bool) -> int | str | None:
+    """Read a MiB setting from args, then the environment, as bytes (or ``"auto"``)."""
+    for raw in _pool_setting_values(args, arg_name, env_name):
+        if allow_auto and str(raw).strip().lower() == "auto":
+            return "auto"
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring invalid %s value %r (expected MiB)", arg_name, raw)
             continue
+        if value > 0 and math.isfinite(value):
+            return int(value * _MIB)
+        logger.warning("Ignoring non-positive %s value %r", arg_name, raw)
+    return None
+
+
+def resolve_pool_item_memory(args: Any = None) -> int | None:
+    """Per-item memory estimate in bytes from args, then the environment."""
+    value = _resolve_megabytes(args, POOL_ITEM_MEMORY_ARG, POOL_ITEM_MEMORY_ENV, allow_auto=False)
+    return value if isinstance(value, int) else None
+
+
+def resolve_pool_memory_limit(args: Any = None) -> int | None:
+    """Pool RSS limit in bytes from args, then the environment; ``auto`` sizes it from free memory."""
+    value = _resolve_megabytes(args, POOL_MEMORY_LIMIT_ARG, POOL_MEMORY_LIMIT_ENV, allow_auto=True)
+    if value == "auto":
+        return int(_available_memory() * _POOL_MEMORY_HEADROOM)
+    return value if isinstance(value, int) else None
+
+
+def _resolve_pool_number(
+    args: Any,
+    arg_name: str,
+    env_name: str,
+    parse: Callable[[Any], _Number],
+    label: str,
+    expected: str,
+    *,
+    positive: bool = True,
+) -> _Number | None:
+    """First usable ``arg_name`` value from args, then ``env_name``.
+
+    Unparsable values are logged and skipped. With ``positive`` a value
+    ``<= 0`` is logged and skipped too; otherwise it is clamped to zero.
+    """
+    for raw in _pool_setting_values(args, arg_name, env_name):
         try:
-            value = int(raw)
+            value = parse(raw)
         except (TypeError, ValueError):
-            logger.warning(
-                "Ignoring invalid pool max workers value %r (expected an integer)",
-                raw,
-            )
+            logger.warning("Ignoring invalid %s value %r (expected %s)", label, raw, expected)
             continue
+        if not positive:
+            return max(value, parse(0))
         if value > 0:
             return value
-        logger.warning("Ignoring non-positive pool max workers value %r", raw)
+        logger.warning("Ignoring non-positive %s value %r", label, raw)
     return None
 
 
+def _resolve_pool_cap(args: Any) -> int | None:
+    """Read the optional pool-width cap from args, then the environment."""
+    return _resolve_pool_number(
+        args, POOL_MAX_WORKERS_ARG, POOL_MAX_WORKERS_ENV, int, "pool max workers", "an integer"
+    )
+
+
 def resolve_pool_item_timeout(args: Any = None) -> float | None:
     """Read the optional per-item time budget from args, then the environment."""
-    candidates = []
-    getter = getattr(args, "get", None)
-    if callable(getter):
-        candidates.append(getter(POOL_ITEM_TIMEOUT_ARG))
-    candidates.append(os.environ.get(POOL_ITEM_TIMEOUT_ENV))
-    for raw in candidates:
-        if raw is None or raw == "":
-            continue
+    return _resolve_pool_number(
+        args, POOL_ITEM_TIMEOUT_ARG, POOL_ITEM_TIMEOUT_ENV, float, "pool item timeout", "seconds"
+    )
+
+
+def resolve_pool_stream_items(args: Any = None) -> int | None:
+    """Read the optional streaming segment size from args, then the environment."""
+    return _resolve_pool_number(
+        args, POOL_STREAM_ITEMS_ARG, POOL_STREAM_ITEMS_ENV, int, "pool stream items", "an integer"
+    )
+
+
+def resolve_pool_batching(args: Any = None) -> str:
+    """Read the batch sizing mode from args, then the environment."""
+    for raw in _pool_setting_values(args, POOL_BATCHING_ARG, POOL_BATCHING_ENV):
+        value = str(raw).strip().lower()
+        if value in POOL_BATCHINGS:
+            return value
+        logger.warning(
+            "Ignoring invalid pool batching %r (expected %s)",
+            raw,
+            ", ".join(POOL_BATCHINGS),
+        )
+    return "fixed"
+
+
+def resolve_pool_item_retries(args: Any = None) -> tuple[int, float]:
+    """Read ``(retries, first backoff seconds)`` from args, then the environment."""
+    retries = _resolve_pool_number(
+        args,
+        POOL_ITEM_RETRIES_ARG,
+        POOL_ITEM_RETRIES_ENV,
+        int,
+        "pool item retries",
+        "an integer",
+        positive=False,
+    )
+    backoff = _resolve_pool_number(
+        args,
+        POOL_RETRY_BACKOFF_ARG,
+        POOL_RETRY_BACKOFF_ENV,
+        float,
+        "pool retry backoff",
+        "seconds",
+        positive=False,
+    )
+    return (
+        0 if retries is None else retries,
+        _DEFAULT_RETRY_BACKOFF_SECONDS if backoff is None else backoff,
+    )
+
+
+def _retry_delay(backoff: float, attempt: int) -> float:
+    return min(backoff * (2**attempt), _MAX_RETRY_BACKOFF_SECONDS)
+
+
+def _retry_item_budget(item_timeout: float | None, retries: int, backoff: float) -> float | None:
+    """Per-item time budget covering every attempt and the waits between them."""
+    if item_timeout is None or not retries:
+        return item_timeout
+    return item_timeout * (retries + 1) + sum(_retry_delay(backoff, attempt) for attempt in range(retries))
+
+
+def _work_pool_with_retry(worker: Any, item: Any, retries: int, backoff: float) -> Any:
+    """Call ``work_pool`` and retry a failure ``retries`` times with backoff."""
+    attempt = 0
+    while True:
         try:
-            value = float(raw)
-        except (TypeError, ValueError):
+            return worker.work_pool(item)
+        # Worker code boundary: the last failure propagates to the caller.
+        except _POOL_ITEM_BOUNDARY_EXCEPTIONS:
+            if attempt >= retries:
+                raise
+            delay = _retry_delay(backoff, attempt)
             logger.warning(
-                "Ignoring invalid pool item timeout value %r (expected seconds)",
-                raw,
+                "work_pool failed for work item %r (attempt %d of %d); retrying in %.1fs",
+                item,
+                attempt + 1,
+                retries + 1,
+                delay,
+                exc_info=True,
             )
-            continue
-        if value > 0:
-            return value
-        logger.warning("Ignoring non-positive pool item timeout value %r", raw)
-    return None
+            time.sleep(delay)
+            attempt += 1
 
 
 def _chunk_deadline_seconds(item_timeout: float, item_count: int, width: int) -> float:
@@ -222,6 +484,197 @@ def map_chunksize(item_count: int, width: int) -> int:
     return max(1, min(_MAP_CHUNKSIZE_CAP, item_count // max(width, 1)))
 
 
+def resolve_result_transport(hooks: PoolFrameHooks, executor_kind: str, args: Any = None) -> str:
+    """Resolve the result transport from args, then the environment.
+
+    ``shm``/``mmap`` only apply to process pools of families that declare
+    ``shared_results``; thread pools already share the parent's memory, so
+    every other combination falls back to ``pipe``.
+    """
+    transport = "pipe"
+    for raw in _pool_setting_values(args, POOL_RESULT_TRANSPORT_ARG, POOL_RESULT_TRANSPORT_ENV):
+        value = str(raw).strip().lower()
+        if value in POOL_RESULT_TRANSPORTS:
+            transport = value
+            break
+        logger.warning(
+            "Ignoring invalid pool result transport %r (expected %s)",
+            raw,
+            ", ".join(POOL_RESULT_TRANSPORTS),
+        )
+    if transport == "pipe":
+        return transport
+    if not hooks.shared_results or not executor_kind.startswith("process"):
+        logger.info(
+            "%s result transport %r needs a process pool of a shared-results "
+            "family; using the executor pipe (%s pool)",
+            hooks.family,
+            transport,
+            executor_kind,
+        )
+        return "pipe"
+    return transport
+
+
+def _resolve_result_dir() -> str | None:
+    """Return the directory for ``mmap`` transport files, if overridden."""
+    raw = os.environ.get(POOL_RESULT_DIR_ENV, "").strip()
+    return os.path.expanduser(raw) if raw else None
+
+
+def resolve_pool_checkpoint_dir(args: Any = None) -> str | None:
+    """Root of the item checkpoint store from args, then the environment.
+
+    Both the pool and the monoprocess paths honour it.
+    """
+    for raw in _pool_setting_values(args, POOL_CHECKPOINT_DIR_ARG, POOL_CHECKPOINT_DIR_ENV):
+        raw = str(raw).strip()
+        if raw:
+            return os.path.expanduser(raw)
+    return None
+
+
+def _item_fingerprint(item: Any) -> str:
+    """Short digest of a work item; file items also hash their size and mtime."""
+    try:
+        payload = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        payload = repr(item).encode("utf-8", "backslashreplace")
+    digest = hashlib.sha1(payload)
+    if isinstance(item, (str, os.PathLike)):
+        try:
+            stat_result = os.stat(item)
+        except (OSError, ValueError):
+            pass
+        else:
+            digest.update(f"{stat_result.st_size}:{stat_result.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+class _ChunkCheckpoint:
+    """Completed item results of one chunk, spilled until the chunk is persisted.
+
+    Results live in ``<root>/<family>-w<worker_id>/chunk-<work_id>/`` as one
+    ``<index>-<fingerprint>.pkl`` file each, so a changed input at the same
+    index is recomputed instead of restored. Streamed segments already handed
+    to ``work_done`` are recorded as a watermark (item count plus a digest of
+    their fingerprints) instead, and restore as ``None`` so they are neither
+    rerun nor written twice.
+    """
+
+    _WATERMARK = "persisted.txt"
+
+    def __init__(self, root: str, hooks: PoolFrameHooks, worker: Any, work_id: int) -> None:
+        self.directory = os.path.join(
+            root, f"{hooks.family}-w{getattr(worker, '_worker_id', 0)}", f"chunk-{work_id:04d}"
+        )
+        self._fingerprints: dict[int, str] = {}
+
+    def _path(self, idx: int) -> str:
+        return os.path.join(self.directory, f"{idx:08d}-{self._fingerprints[idx]}.pkl")
+
+    def _prefix_digest(self, count: int) -> str:
+        digest = hashlib.sha1()
+        for idx in range(count):
+            digest.update(self._fingerprints[idx].encode())
+        return digest.hexdigest()[:16]
+
+    def _load_watermark(self) -> int:
+        path = os.path.join(self.directory, self._WATERMARK)
+        try:
+            with open(path, encoding="utf-8") as stream:
+                count_text, digest = stream.read().split()
+            count = int(count_text)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable pool checkpoint %s: %s", path, exc)
+            return 0
+        if 0 < count <= len(self._fingerprints) and digest == self._prefix_digest(count):
+            return count
+        return 0
+
+    def load(self, work: Sequence[Any]) -> dict[int, Any]:
+        """Fingerprint ``work`` and return the results already checkpointed for it.
+
+        Items below the persisted watermark map to ``None``.
+        """
+        self._fingerprints = {idx: _item_fingerprint(item) for idx, item in enumerate(work)}
+        persisted = self._load_watermark()
+        restored: dict[int, Any] = dict.fromkeys(range(persisted))
+        for idx in range(persisted, len(self._fingerprints)):
+            path = self._path(idx)
+            try:
+                with open(path, "rb") as stream:
+                    restored[idx] = pickle.load(stream)
+            except FileNotFoundError:
+                continue
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+                logger.warning("Ignoring unreadable pool checkpoint %s: %s", path, exc)
+        return restored
+
+    def save(self, idx: int, result: Any) -> None:
+        """Write one item result atomically; a failed write only costs a rerun."""
+        if idx not in self._fingerprints:
+            return
+        path = self._path(idx)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as stream:
+                pickle.dump(result, stream, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.warning("Could not checkpoint pool item %d to %s: %s", idx, path, exc)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def mark_persisted(self, indices: Sequence[int]) -> None:
+        """Record that items up to ``max(indices)`` reached ``work_done``.
+
+        Streamed segments cover the chunk in item order, so one watermark
+        describes every persisted item; their result files are dropped.
+        """
+        if not indices or not self._fingerprints:
+            return
+        count = max(indices) + 1
+        path = os.path.join(self.directory, self._WATERMARK)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as stream:
+                stream.write(f"{count} {self._prefix_digest(count)}")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            # Without the watermark the saved results must stay restorable.
+            logger.warning("Could not record persisted pool items in %s: %s", path, exc)
+            return
+        for idx in indices:
+            try:
+                os.unlink(self._path(idx))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Drop the chunk's checkpoints once its results reached ``work_done``."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        for directory in (self.directory, os.path.dirname(self.directory)):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                break
+
+
 def select_worker_chunks(worker: Any, workers_plan: Any) -> Any:
     """Return this worker's chunk list from the plan with a clear error.
 
@@ -248,12 +701,16 @@ def run_works(worker: Any, workers_plan: Any, workers_plan_metadata: Any) -> flo
     counter (long-lived service workers reuse the same instance across runs),
     calls ``stop()`` and returns the execution time of THIS call in seconds
     (measured with ``time.perf_counter``, not the class-level registration
-    timestamp).
+    timestamp). Consecutive calls tagged with the same ``_work_done_run``
+    token (the batches of one pull-dispatch run) keep counting instead.
     """
     start = time.perf_counter()
     # Reset the work_done chunk suffix counter for every run so service-mode
     # instance reuse does not leak suffixes across works() invocations.
-    worker._work_done_chunk = 0
+    run_token = getattr(worker, "_work_done_run", None)
+    if run_token is None or run_token != getattr(worker, "_work_done_chunk_run", None):
+        worker._work_done_chunk = 0
+    worker._work_done_chunk_run = run_token
     if workers_plan:
         if pool_mode_requested(worker._mode):
             worker._exec_multi_process(workers_plan, workers_plan_metadata)
@@ -285,25 +742,211 @@ def _pool_child_init(worker: Any, pool_vars: Any) -> None:
     worker.pool_init(pool_vars)
 
 
-def _pool_run_batch(batch: Sequence[tuple[int, Any]]) -> list[tuple[int, Any, str | None]]:
+def _pool_run_batch(batch: Sequence[tuple[int, Any]]) -> list[tuple[int, Any, str | None, float]]:
     """Module-level pool entry: run a batch of (index, item) work items.
 
-    Returns ``(index, result, error)`` triples; errors are stringified so they
-    cross the process boundary even when the original exception does not
-    pickle.
+    Returns ``(index, result, error, seconds)`` tuples; errors are stringified
+    so they cross the process boundary even when the original exception does
+    not pickle, and ``seconds`` is the item's ``work_pool`` duration.
     """
     worker = _POOL_RUNTIME_WORKER
-    out: list[tuple[int, Any, str | None]] = []
+    retries, backoff = resolve_pool_item_retries(getattr(worker, "args", None))
+    out: list[tuple[int, Any, str | None, float]] = []
     for idx, item in batch:
+        started = time.perf_counter()
         try:
-            out.append((idx, worker.work_pool(item), None))
+            result = _work_pool_with_retry(worker, item, retries, backoff)
         # Worker code boundary: keep processing sibling items and report the
         # failure with its work item instead of losing completed results.
         except _POOL_ITEM_BOUNDARY_EXCEPTIONS:
-            out.append((idx, None, traceback.format_exc()))
+            out.append((idx, None, traceback.format_exc(), time.perf_counter() - started))
+        else:
+            out.append((idx, result, None, time.perf_counter() - started))
     return out
 
 
+@dataclass(frozen=True)
+class _SharedResult:
+    """Pipe-sized handle for a result whose buffers live outside the pipe."""
+
+    transport: str
+    locator: str
+    payload: bytes
+    buffer_sizes: tuple[int, ...]
+
+
+def _pool_run_batch_shared(
+    batch: Sequence[tuple[int, Any]],
+    transport: str,
+    result_dir: str | None,
+) -> list[tuple[int, Any, str | None, float]]:
+    """Pool entry for the ``shm``/``mmap`` transports.
+
+    Same contract as :func:`_pool_run_batch`, except that large results are
+    replaced by a :class:`_SharedResult` handle the parent maps back.
+    """
+    return [
+        (
+            idx,
+            _export_result(result, transport, result_dir) if error is None else None,
+            error,
+            seconds,
+        )
+        for idx, result, error, seconds in _pool_run_batch(batch)
+    ]
+
+
+def _export_result(result: Any, transport: str, result_dir: str | None) -> Any:
+    """Move the out-of-band buffers of ``result`` into a shared segment.
+
+    Anything that cannot take the shared path (``None``, small results,
+    non-contiguous buffers, a full ``/dev/shm``) is returned unchanged and
+    travels through the pipe as before, so the transport never changes
+    results or error reporting.
+    """
+    if result is None:
+        return None
+    buffers: list[pickle.PickleBuffer] = []
+    try:
+        payload = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+        views = [buffer.raw() for buffer in buffers]
+    # Defensive: unpicklable results must fail through the regular pipe path
+    # so the executor reports them as it always has.
+    except Exception:
+        return result
+    total = sum(view.nbytes for view in views)
+    if total < _SHARED_RESULT_MIN_BYTES:
+        return result
+    try:
+        if transport == "shm":
+            locator = _write_shared_memory(views, total)
+        else:
+            locator = _write_mapped_file(views, result_dir)
+    except OSError as exc:
+        logger.warning(
+            "Pool result transport %r unavailable (%s); sending %d bytes through the pipe",
+            transport,
+            exc,
+            total,
+        )
+        return result
+    return _SharedResult(transport, locator, payload, tuple(view.nbytes for view in views))
+
+
+def _write_shared_memory(views: Sequence[memoryview], total: int) -> str:
+    segment = shared_memory.SharedMemory(create=True, size=total)
+    try:
+        offset = 0
+        for view in views:
+            segment.buf[offset : offset + view.nbytes] = view
+            offset += view.nbytes
+    except BaseException:
+        segment.close()
+        segment.unlink()
+        raise
+    segment.close()
+    return segment.name
+
+
+def _write_mapped_file(views: Sequence[memoryview], result_dir: str | None) -> str:
+    fd, path = tempfile.mkstemp(prefix="agilab-pool-", suffix=".bin", dir=result_dir)
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            for view in views:
+                stream.write(view)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+class _SharedResultLease:
+    """Parent-side mapping that keeps one shared result readable.
+
+    Frames returned by :meth:`attach` reference the mapping directly, so it
+    can only be closed once they are gone; :func:`_release_shared_results`
+    retries leases whose buffers are still exported.
+    """
+
+    def __init__(self, handle: _SharedResult) -> None:
+        self.locator = handle.locator
+        self._segment: shared_memory.SharedMemory | None = None
+        self._mapping: mmap.mmap | None = None
+        self._unlinked = False
+        if handle.transport == "shm":
+            self._segment = shared_memory.SharedMemory(name=handle.locator)
+            self._view = self._segment.buf
+        else:
+            # Copy-on-write keeps mapped frames writable without touching the
+            # file, matching what a pipe-delivered frame allows.
+            with open(handle.locator, "rb") as stream:
+                self._mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_COPY)
+            self._view = memoryview(self._mapping)
+
+    def attach(self, handle: _SharedResult) -> Any:
+        offset = 0
+        views = []
+        for size in handle.buffer_sizes:
+            views.append(self._view[offset : offset + size])
+            offset += size
+        return pickle.loads(handle.payload, buffers=views)
+
+    def release(self) -> bool:
+        """Drop the name/file and close the mapping; False while still in use."""
+        if not self._unlinked:
+            try:
+                if self._segment is not None:
+                    self._segment.unlink()
+                else:
+                    os.unlink(self.locator)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Windows refuses to delete a file that is still mapped; retry
+                # on the next release pass.
+                self._close()
+                return False
+            self._unlinked = True
+        return self._close()
+
+    def _close(self) -> bool:
+        try:
+            self._view.release()
+            if self._segment is not None:
+                self._segment.close()
+            elif self._mapping is not None:
+                self._mapping.close()
+        except BufferError:
+            return False
+        return True
+
+
+# Leases whose frames outlived their chunk (e.g. a work_done hook kept a
+# reference); retried on every release so mappings are closed once unused.
+_DEFERRED_RESULT_LEASES: list[_SharedResultLease] = []
+
+
+def _receive_result(result: Any, leases: list[_SharedResultLease]) -> Any:
+    """Map a :class:`_SharedResult` back into a frame; pass others through."""
+    if not isinstance(result, _SharedResult):
+        return result
+    lease = _SharedResultLease(result)
+    leases.append(lease)
+    return lease.attach(result)
+
+
+def _release_shared_results(leases: list[_SharedResultLease]) -> None:
+    """Release chunk leases plus any earlier ones that are no longer in use."""
+    pending = list(_DEFERRED_RESULT_LEASES)
+    _DEFERRED_RESULT_LEASES.clear()
+    if leases is not _DEFERRED_RESULT_LEASES:
+        pending.extend(leases)
+        leases.clear()
+    for lease in pending:
+        if not lease.release():
+            _DEFERRED_RESULT_LEASES.append(lease)
+
+
 def exec_multi_process(
     worker: Any,
     workers_plan: Any,
@@ -317,46 +960,223 @@ def exec_multi_process(
     """
     chunks = select_worker_chunks(worker, workers_plan)
     chunk_lengths = [len(chunk) for chunk in chunks]
+    worker_event_support.plan_items(sum(chunk_lengths))
     args = getattr(worker, "args", None)
     width = resolve_pool_width(chunk_lengths, args)
-    item_timeout = resolve_pool_item_timeout(args)
+    item_timeout = _retry_item_budget(resolve_pool_item_timeout(args), *resolve_pool_item_retries(args))
+    checkpoint_root = resolve_pool_checkpoint_dir(args)
     executor_factory, executor_kind = resolve_executor(hooks)
+    transport = resolve_result_transport(hooks, executor_kind, args)
+    result_dir = _resolve_result_dir() if transport == "mmap" else None
+    stream_items = resolve_pool_stream_items(args)
+    batching = resolve_pool_batching(args)
+    sizer = _AdaptiveBatchSizer(width) if batching == "adaptive" else None
+    memory_limit = resolve_pool_memory_limit(args)
+    item_memory = resolve_pool_item_memory(args)
     logging.info(
         f"{hooks.family}.works - {executor_kind} pool width {width}"
         f" - worker #{worker._worker_id}"
         f" - work_pool x {sum(chunk_lengths)} across {len(chunk_lengths)} chunk(s)"
         + (f" - item timeout {item_timeout}s" if item_timeout else "")
+        + (f" - {transport} result transport" if transport != "pipe" else "")
+        + (f" - streaming every {stream_items} item(s)" if stream_items else "")
+        + (" - adaptive batches" if sizer is not None else "")
+        + (f" - memory limit {memory_limit / _MIB:.0f} MiB" if memory_limit else "")
+        + (f" - checkpoints in {checkpoint_root}" if checkpoint_root else "")
     )
 
     worker.work_init()
-    executor_manager = executor_factory(
-        max_workers=width,
-        initializer=_pool_child_init,
-        initargs=(worker, worker.pool_vars),
+    warm_key = _warm_pool_key(worker, executor_factory, width)
+    executor_manager, executor = _acquire_executor(warm_key, worker, executor_factory, width)
+    # Without a configured estimate the guard always runs, so the first batch
+    # can calibrate one; a configured estimate already bounded the width.
+    memory_guard = (
+        _PoolMemoryGuard(
+            executor,
+            memory_limit if memory_limit is not None else int(_available_memory() * _POOL_MEMORY_HEADROOM),
+            item_memory=item_memory,
+        )
+        if memory_limit is not None or item_memory is None
+        else None
     )
-    executor = executor_manager.__enter__()
     try:
         for work_id, work in enumerate(chunks):
-            results = _run_chunk(
-                executor, worker, hooks, work_id, list(work), width, item_timeout
+            work = list(work)
+            leases: list[_SharedResultLease] = []
+            checkpoint = (
+                _ChunkCheckpoint(checkpoint_root, hooks, worker, work_id)
+                if checkpoint_root is not None
+                else None
             )
-            _finish_chunk(worker, hooks, results)
+            restored = checkpoint.load(work) if checkpoint is not None else {}
+            if restored:
+                logging.info(
+                    f"{hooks.family}.works - chunk #{work_id} resumes from"
+                    f" {len(restored)} checkpointed item(s) of {len(work)}"
+                )
+                worker_event_support.items_done(len(restored))
+            if stream_items is not None or sizer is not None or memory_guard is not None:
+                try:
+                    _run_chunk_incremental(
+                        executor,
+                        worker,
+                        hooks,
+                        work_id,
+                        work,
+                        width,
+                        item_timeout,
+                        stream_items=stream_items,
+                        sizer=sizer,
+                        memory_guard=memory_guard,
+                        transport=transport,
+                        result_dir=result_dir,
+                        leases=leases,
+                        restored=restored,
+                        checkpoint=checkpoint,
+                    )
+                finally:
+                    _release_shared_results(leases)
+            else:
+                try:
+                    # Results are handed straight to _finish_chunk so mapped frames
+                    # are unreferenced by the time their leases are released.
+                    _finish_chunk(
+                        worker,
+                        hooks,
+                        _run_chunk(
+                            executor,
+                            worker,
+                            hooks,
+                            work_id,
+                            work,
+                            width,
+                            item_timeout,
+                            transport=transport,
+                            result_dir=result_dir,
+                            leases=leases,
+                            restored=restored,
+                            checkpoint=checkpoint,
+                        ),
+                        work_id=work_id,
+                    )
+                finally:
+                    _release_shared_results(leases)
+            if checkpoint is not None:
+                # The chunk reached work_done; its item results are persisted.
+                checkpoint.clear()
     except _PoolItemTimeoutError:
         # _run_chunk already requested non-blocking shutdown. Calling normal
         # context-manager exit here would call shutdown(wait=True), wait for a
         # thread straggler, and violate the configured deadline.
         raise
-    except BaseException:
+    except BaseException as exc:
+        if warm_key is not None and _pool_reusable(executor, exc):
+            # A failing work item leaves the pool itself healthy.
+            _park_warm_pool(warm_key, executor_manager, executor)
+            raise
         # Preserve normal context-manager cleanup and suppression semantics for
         # every non-timeout exit.
         if not executor_manager.__exit__(*sys.exc_info()):
             raise
     else:
-        executor_manager.__exit__(None, None, None)
+        if warm_key is not None:
+            _park_warm_pool(warm_key, executor_manager, executor)
+        else:
+            executor_manager.__exit__(None, None, None)
+    if sizer is not None:
+        _report_adaptive_batches(worker, hooks, sizer)
+    if memory_guard is not None and memory_guard.throttled:
+        logging.info(
+            f"{hooks.family}.works - worker #{worker._worker_id} - submission held back"
+            f" {memory_guard.throttled} time(s) near the {memory_guard.limit_bytes / _MIB:.0f} MiB"
+            f" pool memory limit (peak RSS {memory_guard.peak_rss / _MIB:.0f} MiB"
+            + (
+                f", measured {memory_guard.item_memory / _MIB:.1f} MiB per item)"
+                if memory_guard.item_memory and item_memory is None
+                else ")"
+            )
+        )
+
+
+@contextmanager
+def warm_pool_scope() -> Iterator[None]:
+    """Keep the in-worker executor alive across ``works()`` calls until exit.
+
+    The service loop runs every task it claims through ``works()``. Inside
+    this scope :func:`exec_multi_process` parks its executor instead of
+    shutting it down, and the next call with the same pool configuration
+    reuses it, skipping the process spawn and ``pool_init``. Pool children
+    keep the worker state they were initialised with, so a different worker
+    instance, executor, pool width or ``pool_vars`` starts a fresh pool.
+    """
+    global _WARM_POOL_SCOPES
+    _WARM_POOL_SCOPES += 1
+    try:
+        yield
+    finally:
+        _WARM_POOL_SCOPES -= 1
+        if not _WARM_POOL_SCOPES:
+            _close_warm_pool()
+
+
+def _warm_pool_key(worker: Any, executor_factory: Any, width: int) -> tuple[Any, ...] | None:
+    if not _WARM_POOL_SCOPES:
+        return None
+    pool_vars = getattr(worker, "pool_vars", None)
+    try:
+        pool_vars_key: Any = hashlib.sha1(pickle.dumps(pool_vars)).hexdigest()
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Thread-pool families may hold unpicklable state; fall back to identity.
+        pool_vars_key = id(pool_vars)
+    return (id(worker), executor_factory, width, pool_vars_key)
+
+
+def _acquire_executor(
+    warm_key: tuple[Any, ...] | None,
+    worker: Any,
+    executor_factory: Callable[..., Any],
+    width: int,
+) -> tuple[Any, Any]:
+    """Return ``(context manager, executor)``, reusing the parked pool when it matches."""
+    global _WARM_POOL
+    if warm_key is not None and _WARM_POOL is not None:
+        if _WARM_POOL[0] == warm_key:
+            _key, executor_manager, executor = _WARM_POOL
+            _WARM_POOL = None
+            return executor_manager, executor
+        _close_warm_pool()
+    executor_manager = executor_factory(
+        max_workers=width,
+        initializer=_pool_child_init,
+        initargs=(worker, worker.pool_vars),
+    )
+    return executor_manager, executor_manager.__enter__()
+
+
+def _park_warm_pool(warm_key: tuple[Any, ...], executor_manager: Any, executor: Any) -> None:
+    global _WARM_POOL
+    _close_warm_pool()
+    _WARM_POOL = (warm_key, executor_manager, executor)
+
+
+def _close_warm_pool() -> None:
+    global _WARM_POOL
+    slot, _WARM_POOL = _WARM_POOL, None
+    if slot is not None:
+        slot[1].__exit__(None, None, None)
+
+
+def _pool_reusable(executor: Any, exc: BaseException) -> bool:
+    # Private executor flags: a broken or shut down pool cannot take more work.
+    if any(getattr(executor, flag, False) for flag in ("_broken", "_shutdown", "_shutdown_thread")):
+        return False
+    if isinstance(exc, (KeyboardInterrupt, SystemExit)):
+        return False
+    return not isinstance(exc, BrokenExecutor) and not isinstance(exc.__cause__, BrokenExecutor)
 
 
 def _batches(indexed: list[tuple[int, Any]], chunksize: int) -> list[list[tuple[int, Any]]]:
-    """Mirror the submission batching of :func:`_run_chunk` for reporting."""
+    """Split ``(index, item)`` pairs into the batches submitted to the pool."""
     return [indexed[offset : offset + chunksize] for offset in range(0, len(indexed), chunksize)]
 
 
@@ -396,76 +1216,472 @@ def _run_chunk(
     work: list[Any],
     width: int,
     item_timeout: float | None = None,
+    *,
+    transport: str = "pipe",
+    result_dir: str | None = None,
+    leases: list[_SharedResultLease] | None = None,
+    restored: dict[int, Any] | None = None,
+    checkpoint: _ChunkCheckpoint | None = None,
 ) -> list[tuple[int, Any]]:
-    """Submit one chunk to the warm pool and collect (index, result) pairs."""
-    if not work:
-        return []
+    """Submit one chunk to the warm pool and collect (index, result) pairs.
+
+    With a ``shm``/``mmap`` transport, mapped results are registered in
+    ``leases``; the caller releases them once the chunk is persisted. Items
+    in ``restored`` (checkpointed results) are not run again; each new
+    result is saved to ``checkpoint`` as it arrives.
+    """
+    restored = restored or {}
+    indexed = [(idx, item) for idx, item in enumerate(work) if idx not in restored]
+    if not indexed:
+        return sorted(restored.items())
 
-    chunksize = map_chunksize(len(work), width)
-    indexed = list(enumerate(work))
+    chunksize = map_chunksize(len(indexed), width)
     futures = [
-        executor.submit(_pool_run_batch, indexed[offset : offset + chunksize])
-        for offset in range(0, len(indexed), chunksize)
+        _submit_batch(executor, batch, transport, result_dir)
+        for batch in _batches(indexed, chunksize)
     ]
+    if leases is None:
+        # Unowned mappings are picked up by the next release pass.
+        leases = _DEFERRED_RESULT_LEASES
     deadline = (
-        _chunk_deadline_seconds(item_timeout, len(work), width)
+        _chunk_deadline_seconds(item_timeout, len(indexed), width)
         if item_timeout is not None
         else None
     )
 
-    results: list[tuple[int, Any]] = []
+    results: list[tuple[int, Any]] = list(restored.items())
     failures: list[tuple[Any, str]] = []
     try:
         for future in as_completed(futures, timeout=deadline):
-            for idx, result, error in future.result():
-                if error is None:
-                    results.append((idx, result))
-                else:
-                    failures.append((work[idx], error))
+            results.extend(
+                _collect_batch(future.result(), work, failures, leases, checkpoint=checkpoint)
+            )
     except FuturesTimeoutError as exc:
         _abandon_stuck_pool(executor)
         pending = [item for f, batch in zip(futures, _batches(indexed, chunksize)) if not f.done() for _, item in batch]
-        preview = ", ".join(repr(item) for item in pending[:3])
-        if len(pending) > 3:
-            preview += ", ..."
-        raise _PoolItemTimeoutError(
-            f"{hooks.family}.work_pool exceeded the {item_timeout}s per-item time "
-            f"budget on chunk #{work_id} ({deadline:.1f}s chunk deadline); "
-            f"{len(pending)} item(s) still pending: {preview}. Process-pool "
-            "children are terminated; thread-pool stragglers cannot be stopped "
-            "and may keep running in the background."
-        ) from exc
+        raise _chunk_timeout_error(hooks, work_id, item_timeout, deadline, pending) from exc
     except BrokenExecutor as exc:
-        raise RuntimeError(
-            f"{hooks.family} {hooks.executor_kind} pool broke while running chunk "
-            f"#{work_id} (items: {work[:3]!r}{'...' if len(work) > 3 else ''}). "
-            "A pool child died or failed to start; likely causes: out-of-memory "
-            "kill or segfault in worker code, an exception raised by pool_init "
-            "in the child, or unpicklable worker state (self/pool_vars must "
-            "pickle for process pools). Child-side tracebacks are written to "
-            "the child's stderr."
-        ) from exc
+        raise _broken_pool_error(hooks, work_id, work) from exc
 
     if failures:
-        for item, error in failures:
-            logging.error(
-                f"{hooks.family}.work_pool failed for work item {item!r} "
-                f"(chunk #{work_id}):\n{error}"
-            )
-        failed_items = [item for item, _ in failures]
-        preview = ", ".join(repr(item) for item in failed_items[:3])
-        if len(failed_items) > 3:
-            preview += ", ..."
-        raise RuntimeError(
-            f"{hooks.family}.work_pool failed for {len(failed_items)} of "
-            f"{len(work)} work item(s) in chunk #{work_id}: {preview} "
-            "(every failure is logged above with its traceback)."
-        )
+        raise _chunk_failures_error(hooks, work_id, work, failures)
 
     results.sort(key=lambda pair: pair[0])
     return results
 
 
+def _run_chunk_incremental(
+    executor: Any,
+    worker: Any,
+    hooks: PoolFrameHooks,
+    work_id: int,
+    work: list[Any],
+    width: int,
+    item_timeout: float | None = None,
+    *,
+    stream_items: int | None = None,
+    sizer: _AdaptiveBatchSizer | None = None,
+    memory_guard: _PoolMemoryGuard | None = None,
+    transport: str = "pipe",
+    result_dir: str | None = None,
+    leases: list[_SharedResultLease] | None = None,
+    restored: dict[int, Any] | None = None,
+    checkpoint: _ChunkCheckpoint | None = None,
+) -> int:
+    """Run one chunk with batches submitted as earlier ones complete.
+
+    Used by the streaming mode, adaptive batch sizing and the memory guard.
+    Batches are submitted in work-item order, at most
+    ``_STREAM_BATCHES_PER_SLOT * width`` at a time and, with ``memory_guard``,
+    only while the pool memory allows; each is sized by ``sizer`` when given,
+    else by :func:`map_chunksize`. Completed batches wait in a reorder buffer
+    until every earlier item is in.
+
+    With ``stream_items``, submission also stays within that window of the
+    oldest batch not yet persisted, and :func:`_finish_chunk` runs once at
+    least ``stream_items`` items are buffered (segments end on batch
+    boundaries), so segment boundaries and ``(worker_id, idx)`` labels do not
+    depend on completion order. After a failed item nothing more is
+    persisted; the remaining batches still run so every failure is reported,
+    as in :func:`_run_chunk`. Without it the chunk is persisted once at the
+    end. ``restored`` and ``checkpoint`` work as in :func:`_run_chunk`;
+    restored results are merged into the segments in item order. Returns the
+    number of ``work_done`` calls.
+    """
+    if leases is None:
+        leases = _DEFERRED_RESULT_LEASES
+    restored = restored or {}
+    indexed = [(idx, item) for idx, item in enumerate(work) if idx not in restored]
+    fixed_size = map_chunksize(len(indexed), width)
+    window = _STREAM_BATCHES_PER_SLOT * max(width, 1)
+    deadline = (
+        _chunk_deadline_seconds(item_timeout, len(indexed), width)
+        if item_timeout is not None
+        else None
+    )
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+    in_flight: dict[Any, int] = {}
+    batches: dict[int, list[tuple[int, Any]]] = {}
+    ready: dict[int, list[tuple[int, Any]]] = {}
+    failures: list[tuple[Any, str]] = []
+    # Restored results join the segment stream at their item index.
+    restored_queue = deque(sorted(restored.items()))
+    segment: list[tuple[int, Any]] = []
+    segment_items = 0
+    next_offset = 0
+    next_submit = 0
+    next_persist = 0
+    persisted = 0
+
+    def _persist() -> None:
+        nonlocal segment, segment_items, persisted
+        if _finish_chunk(worker, hooks, segment, skip_empty=True, work_id=work_id):
+            persisted += 1
+        if checkpoint is not None:
+            checkpoint.mark_persisted([idx for idx, _result in segment])
+        segment, segment_items = [], 0
+        # Frames handed to work_done are no longer referenced here.
+        _release_shared_results(leases)
+
+    try:
+        while next_persist < next_submit or next_offset < len(indexed):
+            while (
+                next_offset < len(indexed)
+                and len(in_flight) < window
+                and (stream_items is None or next_submit < next_persist + window)
+                and (
+                    memory_guard is None
+                    or memory_guard.allows_submit(
+                        len(in_flight),
+                        sum(len(batches[batch_no]) for batch_no in in_flight.values()),
+                    )
+                )
+            ):
+                remaining = len(indexed) - next_offset
+                size = sizer.next_size(remaining) if sizer is not None else fixed_size
+                batch = indexed[next_offset : next_offset + size]
+                next_offset += len(batch)
+                batches[next_submit] = batch
+                in_flight[_submit_batch(executor, batch, transport, result_dir)] = next_submit
+                next_submit += 1
+            timeout = None if deadline_at is None else max(deadline_at - time.monotonic(), 0.0)
+            done, _not_done = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                raise FuturesTimeoutError()
+            if memory_guard is not None:
+                memory_guard.calibrate(sum(len(batches[batch_no]) for batch_no in in_flight.values()))
+            for future in done:
+                ready[in_flight.pop(future)] = _collect_batch(
+                    future.result(), work, failures, leases, sizer=sizer, checkpoint=checkpoint
+                )
+            while next_persist in ready:
+                first_idx = batches[next_persist][0][0]
+                while restored_queue and restored_queue[0][0] < first_idx:
+                    segment.append(restored_queue.popleft())
+                    segment_items += 1
+                segment.extend(ready.pop(next_persist))
+                segment_items += len(batches.pop(next_persist))
+                next_persist += 1
+                if stream_items is None:
+                    continue
+                if failures:
+                    segment, segment_items = [], 0
+                elif segment_items >= stream_items:
+                    _persist()
+    except FuturesTimeoutError as exc:
+        _abandon_stuck_pool(executor)
+        pending = [item for batch_no in sorted(in_flight.values()) for _, item in batches[batch_no]]
+        pending.extend(item for _, item in indexed[next_offset:])
+        raise _chunk_timeout_error(hooks, work_id, item_timeout, deadline, pending) from exc
+    except BrokenExecutor as exc:
+        raise _broken_pool_error(hooks, work_id, work) from exc
+
+    if failures:
+        raise _chunk_failures_error(hooks, work_id, work, failures)
+    segment.extend(restored_queue)
+    if stream_items is None:
+        _finish_chunk(worker, hooks, segment, work_id=work_id)
+        return 1
+    if segment:
+        _persist()
+    if not persisted:
+        # Keep the one work_done call per chunk of the buffered path.
+        _finish_chunk(worker, hooks, [], work_id=work_id)
+        persisted = 1
+    return persisted
+
+
+class _PoolMemoryGuard:
+    """Hold back submission while the pool's resident memory nears a limit.
+
+    The pool RSS is the sum over the process-pool children, or the growth of
+    this process for thread pools, sampled at most every
+    ``_POOL_MEMORY_SAMPLE_SECONDS``. Submission also stops while the in-flight
+    items times ``item_memory`` would reach the limit; without a configured
+    estimate, :meth:`calibrate` measures it as the RSS growth over the first
+    completed batch divided by the items then in flight (cold process pools
+    include their interpreter start-up, which errs on the safe side). One
+    batch is always allowed in flight so the chunk keeps progressing even
+    when a single item exceeds the limit.
+    """
+
+    def __init__(
+        self,
+        executor: Any,
+        limit_bytes: int,
+        *,
+        item_memory: int | None = None,
+        rss_fn: Callable[[], int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limit_bytes = limit_bytes
+        self.item_memory = item_memory
+        self.peak_rss = 0
+        self.throttled = 0
+        self._executor = executor
+        self._baseline = 0 if rss_fn is not None else _process_rss(os.getpid())
+        self._rss_fn = rss_fn or self._pool_rss
+        self._clock = clock
+        self._sampled_at: float | None = None
+        self._rss = 0
+        self._calibrated = item_memory is not None
+        self._calibration_base: int | None = None
+
+    def _pool_rss(self) -> int:
+        processes = getattr(self._executor, "_processes", None)
+        if isinstance(processes, dict):
+            return sum(_process_rss(pid) for pid in list(processes))
+        return max(_process_rss(os.getpid()) - self._baseline, 0)
+
+    def rss(self) -> int:
+        now = self._clock()
+        if self._sampled_at is None or now - self._sampled_at >= _POOL_MEMORY_SAMPLE_SECONDS:
+            self._rss = self._rss_fn()
+            self._sampled_at = now
+            self.peak_rss = max(self.peak_rss, self._rss)
+        return self._rss
+
+    def calibrate(self, in_flight_items: int) -> None:
+        """Derive ``item_memory`` once, when the first batch completes."""
+        if self._calibrated or self._calibration_base is None or in_flight_items <= 0:
+            return
+        self._calibrated = True
+        growth = self._rss_fn() - self._calibration_base
+        if growth > 0:
+            self.item_memory = growth // in_flight_items
+
+    def allows_submit(self, in_flight: int, in_flight_items: int = 0) -> bool:
+        soft_limit = self.limit_bytes * _POOL_MEMORY_SOFT_LIMIT
+        if self._calibration_base is None and not self._calibrated:
+            # Sampled before the first submission: the baseline of calibrate().
+            self._calibration_base = self.rss()
+        if in_flight == 0 or (
+            self.rss() < soft_limit
+            and (self.item_memory is None or in_flight_items * self.item_memory < soft_limit)
+        ):
+            return True
+        self.throttled += 1
+        return False
+
+
+def _process_rss(pid: int) -> int:
+    try:
+        return int(psutil.Process(pid).memory_info().rss)
+    except (psutil.Error, OSError):
+        # The child exited (or was replaced) between listing and sampling.
+        return 0
+
+
+class _AdaptiveBatchSizer:
+    """Batch size from the measured per-item cost of completed batches.
+
+    Until a batch completes every slot gets single-item probes. Then each
+    batch aims at ``target_seconds`` of work priced at the p90 of the recent
+    item durations, so slow or skewed items shrink batches (fewer tail
+    stragglers) and tiny items grow them up to ``max_items`` (fewer executor
+    round trips). Near the end of a chunk batches shrink further so the
+    remaining items still spread over every slot. The sizer lives for one
+    ``works()`` call, so later chunks start from what earlier ones measured.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        *,
+        target_seconds: float = _ADAPTIVE_BATCH_TARGET_SECONDS,
+        max_items: int = _ADAPTIVE_BATCH_MAX_ITEMS,
+    ) -> None:
+        self.width = max(int(width), 1)
+        self.target_seconds = target_seconds
+        self.max_items = max(int(max_items), 1)
+        self.batch_sizes: Counter[int] = Counter()
+        self.histogram = [0] * (len(_ITEM_SECONDS_BUCKETS) + 1)
+        self.items = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._recent: deque[float] = deque(maxlen=_ADAPTIVE_SAMPLE_ITEMS)
+
+    def observe(self, durations: Sequence[float]) -> None:
+        for seconds in durations:
+            seconds = max(float(seconds), 0.0)
+            self._recent.append(seconds)
+            self.items += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            bucket = 0
+            while bucket < len(_ITEM_SECONDS_BUCKETS) and seconds >= _ITEM_SECONDS_BUCKETS[bucket]:
+                bucket += 1
+            self.histogram[bucket] += 1
+
+    def _recent_percentile(self, percentile: float) -> float | None:
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
+
+    def next_size(self, remaining: int) -> int:
+        cost = self._recent_percentile(90)
+        size = 1 if cost is None else int(self.target_seconds / max(cost, 1e-6))
+        tail = math.ceil(remaining / self.width)
+        size = max(1, min(size, self.max_items, tail, remaining))
+        self.batch_sizes[size] += 1
+        return size
+
+    def summary(self) -> dict[str, Any]:
+        labels = [f"<{bound:g}s" for bound in _ITEM_SECONDS_BUCKETS]
+        labels.append(f">={_ITEM_SECONDS_BUCKETS[-1]:g}s")
+        return {
+            "batches": sum(self.batch_sizes.values()),
+            "batch_sizes": {str(size): count for size, count in sorted(self.batch_sizes.items())},
+            "items": self.items,
+            "item_seconds_mean": self.total_seconds / self.items if self.items else None,
+            "item_seconds_p50": self._recent_percentile(50),
+            "item_seconds_p90": self._recent_percentile(90),
+            "item_seconds_max": self.max_seconds if self.items else None,
+            "item_seconds_histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+def _report_adaptive_batches(worker: Any, hooks: PoolFrameHooks, sizer: _AdaptiveBatchSizer) -> None:
+    """Log the chosen batch sizes and item timings and record them as metrics."""
+    summary = sizer.summary()
+    logging.info(
+        f"{hooks.family}.works - adaptive batches - worker #{worker._worker_id}"
+        f" - {summary['batches']} batch(es), sizes {summary['batch_sizes']}"
+        f" - item seconds histogram {summary['item_seconds_histogram']}"
+    )
+    record_metric = getattr(worker, "record_metric", None)
+    if not callable(record_metric):
+        return
+    record_metric("pool_batches", summary["batches"], metadata={"batch_sizes": summary["batch_sizes"]})
+    record_metric(
+        "pool_item_seconds_p90",
+        summary["item_seconds_p90"],
+        unit="s",
+        metadata={
+            key: summary[key]
+            for key in (
+                "items",
+                "item_seconds_mean",
+                "item_seconds_p50",
+                "item_seconds_max",
+                "item_seconds_histogram",
+            )
+        },
+    )
+
+
+def _submit_batch(
+    executor: Any,
+    batch: list[tuple[int, Any]],
+    transport: str,
+    result_dir: str | None,
+) -> Any:
+    if transport == "pipe":
+        return executor.submit(_pool_run_batch, batch)
+    return executor.submit(_pool_run_batch_shared, batch, transport, result_dir)
+
+
+def _collect_batch(
+    batch: list[tuple[int, Any, str | None, float]],
+    work: list[Any],
+    failures: list[tuple[Any, str]],
+    leases: list[_SharedResultLease],
+    *,
+    sizer: _AdaptiveBatchSizer | None = None,
+    checkpoint: _ChunkCheckpoint | None = None,
+) -> list[tuple[int, Any]]:
+    """Receive one batch's results, recording failures, timings and progress."""
+    if sizer is not None:
+        sizer.observe([seconds for _idx, _result, _error, seconds in batch])
+    results: list[tuple[int, Any]] = []
+    for idx, result, error, _seconds in batch:
+        if error is None:
+            result = _receive_result(result, leases)
+            if checkpoint is not None:
+                checkpoint.save(idx, result)
+            results.append((idx, result))
+        else:
+            failures.append((work[idx], error))
+    failed = len(batch) - len(results)
+    worker_event_support.items_done(len(batch) - failed, failed)
+    return results
+
+
+def _chunk_timeout_error(
+    hooks: PoolFrameHooks,
+    work_id: int,
+    item_timeout: float | None,
+    deadline: float | None,
+    pending: list[Any],
+) -> _PoolItemTimeoutError:
+    preview = ", ".join(repr(item) for item in pending[:3])
+    if len(pending) > 3:
+        preview += ", ..."
+    return _PoolItemTimeoutError(
+        f"{hooks.family}.work_pool exceeded the {item_timeout}s per-item time "
+        f"budget on chunk #{work_id} ({deadline:.1f}s chunk deadline); "
+        f"{len(pending)} item(s) still pending: {preview}. Process-pool "
+        "children are terminated; thread-pool stragglers cannot be stopped "
+        "and may keep running in the background."
+    )
+
+
+def _broken_pool_error(hooks: PoolFrameHooks, work_id: int, work: list[Any]) -> RuntimeError:
+    return RuntimeError(
+        f"{hooks.family} {hooks.executor_kind} pool broke while running chunk "
+        f"#{work_id} (items: {work[:3]!r}{'...' if len(work) > 3 else ''}). "
+        "A pool child died or failed to start; likely causes: out-of-memory "
+        "kill or segfault in worker code, an exception raised by pool_init "
+        "in the child, or unpicklable worker state (self/pool_vars must "
+        "pickle for process pools). Child-side tracebacks are written to "
+        "the child's stderr."
+    )
+
+
+def _chunk_failures_error(
+    hooks: PoolFrameHooks,
+    work_id: int,
+    work: list[Any],
+    failures: list[tuple[Any, str]],
+) -> RuntimeError:
+    for item, error in failures:
+        logging.error(
+            f"{hooks.family}.work_pool failed for work item {item!r} "
+            f"(chunk #{work_id}):\n{error}"
+        )
+    failed_items = [item for item, _ in failures]
+    preview = ", ".join(repr(item) for item in failed_items[:3])
+    if len(failed_items) > 3:
+        preview += ", ..."
+    return RuntimeError(
+        f"{hooks.family}.work_pool failed for {len(failed_items)} of "
+        f"{len(work)} work item(s) in chunk #{work_id}: {preview} "
+        "(every failure is logged above with its traceback)."
+    )
+
+
 def exec_mono_process(
     worker: Any,
     workers_plan: Any,
@@ -474,29 +1690,72 @@ def exec_mono_process(
 ) -> None:
     """Sequential execution path sharing normalisation/labelling with the pool path."""
     chunks = select_worker_chunks(worker, workers_plan)
+    args = getattr(worker, "args", None)
+    retries, backoff = resolve_pool_item_retries(args)
+    checkpoint_root = resolve_pool_checkpoint_dir(args)
     worker.work_init()
     for work_id, work in enumerate(chunks):
         logging.info(
             f"{hooks.family}.works - monoprocess work #{work_id} - work_pool x {len(work)}"
+            + (f" - checkpoints in {checkpoint_root}" if checkpoint_root else "")
         )
         # Preserve the historical gate: a falsy plan object still drives the
         # chunk loop but yields no work items (pinned by worker tests).
         items = list(work) if workers_plan else []
-        results = [(idx, worker.work_pool(item)) for idx, item in enumerate(items)]
-        _finish_chunk(worker, hooks, results)
+        worker_event_support.plan_items(len(items))
+        checkpoint = (
+            _ChunkCheckpoint(checkpoint_root, hooks, worker, work_id)
+            if checkpoint_root is not None
+            else None
+        )
+        restored = checkpoint.load(items) if checkpoint is not None else {}
+        if restored:
+            logging.info(
+                f"{hooks.family}.works - chunk #{work_id} resumes from"
+                f" {len(restored)} checkpointed item(s) of {len(items)}"
+            )
+            worker_event_support.items_done(len(restored))
+        results = []
+        for idx, item in enumerate(items):
+            if idx in restored:
+                results.append((idx, restored[idx]))
+                continue
+            result = _work_pool_with_retry(worker, item, retries, backoff)
+            if checkpoint is not None:
+                checkpoint.save(idx, result)
+            results.append((idx, result))
+            worker_event_support.items_done()
+        _finish_chunk(worker, hooks, results, work_id=work_id)
+        if checkpoint is not None:
+            checkpoint.clear()
+
+
+def _item_label(worker: Any, work_id: int, idx: int) -> str:
+    """Return the provenance label of work item ``idx`` of chunk ``work_id``."""
+    origins = getattr(worker, "_work_item_origins", None)
+    if origins and work_id < len(origins) and idx < len(origins[work_id]):
+        return str(tuple(origins[work_id][idx]))
+    return str((worker._worker_id, idx))
 
 
 def _finish_chunk(
     worker: Any,
     hooks: PoolFrameHooks,
     results: Sequence[tuple[int, Any]],
-) -> None:
+    *,
+    skip_empty: bool = False,
+    work_id: int = 0,
+) -> bool:
     """Normalise, label and persist one chunk's results.
 
     ``None`` and non-frame results are treated as empty (consistently in mono
     and pool modes). Surviving frames are labelled ``str((worker_id, idx))``
     where ``idx`` is the ORIGINAL work-item index within the chunk, identical
-    in both modes, so provenance survives empty-result filtering.
+    in both modes, so provenance survives empty-result filtering. Pulled
+    batches label items with the ``(planned worker, plan batch, index)``
+    origin their payload carries instead (see :func:`_item_label`). With
+    ``skip_empty`` (streaming segments) nothing is persisted when no frame
+    survives; returns whether ``work_done`` was called.
     """
     frames: list[Any] = []
     labels: list[str] = []
@@ -512,10 +1771,13 @@ def _finish_chunk(
         if hooks.is_empty(result):
             continue
         frames.append(result)
-        labels.append(str((worker._worker_id, idx)))
+        labels.append(_item_label(worker, work_id, idx))
 
     if frames:
         df = hooks.concat_labeled(frames, labels)
+    elif skip_empty:
+        return False
     else:
         df = hooks.empty_frame()
     worker.work_done(df)
+    return True
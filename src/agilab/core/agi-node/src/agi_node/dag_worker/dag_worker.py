@@ -19,11 +19,12 @@
 # dag_worker.py
 from __future__ import annotations
 
+import heapq
 import inspect
 import logging
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Any
 
 # Import BaseWorker from agi_dispatcher.py (as you requested)
@@ -161,10 +162,31 @@ class DagWorker(BaseWorker):
             raise ValueError("Cycle detected in dependency graph")
         return order
 
+    @staticmethod
+    def _stage_priorities(topo, local_deps, dependents, function_info):
+        """
+        Upward rank of each local stage: its weight plus the heaviest chain of
+        dependents after it. Stages on the critical path rank highest; missing
+        or non-numeric weights count as 1.
+        """
+        def _weight(fn):
+            try:
+                return float(function_info[fn].get("weight", 1))
+            except (TypeError, ValueError):
+                return 1.0
+
+        rank = {}
+        for fn in reversed(topo):
+            if fn not in local_deps:
+                continue
+            rank[fn] = _weight(fn) + max((rank[child] for child in dependents[fn]), default=0.0)
+        return rank
+
     def _exec_multi_process(self, workers_plan, workers_plan_metadata):
         """
         Execute tasks in multiple threads, distributing branches to workers by
-        round‑robin, then honoring dependencies per worker.
+        round‑robin, then honoring dependencies per worker through a ready
+        queue prioritised by stage weight.
         """
         import logging
 
@@ -211,64 +233,91 @@ class DagWorker(BaseWorker):
         # topo order over string names
         topo = self._topological_sort(dependency_graph)
 
+        # Only stages assigned here are scheduled; dependencies owned by
+        # another partition/worker are treated as satisfied elsewhere instead
+        # of being re-executed locally with empty args.
+        for fn in topo:
+            if fn not in function_info:
+                logging.info(
+                    f"Skipping cross-partition dependency {fn} (not assigned to worker {worker_id})"
+                )
+        local_deps = {
+            fn: [dep for dep in dependency_graph.get(fn, []) if dep in function_info]
+            for fn in topo
+            if fn in function_info
+        }
+        dependents = {fn: [] for fn in local_deps}
+        for fn, deps in local_deps.items():
+            for dep in deps:
+                dependents[dep].append(fn)
+        remaining = {fn: len(deps) for fn, deps in local_deps.items()}
+        order = {fn: idx for idx, fn in enumerate(topo)}
+        priority = self._stage_priorities(topo, local_deps, dependents, function_info)
+
+        # Ready queue: a stage is submitted only once every local dependency
+        # has finished, so no pool slot is ever held by a blocked stage. Among
+        # ready stages the longest weighted path to a sink starts first; ties
+        # keep the deterministic topological order.
+        ready = [(-priority[fn], order[fn], fn) for fn, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+
         results = {}
-        futures = {}
+        failures = {}
+        skipped = set()
+        running = {}
 
         def _run_stage(fn):
-            # Wait for deps inside the pool thread so independent branches keep
-            # running concurrently instead of serializing on topo order.
-            # Known limitation: a stage blocked on its dependencies still
-            # occupies a pool slot, so runnable stages queued behind it can
-            # starve when max_workers < graph width. An event-driven ready
-            # queue (submit on dependency completion) would fix this but is a
-            # larger scheduling change deferred for now.
-            pipeline_result = {}
-            for dep in dependency_graph.get(fn, []):
-                if dep in futures:
-                    pipeline_result[dep] = futures[dep][0].result()
+            pipeline_result = {dep: results[dep] for dep in local_deps[fn]}
             return self.get_work(fn, fargs.get(fn, ()), pipeline_result)
 
-        # Size the pool against the stages actually assigned to this worker;
-        # `topo` may also contain cross-partition dependency-only nodes that
-        # the submit loop below skips.
-        local_stage_count = sum(1 for fn in topo if fn in function_info)
-        max_workers = min(max(2, os.cpu_count() or 2), max(1, local_stage_count))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for fn in topo:
-                if fn not in function_info:
-                    # Dependency owned by another partition/worker: it is not
-                    # assigned here, so treat it as satisfied elsewhere instead
-                    # of re-executing it locally with empty args.
-                    logging.info(
-                        f"Skipping cross-partition dependency {fn} (not assigned to worker {worker_id})"
-                    )
+        def _skip_dependents(failed):
+            pending = list(dependents[failed])
+            while pending:
+                stage = pending.pop()
+                if stage in skipped:
                     continue
-
-                # forward (fn_name, args, pipeline_result) to get_work
-                future = executor.submit(_run_stage, fn)
-                futures[fn] = (future, function_info[fn]["partition_name"])
-
-        # finalize (log every outcome, then propagate the first failure).
-        # Note: stage return values are consumed by dependent stages via
+                skipped.add(stage)
+                logging.error(
+                    f"Method {stage} for partition {function_info[stage]['partition_name']} "
+                    f"skipped: dependency {failed} failed."
+                )
+                pending.extend(dependents[stage])
+
+        # Size the pool against the stages actually assigned to this worker.
+        max_workers = min(max(2, os.cpu_count() or 2), max(1, len(local_deps)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while ready or running:
+                while ready and len(running) < max_workers:
+                    _, _, fn = heapq.heappop(ready)
+                    running[executor.submit(_run_stage, fn)] = fn
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: order[running[f]]):
+                    fn = running.pop(future)
+                    pname = function_info[fn]["partition_name"]
+                    try:
+                        results[fn] = future.result()
+                        logging.info(f"Method {fn} for partition {pname} completed.")
+                    # Worker code boundary: DAG partitions execute app methods;
+                    # log each failed stage and keep independent branches going.
+                    except _DAG_PARTITION_BOUNDARY_EXCEPTIONS as exc:
+                        logging.error(f"Method {fn} for partition {pname} generated an exception: {exc}")
+                        failures[fn] = exc
+                        _skip_dependents(fn)
+                        continue
+                    for child in dependents[fn]:
+                        remaining[child] -= 1
+                        if remaining[child] == 0 and child not in skipped:
+                            heapq.heappush(ready, (-priority[child], order[child], child))
+
+        # Stage return values are consumed by dependent stages via
         # `pipeline_result`; terminal-stage results are intentionally NOT
         # persisted by the framework (DagWorker has no work_done sink) — DAG
         # stages are expected to persist their own artifacts as side effects.
-        first_failure = None
-        for fn, (future, pname) in futures.items():
-            try:
-                results[fn] = future.result()
-                logging.info(f"Method {fn} for partition {pname} completed.")
-            # Worker code boundary: DAG partitions execute app methods; log each
-            # failed partition while still collecting sibling partition results.
-            except _DAG_PARTITION_BOUNDARY_EXCEPTIONS as exc:
-                logging.error(f"Method {fn} for partition {pname} generated an exception: {exc}")
-                if first_failure is None:
-                    first_failure = exc
-
-        if first_failure is not None:
-            # Re-raise so works() propagates stage failures to the manager
-            # instead of silently reporting success.
-            raise first_failure
+        if failures:
+            # Re-raise the earliest failure in topological order so works()
+            # propagates stage failures to the manager instead of silently
+            # reporting success.
+            raise failures[min(failures, key=order.__getitem__)]
 
         # ._exec_multi_process doesn't need to return anything specific
         return 0.0
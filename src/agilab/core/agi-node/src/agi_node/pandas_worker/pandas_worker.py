@@ -77,6 +77,7 @@ _PANDAS_POOL_HOOKS = worker_pool_support.PoolFrameHooks(
     is_empty=lambda df: df.empty,
     concat_labeled=_concat_labeled,
     empty_frame=pd.DataFrame,
+    shared_results=True,
 )
 
 class PandasWorker(BaseWorker):
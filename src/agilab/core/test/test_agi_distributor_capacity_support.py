@@ -8,6 +8,7 @@ from types import SimpleNamespace
 import pytest
 
 from agi_cluster.agi_distributor import AGI, RunRequest, capacity_support, runtime_misc_support
+from agi_cluster.agi_distributor.runtime import online_capacity_support
 from agi_env import AgiEnv
 from agi_node.agi_dispatcher import BaseWorker
 
@@ -18,6 +19,14 @@ def _minimal_app_env(*, verbose: int = 0) -> AgiEnv:
     return AgiEnv(apps_path=_BUILTIN_APPS_PATH, app="minimal_app_project", verbose=verbose)
 
 
+def _history_path() -> Path:
+    return online_capacity_support.history_path(AGI._capacity_data_file)
+
+
+def _online_model() -> online_capacity_support.OnlineCapacityModel:
+    return online_capacity_support.OnlineCapacityModel.load(_history_path())
+
+
 @pytest.fixture(autouse=True)
 def _reset_agi_capacity_state():
     fields = [
@@ -31,6 +40,7 @@ def _reset_agi_capacity_state():
         "_run_time",
         "_capacity",
         "_calibration_cache",
+        "_hardware_profile",
         "env",
         "target_path",
         "_target",
@@ -53,6 +63,7 @@ def _reset_agi_capacity_state():
         AGI._run_time = []
         AGI._capacity = {}
         AGI._calibration_cache = {}
+        AGI._hardware_profile = {}
         AGI.env = None
         AGI.target_path = None
         AGI._target = None
@@ -856,13 +867,15 @@ def test_update_capacity_success_and_guard_paths(tmp_path, monkeypatch):
 
     AGI._run_time = [{"127.0.0.1:8787": 2.0}]
     capacity_support.update_capacity(AGI)
-    assert train_calls["count"] == 1
-    assert Path(AGI._capacity_data_file).exists()
+    # The regressor is only refit on schedule, not after every run.
+    assert train_calls["count"] == 0
+    model = _online_model()
+    assert model.total_rows == 1 and model.estimate("127.0.0.1") == 1.0
 
     AGI.workers_info["127.0.0.1:8787"]["label"] = 0.0
     AGI._run_time = [{"127.0.0.1:8787": 2.0}]
     capacity_support.update_capacity(AGI)
-    assert train_calls["count"] == 1
+    assert _online_model().total_rows == 1
 
 
 def test_update_capacity_adjusts_against_other_workers(tmp_path, monkeypatch):
@@ -902,8 +915,9 @@ def test_update_capacity_adjusts_against_other_workers(tmp_path, monkeypatch):
 
     capacity_support.update_capacity(AGI)
 
-    assert Path(AGI._capacity_data_file).exists()
-    assert train_calls["count"] == 1
+    model = _online_model()
+    assert model.estimate("127.0.0.1") < 1.0 < model.estimate("10.0.0.2")
+    assert train_calls["count"] == 0
 
 
 @pytest.mark.asyncio
@@ -959,10 +973,9 @@ async def test_calibration_fallback_worker_does_not_penalize_valid_capacity_row(
 
     capacity_support.update_capacity(AGI)
 
-    rows = Path(AGI._capacity_data_file).read_text(encoding="utf-8").splitlines()
-    assert len(rows) == 1
-    assert float(rows[0].split(",")[-1]) == 1.0
-    assert train_calls["count"] == 1
+    _features, labels = _online_model().history()
+    assert labels.tolist() == [1.0]
+    assert train_calls["count"] == 0
 
 
 def test_update_capacity_ignores_zero_runtime_adjustment(tmp_path, monkeypatch):
@@ -997,13 +1010,13 @@ def test_update_capacity_ignores_zero_runtime_adjustment(tmp_path, monkeypatch):
 
     capacity_support.update_capacity(AGI)
 
-    assert Path(AGI._capacity_data_file).exists()
+    assert list(_online_model().hosts) == ["10.0.0.2"]
 
 
 def test_update_capacity_skips_only_unresolved_worker(tmp_path, monkeypatch):
     # 10.0.0.2 is missing from AGI._workers (e.g. a stale/mismatched
     # hostname); its row must be dropped without discarding the whole batch,
-    # so 127.0.0.1's row still gets written and the model still retrains.
+    # so 127.0.0.1's row still reaches the online model.
     AGI._workers = {"127.0.0.1": 1}
     AGI.workers_info = {
         "127.0.0.1:8787": {
@@ -1040,11 +1053,9 @@ def test_update_capacity_skips_only_unresolved_worker(tmp_path, monkeypatch):
 
     capacity_support.update_capacity(AGI)
 
-    assert train_calls["count"] == 1
-    csv_path = Path(AGI._capacity_data_file)
-    assert csv_path.exists()
-    rows = [line for line in csv_path.read_text(encoding="utf-8").split("\r") if line]
-    assert len(rows) == 1
+    model = _online_model()
+    assert model.total_rows == 1
+    assert list(model.hosts) == ["127.0.0.1"]
 
 
 def test_update_capacity_skips_retrain_when_every_worker_is_unresolved(tmp_path, monkeypatch):
@@ -1073,10 +1084,10 @@ def test_update_capacity_skips_retrain_when_every_worker_is_unresolved(tmp_path,
     capacity_support.update_capacity(AGI)
 
     assert train_calls["count"] == 0
-    assert not Path(AGI._capacity_data_file).exists()
+    assert not _history_path().exists()
 
 
-def test_update_capacity_writes_utf8_capacity_csv_for_polars(tmp_path, monkeypatch):
+def test_update_capacity_refits_on_schedule_and_writes_evaluation_report(tmp_path, monkeypatch):
     AGI._workers = {"127.0.0.1": 1}
     AGI.workers_info = {
         "127.0.0.1:8787": {
@@ -1089,32 +1100,32 @@ def test_update_capacity_writes_utf8_capacity_csv_for_polars(tmp_path, monkeypat
             "label": 1.0,
         }
     }
-    AGI._run_time = [{"127.0.0.1:8787": 2.0}]
     AGI._capacity_data_file = str(tmp_path / "capacity.csv")
     AGI.env = SimpleNamespace(home_abs=str(tmp_path))
-    monkeypatch.setattr(AGI, "_train_capacity", staticmethod(lambda _path: None))
-    open_calls: list[dict[str, object]] = []
-    original_open = open
-
-    def _tracking_open(file, mode="r", *args, **kwargs):
-        if Path(file) == Path(AGI._capacity_data_file) and "a" in mode:
-            open_calls.append(
-                {
-                    "encoding": kwargs.get("encoding"),
-                    "newline": kwargs.get("newline"),
-                }
-            )
-        return original_open(file, mode, *args, **kwargs)
-
-    monkeypatch.setitem(
-        capacity_support.update_capacity.__globals__,
-        "open",
-        _tracking_open,
+    train_calls = []
+    monkeypatch.setattr(
+        AGI,
+        "_train_capacity",
+        staticmethod(lambda _path: train_calls.append(_online_model().total_rows) or 0.75),
     )
 
-    capacity_support.update_capacity(AGI)
-
-    assert open_calls == [{"encoding": "utf-8", "newline": ""}]
+    for label in (1.0, 2.0, 2.0, 2.0):
+        AGI.workers_info["127.0.0.1:8787"]["label"] = label
+        AGI._run_time = [{"127.0.0.1:8787": 2.0}]
+        capacity_support.update_capacity(AGI, refit_every=3)
+
+    # The refit sees the persisted third row.
+    assert train_calls == [3]
+    report = json.loads((tmp_path / "balancer_report.json").read_text(encoding="utf-8"))
+    assert report["total_rows"] == 4
+    assert report["regressor"] == {
+        "refits": 1,
+        "rows_since_refit": 1,
+        "refit_every": 3,
+        "holdout_r2": 0.75,
+    }
+    # Prequential errors: |1-2| then |1.3-2| then |1.51-2|.
+    assert report["hosts"]["127.0.0.1"]["mae"] == pytest.approx((1.0 + 0.7 + 0.49) / 3)
 
 
 def test_parse_run_timing_supports_raw_seconds_and_humanized_deltas():
@@ -1171,7 +1182,7 @@ def test_update_capacity_skips_retrain_without_run_time_feedback(tmp_path, monke
     capacity_support.update_capacity(AGI)
 
     assert train_calls["count"] == 0
-    assert not Path(AGI._capacity_data_file).exists()
+    assert not _history_path().exists()
 
 
 def test_train_capacity_missing_and_success(tmp_path):
@@ -0,0 +1,188 @@
+import json
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import asyncssh
+import pytest
+
+from agi_cluster.agi_distributor.deployment import deployment_delta_sync_support
+
+
+class _FakeRemoteFile:
+    def __init__(self, sftp, path, mode):
+        self._sftp = sftp
+        self._path = path
+        self._mode = mode
+
+    async def __aenter__(self):
+        if "r" in self._mode and self._path not in self._sftp.files:
+            raise asyncssh.SFTPNoSuchFile(self._path)
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    async def read(self):
+        return self._sftp.files[self._path].decode("utf-8")
+
+    async def write(self, text):
+        self._sftp.files[self._path] = text.encode("utf-8")
+
+
+class _FakeSftp:
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.puts: list[str] = []
+        self.dirs: set[str] = set()
+
+    def open(self, path, mode="r"):
+        return _FakeRemoteFile(self, path, mode)
+
+    async def stat(self, path):
+        if path not in self.files:
+            raise asyncssh.SFTPNoSuchFile(path)
+        return SimpleNamespace(size=len(self.files[path]))
+
+    async def makedirs(self, path, exist_ok=False):
+        self.dirs.add(path)
+
+    async def put(self, local_path, remote_path):
+        self.puts.append(remote_path)
+        self.files[remote_path] = Path(local_path).read_bytes()
+
+
+def _agi_cls(sftp, *, fail=None):
+    class _Conn:
+        @asynccontextmanager
+        async def start_sftp_client(self):
+            if fail is not None:
+                raise fail
+            yield sftp
+
+    @asynccontextmanager
+    async def _get_ssh_connection(_ip):
+        yield _Conn()
+
+    scp_calls = []
+
+    async def _send_files(_env, ip, files, remote_dir):
+        scp_calls.append((ip, [Path(f).name for f in files], str(remote_dir)))
+
+    return SimpleNamespace(
+        get_ssh_connection=_get_ssh_connection,
+        send_files=_send_files,
+        scp_calls=scp_calls,
+    )
+
+
+def _artifacts(tmp_path):
+    egg = tmp_path / "demo_worker-0.0.1.egg"
+    egg.write_bytes(b"egg-v1")
+    wheel = tmp_path / "agi_node-1.0-py3-none-any.whl"
+    wheel.write_bytes(b"wheel" * 100)
+    return egg, wheel
+
+
+def _env(tmp_path, **envars):
+    return SimpleNamespace(
+        wenv_rel=Path("wenv/demo_worker"),
+        wenv_abs=tmp_path / "wenv_abs",
+        envars=envars,
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_worker_artifacts_skips_unchanged_blobs(tmp_path, monkeypatch):
+    monkeypatch.delenv("AGILAB_DELTA_DEPLOY", raising=False)
+    egg, wheel = _artifacts(tmp_path)
+    sftp = _FakeSftp()
+    agi_cls = _agi_cls(sftp)
+    env = _env(tmp_path)
+    batches = [([egg], env.wenv_rel), ([wheel], env.wenv_rel / "dist")]
+
+    await deployment_delta_sync_support.send_worker_artifacts(agi_cls, "10.0.0.2", env, batches)
+    assert sftp.puts == [
+        "wenv/demo_worker/demo_worker-0.0.1.egg",
+        "wenv/demo_worker/dist/agi_node-1.0-py3-none-any.whl",
+    ]
+    assert "wenv/demo_worker/dist" in sftp.dirs
+
+    egg.write_bytes(b"egg-v2")
+    sftp.puts.clear()
+    await deployment_delta_sync_support.send_worker_artifacts(agi_cls, "10.0.0.2", env, batches)
+
+    assert sftp.puts == ["wenv/demo_worker/demo_worker-0.0.1.egg"]
+    assert sftp.files["wenv/demo_worker/demo_worker-0.0.1.egg"] == b"egg-v2"
+    stats = agi_cls._deploy_transfer_stats["10.0.0.2"]
+    assert (stats["files_sent"], stats["bytes_sent"]) == (1, 6)
+    assert (stats["files_skipped"], stats["bytes_skipped"]) == (1, 500)
+    assert agi_cls.scp_calls == []
+
+    # A blob deleted on the node is re-sent even though the manifest lists it.
+    del sftp.files["wenv/demo_worker/dist/agi_node-1.0-py3-none-any.whl"]
+    sftp.puts.clear()
+    await deployment_delta_sync_support.send_worker_artifacts(agi_cls, "10.0.0.2", env, batches)
+    assert sftp.puts == ["wenv/demo_worker/dist/agi_node-1.0-py3-none-any.whl"]
+
+
+@pytest.mark.asyncio
+async def test_send_worker_artifacts_records_transfers_in_timing_trace(tmp_path, monkeypatch):
+    monkeypatch.delenv("AGILAB_DELTA_DEPLOY", raising=False)
+    monkeypatch.delenv("AGILAB_PERF_TRACE", raising=False)
+    egg, _wheel = _artifacts(tmp_path)
+    env = _env(tmp_path, AGILAB_PERF_TRACE="1")
+    trace = env.wenv_abs / ".agilab-deploy-timing.json"
+    trace.parent.mkdir(parents=True)
+    trace.write_text(
+        json.dumps({"schema": "agilab-deploy-timing-v1", "stages": [{"stage": "x"}], "results": {}}),
+        encoding="utf-8",
+    )
+    sftp = _FakeSftp()
+
+    for ip in ("10.0.0.2", "10.0.0.3"):
+        await deployment_delta_sync_support.send_worker_artifacts(
+            _agi_cls(sftp), ip, env, [([egg], env.wenv_rel)]
+        )
+
+    payload = json.loads(trace.read_text(encoding="utf-8"))
+    assert payload["stages"] == [{"stage": "x"}]
+    assert payload["remote_transfers"]["10.0.0.2"]["bytes_sent"] == 6
+    # Both nodes share the fake SFTP store, so the second one already has the egg.
+    assert payload["remote_transfers"]["10.0.0.3"]["bytes_skipped"] == 6
+
+
+@pytest.mark.asyncio
+async def test_send_worker_artifacts_falls_back_to_scp(tmp_path, monkeypatch):
+    egg, wheel = _artifacts(tmp_path)
+    env = _env(tmp_path)
+    batches = [([egg], env.wenv_rel), ([wheel], env.wenv_rel / "dist")]
+
+    monkeypatch.delenv("AGILAB_DELTA_DEPLOY", raising=False)
+    failing = _agi_cls(_FakeSftp(), fail=asyncssh.ChannelOpenError(1, "sftp subsystem refused"))
+    await deployment_delta_sync_support.send_worker_artifacts(failing, "10.0.0.2", env, batches)
+    assert [names for _, names, _ in failing.scp_calls] == [
+        ["demo_worker-0.0.1.egg"],
+        ["agi_node-1.0-py3-none-any.whl"],
+    ]
+
+    monkeypatch.setenv("AGILAB_DELTA_DEPLOY", "0")
+    sftp = _FakeSftp()
+    disabled = _agi_cls(sftp)
+    await deployment_delta_sync_support.send_worker_artifacts(disabled, "10.0.0.2", env, batches)
+    assert sftp.puts == []
+    assert len(disabled.scp_calls) == 2
+    assert disabled._deploy_transfer_stats["10.0.0.2"]["bytes_skipped"] == 0
+
+
+def test_file_digest_reuses_cached_hash_for_unchanged_file(tmp_path, monkeypatch):
+    blob = tmp_path / "blob.bin"
+    blob.write_bytes(b"abc")
+    first = deployment_delta_sync_support.file_digest(blob)
+    assert first["size"] == 3
+
+    def _no_rehash(*_args, **_kwargs):
+        raise AssertionError("unchanged file was hashed again")
+
+    monkeypatch.setattr(deployment_delta_sync_support.hashlib, "sha256", _no_rehash)
+    assert deployment_delta_sync_support.file_digest(blob) == first
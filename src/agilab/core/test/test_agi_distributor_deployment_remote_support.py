@@ -11,6 +11,12 @@ from agi_env.cython_build_config import CYTHON_BUILD_REQUIREMENT
 from agi_cluster.agi_distributor import deployment_remote_support, uv_source_support
 
 
+@pytest.fixture(autouse=True)
+def _scp_artifact_transfer(monkeypatch):
+    # These fakes only implement send_files; SFTP delta sync has its own tests.
+    monkeypatch.setenv("AGILAB_DELTA_DEPLOY", "0")
+
+
 @pytest.mark.parametrize(
     ("system", "machine", "product_version", "expected"),
     [
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from agi_cluster.agi_distributor import AGI
+from agi_cluster.agi_distributor.runtime import capacity_support, hardware_profile_support
+
+
+@pytest.fixture(autouse=True)
+def _restore_agi_state(monkeypatch):
+    for field in ("_dask_client", "_dask_workers", "_workers", "_capacity_predictor", "workers_info", "env"):
+        monkeypatch.setattr(AGI, field, getattr(AGI, field, None), raising=False)
+    monkeypatch.setattr(AGI, "_capacity", {})
+    monkeypatch.setattr(AGI, "_calibration_cache", {}, raising=False)
+    monkeypatch.setattr(AGI, "_hardware_profile", {})
+    monkeypatch.delenv(hardware_profile_support.HARDWARE_PROFILE_TTL_ENV, raising=False)
+
+
+def test_stale_benchmark_workers_picks_one_worker_per_stale_host():
+    profiles = {"10.0.0.1": {"measured_at": 95.0}, "10.0.0.2": {"measured_at": 0.0}}
+    workers = ["10.0.0.1:8787", "10.0.0.2:8787", "10.0.0.2:8788", "10.0.0.3:8787"]
+
+    assert hardware_profile_support.stale_benchmark_workers(
+        workers, profiles, now=100.0, ttl=10.0
+    ) == ["10.0.0.2:8787", "10.0.0.3:8787"]
+
+
+def test_hardware_scores_are_relative_to_the_median_host():
+    profiles = {
+        "a": {"cpu_gflops": 4.0, "memory_gbps": 20.0},
+        "b": {"cpu_gflops": 2.0, "memory_gbps": 20.0},
+        "c": {"cpu_gflops": 2.0, "memory_gbps": 20.0, "disk_write_mbps": 100.0},
+    }
+    scores = hardware_profile_support.hardware_scores(profiles, ["a", "b", "c", "d"])
+
+    cpu_weight = hardware_profile_support.METRIC_WEIGHTS["cpu_gflops"]
+    memory_weight = hardware_profile_support.METRIC_WEIGHTS["memory_gbps"]
+    assert scores["a"] == pytest.approx(2.0 ** (cpu_weight / (cpu_weight + memory_weight)))
+    assert scores["b"] == scores["c"] == pytest.approx(1.0)
+    assert scores["d"] == 1.0
+    assert hardware_profile_support.hardware_scores({"a": profiles["a"]}, ["a"]) == {"a": 1.0}
+
+
+def test_measure_transfer_mbps_subtracts_the_round_trip_baseline():
+    ticks = iter([0.0, 0.1, 1.0, 1.18])
+
+    class _Client:
+        def submit(self, fn, payload, *, workers, pure):
+            return fn(payload)
+
+        def gather(self, futures):
+            return futures
+
+    mbps = hardware_profile_support.measure_transfer_mbps(
+        _Client(),
+        "w",
+        payload_bytes=8_000_000,
+        clock=lambda: next(ticks),
+    )
+    assert mbps == pytest.approx(100.0)
+    assert hardware_profile_support.measure_transfer_mbps(object(), "w") is None
+
+
+def test_resolve_profile_ttl_reads_environment_then_envars(monkeypatch, caplog):
+    env = SimpleNamespace(envars={hardware_profile_support.HARDWARE_PROFILE_TTL_ENV: "60"})
+    assert hardware_profile_support.resolve_profile_ttl(SimpleNamespace(envars={})) == 86400.0
+    assert hardware_profile_support.resolve_profile_ttl(env) == 60.0
+
+    monkeypatch.setenv(hardware_profile_support.HARDWARE_PROFILE_TTL_ENV, "soon")
+    assert hardware_profile_support.resolve_profile_ttl(env) == 86400.0
+    assert "Ignoring invalid AGILAB_HARDWARE_PROFILE_TTL_SECONDS" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_calibration_scales_capacity_by_cached_host_profiles(tmp_path, monkeypatch):
+    features = {
+        "ram_total": [16.0],
+        "ram_available": [8.0],
+        "cpu_count": [4.0],
+        "cpu_frequency": [2.5],
+        "network_speed": [1.0],
+    }
+
+    class _Client:
+        def __init__(self):
+            self.hardware_requests = []
+
+        def run(self, _fn, _worker_id, hardware_workers, **_kwargs):
+            self.hardware_requests.append(list(hardware_workers))
+            infos = {}
+            for worker, gflops in (("10.0.0.1:8787", 4.0), ("10.0.0.2:8787", 1.0)):
+                info = {key: list(value) for key, value in features.items()}
+                if worker in hardware_workers:
+                    info["hardware"] = {"cpu_gflops": gflops, "memory_gbps": 10.0}
+                infos[f"tcp://{worker}"] = info
+            return infos
+
+        def gather(self, payload):
+            return payload
+
+    transfers = []
+    monkeypatch.setattr(
+        hardware_profile_support,
+        "measure_transfer_mbps",
+        lambda _client, worker: transfers.append(worker) or 100.0,
+    )
+    monkeypatch.setattr(capacity_support.time, "time", lambda: 100.0)
+    AGI.env = SimpleNamespace(
+        envars={"AGILAB_CALIBRATION_CACHE_TTL_SECONDS": "0"},
+        resources_path=tmp_path,
+    )
+    AGI._dask_client = _Client()
+    AGI._dask_workers = ["10.0.0.1:8787", "10.0.0.2:8787"]
+    AGI._workers = {"10.0.0.1": 1, "10.0.0.2": 1}
+    AGI._capacity_predictor = SimpleNamespace(predict=lambda _data: [1.0])
+
+    await capacity_support.calibration(AGI)
+
+    assert AGI._dask_client.hardware_requests == [["10.0.0.1:8787", "10.0.0.2:8787"]]
+    assert transfers == ["10.0.0.1:8787", "10.0.0.2:8787"]
+    # Only the CPU metric differs (4x): 4 ** (0.45 / 0.8) with the weights of
+    # the three reported metrics.
+    assert AGI._capacity == {"10.0.0.1:8787": 2.2, "10.0.0.2:8787": 1.0}
+    assert "hardware" not in AGI.workers_info["10.0.0.1:8787"]
+    assert AGI._hardware_profile["10.0.0.1"]["cpu_gflops"] == 4.0
+    stored = hardware_profile_support.load_profiles(tmp_path / "hardware_profile.json")
+    assert stored["10.0.0.2"]["measured_at"] == 100.0
+
+    await capacity_support.calibration(AGI)
+    assert AGI._dask_client.hardware_requests[-1] == []
+    assert len(transfers) == 2
+    assert AGI._capacity == {"10.0.0.1:8787": 2.2, "10.0.0.2:8787": 1.0}
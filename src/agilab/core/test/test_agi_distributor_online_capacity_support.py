@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from agi_cluster.agi_distributor import AGI
+from agi_cluster.agi_distributor.runtime import capacity_support, online_capacity_support
+from agi_cluster.agi_distributor.runtime.online_capacity_support import OnlineCapacityModel
+
+
+def _row(label, nb_workers=1.0):
+    return {
+        "nb_workers": nb_workers,
+        "ram_total": 16.0,
+        "ram_available": 8.0,
+        "cpu_count": 4.0,
+        "cpu_frequency": 2.5,
+        "network_speed": 1.0,
+        "label": label,
+    }
+
+
+def test_history_is_a_bounded_ring_that_survives_a_round_trip(tmp_path):
+    model = OnlineCapacityModel(max_rows=3)
+    for label in (1.0, 2.0, 3.0, 4.0, 5.0):
+        model.observe("h", _row(label), now=0.0)
+
+    _features, labels = model.history()
+    assert labels.tolist() == [3.0, 4.0, 5.0]
+    assert model.total_rows == 5
+
+    path = tmp_path / online_capacity_support.CAPACITY_HISTORY_FILENAME
+    model.save(path)
+    restored = OnlineCapacityModel.load(path, max_rows=3)
+    assert restored.history()[1].tolist() == [3.0, 4.0, 5.0]
+    assert restored.estimate("h") == pytest.approx(model.estimate("h"))
+
+    shrunk = OnlineCapacityModel.load(path, max_rows=2)
+    assert shrunk.history()[1].tolist() == [4.0, 5.0]
+    assert OnlineCapacityModel.load(tmp_path / "missing.npz").total_rows == 0
+
+
+def test_ewma_estimate_tracks_the_latest_labels():
+    model = OnlineCapacityModel(alpha=0.5)
+    for label in (1.0, 3.0, 3.0):
+        model.observe("h", _row(label), now=0.0)
+
+    assert model.estimate("h") == pytest.approx(2.5)
+    assert model.estimate("unknown") is None
+    assert model.report()["hosts"]["h"]["mae"] == pytest.approx((2.0 + 1.0) / 2)
+
+
+def test_train_capacity_uses_seed_csv_and_bounded_history(tmp_path, monkeypatch):
+    monkeypatch.setattr(AGI, "_capacity_data_file", "balancer_df.csv")
+    monkeypatch.setattr(AGI, "_capacity_model_file", "balancer_model.pkl")
+    monkeypatch.setattr(AGI, "_capacity_predictor", None)
+    model = OnlineCapacityModel()
+    for index in range(12):
+        model.observe(f"h{index % 3}", _row(1.0 + index % 3, nb_workers=1.0 + index % 3), now=0.0)
+    model.save(tmp_path / online_capacity_support.CAPACITY_HISTORY_FILENAME)
+
+    score = capacity_support.train_capacity(AGI, tmp_path)
+
+    assert isinstance(score, float)
+    assert (tmp_path / "balancer_model.pkl").exists()
+    assert AGI._capacity_predictor.n_features_in_ == 6
+
+
+@pytest.mark.asyncio
+async def test_calibration_prefers_online_host_estimates_over_the_regressor(tmp_path, monkeypatch):
+    data_file = tmp_path / "balancer_df.csv"
+    model = OnlineCapacityModel()
+    model.observe("10.0.0.1", _row(3.0), now=0.0)
+    model.save(online_capacity_support.history_path(data_file))
+
+    class _Client:
+        def run(self, *_args, **_kwargs):
+            return {
+                f"tcp://{worker}": {key: [value] for key, value in _row(0.0).items() if key not in ("label", "nb_workers")}
+                for worker in ("10.0.0.1:8787", "10.0.0.2:8787")
+            }
+
+        def gather(self, payload):
+            return payload
+
+    for field, value in {
+        "env": SimpleNamespace(envars={"AGILAB_CALIBRATION_CACHE_TTL_SECONDS": "0", "AGILAB_HARDWARE_PROFILE_TTL_SECONDS": "0"}),
+        "_capacity_data_file": data_file,
+        "_dask_client": _Client(),
+        "_dask_workers": ["10.0.0.1:8787", "10.0.0.2:8787"],
+        "_workers": {"10.0.0.1": 1, "10.0.0.2": 1},
+        "_capacity_predictor": SimpleNamespace(predict=lambda _data: [1.0]),
+        "_capacity": {},
+        "workers_info": {},
+        "_calibration_cache": {},
+    }.items():
+        monkeypatch.setattr(AGI, field, value, raising=False)
+
+    await capacity_support.calibration(AGI)
+
+    assert AGI._capacity == {"10.0.0.1:8787": 3.0, "10.0.0.2:8787": 1.0}
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from agi_cluster.agi_distributor import AGI, runtime_distribution_support
+from agi_cluster.agi_distributor.runtime import pull_dispatch_support
+from agi_cluster.agi_distributor.runtime.pull_dispatch_support import PullQueue
+from agi_node.agi_dispatcher import BaseWorker
+from agi_node.pandas_worker import PandasWorker
+
+
+class _ImmediateFuture:
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+
+class _RecordingClient:
+    """Runs submitted work inline; ``delays`` slows selected workers down."""
+
+    def __init__(self, delays=None, fail_on=None):
+        self.delays = delays or {}
+        self.fail_on = fail_on
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn, plan, metadata, *, workers, pure):
+        with self._lock:
+            self.calls.append({"worker": workers[0], "plan": plan, "metadata": metadata, "pure": pure})
+        items = plan["chunk"][0]
+        if self.fail_on is not None and self.fail_on in items:
+            return _ImmediateFuture(error=RuntimeError(f"boom on {self.fail_on}"))
+        return _ImmediateFuture(value=(workers[0], items))
+
+    def gather(self, futures):
+        results = []
+        for future in futures:
+            if future.error is not None:
+                raise future.error
+            worker, items = future.value
+            time.sleep(self.delays.get(worker, 0.0) * len(items))
+            results.append(f"{worker}:{','.join(items)};")
+        return results
+
+
+def test_pull_queue_takes_own_front_then_steals_tail_of_heaviest_deque():
+    plan = [[["a1", "a2"]], [["b1", "b2", "b3", "b4", "b5", "b6"]]]
+    metadata = [[{"size_kb": 2}], [{"size_kb": 60}]]
+    queue = PullQueue(plan, metadata, 2)
+
+    first = queue.next_batch(0)
+    assert first.items[0] == "a1" and not first.stolen
+    while queue.remaining_weight(0):
+        queue.next_batch(0)
+
+    stolen = queue.next_batch(0)
+    assert stolen.stolen
+    assert stolen.origin_worker == 1
+    assert stolen.items[-1] == "b6"
+    assert stolen.metadata == {"size_kb": 60}
+
+    drained = [stolen]
+    while (batch := queue.next_batch(1)) is not None:
+        drained.append(batch)
+    executed = sorted(item for batch in drained for item in batch.items)
+    assert executed == ["b1", "b2", "b3", "b4", "b5", "b6"]
+    assert queue.next_batch(0) is None
+    assert queue.summary()["stolen_batches"] == 1
+
+
+def test_pull_queue_guided_batches_shrink_and_keep_unsplittable_batches_whole():
+    plan = [[[f"item-{index}" for index in range(32)], {"stage": "dag"}]]
+    queue = PullQueue(plan, [[None, None]], 2)
+
+    sizes = []
+    while (batch := queue.next_batch(0)) is not None:
+        if isinstance(batch.items, dict):
+            assert batch.items == {"stage": "dag"}
+            continue
+        sizes.append(len(batch.items))
+
+    assert sum(sizes) == 32
+    assert sizes[0] > sizes[-1] == 1
+    assert sizes == sorted(sizes, reverse=True)
+
+
+def test_resolve_dispatch_mode_reads_environment_then_envars(monkeypatch, caplog):
+    monkeypatch.delenv(pull_dispatch_support.DISPATCH_MODE_ENV, raising=False)
+    assert pull_dispatch_support.resolve_dispatch_mode(SimpleNamespace(envars={})) == "static"
+    env = SimpleNamespace(envars={pull_dispatch_support.DISPATCH_MODE_ENV: "Pull"})
+    assert pull_dispatch_support.resolve_dispatch_mode(env) == "pull"
+
+    monkeypatch.setenv(pull_dispatch_support.DISPATCH_MODE_ENV, "round-robin")
+    assert pull_dispatch_support.resolve_dispatch_mode(env) == "static"
+    assert "Ignoring AGILAB_DISPATCH_MODE" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_run_pull_dispatch_moves_work_off_a_slow_worker():
+    items = [f"f{index}" for index in range(24)]
+    plan = [[items[:12]], [items[12:]]]
+    client = _RecordingClient(delays={"slow": 0.02})
+
+    logs, queue = await pull_dispatch_support.run_pull_dispatch(
+        client,
+        dask_workers=["fast", "slow"],
+        workers_plan=plan,
+        workers_plan_metadata=[[{"n": 12}], [{"n": 12}]],
+        do_works=lambda *_args: None,
+    )
+
+    executed = {"fast": 0, "slow": 0}
+    for call in client.calls:
+        assert call["pure"] is False
+        assert call["plan"]["worker_idx"] == ["fast", "slow"].index(call["worker"])
+        assert call["plan"]["total_workers"] == 2
+        assert call["metadata"]["chunk"] == [{"n": 12}]
+        executed[call["worker"]] += len(call["plan"]["chunk"][0])
+    assert sum(executed.values()) == 24
+    assert executed["fast"] > executed["slow"]
+    assert any(entry["stolen"] and entry["worker"] == 0 for entry in queue.history)
+    assert logs["slow"].startswith("slow:")
+
+
+@pytest.mark.asyncio
+async def test_run_pull_dispatch_stops_pulling_after_a_failed_batch():
+    client = _RecordingClient(fail_on="x0")
+
+    with pytest.raises(RuntimeError, match="boom on x0"):
+        await pull_dispatch_support.run_pull_dispatch(
+            client,
+            dask_workers=["only"],
+            workers_plan=[[[f"x{index}" for index in range(8)]]],
+            workers_plan_metadata=[[None]],
+            do_works=lambda *_args: None,
+        )
+
+    # Only the batch queued behind the failed one was submitted, and it
+    # depends on the failed batch.
+    assert len(client.calls) == 2
+    assert client.calls[1]["plan"]["after_batch"] is not None
+    assert "after_batch" not in client.calls[0]["plan"]
+
+
+@pytest.mark.asyncio
+async def test_run_pull_dispatch_queues_next_batch_behind_the_running_one():
+    events = []
+
+    class _Client(_RecordingClient):
+        def submit(self, fn, plan, metadata, *, workers, pure):
+            future = super().submit(fn, plan, metadata, workers=workers, pure=pure)
+            events.append(("submit", tuple(plan["chunk"][0]), plan.get("after_batch")))
+            return future
+
+        def gather(self, futures):
+            events.append(("gather", tuple(futures[0].value[1])))
+            return super().gather(futures)
+
+    await pull_dispatch_support.run_pull_dispatch(
+        _Client(),
+        dask_workers=["only"],
+        workers_plan=[[[f"q{index}" for index in range(16)]]],
+        workers_plan_metadata=[[None]],
+        do_works=lambda *_args: None,
+    )
+
+    submits = [event for event in events if event[0] == "submit"]
+    assert len(submits) > 2
+    # Every batch after the first is submitted, chained on its predecessor,
+    # before the predecessor is gathered.
+    for previous, current in zip(submits, submits[1:]):
+        assert current[2] is not None and current[2].value[1] == list(previous[1])
+        assert events.index(current) < events.index(("gather", previous[1]))
+
+
+@pytest.mark.asyncio
+async def test_distribute_uses_pull_dispatch_when_configured(monkeypatch):
+    monkeypatch.setenv(pull_dispatch_support.DISPATCH_MODE_ENV, "pull")
+
+    class _Client(_RecordingClient):
+        def scheduler_info(self):
+            return {"workers": {"tcp://127.0.0.1:8787": {}, "tcp://127.0.0.1:8788": {}}}
+
+        def submit(self, fn, *args, **kwargs):
+            if len(args) == 2:
+                return super().submit(fn, *args, **kwargs)
+            return _ImmediateFuture(value=None)
+
+        def gather(self, futures):
+            if futures and futures[0].value is None:
+                return [None for _ in futures]
+            return super().gather(futures)
+
+    class _Dispatcher:
+        @staticmethod
+        async def _do_distrib(_env, workers, _args, *, capacities=None):
+            return workers, [[["a", "b"]], [["c"]]], [[{"n": 2}], [{"n": 1}]]
+
+    class _Worker:
+        @staticmethod
+        def _new(**_kwargs):
+            return None
+
+        @staticmethod
+        def _do_works(*_args, **_kwargs):
+            return None
+
+    async def _fake_calibration():
+        return None
+
+    client = _Client()
+    monkeypatch.setattr(
+        AGI,
+        "env",
+        SimpleNamespace(debug=False, target="demo", envars={}, mode2str=lambda mode: f"mode={mode}"),
+    )
+    monkeypatch.setattr(AGI, "_dask_client", client)
+    monkeypatch.setattr(AGI, "_dask_workers", None)
+    monkeypatch.setattr(AGI, "_workers", {"127.0.0.1": 2})
+    monkeypatch.setattr(AGI, "_args", {})
+    monkeypatch.setattr(AGI, "_mode", AGI.DASK_MODE)
+    monkeypatch.setattr(AGI, "verbose", 0)
+    monkeypatch.setattr(AGI, "_work_plan", None)
+    monkeypatch.setattr(AGI, "_work_plan_metadata", None)
+    monkeypatch.setattr(AGI, "_capacity", None)
+    monkeypatch.setattr(AGI, "_calibration", staticmethod(_fake_calibration))
+    monkeypatch.setattr(AGI, "_scale_cluster", staticmethod(lambda: None))
+    monkeypatch.setattr(AGI, "_pull_dispatch_history", None)
+
+    await runtime_distribution_support.distribute(
+        AGI,
+        work_dispatcher_cls=_Dispatcher,
+        base_worker_cls=_Worker,
+        time_fn=lambda: 0.0,
+    )
+
+    pulled = sorted(item for entry in client.calls for item in entry["plan"]["chunk"][0])
+    assert pulled == ["a", "b", "c"]
+    assert {entry["origin_worker"] for entry in AGI._pull_dispatch_history} == {0, 1}
+
+
+class _PulledPandasWorker(PandasWorker):
+    def __init__(self, data_out):
+        self._worker_id = 0
+        self._mode = 0
+        self.verbose = 0
+        self.args = {"output_format": "csv"}
+        self.data_out = data_out
+        self.pool_vars = None
+
+    def _actual_work_pool(self, x):
+        return pd.DataFrame({"item": [x]})
+
+    def work_init(self):
+        pass
+
+    def pool_init(self, pool_vars):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _InlineWorkerClient:
+    """Runs each pulled batch through the real ``BaseWorker._do_works`` path."""
+
+    def submit(self, fn, plan, metadata, *, workers, pure):
+        return _ImmediateFuture(value=fn(plan, metadata))
+
+    def gather(self, futures):
+        return [future.value for future in futures]
+
+
+@pytest.mark.asyncio
+async def test_run_pull_dispatch_keeps_every_pulled_batch_output(monkeypatch, tmp_path):
+    worker = _PulledPandasWorker(tmp_path)
+    monkeypatch.setattr(BaseWorker, "_worker_id", 0)
+    monkeypatch.setattr(BaseWorker, "_worker", "inline")
+    monkeypatch.setattr(BaseWorker, "_insts", {0: worker})
+    items = [f"f{index}" for index in range(4)]
+
+    _logs, queue = await pull_dispatch_support.run_pull_dispatch(
+        _InlineWorkerClient(),
+        dask_workers=["inline"],
+        workers_plan=[[items]],
+        workers_plan_metadata=[[None]],
+        do_works=BaseWorker._do_works,
+    )
+
+    assert len(queue.history) > 1
+    outputs = sorted(tmp_path.glob("0_output*.csv"))
+    assert len(outputs) == len(queue.history)
+    written = pd.concat(pd.read_csv(path) for path in outputs)["item"].tolist()
+    assert sorted(written) == items
+    # Labels name the planned (worker, batch, index), not the pulled position.
+    labelled = pd.concat(pd.read_csv(path) for path in outputs)
+    assert dict(zip(labelled["item"], labelled["worker_id"])) == {
+        item: str((0, 0, index)) for index, item in enumerate(items)
+    }
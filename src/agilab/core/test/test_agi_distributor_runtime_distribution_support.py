@@ -42,6 +42,9 @@ def _reset_agi_runtime_distribution_state():
         "_TIMEOUT",
         "_work_plan",
         "_work_plan_metadata",
+        "_pull_dispatch_history",
+        "_warm_cluster",
+        "_worker_progress",
         "_capacity",
         "_phase_timings",
         "_dask_log_level",
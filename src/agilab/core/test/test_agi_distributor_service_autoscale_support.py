@@ -0,0 +1,137 @@
+import json
+
+import pytest
+
+from agi_cluster.agi_distributor.service import service_autoscale_support
+from agi_cluster.agi_distributor.service.service_autoscale_support import (
+    ServiceAutoscalePolicy,
+    autoscale_decision,
+)
+
+
+def _decide(
+    policy,
+    *,
+    workers,
+    healthy=None,
+    pending=0,
+    running=0,
+    p90=None,
+    idle_since=None,
+    last_scale_at=None,
+    now=1000.0,
+):
+    return autoscale_decision(
+        policy,
+        workers=workers,
+        healthy=workers if healthy is None else healthy,
+        queue={"pending": pending, "running": running},
+        latency={"p90_sec": p90},
+        idle_since=idle_since,
+        last_scale_at=last_scale_at,
+        now=now,
+    )
+
+
+def test_policy_from_value_validates_bounds_and_fields():
+    policy = ServiceAutoscalePolicy.from_value({"min_workers": 1, "max_workers": 4})
+    assert policy == ServiceAutoscalePolicy(min_workers=1, max_workers=4)
+    assert ServiceAutoscalePolicy.from_value(policy.as_dict()) == policy
+    assert ServiceAutoscalePolicy.from_value(None) is None
+
+    with pytest.raises(ValueError, match="max_workers"):
+        ServiceAutoscalePolicy(min_workers=3, max_workers=2)
+    with pytest.raises(ValueError, match="Unknown autoscale"):
+        ServiceAutoscalePolicy.from_value({"min_workers": 1, "max_workers": 2, "burst": 3})
+    with pytest.raises(TypeError):
+        ServiceAutoscalePolicy.from_value(4)
+
+
+def test_autoscale_decision_scales_with_backlog_latency_and_idleness():
+    policy = ServiceAutoscalePolicy(
+        min_workers=1,
+        max_workers=6,
+        pending_per_worker=2.0,
+        latency_p90_sec=5.0,
+        idle_retire_sec=60.0,
+        cooldown_sec=30.0,
+    )
+
+    assert _decide(policy, workers=2, pending=7, running=2) == (
+        service_autoscale_support.ServiceAutoscaleDecision(5, "queue_depth")
+    )
+    # An unhealthy worker drains nothing, so it does not count as capacity.
+    assert _decide(policy, workers=2, healthy=1, pending=3).target == 3
+    assert _decide(policy, workers=2, pending=40).target == 6
+    assert _decide(policy, workers=2, pending=1, p90=9.0).reason == "claim_latency"
+    # A slow history alone does not add workers to an empty queue.
+    assert _decide(policy, workers=2, p90=9.0, idle_since=990.0).reason == "steady"
+
+    assert _decide(policy, workers=3, idle_since=900.0) == (
+        service_autoscale_support.ServiceAutoscaleDecision(2, "idle")
+    )
+    assert _decide(policy, workers=1, idle_since=0.0).reason == "steady"
+    assert _decide(policy, workers=3, pending=20, last_scale_at=990.0).reason == "cooldown"
+    # Bounds are restored even during the cooldown.
+    assert _decide(policy, workers=8, last_scale_at=990.0).target == 6
+
+
+def test_retire_candidates_prefer_unhealthy_then_newest_added():
+    workers = ["a", "b", "c", "d"]
+    assert service_autoscale_support.retire_candidates(workers, 1, added=["c", "d"]) == ["d"]
+    assert service_autoscale_support.retire_candidates(
+        workers, 2, added=["c"], unhealthy=["a"]
+    ) == ["a", "c"]
+    assert service_autoscale_support.retire_candidates(workers, 2) == ["d", "c"]
+
+
+def _queue_task(pending_dir, worker, name):
+    worker_dir = pending_dir / worker.replace(":", "_")
+    worker_dir.mkdir(parents=True, exist_ok=True)
+    path = worker_dir / f"{name}.task.json"
+    path.write_text(json.dumps({"task_id": name, "worker": worker}), encoding="utf-8")
+    return path
+
+
+def test_rebalance_moves_backlog_to_new_workers_and_drains_retired_ones(tmp_path):
+    pending_dir = tmp_path / "pending"
+    safe_name = lambda worker: worker.replace(":", "_")
+    for index in range(6):
+        _queue_task(pending_dir, "w:1", f"{index:06d}")
+
+    tasks = service_autoscale_support.pending_tasks_by_worker(
+        pending_dir, ["w:1", "w:2", "w:3"], safe_name=safe_name
+    )
+    moves = service_autoscale_support.plan_rebalance(
+        tasks, sources=["w:1"], targets=["w:2", "w:3"], drain=False
+    )
+    # The newest tasks move; the oldest stay with the worker that already has them.
+    assert sorted(path.stem for path, _ in moves) == [f"{index:06d}.task" for index in (2, 3, 4, 5)]
+    assert service_autoscale_support.rehome_pending_tasks(
+        moves, pending_dir=pending_dir, safe_name=safe_name
+    ) == 4
+
+    tasks = service_autoscale_support.pending_tasks_by_worker(
+        pending_dir, ["w:1", "w:2", "w:3"], safe_name=safe_name
+    )
+    assert {worker: len(paths) for worker, paths in tasks.items()} == {"w:1": 2, "w:2": 2, "w:3": 2}
+    moved = json.loads(tasks["w:3"][0].read_text(encoding="utf-8"))
+    assert moved["worker"] == "w:3"
+
+    moves = service_autoscale_support.plan_rebalance(
+        tasks, sources=["w:3"], targets=["w:1", "w:2"], drain=True
+    )
+    service_autoscale_support.rehome_pending_tasks(moves, pending_dir=pending_dir, safe_name=safe_name)
+    assert not list((pending_dir / "w_3").glob("*.task.json"))
+    assert len(list(pending_dir.glob("*/*.task.json"))) == 6
+    assert not list(pending_dir.glob("*/.*.tmp"))
+
+
+def test_rehome_skips_tasks_claimed_meanwhile(tmp_path):
+    pending_dir = tmp_path / "pending"
+    claimed = pending_dir / "w_1" / "000001.task.json"
+    moved = service_autoscale_support.rehome_pending_tasks(
+        [(claimed, "w:2")], pending_dir=pending_dir, safe_name=lambda worker: worker.replace(":", "_")
+    )
+    assert moved == 0
+    assert not (pending_dir / "w_2").exists()
@@ -10,6 +10,7 @@ import pytest
 from agi_cluster.agi_distributor import AGI
 import agi_cluster.agi_distributor.agi_distributor as agi_distributor_module
 from agi_cluster.agi_distributor import service_lifecycle_support, service_state_support
+from agi_cluster.agi_distributor.service import service_autoscale_support
 from agi_env import AgiEnv
 from agi_node.agi_dispatcher import BaseWorker
 
@@ -46,6 +47,8 @@ def _reset_agi_service_state():
         "_service_cleanup_heartbeat_ttl_sec": AGI._service_cleanup_heartbeat_ttl_sec,
         "_service_cleanup_unproven": AGI._service_cleanup_unproven,
         "_service_runtime_shutdown_proven": AGI._service_runtime_shutdown_proven,
+        "_service_autoscale_policy": AGI._service_autoscale_policy,
+        "_service_autoscale_state": dict(AGI._service_autoscale_state),
         "_service_futures": dict(AGI._service_futures),
         "_service_heartbeat_timeout": AGI._service_heartbeat_timeout,
         "_service_poll_interval": AGI._service_poll_interval,
@@ -121,6 +124,8 @@ def _reset_agi_service_state():
     AGI._service_runtime_shutdown_proven = snapshot[
         "_service_runtime_shutdown_proven"
     ]
+    AGI._service_autoscale_policy = snapshot["_service_autoscale_policy"]
+    AGI._service_autoscale_state = snapshot["_service_autoscale_state"]
     AGI._service_futures = snapshot["_service_futures"]
     AGI._service_heartbeat_timeout = snapshot["_service_heartbeat_timeout"]
     AGI._service_poll_interval = snapshot["_service_poll_interval"]
@@ -724,6 +729,160 @@ async def test_service_auto_restart_state_publish_failure_forces_runtime_shutdow
     assert break_submissions[0]["kwargs"]["allow_other_workers"] is False
 
 
+def _autoscale_service(monkeypatch, tmp_path, workers, policy):
+    env = AgiEnv(apps_path=Path("src/agilab/apps/builtin"), app="minimal_app_project", verbose=0)
+    AGI._args = {"sample": 1}
+    AGI._mode = AGI.DASK_MODE
+    AGI._service_apply_queue_root(tmp_path / "queue", create=True)
+    AGI._service_workers = list(workers)
+    AGI._service_futures = {
+        worker: _FakeFuture(status="running", key=f"loop-{worker}", kind="loop")
+        for worker in workers
+    }
+    AGI._service_autoscale_policy = policy
+    AGI._service_autoscale_state = {}
+    client = _FakeClient(list(workers))
+    client.loop_futures.extend(AGI._service_futures.values())
+    writes = []
+    monkeypatch.setattr(AGI, "_init_service_queue", staticmethod(lambda _env: None))
+    monkeypatch.setattr(AGI, "_service_unhealthy_workers", staticmethod(lambda _workers: {}))
+    monkeypatch.setattr(
+        AGI,
+        "_service_write_state",
+        staticmethod(lambda _env, payload: writes.append(payload)),
+    )
+    return env, client, writes
+
+
+def _queue_service_task(worker: str, name: str) -> Path:
+    worker_dir = AGI._service_queue_pending / AGI._service_safe_worker_name(worker)
+    worker_dir.mkdir(parents=True, exist_ok=True)
+    task_path = worker_dir / f"{name}.task.json"
+    task_path.write_text(json.dumps({"task_id": name, "worker": worker}), encoding="utf-8")
+    return task_path
+
+
+@pytest.mark.asyncio
+async def test_service_autoscale_adds_local_workers_and_shares_backlog(monkeypatch, tmp_path):
+    policy = service_autoscale_support.ServiceAutoscalePolicy(
+        min_workers=1,
+        max_workers=3,
+        pending_per_worker=2.0,
+    )
+    env, client, writes = _autoscale_service(monkeypatch, tmp_path, ["127.0.0.1:9000"], policy)
+    for index in range(6):
+        _queue_service_task("127.0.0.1:9000", f"{index:06d}")
+
+    def _start_local_workers(count):
+        client._workers.extend(f"127.0.0.1:{9001 + index}" for index in range(count))
+
+    monkeypatch.setattr(AGI, "_service_start_local_workers", staticmethod(_start_local_workers))
+
+    result = await service_lifecycle_support.service_autoscale(
+        AGI,
+        env,
+        client,
+        now=100.0,
+        wait_fn=lambda futures, **_kwargs: (set(futures), set()),
+    )
+
+    assert result["reason"] == "queue_depth"
+    assert result["added"] == ["127.0.0.1:9001", "127.0.0.1:9002"]
+    assert AGI._service_workers == ["127.0.0.1:9000", "127.0.0.1:9001", "127.0.0.1:9002"]
+    assert set(AGI._service_futures) == set(AGI._service_workers)
+    loop_keys = [
+        submission["kwargs"]["key"]
+        for submission in client.submissions
+        if submission["fn"] == "loop"
+    ]
+    assert len(loop_keys) == 2 and all(key.startswith("agi-serve-autoscale-loop-") for key in loop_keys)
+    assert writes[-1]["service_loop_keys"]["127.0.0.1:9002"] in loop_keys
+    assert writes[-1]["autoscale"]["max_workers"] == 3
+    for worker in AGI._service_workers:
+        queued = list((AGI._service_queue_pending / AGI._service_safe_worker_name(worker)).glob("*.task.json"))
+        assert len(queued) == 2
+        assert {json.loads(path.read_text())["worker"] for path in queued} == {worker}
+
+    # The cooldown holds the pool steady right after scaling.
+    again = await service_lifecycle_support.service_autoscale(
+        AGI, env, client, now=110.0, wait_fn=lambda futures, **_kwargs: (set(futures), set())
+    )
+    assert again["reason"] == "cooldown" and again["added"] == []
+
+
+@pytest.mark.asyncio
+async def test_service_autoscale_retires_idle_worker_and_keeps_its_tasks(monkeypatch, tmp_path):
+    policy = service_autoscale_support.ServiceAutoscalePolicy(
+        min_workers=1,
+        max_workers=3,
+        idle_retire_sec=30.0,
+    )
+    workers = ["127.0.0.1:9000", "127.0.0.1:9001"]
+    env, client, writes = _autoscale_service(monkeypatch, tmp_path, workers, policy)
+    retired_calls = []
+
+    def _retire_workers(*, workers, close_workers):
+        retired_calls.append((workers, close_workers))
+        return {}
+
+    client.retire_workers = _retire_workers
+    gather = client.gather
+
+    def _gather_hands_back_claim(futures, errors="raise"):
+        # A claim the stopping loop had not started goes back to its queue.
+        _queue_service_task("127.0.0.1:9001", "000042")
+        return gather(futures, errors=errors)
+
+    client.gather = _gather_hands_back_claim
+
+    async def _connected(_client):
+        return list(client._workers)
+
+    monkeypatch.setattr(AGI, "_service_connected_workers", staticmethod(_connected))
+    wait_fn = lambda futures, **_kwargs: (set(futures), set())
+
+    first = await service_lifecycle_support.service_autoscale(AGI, env, client, now=100.0, wait_fn=wait_fn)
+    assert first["reason"] == "steady" and first["retired"] == []
+
+    second = await service_lifecycle_support.service_autoscale(AGI, env, client, now=131.0, wait_fn=wait_fn)
+    assert second["reason"] == "idle"
+    assert second["retired"] == ["127.0.0.1:9001"]
+    assert AGI._service_workers == ["127.0.0.1:9000"]
+    assert list(AGI._service_futures) == ["127.0.0.1:9000"]
+    assert retired_calls == [(["tcp://127.0.0.1:9001"], True)]
+    assert writes[-1]["service_workers"] == ["127.0.0.1:9000"]
+    survivor_dir = AGI._service_queue_pending / AGI._service_safe_worker_name("127.0.0.1:9000")
+    handed_over = json.loads((survivor_dir / "000042.task.json").read_text())
+    assert handed_over["worker"] == "127.0.0.1:9000"
+    assert second["workers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_serve_status_reports_autoscale_step(monkeypatch):
+    env = _minimal_app_env()
+    AGI._dask_client = _FakeClient(["w1"])
+    AGI._service_workers = ["w1"]
+    AGI._service_futures = {"w1": _FakeFuture(status="running", key="loop-w1")}
+    AGI._service_autoscale_policy = service_autoscale_support.ServiceAutoscalePolicy(
+        min_workers=1,
+        max_workers=2,
+    )
+
+    async def _no_restart(_env, _client):
+        return {"restarted": [], "reasons": {}}
+
+    async def _autoscale(_env, _client):
+        raise ConnectionError("scheduler unreachable")
+
+    monkeypatch.setattr(AGI, "_service_auto_restart_unhealthy", staticmethod(_no_restart))
+    monkeypatch.setattr(AGI, "_service_autoscale", staticmethod(_autoscale))
+
+    result = await AGI.serve(env, action="status")
+
+    assert result["status"] == "running"
+    assert result["autoscale"] == {"enabled": True, "error": "scheduler unreachable"}
+
+
 @pytest.mark.asyncio
 async def test_service_recover_preserves_state_on_transient_failure(tmp_path, monkeypatch):
     env = AgiEnv(apps_path=Path("src/agilab/apps/builtin"), app="minimal_app_project", verbose=0)
@@ -1926,6 +2085,71 @@ async def test_agi_submit_builds_distribution_when_plan_missing(monkeypatch, tmp
     assert len(result["queued_files"]) == 1
 
 
+@pytest.mark.asyncio
+async def test_agi_submit_many_plans_once_per_distinct_args(monkeypatch, tmp_path):
+    env = AgiEnv(apps_path=Path("src/agilab/apps/builtin"), app="minimal_app_project", verbose=0)
+    AGI._service_futures = {"127.0.0.1:8787": _FakeFuture("running")}
+    AGI._service_workers = ["127.0.0.1:8787"]
+    AGI._dask_client = _FakeClient(["127.0.0.1:8787"])
+    AGI._workers = {"127.0.0.1": 1}
+    AGI._args = {}
+    AGI._service_apply_queue_root(tmp_path / "queue", create=True)
+    planned_args = []
+
+    async def _do_distrib(_env, _workers, args):
+        planned_args.append(dict(args))
+        return {"127.0.0.1": 1}, [[f"step-{args['alpha']}"]], [[{"alpha": args["alpha"]}]]
+
+    def _no_cleanup():
+        raise AssertionError("submit_many must not clean artifacts unless asked to")
+
+    monkeypatch.setattr(agi_distributor_module.WorkDispatcher, "_do_distrib", staticmethod(_do_distrib))
+    monkeypatch.setattr(AGI, "_service_cleanup_artifacts", staticmethod(_no_cleanup))
+
+    result = await AGI.submit_many(
+        [
+            {"task_id": "a", "alpha": 1},
+            {"task_id": "b", "alpha": 2},
+            {"task_id": "c", "alpha": 1},
+            {
+                "task_id": "d",
+                "work_plan": [["given"]],
+                "work_plan_metadata": [[{}]],
+                "task_priority": 3,
+                "task_deadline": 1_900_000_000,
+                "alpha": 3,
+            },
+        ],
+        env,
+    )
+
+    assert result["status"] == "queued"
+    assert result["planned"] == 2
+    assert planned_args == [{"alpha": 1}, {"alpha": 2}]
+    assert result["cleanup"] is None
+    assert [task["task_id"] for task in result["tasks"]] == ["a", "b", "c", "d"]
+    queued = [Path(task["queued_files"][0]) for task in result["tasks"]]
+    assert all(path.parent == tmp_path / "queue" / "pending" / "127.0.0.1-8787" for path in queued)
+    text = queued[2].read_text(encoding="utf-8")
+    assert ", " not in text and ": " not in text
+    payloads = [json.loads(path.read_text(encoding="utf-8")) for path in queued]
+    assert [(payload["priority"], payload["deadline"]) for payload in payloads] == [
+        (0, None),
+        (0, None),
+        (0, None),
+        (3, 1_900_000_000.0),
+    ]
+    assert "task_priority" not in payloads[3]["args"]
+    assert [payload["plan"]["chunk"] for payload in payloads] == [
+        ["step-1"],
+        ["step-2"],
+        ["step-1"],
+        ["given"],
+    ]
+    # Submit order is kept in the file names the workers sort on.
+    assert sorted(queued, key=lambda path: path.name) == queued
+
+
 @pytest.mark.asyncio
 async def test_agi_submit_queues_tasks_for_service_workers(monkeypatch, tmp_path):
     env = AgiEnv(apps_path=Path("src/agilab/apps/builtin"), app="minimal_app_project", verbose=0)
@@ -1971,6 +2195,7 @@ async def test_agi_submit_queues_tasks_for_service_workers(monkeypatch, tmp_path
     queued_file = Path(result["queued_files"][0])
     assert queued_file.exists()
     assert queued_file.name.endswith(".task.json")
+    assert queued_file.parent == tmp_path / "service_queue" / "pending" / "127.0.0.1-8787"
     payload = json.loads(queued_file.read_text(encoding="utf-8"))
     assert payload["schema"] == "agi.service.task.v1"
     assert payload["task_name"] == "test-batch"
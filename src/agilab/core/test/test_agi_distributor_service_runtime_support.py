@@ -25,9 +25,11 @@ def test_service_runtime_support_reexports_service_helpers(monkeypatch):
     lifecycle_exports = {
         "serve",
         "service_auto_restart_unhealthy",
+        "service_autoscale",
         "service_recover",
         "service_restart_workers",
         "submit",
+        "submit_many",
         "wrap_worker_chunk",
     }
     state_exports = {
@@ -45,6 +47,7 @@ def test_service_runtime_support_reexports_service_helpers(monkeypatch):
         "service_heartbeat_timeout_value",
         "service_public_args",
         "service_queue_counts",
+        "service_queue_latency",
         "service_queue_paths",
         "service_read_heartbeat_payloads",
         "service_read_heartbeats",
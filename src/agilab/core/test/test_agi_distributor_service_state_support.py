@@ -10,6 +10,7 @@ from types import SimpleNamespace
 import pytest
 
 from agi_cluster.agi_distributor import service_state_support
+from agi_cluster.agi_distributor.service import service_heartbeat_support
 
 
 class _FakeFuture:
@@ -452,6 +453,8 @@ def test_service_queue_counts_reads_task_files(tmp_path):
 
     (pending / "a.task.json").write_text("x", encoding="utf-8")
     (pending / "b.task.json").write_text("x", encoding="utf-8")
+    (pending / "127.0.0.1-8787").mkdir()
+    (pending / "127.0.0.1-8787" / "e.task.json").write_text("x", encoding="utf-8")
     (running / "c.task.json").write_text("x", encoding="utf-8")
     (done / "d.task.json").write_text("x", encoding="utf-8")
     (failed / "legacy.task.pkl").write_text("x", encoding="utf-8")
@@ -462,7 +465,7 @@ def test_service_queue_counts_reads_task_files(tmp_path):
     agi._service_queue_failed = failed
 
     assert service_state_support.service_queue_counts(agi) == {
-        "pending": 2,
+        "pending": 3,
         "running": 1,
         "done": 1,
         "failed": 1,
@@ -1024,6 +1027,48 @@ def test_service_health_payload_counts_and_fields(tmp_path):
     assert payload["restart_reasons"]["w2"] == "missing-heartbeat"
 
 
+def test_service_queue_latency_summarises_recent_terminal_tasks(tmp_path):
+    agi = _build_agi()
+    done = tmp_path / "done"
+    failed = tmp_path / "failed"
+    done.mkdir()
+    failed.mkdir()
+    agi._service_queue_done = done
+    agi._service_queue_failed = failed
+
+    for index, wait in enumerate((1.0, 2.0, 3.0, 4.0)):
+        folder = failed if index == 3 else done
+        (folder / f"{index:06d}-t.task.json").write_text(
+            json.dumps(
+                {
+                    "created_at": 100.0,
+                    "started_at": 100.0 + wait,
+                    "deadline_missed": index == 3,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.utime(folder / f"{index:06d}-t.task.json", (1000 + index, 1000 + index))
+    (done / "bad.task.json").write_text("not-json", encoding="utf-8")
+    os.utime(done / "bad.task.json", (900, 900))
+
+    latency = service_state_support.service_queue_latency(agi)
+    assert latency["samples"] == 4
+    assert latency["deadline_missed"] == 1
+    assert latency["p50_sec"] == pytest.approx(2.5)
+    assert latency["p99_sec"] == pytest.approx(3.97)
+    assert latency["max_sec"] == 4.0
+
+    # Only the newest tasks are sampled.
+    assert service_state_support.service_queue_latency(agi, sample=2)["p50_sec"] == pytest.approx(3.5)
+
+    health = service_state_support.service_health_payload(
+        _build_env(tmp_path),
+        {"status": "running", "queue_latency": latency},
+    )
+    assert health["queue_latency"] == latency
+
+
 def test_service_read_heartbeats_keeps_latest_and_ignores_bad(tmp_path):
     agi = _build_agi()
     hb_dir = tmp_path / "heartbeats"
@@ -1044,6 +1089,68 @@ def test_service_read_heartbeats_keeps_latest_and_ignores_bad(tmp_path):
     assert float(payloads["w1"]["timestamp"]) == 3.0
 
 
+def test_service_heartbeat_view_reparses_only_changed_files(tmp_path, monkeypatch):
+    agi = _build_agi()
+    hb_dir = tmp_path / "heartbeats"
+    hb_dir.mkdir(parents=True, exist_ok=True)
+    agi._service_queue_heartbeats = hb_dir
+    (hb_dir / "a.json").write_text(json.dumps({"worker": "w1", "timestamp": 1.0}), encoding="utf-8")
+    (hb_dir / "b.json").write_text(json.dumps({"worker": "w2", "timestamp": 2.0}), encoding="utf-8")
+
+    opened: list[str] = []
+    real_open = open
+
+    def _counting_open(path, *args, **kwargs):
+        opened.append(Path(path).name)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(service_heartbeat_support, "open", _counting_open, raising=False)
+    assert service_state_support.service_read_heartbeats(agi) == {"w1": 1.0, "w2": 2.0}
+    assert sorted(opened) == ["a.json", "b.json"]
+
+    opened.clear()
+    (hb_dir / "b.json").write_text(json.dumps({"worker": "w2", "timestamp": 12.0}), encoding="utf-8")
+    (hb_dir / "a.json").unlink()
+    assert service_state_support.service_read_heartbeats(agi) == {"w2": 12.0}
+    assert opened == ["b.json"]
+
+
+def test_service_heartbeat_events_answer_health_without_reading_files(tmp_path):
+    agi = _build_agi()
+    hb_dir = tmp_path / "heartbeats"
+    hb_dir.mkdir(parents=True, exist_ok=True)
+    agi._service_queue_heartbeats = hb_dir
+    agi._service_workers = ["w1", "w2"]
+    (hb_dir / "w1.json").write_text(json.dumps({"worker": "w1", "timestamp": 1.0}), encoding="utf-8")
+
+    subscriptions = []
+    client = SimpleNamespace(subscribe_topic=lambda topic, handler: subscriptions.append((topic, handler)))
+    assert service_heartbeat_support.subscribe_service_heartbeats(agi, client)
+    assert service_heartbeat_support.subscribe_service_heartbeats(agi, client)
+    assert [topic for topic, _ in subscriptions] == [service_heartbeat_support.SERVICE_HEARTBEAT_TOPIC]
+    handler = subscriptions[0][1]
+
+    now = time.time()
+    handler((now, {"worker": "w1", "timestamp": now, "state": "running"}))
+    # Without a fresh event from every worker the files are still read.
+    assert service_state_support.service_read_heartbeats(agi) == {"w1": now}
+    view = agi._service_heartbeat_view
+    view.refresh_files = lambda: pytest.fail("heartbeat files read while events are fresh")
+    handler((now, {"worker": "w2", "timestamp": now, "state": "processing"}))
+    handler((now, {"worker": "w2", "timestamp": now - 5.0, "state": "running"}))
+    handler("malformed")
+
+    payloads = service_state_support.service_read_heartbeat_payloads(agi)
+    assert {worker: payload["state"] for worker, payload in payloads.items()} == {
+        "w1": "running",
+        "w2": "processing",
+    }
+    assert view.events_received == 2
+
+    service_state_support.reset_service_queue_state(agi)
+    assert agi._service_heartbeat_view is None
+
+
 def test_service_cleanup_artifacts_ttl_and_max_files(tmp_path):
     agi = _build_agi()
     done_dir = tmp_path / "done"
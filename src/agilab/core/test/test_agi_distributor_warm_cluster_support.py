@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from agi_cluster.agi_distributor import AGI, runtime_distribution_support
+from agi_cluster.agi_distributor.runtime import warm_cluster_support
+from agi_cluster.agi_distributor.runtime.warm_cluster_support import WarmCluster
+
+
+class _Client:
+    def __init__(self, workers=2):
+        self.status = "running"
+        self.workers = {f"tcp://127.0.0.1:{9000 + index}": {} for index in range(workers)}
+        self.submitted = []
+
+    def scheduler_info(self):
+        return {"workers": dict(self.workers)}
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted.append(getattr(fn, "__name__", fn))
+        return None
+
+    def gather(self, futures):
+        return [None for _ in futures]
+
+
+def _warm(key="key", client=None, shutdowns=None, **overrides):
+    client = client or _Client()
+    fields = dict(
+        key=key,
+        client=client,
+        scheduler="127.0.0.1:8786",
+        scheduler_ip="127.0.0.1",
+        scheduler_port=8786,
+        jobs=None,
+        worker_count=len(client.workers),
+        start_seconds=4.0,
+        shutdown_fn=lambda warm: (shutdowns if shutdowns is not None else []).append(warm),
+    )
+    fields.update(overrides)
+    return WarmCluster(**fields)
+
+
+@pytest.fixture(autouse=True)
+def _no_parked_cluster(monkeypatch):
+    monkeypatch.delenv(warm_cluster_support.DASK_KEEPALIVE_TTL_ENV, raising=False)
+    warm_cluster_support.discard_parked()
+    yield
+    warm_cluster_support.discard_parked()
+
+
+def test_resolve_keepalive_ttl_reads_environment_then_envars(monkeypatch, caplog):
+    env = SimpleNamespace(envars={warm_cluster_support.DASK_KEEPALIVE_TTL_ENV: "120"})
+    assert warm_cluster_support.resolve_keepalive_ttl(SimpleNamespace(envars={})) == 0.0
+    assert warm_cluster_support.resolve_keepalive_ttl(env) == 120.0
+
+    monkeypatch.setenv(warm_cluster_support.DASK_KEEPALIVE_TTL_ENV, "-5")
+    assert warm_cluster_support.resolve_keepalive_ttl(env) == 0.0
+    assert "Ignoring invalid AGILAB_DASK_KEEPALIVE_TTL" in caplog.text
+
+
+def test_claim_reuses_matching_cluster_and_shuts_down_a_stale_one():
+    shutdowns = []
+    warm = _warm(shutdowns=shutdowns)
+    warm_cluster_support.park(warm, ttl=60)
+
+    assert warm_cluster_support.claim("key", expected_workers=2) is warm
+    assert warm.runs == 1
+    assert warm_cluster_support.parked() is None
+
+    warm_cluster_support.park(warm, ttl=60)
+    assert warm_cluster_support.claim("other-app", expected_workers=2) is None
+    assert shutdowns == [warm]
+
+    lost = _warm(shutdowns=shutdowns)
+    warm_cluster_support.park(lost, ttl=60)
+    lost.client.workers.popitem()
+    assert warm_cluster_support.claim("key", expected_workers=2) is None
+    assert shutdowns == [warm, lost]
+
+
+def test_parked_cluster_is_shut_down_after_idle_ttl():
+    shutdowns = []
+    warm = _warm(shutdowns=shutdowns)
+    warm_cluster_support.park(warm, ttl=0.05)
+
+    deadline = time.monotonic() + 5
+    while not shutdowns and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert shutdowns == [warm]
+    assert warm_cluster_support.parked() is None
+
+
+def test_cluster_key_is_disabled_for_remote_workers_and_changes_with_app_sources(tmp_path, monkeypatch):
+    source = tmp_path / "app" / "src" / "demo_worker.py"
+    source.parent.mkdir(parents=True)
+    source.write_text("VALUE = 1\n", encoding="utf-8")
+    env = SimpleNamespace(
+        envars={warm_cluster_support.DASK_KEEPALIVE_TTL_ENV: "60"},
+        is_local=lambda ip: ip == "127.0.0.1",
+        active_app=tmp_path / "app",
+        wenv_abs=tmp_path / "wenv",
+        app="demo",
+    )
+    monkeypatch.setattr(AGI, "env", env)
+    monkeypatch.setattr(AGI, "_workers", {"127.0.0.1": 2})
+    monkeypatch.setattr(AGI, "_mode", AGI.DASK_MODE)
+    monkeypatch.setattr(AGI, "_mode_auto", False)
+
+    key = warm_cluster_support.cluster_key(AGI, None)
+    assert key is not None and warm_cluster_support.cluster_key(AGI, None) == key
+
+    source.write_text("VALUE = 22\n", encoding="utf-8")
+    assert warm_cluster_support.cluster_key(AGI, None) != key
+
+    monkeypatch.setattr(AGI, "_workers", {"10.0.0.2": 2})
+    assert warm_cluster_support.cluster_key(AGI, None) is None
+
+
+@pytest.mark.asyncio
+async def test_main_keeps_cluster_warm_and_reports_saved_start_time(monkeypatch):
+    class _Jobs:
+        owned = []
+        running = []
+
+        def flush(self):
+            return None
+
+    calls = []
+    clock = iter(float(tick) for tick in range(100))
+    client = _Client()
+
+    async def _fake_start(_scheduler):
+        calls.append("start")
+        AGI._dask_client = client
+        AGI._scheduler = "127.0.0.1:8786"
+        AGI._scheduler_ip = "127.0.0.1"
+        AGI._scheduler_port = 8786
+        return True
+
+    async def _fake_distribute():
+        calls.append("distribute")
+        return "ok"
+
+    async def _fake_stop():
+        calls.append("stop")
+
+    env = SimpleNamespace(
+        envars={warm_cluster_support.DASK_KEEPALIVE_TTL_ENV: "60"},
+        is_local=lambda _ip: True,
+        active_app=None,
+        wenv_abs=None,
+        app="demo",
+    )
+    monkeypatch.setattr(AGI, "env", env)
+    monkeypatch.setattr(AGI, "_workers", {"127.0.0.1": 2})
+    monkeypatch.setattr(AGI, "_mode", AGI.DASK_MODE)
+    monkeypatch.setattr(AGI, "_mode_auto", False)
+    monkeypatch.setattr(AGI, "_dask_client", None)
+    monkeypatch.setattr(AGI, "_jobs", None)
+    monkeypatch.setattr(AGI, "_warm_cluster", None)
+    monkeypatch.setattr(AGI, "_phase_timings", [], raising=False)
+    monkeypatch.setattr(AGI, "_start", staticmethod(_fake_start))
+    monkeypatch.setattr(AGI, "_distribute", staticmethod(_fake_distribute))
+    monkeypatch.setattr(AGI, "_stop", staticmethod(_fake_stop))
+    monkeypatch.setattr(AGI, "_update_capacity", staticmethod(lambda: None))
+    monkeypatch.setattr(AGI, "_clean_job", staticmethod(lambda _cond: None))
+    monkeypatch.setattr(
+        runtime_distribution_support,
+        "_shutdown_warm_cluster",
+        lambda _warm: calls.append("shutdown"),
+    )
+
+    for _ in range(2):
+        assert await runtime_distribution_support.main(
+            AGI,
+            None,
+            background_job_manager_factory=_Jobs,
+            time_fn=lambda: next(clock),
+        ) == "ok"
+
+    assert calls == ["start", "distribute", "distribute"]
+    start_timings = [entry for entry in AGI._phase_timings if entry["phase"] == "start-dask"]
+    assert start_timings == [{"phase": "start-dask", "seconds": 0.0, "reused": True, "saved_seconds": 1.0}]
+    assert {"phase": "stop-dask", "seconds": 0.0, "kept_warm": True} in AGI._phase_timings
+    assert AGI._dask_client is None and AGI._warm_cluster is None
+    assert warm_cluster_support.parked().client is client
+
+    monkeypatch.setattr(AGI, "_mode", AGI.DASK_MODE | AGI.RAPIDS_MODE)
+    await runtime_distribution_support.main(
+        AGI,
+        None,
+        background_job_manager_factory=_Jobs,
+        time_fn=lambda: next(clock),
+    )
+    # A different run mode cannot reuse the parked cluster.
+    assert calls[3:5] == ["shutdown", "start"]
+
+
+@pytest.mark.asyncio
+async def test_distribute_reuses_initialized_workers_of_a_warm_cluster(monkeypatch):
+    client = _Client()
+    calibrations = []
+
+    class _Dispatcher:
+        @staticmethod
+        async def _do_distrib(_env, workers, _args, *, capacities=None):
+            return workers, [], []
+
+    class _Worker:
+        @staticmethod
+        def _new(**_kwargs):
+            return None
+
+        @staticmethod
+        def _do_works(*_args, **_kwargs):
+            return None
+
+    async def _fake_calibration():
+        calibrations.append(True)
+        AGI._capacity = {"127.0.0.1:9000": 1.0, "127.0.0.1:9001": 2.0}
+
+    monkeypatch.setattr(
+        AGI,
+        "env",
+        SimpleNamespace(debug=False, app="demo", target="demo", envars={}, mode2str=lambda mode: f"mode={mode}"),
+    )
+    monkeypatch.setattr(AGI, "_dask_client", client)
+    monkeypatch.setattr(AGI, "_dask_workers", None)
+    monkeypatch.setattr(AGI, "_workers", {"127.0.0.1": 2})
+    monkeypatch.setattr(AGI, "_args", {})
+    monkeypatch.setattr(AGI, "_worker_args", {"data_in": "in"})
+    monkeypatch.setattr(AGI, "_mode", AGI.DASK_MODE)
+    monkeypatch.setattr(AGI, "verbose", 0)
+    monkeypatch.setattr(AGI, "_capacity", None)
+    monkeypatch.setattr(AGI, "_phase_timings", [], raising=False)
+    monkeypatch.setattr(AGI, "_calibration", staticmethod(_fake_calibration))
+    monkeypatch.setattr(AGI, "_scale_cluster", staticmethod(lambda: None))
+    warm = _warm(client=client)
+    monkeypatch.setattr(AGI, "_warm_cluster", warm)
+    ticks = iter(float(tick) for tick in range(100))
+
+    async def _distribute():
+        await runtime_distribution_support.distribute(
+            AGI,
+            work_dispatcher_cls=_Dispatcher,
+            base_worker_cls=_Worker,
+            time_fn=lambda: next(ticks),
+        )
+
+    await _distribute()
+    assert client.submitted.count("_new") == 2 and len(calibrations) == 1
+    assert warm.worker_init_key is not None and warm.worker_init_seconds == 1.0
+
+    AGI._capacity = None
+    await _distribute()
+    assert client.submitted.count("_new") == 2 and len(calibrations) == 1
+    assert AGI._capacity == {"127.0.0.1:9000": 1.0, "127.0.0.1:9001": 2.0}
+    assert AGI._phase_timings[-1] == {
+        "phase": "worker-init",
+        "seconds": 0.0,
+        "reused": True,
+        "saved_seconds": 1.0,
+    }
+
+    AGI._worker_args = {"data_in": "other"}
+    await _distribute()
+    assert client.submitted.count("_new") == 4 and len(calibrations) == 2
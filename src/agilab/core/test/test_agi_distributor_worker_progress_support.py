@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from agi_cluster.agi_distributor import AGI
+from agi_cluster.agi_distributor.runtime import worker_progress_support
+from agi_cluster.agi_distributor.runtime.worker_progress_support import WorkerProgressMonitor
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _batch(worker, *, total, done, failed=0, status=None, messages=()):
+    message = {
+        "worker_id": 0,
+        "worker": worker,
+        "events": [{"kind": "log", "level": "INFO", "message": text} for text in messages],
+        "dropped": 0,
+        "progress": {"items_total": total, "items_done": done, "items_failed": failed},
+    }
+    if status is not None:
+        message["status"] = status
+    return (0.0, message)
+
+
+def test_monitor_tracks_rates_eta_and_flags_stragglers():
+    clock = _Clock()
+    monitor = WorkerProgressMonitor(["a", "b", "c"], time_fn=clock)
+    for worker in ("a", "b", "c"):
+        monitor.handle_event(_batch(worker, total=100, done=0))
+
+    clock.now += 10
+    monitor.handle_event(_batch("a", total=100, done=50, messages=["a-1", "a-2"]))
+    monitor.handle_event(_batch("b", total=100, done=40))
+    monitor.handle_event(_batch("c", total=100, done=5, messages=["c-1"]))
+
+    snapshot = monitor.snapshot()
+    rows = {row["worker"]: row for row in snapshot["workers"]}
+    assert rows["a"]["items_per_second"] == pytest.approx(5.0)
+    assert rows["a"]["eta_seconds"] == pytest.approx(10.0)
+    assert snapshot["stragglers"] == ["c"]
+    assert snapshot["items_done"] == 95 and snapshot["items_total"] == 300
+    assert [record["message"] for record in snapshot["logs"]] == ["a-1", "a-2", "c-1"]
+    assert [record["message"] for record in monitor.snapshot(since=2)["logs"]] == ["c-1"]
+
+    monitor.handle_event(_batch("c", total=100, done=100, status="done"))
+    assert monitor.snapshot()["stragglers"] == []
+    assert not monitor.all_reported()
+
+
+def test_monitor_bounds_log_buffer_and_counts_dropped_records():
+    monitor = WorkerProgressMonitor(["a"], max_log_records=2, time_fn=_Clock())
+    monitor.handle_event(_batch("a", total=1, done=0, messages=["1", "2", "3"]))
+    message = _batch("a", total=1, done=1, status="done")[1]
+    message["dropped"] = 4
+    monitor.handle_event((0.0, message))
+
+    snapshot = monitor.snapshot()
+    assert [record["message"] for record in snapshot["logs"]] == ["2", "3"]
+    assert snapshot["dropped_records"] == 5
+    assert monitor.all_reported()
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop_monitor_publish_a_snapshot_readable_by_other_processes(tmp_path, monkeypatch):
+    class _Client:
+        def __init__(self):
+            self.handlers = {}
+
+        def subscribe_topic(self, topic, handler):
+            self.handlers[topic] = handler
+
+        def unsubscribe_topic(self, topic):
+            self.handlers.pop(topic)
+
+    env = SimpleNamespace(wenv_abs=tmp_path)
+    monkeypatch.setattr(AGI, "env", env)
+    monkeypatch.setattr(AGI, "_worker_progress", None)
+    client = _Client()
+
+    monitor = worker_progress_support.start_monitor(AGI, client, ["a"])
+    assert AGI._worker_progress is monitor
+    client.handlers[worker_progress_support.WORKER_EVENT_TOPIC](
+        _batch("a", total=2, done=2, status="done", messages=["hello"])
+    )
+    await worker_progress_support.stop_monitor(client, monitor, status="done")
+
+    assert client.handlers == {}
+    payload = worker_progress_support.read_worker_progress(tmp_path / "worker_progress.json")
+    assert payload["status"] == "done" and payload["items_done"] == 2
+    assert AGI.worker_progress(env, since=0)["logs"][0]["message"] == "hello"
+    assert AGI.worker_progress(env, since=1)["logs"] == []
+    assert AGI.worker_progress()["status"] == "done"
+
+    assert worker_progress_support.start_monitor(AGI, object(), ["a"]) is None
@@ -1413,3 +1413,38 @@ def test_execute_worker_plan_logs_traceback_and_reraises_worker_bug(monkeypatch)
 
     assert logged == ["worker traceback"]
     assert detached == [(root_logger, handler)]
+
+
+def test_collect_worker_info_runs_hardware_benchmark_only_when_requested(tmp_path):
+    calls = []
+    kwargs = dict(
+        share_path=str(tmp_path),
+        worker="127.0.0.1:8787",
+        normalize_path_fn=str,
+        logger_obj=SimpleNamespace(info=lambda *_a: None, warning=lambda *_a: None),
+        psutil_module=SimpleNamespace(
+            virtual_memory=lambda: SimpleNamespace(total=8e9, available=4e9),
+            cpu_count=lambda: 4,
+            cpu_freq=lambda: None,
+        ),
+        tempfile_module=SimpleNamespace(gettempdir=lambda: str(tmp_path)),
+        os_module=os,
+        time_module=SimpleNamespace(perf_counter=itertools.count(1.0).__next__, time=None, sleep=None),
+        hardware_benchmark_fn=lambda path, worker: calls.append((path, worker)) or {"cpu_gflops": 1.0},
+    )
+
+    assert "hardware" not in execution_support.collect_worker_info(**kwargs)
+    info = execution_support.collect_worker_info(hardware_benchmark=True, **kwargs)
+
+    assert info["hardware"] == {"cpu_gflops": 1.0}
+    assert calls == [(str(tmp_path), "127.0.0.1:8787")]
+
+
+def test_hardware_benchmark_measures_positive_throughput_and_cleans_up(tmp_path):
+    from agi_node.agi_dispatcher import hardware_benchmark_support
+
+    result = hardware_benchmark_support.run_hardware_benchmark(tmp_path, worker="127.0.0.1:8787")
+
+    for metric in ("cpu_gflops", "memory_gbps", "disk_write_mbps", "disk_read_mbps"):
+        assert result[metric] > 0
+    assert list(tmp_path.iterdir()) == []
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 import threading
 import time
 from collections.abc import Callable
@@ -13,6 +14,7 @@ import pytest
 from agi_node.agi_dispatcher import BaseWorker
 from agi_node.agi_dispatcher import base_worker as base_worker_mod
 from agi_node.agi_dispatcher import base_worker_service_support as service_support
+from agi_node.agi_dispatcher import service_queue_wakeup_support
 
 SERVICE_TASK_SCHEMA = "agi.service.task.v1"
 
@@ -104,6 +106,78 @@ def test_make_heartbeat_writer_persists_payload(tmp_path):
     )
 
 
+def test_make_heartbeat_writer_coalesces_writes_and_publishes(tmp_path):
+    queue_root = tmp_path / "queue"
+    clock = SimpleNamespace(now=100.0)
+    published: list[dict] = []
+    replaced: list[Path] = []
+
+    def _replace(src, dst):
+        replaced.append(Path(dst))
+        os.replace(src, dst)
+
+    write_heartbeat = service_support.make_heartbeat_writer(
+        queue_root,
+        worker_id=1,
+        worker_name="worker-1",
+        logger_obj=SimpleNamespace(debug=lambda *_args, **_kwargs: None),
+        os_module=SimpleNamespace(replace=_replace),
+        time_module=SimpleNamespace(time=lambda: clock.now),
+        min_interval=2.0,
+        publish_fn=published.append,
+    )
+    write_heartbeat("running")
+    for _ in range(5):
+        clock.now += 0.3
+        write_heartbeat("running")
+    assert len(replaced) == 1
+
+    clock.now += 0.6
+    write_heartbeat("running")
+    clock.now += 0.1
+    write_heartbeat("stopped")
+
+    assert len(replaced) == 3
+    assert [payload["state"] for payload in published] == ["running", "running", "stopped"]
+    heartbeat = json.loads(replaced[-1].read_text(encoding="utf-8"))
+    assert heartbeat == published[-1]
+    assert heartbeat["timestamp"] == pytest.approx(102.2)
+
+
+def test_make_heartbeat_writer_writes_state_changes_inside_interval(tmp_path):
+    clock = SimpleNamespace(now=100.0)
+    published: list[dict] = []
+    write_heartbeat = service_support.make_heartbeat_writer(
+        tmp_path / "queue",
+        worker_id=1,
+        worker_name="worker-1",
+        logger_obj=SimpleNamespace(debug=lambda *_args, **_kwargs: None),
+        time_module=SimpleNamespace(time=lambda: clock.now),
+        min_interval=5.0,
+        publish_fn=published.append,
+    )
+    for state in ("running", "processing", "processing", "running", "error"):
+        clock.now += 0.1
+        write_heartbeat(state)
+
+    assert [payload["state"] for payload in published] == ["running", "processing", "running", "error"]
+    heartbeat_file = next((tmp_path / "queue" / "heartbeats").glob("*.json"))
+    assert json.loads(heartbeat_file.read_text(encoding="utf-8"))["state"] == "error"
+
+
+def test_resolve_service_heartbeat_interval_prefers_worker_args(monkeypatch):
+    monkeypatch.setenv(service_support.SERVICE_HEARTBEAT_INTERVAL_ENV, "3")
+    assert service_support.resolve_service_heartbeat_interval(
+        {service_support.SERVICE_HEARTBEAT_INTERVAL_ARG: 1.5}
+    ) == 1.5
+    assert service_support.resolve_service_heartbeat_interval(SimpleNamespace()) == 3.0
+    monkeypatch.setenv(service_support.SERVICE_HEARTBEAT_INTERVAL_ENV, "-1")
+    assert (
+        service_support.resolve_service_heartbeat_interval({})
+        == service_support.DEFAULT_SERVICE_HEARTBEAT_INTERVAL
+    )
+
+
 def test_heartbeat_json_reader_retries_only_transient_permission_errors(tmp_path):
     heartbeat_file = tmp_path / "heartbeat.json"
     heartbeat_file.write_text('{"state": "processing"}', encoding="utf-8")
@@ -623,6 +697,242 @@ def test_service_loop_skips_tasks_for_other_workers(tmp_path):
     assert payload_out.get("processed") == 0
 
 
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify wakeups are Linux-only")
+def test_service_loop_wakes_on_task_queued_in_its_directory(tmp_path):
+    worker = DummyWorker()
+    BaseWorker._worker_id = 0
+    BaseWorker._worker = "tcp://127.0.0.1:8787"
+    worker.args = SimpleNamespace(_agi_service_queue_dir=str(tmp_path / "service_queue"))
+    queue_root = Path(worker.args._agi_service_queue_dir)
+    own_dir = queue_root / "pending" / "tcp-127.0.0.1-8787"
+    other_dir = queue_root / "pending" / "tcp-10.0.0.9-8787"
+    other_dir.mkdir(parents=True)
+    other_task = other_dir / "000001-other.task.json"
+    _write_task(other_task, {"worker": "tcp://10.0.0.9:8787", "plan": [], "metadata": []})
+
+    result: dict[str, object] = {}
+    thread = threading.Thread(
+        target=lambda: result.update(payload=BaseWorker.loop(poll_interval=30.0)),
+        daemon=True,
+    )
+    thread.start()
+    deadline = time.time() + 2.0
+    while time.time() < deadline and not (queue_root / "heartbeats").exists():
+        time.sleep(0.01)
+    time.sleep(0.1)  # let the loop reach its idle wait
+
+    task_file = own_dir / "000002-mine.task.json"
+    tmp_file = own_dir / "000002-mine.task.json.tmp"
+    _write_task(tmp_file, {"worker": "tcp://127.0.0.1:8787", "plan": [], "metadata": []})
+    submitted_at = time.time()
+    os.replace(tmp_file, task_file)
+
+    done_file = queue_root / "done" / task_file.name
+    while time.time() < submitted_at + 5.0 and not done_file.exists():
+        time.sleep(0.005)
+
+    assert done_file.exists()
+    # Woken by the rename, not by the 30 s rescan.
+    assert time.time() - submitted_at < 5.0
+    assert other_task.exists()
+
+    assert BaseWorker.break_loop() is True
+    thread.join(timeout=2)
+    assert not thread.is_alive(), "Service loop did not stop after break_loop"
+    assert result["payload"]["processed"] == 1
+
+
+def test_service_loop_claims_a_batch_and_publishes_each_task(tmp_path):
+    queue_root = tmp_path / "queue"
+    own_dir = queue_root / "pending" / "worker-1"
+    own_dir.mkdir(parents=True)
+    task_files = [own_dir / f"00000{index}-batch.task.json" for index in range(1, 4)]
+    for index, task_file in enumerate(task_files):
+        _write_task(task_file, {"worker": "worker-1", "plan": [index], "metadata": []})
+    stop_event = threading.Event()
+    seen: list[tuple[object, int, int]] = []
+
+    def _do_works(plan, _metadata):
+        running = len(list((queue_root / "running").glob("*.task.json")))
+        done = len(list((queue_root / "done").glob("*.task.json")))
+        seen.append((plan, running, done))
+        if len(seen) == 3:
+            stop_event.set()
+        return [f"ran {plan}"]
+
+    result = service_support.run_service_queue(
+        stop_event=stop_event,
+        queue_root=queue_root,
+        worker_id=0,
+        worker_name="worker-1",
+        poll=0.01,
+        do_works_fn=_do_works,
+        write_heartbeat=lambda _state: None,
+        logger_obj=SimpleNamespace(
+            error=lambda *_args, **_kwargs: None,
+            exception=lambda *_args, **_kwargs: None,
+        ),
+        claim_batch=2,
+    )
+
+    assert result == {"status": "stopped", "processed": 3, "failed": 0}
+    # Two tasks claimed by the first scan; each published before the next runs.
+    assert seen == [([0], 2, 0), ([1], 1, 1), ([2], 1, 2)]
+    for task_file in task_files:
+        terminal = json.loads((queue_root / "done" / task_file.name).read_text(encoding="utf-8"))
+        assert terminal["status"] == "done"
+        assert terminal["started_at"] >= terminal["claim"]["claimed_at"]
+
+
+def test_service_loop_returns_unstarted_claims_when_stopped(tmp_path):
+    queue_root = tmp_path / "queue"
+    own_dir = queue_root / "pending" / "worker-1"
+    own_dir.mkdir(parents=True)
+    task_files = [own_dir / f"00000{index}-batch.task.json" for index in range(1, 4)]
+    for task_file in task_files:
+        _write_task(task_file, {"worker": "worker-1", "plan": [], "metadata": []})
+    stop_event = threading.Event()
+
+    def _do_works(_plan, _metadata):
+        stop_event.set()
+        return []
+
+    result = service_support.run_service_queue(
+        stop_event=stop_event,
+        queue_root=queue_root,
+        worker_id=0,
+        worker_name="worker-1",
+        poll=0.01,
+        do_works_fn=_do_works,
+        write_heartbeat=lambda _state: None,
+        logger_obj=SimpleNamespace(
+            error=lambda *_args, **_kwargs: None,
+            exception=lambda *_args, **_kwargs: None,
+        ),
+        claim_batch=3,
+    )
+
+    assert result["processed"] == 1
+    assert (queue_root / "done" / task_files[0].name).exists()
+    assert [path.exists() for path in task_files] == [False, True, True]
+    assert list((queue_root / "running").glob("*.task.json")) == []
+
+
+def test_service_loop_claims_by_priority_then_deadline(tmp_path):
+    queue_root = tmp_path / "queue"
+    own_dir = queue_root / "pending" / "worker-1"
+    own_dir.mkdir(parents=True)
+    now = time.time()
+    tasks = {
+        "000001-bulk": {"priority": 0, "created_at": now},
+        "000002-late": {"priority": 5, "deadline": now + 60, "created_at": now},
+        "000003-soon": {"priority": 5, "deadline": now + 10, "created_at": now},
+        "000004-plain": {"created_at": now},
+    }
+    for name, fields in tasks.items():
+        _write_task(own_dir / f"{name}.task.json", {"worker": "worker-1", "plan": [name], **fields})
+    stop_event = threading.Event()
+    order: list[str] = []
+
+    def _do_works(plan, _metadata):
+        order.append(plan[0])
+        if len(order) == len(tasks):
+            stop_event.set()
+        return []
+
+    service_support.run_service_queue(
+        stop_event=stop_event,
+        queue_root=queue_root,
+        worker_id=0,
+        worker_name="worker-1",
+        poll=0.01,
+        do_works_fn=_do_works,
+        write_heartbeat=lambda _state: None,
+        logger_obj=SimpleNamespace(
+            error=lambda *_args, **_kwargs: None,
+            exception=lambda *_args, **_kwargs: None,
+        ),
+        claim_batch=1,
+    )
+
+    assert order == ["000003-soon", "000002-late", "000001-bulk", "000004-plain"]
+
+
+def test_service_loop_batch_claims_yield_to_newer_urgent_task(tmp_path):
+    queue_root = tmp_path / "queue"
+    own_dir = queue_root / "pending" / "worker-1"
+    own_dir.mkdir(parents=True)
+    now = time.time()
+    for name in ("000001-bulk", "000002-bulk"):
+        _write_task(own_dir / f"{name}.task.json", {"worker": "worker-1", "plan": [name], "created_at": now})
+    stop_event = threading.Event()
+    order: list[str] = []
+
+    def _do_works(plan, _metadata):
+        order.append(plan[0])
+        if plan[0] == "000001-bulk":
+            # Queued while the batch is running; it must not wait behind the
+            # bulk task this worker already claimed.
+            _write_task(
+                own_dir / "000003-urgent.task.json",
+                {"worker": "worker-1", "plan": ["000003-urgent"], "priority": 5, "created_at": now},
+            )
+        if len(order) == 3:
+            stop_event.set()
+        return []
+
+    result = service_support.run_service_queue(
+        stop_event=stop_event,
+        queue_root=queue_root,
+        worker_id=0,
+        worker_name="worker-1",
+        poll=0.01,
+        do_works_fn=_do_works,
+        write_heartbeat=lambda _state: None,
+        logger_obj=SimpleNamespace(
+            error=lambda *_args, **_kwargs: None,
+            exception=lambda *_args, **_kwargs: None,
+        ),
+        claim_batch=2,
+        priority_aging=0,
+    )
+
+    assert order == ["000001-bulk", "000003-urgent", "000002-bulk"]
+    assert result == {"status": "stopped", "processed": 3, "failed": 0}
+    assert list((queue_root / "running").glob("*.task.json")) == []
+
+
+def test_service_task_rank_ages_waiting_tasks():
+    fresh_urgent = {"priority": 2, "created_at": 1000.0}
+    old_bulk = {"priority": 0, "created_at": 1000.0 - 95.0}
+    rank = service_support.service_task_rank
+
+    assert rank(fresh_urgent, now=1000.0, aging_seconds=0) < rank(old_bulk, now=1000.0, aging_seconds=0)
+    # 95 s of waiting is worth three levels with 30 s aging.
+    assert rank(old_bulk, now=1000.0, aging_seconds=30.0) < rank(fresh_urgent, now=1000.0, aging_seconds=30.0)
+    assert rank({"deadline": "bad"}, now=0.0, aging_seconds=30.0) == (0.0, float("inf"))
+
+
+def test_resolve_service_claim_batch_sources(monkeypatch):
+    monkeypatch.delenv("AGILAB_SERVICE_CLAIM_BATCH", raising=False)
+    assert service_support.resolve_service_claim_batch(None) == service_support.DEFAULT_SERVICE_CLAIM_BATCH == 1
+    monkeypatch.setenv("AGILAB_SERVICE_CLAIM_BATCH", "8")
+    assert service_support.resolve_service_claim_batch(SimpleNamespace()) == 8
+    assert service_support.resolve_service_claim_batch({"service_claim_batch": 2}) == 2
+    monkeypatch.setenv("AGILAB_SERVICE_CLAIM_BATCH", "zero")
+    assert service_support.resolve_service_claim_batch(None) == service_support.DEFAULT_SERVICE_CLAIM_BATCH
+
+
+def test_service_queue_waiter_polls_when_notifications_are_disabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("AGILAB_SERVICE_QUEUE_NOTIFY", "0")
+    stop_event = threading.Event()
+    waiter = service_queue_wakeup_support.ServiceQueueWaiter(stop_event, [tmp_path])
+    assert waiter.backend == "poll"
+    stop_event.set()
+    assert waiter.wait(5.0) is False
+    waiter.close()
+
+
 def test_service_loop_swallow_heartbeat_write_failure(monkeypatch, tmp_path):
     class LoopWorker(BaseWorker):
         def __init__(self):
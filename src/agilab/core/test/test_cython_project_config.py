@@ -21,6 +21,12 @@ import agi_cluster.agi_distributor.deployment_build_support as deployment_build_
 from agi_node.agi_dispatcher import build as build_mod
 
 
+@pytest.fixture(autouse=True)
+def _scp_artifact_transfer(monkeypatch):
+    # These fakes only implement send_files; SFTP delta sync has its own tests.
+    monkeypatch.setenv("AGILAB_DELTA_DEPLOY", "0")
+
+
 REPO_ROOT = Path(__file__).resolve().parents[4]
 INSTALLER_PATH = REPO_ROOT / "src" / "agilab" / "apps" / "install.py"
 
@@ -298,3 +298,103 @@ def test_exec_multi_process_future_exception_is_logged_and_raised(caplog):
             w._exec_multi_process(workers_tree, workers_tree_info)
 
     assert any("generated an exception" in record.message for record in caplog.records)
+
+
+# -------------------- Ready-queue scheduling tests --------------------
+
+class InlineExecutor:
+    """Synchronous executor: stages run at submit time, in submission order."""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def weighted_branch(pname, entries):
+    tree, info = [], []
+    for fn, deps, weight in entries:
+        tree.append((make_fn(fn), deps))
+        info.append((pname, weight))
+    return tree, info
+
+
+def test_ready_queue_starts_critical_path_first(monkeypatch):
+    monkeypatch.setattr(dag_module, "ThreadPoolExecutor", InlineExecutor)
+    # "b" heads a chain worth 1 + 5, so it outranks the lone root "a".
+    tree, info = weighted_branch("P0", [("a", [], 1), ("b", [], 1), ("c", ["b"], 5)])
+
+    w = _cfg(DummyDagWorker(), 0, 0, 0)
+    w.works([tree], [info])
+
+    assert w.execution_order == ["b", "a", "c"]
+
+
+def test_stage_priorities_use_weights_and_tolerate_bad_values():
+    topo = ["a", "b", "c"]
+    local_deps = {"a": [], "b": ["a"], "c": ["a"]}
+    dependents = {"a": ["b", "c"], "b": [], "c": []}
+    info = {
+        "a": {"weight": 2},
+        "b": {"weight": "heavy"},
+        "c": {"weight": 4.5},
+    }
+
+    rank = DagWorker._stage_priorities(topo, local_deps, dependents, info)
+
+    assert rank == {"a": 6.5, "b": 1.0, "c": 4.5}
+
+
+def test_blocked_stages_do_not_hold_pool_slots():
+    # Two workers, a slow root and four stages that wait on it: with the old
+    # submit-everything scheduler the dependents occupied both slots while the
+    # independent "free" stage waited behind them.
+    started = {}
+
+    class TimedWorker(DummyDagWorker):
+        def get_work(self, fn_name, args, pipeline_result):
+            started[fn_name] = time.perf_counter()
+            if fn_name == "root":
+                time.sleep(0.2)
+            return super().get_work(fn_name, args, pipeline_result)
+
+    entries = [("root", [])] + [(f"dep{i}", ["root"]) for i in range(4)] + [("free", [])]
+    tree, info = branch("P0", entries)
+    w = _cfg(TimedWorker(), 0, 0, 0)
+    w.works([tree], [info])
+
+    assert started["free"] < started["root"] + 0.1
+    assert all(started[f"dep{i}"] >= started["root"] + 0.2 for i in range(4))
+
+
+def test_failed_stage_skips_dependents_but_runs_independent_branches(caplog):
+    class PartlyFailingWorker(DummyDagWorker):
+        def get_work(self, fn_name, args, pipeline_result):
+            if fn_name == "bad":
+                raise RuntimeError("bad stage")
+            return super().get_work(fn_name, args, pipeline_result)
+
+    tree, info = branch("P0", [("bad", []), ("after_bad", ["bad"]), ("ok", []), ("after_ok", ["ok"])])
+    w = _cfg(PartlyFailingWorker(), 0, 0, 0)
+
+    with caplog.at_level("ERROR"):
+        with pytest.raises(RuntimeError, match="bad stage"):
+            w._exec_multi_process([tree], [info])
+
+    assert "after_bad" not in w.execution_order
+    assert w.execution_order.index("ok") < w.execution_order.index("after_ok")
+    assert any("skipped: dependency bad failed" in record.message for record in caplog.records)
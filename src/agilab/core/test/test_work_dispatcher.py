@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import datetime
+import os
 import time
 from pathlib import Path
 from types import SimpleNamespace
@@ -11,11 +12,14 @@ import pytest
 import numpy as np
 
 import agi_node.agi_dispatcher.agi_dispatcher as dispatcher_module
+import agi_node.agi_dispatcher.distribution_cache_support as cache_support
+import agi_node.agi_dispatcher.partition_support as partition_support
 import agi_env.runtime.atomic_write_support as atomic_write_support
 from agi_node.agi_dispatcher import WorkDispatcher
 from agi_node.agi_dispatcher.agi_dispatcher import RUN_STAGES_KEY
 from agi_node.agi_dispatcher.distribution_cache_support import (
     DISTRIBUTION_CACHE_SCHEMA,
+    FingerprintIndex,
     build_cache_context,
 )
 
@@ -86,6 +90,67 @@ def test_distribution_cache_declared_inputs_can_replace_inferred_paths(tmp_path)
     assert unrelated_output.as_posix() not in json.dumps(context)
 
 
+def test_fingerprint_index_reuses_unchanged_digests_across_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_support, "_RACY_WINDOW_NS", 0)
+    data_in = tmp_path / "data"
+    data_in.mkdir()
+    for name in ("a.csv", "b.csv", "c.csv"):
+        (data_in / name).write_text(f"{name}\n", encoding="utf-8")
+    target = SimpleNamespace(
+        args=SimpleNamespace(data_in=data_in),
+        build_distribution=lambda _workers: None,
+    )
+    index_path = tmp_path / "plan.fingerprints.json"
+
+    unindexed = build_cache_context(target, capacities=None)
+    first_index = FingerprintIndex.load(index_path)
+    first = build_cache_context(target, capacities=None, fingerprint_index=first_index)
+    first_index.save()
+    second_index = FingerprintIndex.load(index_path)
+    second = build_cache_context(target, capacities=None, fingerprint_index=second_index)
+
+    assert first == second == unindexed
+    assert (first_index.hits, first_index.misses) == (0, 3)
+    assert (second_index.hits, second_index.misses) == (3, 0)
+
+    (data_in / "b.csv").write_text("changed and longer\n", encoding="utf-8")
+    third_index = FingerprintIndex.load(index_path)
+    third = build_cache_context(target, capacities=None, fingerprint_index=third_index)
+
+    assert third["inputs"]["digest_sha256"] != first["inputs"]["digest_sha256"]
+    assert (third_index.hits, third_index.misses) == (2, 1)
+
+
+def test_fingerprint_index_rehashes_racily_clean_same_size_rewrites(tmp_path):
+    source = tmp_path / "input.txt"
+    source.write_text("alpha", encoding="utf-8")
+    target = SimpleNamespace(
+        args=SimpleNamespace(input_file=source),
+        build_distribution=lambda _workers: None,
+    )
+    index = FingerprintIndex(tmp_path / "index.json")
+    first = build_cache_context(target, capacities=None, fingerprint_index=index)
+    original = source.stat()
+
+    source.write_text("ALPHA", encoding="utf-8")
+    os.utime(source, ns=(original.st_atime_ns, original.st_mtime_ns))
+    second = build_cache_context(target, capacities=None, fingerprint_index=index)
+
+    assert index.hits == 0
+    assert second["digest_sha256"] != first["digest_sha256"]
+
+
+def test_fingerprint_index_ignores_unreadable_or_foreign_payloads(tmp_path):
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{", encoding="utf-8")
+    foreign = tmp_path / "foreign.json"
+    foreign.write_text(json.dumps({"schema": "other", "entries": {"x": {}}}), encoding="utf-8")
+
+    assert FingerprintIndex.load(corrupt).stats() == {"hits": 0, "misses": 0, "entries": 0}
+    assert FingerprintIndex.load(foreign).stats()["entries"] == 0
+    assert FingerprintIndex.load(tmp_path / "missing.json").stats()["entries"] == 0
+
+
 def test_dispatcher_run_stage_contract_rejects_legacy_and_invalid_payloads():
     with pytest.raises(TypeError, match="Legacy dispatch key"):
         WorkDispatcher._split_dispatch_args({"_agilab_run_steps": []})
@@ -241,6 +306,8 @@ async def test_do_distrib_builds_and_caches_plan(tmp_path, monkeypatch):
 
     await WorkDispatcher._do_distrib(env, workers, args)
     assert DemoWorker.build_calls == 1  # cached, no rebuild
+    index = json.loads((tmp_path / "plan.fingerprints.json").read_text(encoding="utf-8"))
+    assert index["schema"] == cache_support.FINGERPRINT_INDEX_SCHEMA
 
 
 @pytest.mark.asyncio
@@ -822,9 +889,9 @@ def test_onerror_reraises_non_permission_issue(monkeypatch):
     assert caught.value is original
 
 
-def test_make_chunks_selects_optimal_or_fastest(monkeypatch):
+def test_make_chunks_selects_optimal_or_anytime(monkeypatch):
     monkeypatch.setattr(WorkDispatcher, "_make_chunks_optimal", lambda *_args, **_kwargs: [["optimal"]])
-    monkeypatch.setattr(WorkDispatcher, "_make_chunks_fastest", lambda *_args, **_kwargs: [["fastest"]])
+    monkeypatch.setattr(WorkDispatcher, "_make_chunks_anytime", lambda *_args, **_kwargs: [["anytime"]])
 
     small = [("a", 3), ("b", 1)]
     large = [("a", 3), ("b", 1), ("c", 2), ("d", 4)]
@@ -835,13 +902,13 @@ def test_make_chunks_selects_optimal_or_fastest(monkeypatch):
     ) == [["optimal"]]
     assert WorkDispatcher.make_chunks(
         len(large), large, workers={"127.0.0.1": 1}, threshold=3
-    ) == [["fastest"]]
+    ) == [["anytime"]]
 
     # Regression: an understated ``nchunk2`` must not force a large work list down
     # the exponential path. This previously selected ``_make_chunks_optimal``.
     assert WorkDispatcher.make_chunks(
         1, large, workers={"127.0.0.1": 1}, threshold=3
-    ) == [["fastest"]]
+    ) == [["anytime"]]
 
 
 def test_make_chunks_understated_nchunk2_cannot_trigger_exponential_hang():
@@ -896,6 +963,100 @@ def test_make_chunks_fastest_uses_float_capacity_normalized_lpt():
     assert normalized_loads == pytest.approx([2.0, 2.0])
 
 
+def test_make_chunks_anytime_swaps_past_lpt_local_optimum():
+    weights = [("a", 3), ("b", 3), ("c", 2), ("d", 2), ("e", 2)]
+
+    lpt = WorkDispatcher._make_chunks_fastest(weights, [1.0, 1.0])
+    chunks = WorkDispatcher.make_chunks(len(weights), weights, workers={"127.0.0.1": 2}, threshold=2)
+
+    assert max(sum(weight for _name, weight in chunk) for chunk in lpt) == 7
+    assert sorted(sum(weight for _name, weight in chunk) for chunk in chunks) == [6, 6]
+    assert sorted(item for chunk in chunks for item in chunk) == sorted(weights)
+
+
+def test_make_chunks_anytime_balances_capacity_normalized_loads():
+    weights = [(f"job-{index}", float((index * 7) % 13 + 1)) for index in range(40)]
+    capacities = [1.0, 2.0, 0.5]
+
+    chunks = WorkDispatcher._make_chunks_anytime(weights, capacities, time_budget=1.0)
+
+    loads = [
+        sum(weight for _name, weight in chunk) / capacity
+        for chunk, capacity in zip(chunks, capacities)
+    ]
+    total = sum(weight for _name, weight in weights)
+    assert max(loads) <= total / sum(capacities) + 13 / 0.5
+    assert max(loads) <= max(
+        sum(weight for _name, weight in chunk) / capacity
+        for chunk, capacity in zip(WorkDispatcher._make_chunks_fastest(weights, capacities), capacities)
+    )
+    assert sorted(item for chunk in chunks for item in chunk) == sorted(weights)
+    for chunk in chunks:
+        assert [weight for _name, weight in chunk] == sorted((weight for _name, weight in chunk), reverse=True)
+
+
+def test_make_chunks_anytime_is_deterministic_without_budget(monkeypatch):
+    monkeypatch.delenv(partition_support.PARTITION_TIME_BUDGET_ENV, raising=False)
+    weights = [(f"job-{index}", float((index * 37) % 101 + 1)) for index in range(300)]
+    capacities = np.array([1.0, 1.0, 1.0, 1.0])
+    expected = partition_support.anytime_partition(weights, capacities)
+
+    # A clock that leaps an hour per reading would exhaust any wall-clock budget.
+    ticks = iter(range(0, 10**9, 3600))
+    monkeypatch.setattr(partition_support.time, "perf_counter", lambda: float(next(ticks)))
+
+    assert partition_support.anytime_partition(weights, capacities) == expected
+    capped = partition_support.anytime_partition(weights, capacities, max_steps=0)
+    assert sorted(item for chunk in capped for item in chunk) == sorted(weights)
+
+
+@pytest.mark.parametrize("capacities", [[1.0, 2.0, 0.5, 1.5], [1.0] * 8])
+def test_anytime_partition_stays_near_lpt_cost_on_large_plans(monkeypatch, capacities):
+    monkeypatch.delenv(partition_support.PARTITION_TIME_BUDGET_ENV, raising=False)
+    rng = np.random.default_rng(0)
+    weights = [(f"job-{index}", float(size)) for index, size in enumerate(rng.integers(1, 10**6, 100_000))]
+    capacities = np.array(capacities)
+
+    started = time.perf_counter()
+    partition_support.lpt_assignment([size for _name, size in weights], capacities)
+    lpt_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    chunks = partition_support.anytime_partition(weights, capacities)
+    anytime_seconds = time.perf_counter() - started
+
+    # LPT is already within the gap tolerance here, so refinement is skipped.
+    assert anytime_seconds < 3 * lpt_seconds + 1.0
+    bound = partition_support.makespan_lower_bound([size for _name, size in weights], capacities)
+    makespan = max(sum(size for _name, size in chunk) / cap for chunk, cap in zip(chunks, capacities))
+    assert makespan <= bound * (1 + partition_support.PARTITION_GAP_TOLERANCE)
+
+
+def test_make_chunks_anytime_budget_falls_back_on_invalid_env(monkeypatch, caplog):
+    monkeypatch.setenv(partition_support.PARTITION_TIME_BUDGET_ENV, "soon")
+
+    assert partition_support.resolve_time_budget() == partition_support.DEFAULT_PARTITION_TIME_BUDGET
+    assert "Ignoring invalid partition time budget" in caplog.text
+    assert partition_support.resolve_time_budget(0) == 0.0
+
+    monkeypatch.setenv(partition_support.PARTITION_TIME_BUDGET_ENV, "2.5")
+    assert partition_support.resolve_time_budget() == 2.5
+
+
+def test_karmarkar_karp_assignment_beats_lpt_on_equal_capacities():
+    weights = [8.0, 7.0, 6.0, 5.0, 4.0]
+    capacities = np.array([1.0, 1.0])
+
+    lpt = partition_support.lpt_assignment(weights, capacities)
+    differencing = partition_support.karmarkar_karp_assignment(weights, capacities)
+
+    def _makespan(assignment):
+        return max(sum(w for w, worker in zip(weights, assignment) if worker == slot) for slot in (0, 1))
+
+    assert _makespan(lpt) == 17
+    assert _makespan(differencing) == 16
+    assert partition_support.karmarkar_karp_assignment(weights, capacities, deadline=0.0) is None
+
+
 def test_make_chunks_fastest_does_not_mutate_caller_subsets():
     # Regression: the LPT scheduler used to sort the caller-supplied ``subsets``
     # list in place, mutating shared caller state.
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import threading
+from types import SimpleNamespace
+
+from agi_node.agi_dispatcher import worker_event_support
+from agi_node.agi_dispatcher.worker_event_support import LogTail, WorkerEventStream
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("demo", level, __file__, 1, message, None, None)
+
+
+def test_stream_batches_until_the_flush_interval_and_coalesces_progress():
+    published = []
+    clock = _Clock()
+    stream = WorkerEventStream(
+        published.append,
+        worker_id=1,
+        worker="127.0.0.1:9001",
+        flush_interval=1.0,
+        time_fn=clock,
+    )
+
+    stream.plan(10)
+    stream.log(_record("first"), "first")
+    stream.items(3)
+    assert published == []
+
+    clock.now = 1.5
+    stream.items(1, failed=1)
+    assert len(published) == 1
+    batch = published[0]
+    assert batch["worker"] == "127.0.0.1:9001" and batch["worker_id"] == 1
+    assert [event["message"] for event in batch["events"]] == ["first"]
+    assert batch["progress"] == {"items_total": 10, "items_done": 4, "items_failed": 1}
+    assert "status" not in batch
+
+    stream.flush(status="done")
+    assert published[-1]["events"] == [] and published[-1]["status"] == "done"
+
+
+def test_stream_flusher_publishes_buffered_records_without_new_events():
+    published = []
+    arrived = threading.Event()
+
+    def _publish(message):
+        published.append(message)
+        arrived.set()
+
+    stream = WorkerEventStream(_publish, worker_id=0, worker="w", flush_interval=0.05)
+    stream.start_flusher()
+    try:
+        # Logged right before a long work item: nothing else will trigger a flush.
+        stream.log(_record("before slow item"), "before slow item")
+        assert arrived.wait(5.0)
+    finally:
+        stream.stop_flusher()
+
+    assert [event["message"] for event in published[0]["events"]] == ["before slow item"]
+    assert not any(thread.name == "agi-worker-events-0" for thread in threading.enumerate())
+
+
+def test_stream_drops_oldest_log_records_when_the_buffer_is_full():
+    published = []
+    stream = WorkerEventStream(
+        published.append,
+        worker_id=0,
+        worker="w",
+        max_buffered=2,
+        flush_interval=60.0,
+        time_fn=_Clock(),
+    )
+    for index in range(5):
+        stream.log(_record(str(index)), str(index))
+    stream.flush()
+
+    assert [event["message"] for event in published[0]["events"]] == ["3", "4"]
+    assert published[0]["dropped"] == 3
+
+
+def test_log_tail_keeps_last_records_and_notes_streamed_ones():
+    tail = LogTail(max_records=2)
+    for line in ("a\n", "b\n", "c\n"):
+        tail.write(line)
+
+    assert tail.getvalue() == (
+        "... 1 earlier log record(s) were streamed to the manager ...\nb\nc\n"
+    )
+    assert LogTail().getvalue() == ""
+
+
+def test_worker_event_stream_reports_status_and_progress_helpers(monkeypatch):
+    published = []
+    monkeypatch.delenv(worker_event_support.WORKER_EVENTS_ENV, raising=False)
+
+    with worker_event_support.worker_event_stream(
+        worker_id=0,
+        worker="w",
+        publisher_factory=lambda: published.append,
+    ) as stream:
+        assert stream is not None
+        worker_event_support.plan_items(2)
+        worker_event_support.items_done()
+
+    assert published[-1]["status"] == "done"
+    assert published[-1]["progress"]["items_done"] == 1
+    # Outside a stream the helpers are no-ops.
+    worker_event_support.items_done()
+
+    try:
+        with worker_event_support.worker_event_stream(
+            worker_id=0,
+            worker="w",
+            publisher_factory=lambda: published.append,
+        ):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert published[-1]["status"] == "failed"
+
+    monkeypatch.setenv(worker_event_support.WORKER_EVENTS_ENV, "off")
+    with worker_event_support.worker_event_stream(
+        worker_id=0,
+        worker="w",
+        publisher_factory=lambda: published.append,
+    ) as stream:
+        assert stream is None
+
+
+def test_worker_event_stream_is_disabled_outside_a_dask_worker(monkeypatch):
+    monkeypatch.delenv(worker_event_support.WORKER_EVENTS_ENV, raising=False)
+    with worker_event_support.worker_event_stream(worker_id=0, worker="w") as stream:
+        assert stream is None
+
+
+def test_execute_worker_plan_streams_captured_records_and_detaches_handlers(monkeypatch):
+    from agi_node.agi_dispatcher import base_worker_execution_support as execution_support
+
+    monkeypatch.delenv(worker_event_support.WORKER_EVENTS_ENV, raising=False)
+    published = []
+    root = logging.Logger("agilab-test-root", logging.INFO)
+    worker_logger = logging.Logger("agilab-test-worker", logging.INFO)
+    worker_logger.parent = root
+
+    def _stream_factory(**kwargs):
+        return worker_event_support.worker_event_stream(
+            publisher_factory=lambda: published.append,
+            **kwargs,
+        )
+
+    try:
+        execution_support.execute_worker_plan(
+            workers_plan=[],
+            workers_plan_metadata=[],
+            worker_id=None,
+            worker_name="w",
+            insts={},
+            expand_chunk_fn=lambda payload, _worker_id: (payload, 0, 0),
+            logger_obj=worker_logger,
+            traceback_module=SimpleNamespace(format_exc=lambda: "trace"),
+            file_path=__file__,
+            root_logger=root,
+            event_stream_factory=_stream_factory,
+        )
+    except RuntimeError:
+        pass
+
+    messages = [event["message"] for batch in published for event in batch["events"]]
+    assert "this worker is not initialized" in messages
+    assert published[-1]["status"] == "failed"
+    assert root.handlers == []
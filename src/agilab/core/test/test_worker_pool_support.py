@@ -90,6 +90,7 @@ def _patch_pool(monkeypatch):
     RecordingPool.instances = []
     monkeypatch.setattr(pandas_module, "ProcessPoolExecutor", RecordingPool)
     yield
+    worker_pool_support._release_shared_results([])
 
 
 # --- mode dispatch -----------------------------------------------------
@@ -162,6 +163,51 @@ def test_pool_entry_is_module_level_and_instance_ships_via_initializer():
         assert all(isinstance(idx, int) for idx, _item in batch)
 
 
+def test_warm_pool_scope_reuses_executor_across_works_calls():
+    worker = EngineWorker(mode=1)
+    closed = []
+
+    class ClosingPool(RecordingPool):
+        def __exit__(self, exc_type, exc, tb):
+            closed.append(self)
+            return False
+
+    hooks = worker_pool_support.PoolFrameHooks(
+        family="PandasWorker",
+        executor_kind="process",
+        executor_factory=ClosingPool,
+        is_frame=lambda r: isinstance(r, pd.DataFrame),
+        is_empty=lambda df: df.empty,
+        concat_labeled=pandas_module._concat_labeled,
+        empty_frame=pd.DataFrame,
+    )
+    with worker_pool_support.warm_pool_scope():
+        worker_pool_support.exec_multi_process(worker, {0: [[1, 2]]}, None, hooks)
+        worker_pool_support.exec_multi_process(worker, {0: [[3, 4]]}, None, hooks)
+        assert len(RecordingPool.instances) == 1
+        assert closed == []
+        # Children hold the pool_vars they were initialised with.
+        worker.pool_vars = {"args": "changed"}
+        worker_pool_support.exec_multi_process(worker, {0: [[5, 6]]}, None, hooks)
+        assert len(RecordingPool.instances) == 2
+        assert closed == [RecordingPool.instances[0]]
+    assert closed == RecordingPool.instances
+    assert len(worker.last_dfs) == 3
+
+    worker_pool_support.exec_multi_process(worker, {0: [[7, 8]]}, None, hooks)
+    assert len(RecordingPool.instances) == 3
+    assert closed == RecordingPool.instances
+
+
+def test_warm_pool_survives_item_failures():
+    worker = FailingWorker(mode=1)
+    with worker_pool_support.warm_pool_scope():
+        with pytest.raises(RuntimeError, match="'boom'"):
+            worker._exec_multi_process({0: [["a", "boom"]]}, None)
+        worker._exec_multi_process({0: [["c"]]}, None)
+    assert len(RecordingPool.instances) == 1
+
+
 # --- result handling ----------------------------------------------------
 
 
@@ -298,11 +344,13 @@ def test_timed_out_chunk_raises_and_abandons_pool(monkeypatch):
         def shutdown(self, wait=True, cancel_futures=False):
             StuckPool.abandoned.append((wait, cancel_futures))
 
-    def _raise_timeout(futures, timeout=None):
+    def _raise_timeout(futures, timeout=None, **_kwargs):
         assert timeout is not None
         raise worker_pool_support.FuturesTimeoutError()
 
+    # The buffered path waits with as_completed, the memory-guarded one with wait.
     monkeypatch.setattr(worker_pool_support, "as_completed", _raise_timeout)
+    monkeypatch.setattr(worker_pool_support, "wait", _raise_timeout)
     worker = EngineWorker(mode=1)
     worker.args = {"output_format": "csv", "pool_item_timeout": 0.01}
     with pytest.raises(RuntimeError, match="per-item time"):
@@ -418,3 +466,439 @@ def test_resolve_executor_never_converts_thread_family_to_process(monkeypatch):
     )
     factory, kind = worker_pool_support.resolve_executor(hooks)
     assert factory is RecordingPool and kind == "thread"
+
+
+# --- shared result transport ----------------------------------------------
+
+
+class LargeFrameWorker(EngineWorker):
+    def _actual_work_pool(self, x):
+        # 20k float64 rows (160 KiB) clear the shared-transport size floor.
+        return pd.DataFrame({"col": [float(x)] * 20_000})
+
+
+def test_resolve_result_transport_sources_and_fallbacks(monkeypatch, caplog):
+    hooks = pandas_module._PANDAS_POOL_HOOKS
+    monkeypatch.delenv(worker_pool_support.POOL_RESULT_TRANSPORT_ENV, raising=False)
+    assert worker_pool_support.resolve_result_transport(hooks, "process", {}) == "pipe"
+    monkeypatch.setenv(worker_pool_support.POOL_RESULT_TRANSPORT_ENV, "mmap")
+    assert worker_pool_support.resolve_result_transport(hooks, "process", {}) == "mmap"
+    # args wins over env; invalid values are ignored with a warning.
+    assert (
+        worker_pool_support.resolve_result_transport(
+            hooks, "process", {"pool_result_transport": "SHM"}
+        )
+        == "shm"
+    )
+    with caplog.at_level(logging.WARNING):
+        assert (
+            worker_pool_support.resolve_result_transport(
+                hooks, "process", {"pool_result_transport": "rdma"}
+            )
+            == "mmap"
+        )
+    assert "invalid pool result transport" in caplog.text
+    # Thread pools and families without shared_results keep the pipe.
+    assert worker_pool_support.resolve_result_transport(hooks, "thread (forced by env)", {}) == "pipe"
+    assert worker_pool_support.resolve_result_transport(_pandas_hooks(RecordingPool), "process", {}) == "pipe"
+
+
+@pytest.mark.parametrize("transport", ["shm", "mmap"])
+def test_shared_transport_matches_pipe_results_and_cleans_up(transport, monkeypatch, tmp_path):
+    monkeypatch.setenv(worker_pool_support.POOL_RESULT_DIR_ENV, str(tmp_path))
+    pipe = LargeFrameWorker(mode=1)
+    pipe._exec_multi_process({0: [[1, 2], [3]]}, None)
+
+    shared = LargeFrameWorker(mode=1)
+    shared.args = {"output_format": "csv", "pool_result_transport": transport}
+    shared._exec_multi_process({0: [[1, 2], [3]]}, None)
+
+    pool = RecordingPool.instances[-1]
+    assert all(args[1:] == (transport, str(tmp_path) if transport == "mmap" else None) for args in pool.submitted)
+    assert len(shared.last_dfs) == len(pipe.last_dfs) == 2
+    assert all(
+        expected.equals(observed)
+        for expected, observed in zip(pipe.last_dfs, shared.last_dfs)
+    )
+    # Segments/files are removed as soon as their chunk is persisted; mappings
+    # still referenced by a kept frame close on the next release pass.
+    assert list(tmp_path.iterdir()) == []
+    shared.last_dfs.clear()
+    worker_pool_support._release_shared_results([])
+    assert worker_pool_support._DEFERRED_RESULT_LEASES == []
+
+
+def test_small_and_none_results_stay_on_the_pipe():
+    small = pd.DataFrame({"col": [1]})
+    assert worker_pool_support._export_result(small, "shm", None) is small
+    assert worker_pool_support._export_result(None, "shm", None) is None
+
+
+def test_shared_lease_is_deferred_while_frame_is_referenced(tmp_path):
+    frame = pd.DataFrame({"col": [1.5] * 20_000})
+    handle = worker_pool_support._export_result(frame, "mmap", str(tmp_path))
+    assert isinstance(handle, worker_pool_support._SharedResult)
+
+    leases = []
+    received = worker_pool_support._receive_result(handle, leases)
+    pd.testing.assert_frame_equal(received, frame)
+    worker_pool_support._release_shared_results(leases)
+    # The file is gone but the mapping stays open while ``received`` lives.
+    assert list(tmp_path.iterdir()) == []
+    assert len(worker_pool_support._DEFERRED_RESULT_LEASES) == 1
+    assert received["col"].sum() == frame["col"].sum()
+
+    del received
+    worker_pool_support._release_shared_results([])
+    assert worker_pool_support._DEFERRED_RESULT_LEASES == []
+
+
+# --- streaming mode -----------------------------------------------------
+
+
+def test_resolve_pool_stream_items_sources(monkeypatch):
+    assert worker_pool_support.resolve_pool_stream_items({}) is None
+    monkeypatch.setenv(worker_pool_support.POOL_STREAM_ITEMS_ENV, "500")
+    assert worker_pool_support.resolve_pool_stream_items({}) == 500
+    assert worker_pool_support.resolve_pool_stream_items({"pool_stream_items": "8"}) == 8
+    monkeypatch.setenv(worker_pool_support.POOL_STREAM_ITEMS_ENV, "0")
+    assert worker_pool_support.resolve_pool_stream_items({}) is None
+
+
+class DeferredPool(RecordingPool):
+    """Runs work at submit time but leaves completion to :func:`_wait_one`."""
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+        future = Future()
+        future.outcome = fn(*args)
+        return future
+
+
+def _wait_one(in_flight_sizes, *, newest_first):
+    def _wait(futures, timeout=None, return_when=None):
+        in_flight_sizes.append(len(futures))
+        chosen = list(futures)[-1 if newest_first else 0]
+        chosen.set_result(chosen.outcome)
+        return {chosen}, set(futures) - {chosen}
+
+    return _wait
+
+
+def test_streaming_bounds_in_flight_and_persists_in_item_order(monkeypatch):
+    in_flight_sizes = []
+    monkeypatch.setattr(worker_pool_support, "map_chunksize", lambda item_count, width: 1)
+    monkeypatch.setattr(worker_pool_support, "wait", _wait_one(in_flight_sizes, newest_first=True))
+    worker = NoneReturningWorker(mode=1)
+    pool = DeferredPool(
+        initializer=worker_pool_support._pool_child_init,
+        initargs=(worker, worker.pool_vars),
+    ).__enter__()
+    items = [0, 1, "bad", 3, 4, 5, 6, 7, 8, 9]
+
+    persisted = worker_pool_support._run_chunk_incremental(
+        pool,
+        worker,
+        _pandas_hooks(DeferredPool),
+        0,
+        items,
+        2,
+        stream_items=3,
+    )
+
+    # Two pool slots keep at most four batches ahead of the oldest unpersisted one.
+    assert max(in_flight_sizes) == 2 * worker_pool_support._STREAM_BATCHES_PER_SLOT
+    assert persisted == 4
+    assert [df["worker_id"].tolist() for df in worker.last_dfs] == [
+        [str((0, 0)), str((0, 1))],
+        [str((0, 3)), str((0, 4)), str((0, 5))],
+        [str((0, 6)), str((0, 7)), str((0, 8))],
+        [str((0, 9))],
+    ]
+
+
+def test_streaming_stops_persisting_after_a_failure(monkeypatch):
+    monkeypatch.setattr(worker_pool_support, "map_chunksize", lambda item_count, width: 1)
+    monkeypatch.setattr(worker_pool_support, "wait", _wait_one([], newest_first=False))
+    worker = FailingWorker(mode=1)
+    worker.args = {"output_format": "csv", "pool_stream_items": 1}
+    with pytest.raises(RuntimeError, match="2 of 5 work item"):
+        worker_pool_support.exec_multi_process(
+            worker, {0: [["a", "b", "boom", "c", "boom"]]}, None, _pandas_hooks(DeferredPool)
+        )
+    assert [df["col"].tolist() for df in worker.last_dfs] == [["a"], ["b"]]
+
+
+def test_streaming_empty_chunk_still_calls_work_done_once(monkeypatch):
+    monkeypatch.setenv(worker_pool_support.POOL_STREAM_ITEMS_ENV, "1")
+    monkeypatch.setattr(worker_pool_support, "map_chunksize", lambda item_count, width: 1)
+    worker = NoneReturningWorker(mode=1)
+    worker._exec_multi_process({0: [["bad", "bad"], [1, 2]]}, None)
+    assert len(worker.last_dfs) == 3
+    assert worker.last_dfs[0].empty
+    assert [df["col"].tolist() for df in worker.last_dfs[1:]] == [[1], [2]]
+
+
+# --- adaptive batch sizing ----------------------------------------------
+
+
+def test_resolve_pool_batching_sources(monkeypatch, caplog):
+    assert worker_pool_support.resolve_pool_batching({}) == "fixed"
+    monkeypatch.setenv(worker_pool_support.POOL_BATCHING_ENV, "adaptive")
+    assert worker_pool_support.resolve_pool_batching({}) == "adaptive"
+    assert worker_pool_support.resolve_pool_batching({"pool_batching": "Fixed"}) == "fixed"
+    with caplog.at_level(logging.WARNING):
+        assert worker_pool_support.resolve_pool_batching({"pool_batching": "huge"}) == "adaptive"
+    assert "Ignoring invalid pool batching" in caplog.text
+
+
+def test_adaptive_sizer_grows_for_tiny_items_and_shrinks_for_slow_ones():
+    sizer = worker_pool_support._AdaptiveBatchSizer(4, target_seconds=0.25, max_items=100)
+    # Nothing measured yet: single-item probes.
+    assert sizer.next_size(10_000) == 1
+
+    sizer.observe([0.001] * 50)
+    assert sizer.next_size(10_000) == 100
+    # The tail is spread over every slot instead of one straggler batch.
+    assert sizer.next_size(12) == 3
+
+    sizer.observe([2.0] * 600)
+    assert sizer.next_size(10_000) == 1
+
+    summary = sizer.summary()
+    assert summary["batches"] == 4
+    assert summary["batch_sizes"] == {"1": 2, "3": 1, "100": 1}
+    assert summary["items"] == 650
+    assert summary["item_seconds_max"] == 2.0
+    assert summary["item_seconds_histogram"]["<0.01s"] == 50
+    assert summary["item_seconds_histogram"]["<10s"] == 600
+
+
+def test_adaptive_batching_keeps_results_and_records_metrics(monkeypatch):
+    monkeypatch.setattr(worker_pool_support.os, "cpu_count", lambda: 2)
+    worker = NoneReturningWorker(mode=1)
+    worker.args = {"output_format": "csv", "pool_batching": "adaptive"}
+    items = ["a", "bad", *range(40)]
+    worker._exec_multi_process({0: [items, ["z"]]}, None)
+
+    assert len(worker.last_dfs) == 2
+    expected = [str((0, idx)) for idx in range(len(items)) if items[idx] != "bad"]
+    assert worker.last_dfs[0]["worker_id"].tolist() == expected
+    # Probes and growing batches, not the fixed split into width-sized halves.
+    batch_lengths = [len(batch) for (batch,) in RecordingPool.instances[0].submitted]
+    assert batch_lengths[:2] == [1, 1]
+    assert sum(batch_lengths) == len(items) + 1
+
+    metrics = {record["name"]: record for record in worker._metric_records()}
+    assert metrics["pool_batches"]["value"] == len(batch_lengths)
+    assert metrics["pool_item_seconds_p90"]["unit"] == "s"
+    assert metrics["pool_item_seconds_p90"]["metadata"]["items"] == len(items) + 1
+
+
+# --- memory awareness ---------------------------------------------------
+
+
+def test_resolve_pool_width_fits_item_memory_estimate(monkeypatch):
+    monkeypatch.setattr(worker_pool_support.os, "cpu_count", lambda: 16)
+    monkeypatch.setattr(worker_pool_support, "_available_memory", lambda: 1000 * worker_pool_support._MIB)
+    assert worker_pool_support.resolve_pool_width([32]) == 16
+    assert worker_pool_support.resolve_pool_width([32], {"pool_item_memory_mb": 300}) == 2
+    # Even an item larger than the host memory gets one slot.
+    assert worker_pool_support.resolve_pool_width([32], {"pool_item_memory_mb": "5000"}) == 1
+    monkeypatch.setenv(worker_pool_support.POOL_ITEM_MEMORY_ENV, "100")
+    assert worker_pool_support.resolve_pool_width([32], {"pool_max_workers": 4}) == 4
+
+
+def test_resolve_pool_memory_limit_sources(monkeypatch):
+    monkeypatch.setattr(worker_pool_support, "_available_memory", lambda: 1000 * worker_pool_support._MIB)
+    assert worker_pool_support.resolve_pool_memory_limit({}) is None
+    assert worker_pool_support.resolve_pool_memory_limit({"pool_memory_limit_mb": "auto"}) == int(
+        800 * worker_pool_support._MIB
+    )
+    monkeypatch.setenv(worker_pool_support.POOL_MEMORY_LIMIT_ENV, "512")
+    assert worker_pool_support.resolve_pool_memory_limit({}) == 512 * worker_pool_support._MIB
+    assert worker_pool_support.resolve_pool_memory_limit({"pool_memory_limit_mb": "lots"}) == (
+        512 * worker_pool_support._MIB
+    )
+
+
+def test_memory_guard_samples_at_a_bounded_rate():
+    samples = iter([10, 95, 20])
+    clock = {"now": 0.0}
+    guard = worker_pool_support._PoolMemoryGuard(
+        None, 100, rss_fn=lambda: next(samples), clock=lambda: clock["now"]
+    )
+    assert guard.allows_submit(3)
+    clock["now"] += 0.5
+    assert not guard.allows_submit(3)
+    # No new sample within the interval, but one batch may always run.
+    assert guard.allows_submit(0)
+    clock["now"] += 0.5
+    assert guard.allows_submit(3)
+    assert (guard.peak_rss, guard.throttled) == (95, 1)
+
+
+def test_memory_guard_measures_item_memory_from_first_batch():
+    samples = iter([100, 300, 400, 400])
+    guard = worker_pool_support._PoolMemoryGuard(
+        None, 1000, rss_fn=lambda: next(samples), clock=iter(range(0, 1000, 10)).__next__
+    )
+    # The first check, before any submission, is the calibration baseline.
+    assert guard.allows_submit(0, 0)
+    guard.calibrate(4)
+    assert guard.item_memory == 50
+    guard.calibrate(1)
+    assert guard.item_memory == 50
+    # 17 items x 50 bytes stay under 90% of the limit, 18 do not.
+    assert guard.allows_submit(2, 17)
+    assert not guard.allows_submit(2, 18)
+    assert guard.throttled == 1
+
+
+def test_memory_guard_throttles_in_flight_batches(monkeypatch):
+    in_flight_sizes = []
+    monkeypatch.setattr(worker_pool_support, "map_chunksize", lambda item_count, width: 1)
+    monkeypatch.setattr(worker_pool_support, "wait", _wait_one(in_flight_sizes, newest_first=False))
+    worker = EngineWorker(mode=1)
+    pool = DeferredPool(
+        initializer=worker_pool_support._pool_child_init,
+        initargs=(worker, worker.pool_vars),
+    ).__enter__()
+    rss = {"value": 10}
+    guard = worker_pool_support._PoolMemoryGuard(
+        pool, 100, rss_fn=lambda: rss["value"], clock=iter(range(1000)).__next__
+    )
+
+    worker_pool_support._run_chunk_incremental(
+        pool, worker, _pandas_hooks(DeferredPool), 0, list(range(4)), 4, memory_guard=guard
+    )
+    assert max(in_flight_sizes) == 4
+
+    rss["value"] = 95
+    in_flight_sizes.clear()
+    worker_pool_support._run_chunk_incremental(
+        pool, worker, _pandas_hooks(DeferredPool), 0, list(range(4)), 4, memory_guard=guard
+    )
+    assert in_flight_sizes == [1, 1, 1, 1]
+    assert guard.throttled
+    assert worker.last_dfs[-1]["col"].tolist() == [0, 1, 2, 3]
+
+
+# --- item retries and checkpoints ---------------------------------------
+
+
+class FlakyWorker(EngineWorker):
+    def __init__(self, failures, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = dict(failures)
+        self.calls = []
+
+    def _actual_work_pool(self, x):
+        self.calls.append(x)
+        if self.failures.get(x, 0) > 0:
+            self.failures[x] -= 1
+            raise ValueError(f"flaky item {x}")
+        return pd.DataFrame({"col": [x]})
+
+
+def test_resolve_pool_item_retries_sources(monkeypatch, caplog):
+    assert worker_pool_support.resolve_pool_item_retries({}) == (0, 1.0)
+    monkeypatch.setenv(worker_pool_support.POOL_ITEM_RETRIES_ENV, "2")
+    monkeypatch.setenv(worker_pool_support.POOL_RETRY_BACKOFF_ENV, "0.5")
+    assert worker_pool_support.resolve_pool_item_retries({}) == (2, 0.5)
+    assert worker_pool_support.resolve_pool_item_retries(
+        {"pool_item_retries": 1, "pool_retry_backoff": 0}
+    ) == (1, 0.0)
+    with caplog.at_level(logging.WARNING):
+        assert worker_pool_support.resolve_pool_item_retries({"pool_item_retries": "many"}) == (2, 0.5)
+    assert "pool item retries" in caplog.text
+
+
+def test_retry_budget_covers_every_attempt_and_backoff():
+    assert worker_pool_support._retry_item_budget(None, 3, 1.0) is None
+    assert worker_pool_support._retry_item_budget(10.0, 0, 1.0) == 10.0
+    # Three attempts plus backoffs of 1s and 2s.
+    assert worker_pool_support._retry_item_budget(10.0, 2, 1.0) == 33.0
+
+
+def test_flaky_item_is_retried_in_both_paths(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(worker_pool_support.time, "sleep", sleeps.append)
+    for mode, runner in ((1, "_exec_multi_process"), (0, "_exec_mono_process")):
+        worker = FlakyWorker({"b": 2}, mode=mode)
+        worker.args["pool_item_retries"] = 2
+        getattr(worker, runner)({0: [["a", "b", "c"]]}, None)
+        assert worker.calls.count("b") == 3
+        assert worker.last_dfs[0]["col"].tolist() == ["a", "b", "c"]
+    assert sleeps == [1.0, 2.0, 1.0, 2.0]
+
+
+def test_exhausted_retries_still_raise(monkeypatch):
+    monkeypatch.setattr(worker_pool_support.time, "sleep", lambda _seconds: None)
+    worker = FlakyWorker({"b": 5}, mode=1)
+    worker.args["pool_item_retries"] = 1
+    with pytest.raises(RuntimeError, match="'b'"):
+        worker._exec_multi_process({0: [["a", "b"]]}, None)
+    assert worker.calls.count("b") == 2
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_checkpoint_resumes_only_missing_items(streaming, tmp_path):
+    worker = FlakyWorker({"b": 1}, mode=1)
+    worker.args["pool_checkpoint_dir"] = str(tmp_path)
+    if streaming:
+        worker.args["pool_stream_items"] = 100
+    with pytest.raises(RuntimeError, match="'b'"):
+        worker._exec_multi_process({0: [["a", "b", "c"]]}, None)
+    assert len(list(tmp_path.rglob("*.pkl"))) == 2
+
+    worker.calls.clear()
+    worker._exec_multi_process({0: [["a", "b", "c"]]}, None)
+    assert worker.calls == ["b"]
+    assert worker.last_dfs[-1]["col"].tolist() == ["a", "b", "c"]
+    # The persisted chunk no longer needs its checkpoints.
+    assert not list(tmp_path.rglob("*.pkl"))
+
+
+def test_checkpoint_never_rewrites_streamed_segments(tmp_path):
+    items = list(range(100))
+    worker = FlakyWorker({99: 1}, mode=1)
+    worker.args.update(pool_checkpoint_dir=str(tmp_path), pool_stream_items=10, pool_max_workers=1)
+    with pytest.raises(RuntimeError, match="99"):
+        worker._exec_multi_process({0: [items]}, None)
+    first_run_rows = sum(len(df) for df in worker.last_dfs)
+    assert first_run_rows >= 10
+
+    worker.calls.clear()
+    worker._exec_multi_process({0: [items]}, None)
+    assert worker.calls == [99]
+    rows = [value for df in worker.last_dfs for value in df["col"].tolist()]
+    assert sorted(rows) == items
+    assert not list(tmp_path.rglob("*"))
+
+
+def test_checkpoint_resumes_monoprocess_chunk(tmp_path):
+    worker = FlakyWorker({"b": 1}, mode=0)
+    worker.args["pool_checkpoint_dir"] = str(tmp_path)
+    with pytest.raises(ValueError, match="flaky item b"):
+        worker._exec_mono_process({0: [["a", "b", "c"]]}, None)
+    assert len(list(tmp_path.rglob("*.pkl"))) == 1
+
+    worker.calls.clear()
+    worker._exec_mono_process({0: [["a", "b", "c"]]}, None)
+    assert worker.calls == ["b", "c"]
+    assert worker.last_dfs[-1]["col"].tolist() == ["a", "b", "c"]
+    assert not list(tmp_path.rglob("*.pkl"))
+
+
+def test_checkpoint_ignores_results_of_a_changed_item(tmp_path):
+    source = tmp_path / "input.csv"
+    source.write_text("v1")
+    checkpoint = worker_pool_support._ChunkCheckpoint(
+        str(tmp_path / "ckpt"), _pandas_hooks(RecordingPool), EngineWorker(), 0
+    )
+    assert checkpoint.load([str(source)]) == {}
+    checkpoint.save(0, "cached")
+    assert checkpoint.load([str(source)]) == {0: "cached"}
+    source.write_text("version 2")
+    assert checkpoint.load([str(source)]) == {}
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, Callable, Mapping, TextIO
 
 from .dag_idempotency import execute_idempotently, write_json_atomic
+from .dag_stage_runner_pool import StageRunnerUnavailable, dag_stage_runner_pool
 
 from agilab.orchestrate.orchestrate_page_support import compute_run_mode
 
@@ -380,14 +381,15 @@ def _run_agilab_stage_subprocess_once(
         try:
             command_env = os.environ.copy()
             command_env["AGILAB_IDEMPOTENCY_TOKEN"] = token
-            completed = subprocess.run(
+            returncode, stage_runner = _run_stage_script(
                 command,
-                cwd=repo_root,
-                env=command_env,
-                text=True,
-                stdout=stdout_handle,
-                stderr=stderr_handle,
-                check=False,
+                script_path=script_path,
+                repo_root=repo_root,
+                command_env=command_env,
+                stdout_handle=stdout_handle,
+                stderr_handle=stderr_handle,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
             )
         finally:
             stdout_handle.flush()
@@ -401,15 +403,17 @@ def _run_agilab_stage_subprocess_once(
         "created_at": timestamp,
         "command": command,
         "script": str(script_path),
-        "returncode": completed.returncode,
+        "returncode": returncode,
         "stdout_log": str(stdout_path),
         "stderr_log": str(stderr_path),
         "stdout_tail": stdout_tail,
         "stderr_tail": stderr_tail,
         "idempotency_token": token,
     }
-    if completed.returncode:
-        detail = stderr_tail.strip() or stdout_tail.strip() or f"exit {completed.returncode}"
+    if stage_runner is not None:
+        payload["stage_runner"] = stage_runner
+    if returncode:
+        detail = stderr_tail.strip() or stdout_tail.strip() or f"exit {returncode}"
         raise RuntimeError(f"Distributed DAG stage `{app_name}` failed: {_tail(detail, max_chars=3800)}")
     failure_detail = _stage_result_failure(stdout_tail)
     if failure_detail:
@@ -422,6 +426,48 @@ def _run_agilab_stage_subprocess_once(
     return payload
 
 
+def _run_stage_script(
+    command: list[str],
+    *,
+    script_path: Path,
+    repo_root: Path,
+    command_env: Mapping[str, str],
+    stdout_handle: TextIO,
+    stderr_handle: TextIO,
+    stdout_path: Path,
+    stderr_path: Path,
+) -> tuple[int, dict[str, Any] | None]:
+    """Run the stage script in a warm runner when the pool has one, else cold."""
+    pool = dag_stage_runner_pool()
+    if pool is not None:
+        try:
+            outcome = pool.run_stage(
+                script_path=script_path,
+                cwd=repo_root,
+                env=command_env,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
+            )
+        except StageRunnerUnavailable:
+            pass
+        else:
+            return outcome.returncode, {
+                "mode": "warm",
+                "runner_pid": outcome.runner_pid,
+                "stage_pid": outcome.stage_pid,
+            }
+    completed = subprocess.run(
+        command,
+        cwd=repo_root,
+        env=dict(command_env),
+        text=True,
+        stdout=stdout_handle,
+        stderr=stderr_handle,
+        check=False,
+    )
+    return completed.returncode, None
+
+
 def _run_worker_log_file_tee(
     stdout_path: Path,
     stderr_path: Path,
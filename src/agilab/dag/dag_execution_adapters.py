@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import os
@@ -9,6 +9,7 @@ from pathlib import Path
 import re
 import shlex
 import subprocess
+import time
 from typing import Any, Callable, Mapping, Protocol
 
 from .dag_idempotency import (
@@ -17,6 +18,13 @@ from .dag_idempotency import (
     fsync_directory,
     write_json_atomic,
 )
+from .dag_stage_cache import DagStageCache
+from .dag_stage_durations import (
+    StageDurationModel,
+    artifact_input_bytes,
+    prioritize_ready_units,
+    record_stage_duration,
+)
 from .dag_execution_registry import (
     CONTROLLED_CONTRACT_ADAPTER,
     CONTROLLED_CONTRACT_RUNNER_STATUS,
@@ -35,6 +43,8 @@ GLOBAL_DAG_CONTRACT_EXECUTION_SCOPE = "controlled_contract_dag_stage"
 GLOBAL_DAG_DISTRIBUTED_EXECUTION_SCOPE = "controlled_contract_dag_stage_distributed"
 DAG_STAGE_BACKEND_LOCAL = "local"
 DAG_STAGE_BACKEND_DISTRIBUTED = "distributed"
+DAG_STAGE_SCHEDULE_WAVE = "wave"
+DAG_STAGE_SCHEDULE_CONTINUOUS = "continuous"
 _DURABLE_CLAIM_RECEIPT = object()
 
 
@@ -70,6 +80,8 @@ class DagExecutionContext:
     now_fn: Callable[[], str] = _now_iso
     execution_attempt_id: str = ""
     persist_execution_claim_fn: Callable[[Mapping[str, Any]], object] | None = None
+    persist_execution_progress_fn: Callable[[Mapping[str, Any]], object] | None = None
+    stage_cache: DagStageCache | None = None
 
 
 def _persist_execution_claim(context: DagExecutionContext, state: dict[str, Any]) -> None:
@@ -89,6 +101,23 @@ def _persist_execution_claim(context: DagExecutionContext, state: dict[str, Any]
         )
 
 
+def _persist_execution_progress(context: DagExecutionContext, state: dict[str, Any]) -> None:
+    """Persist per-unit transitions (new claims, completions) of a claimed attempt."""
+
+    _refresh_summary(state)
+    if context.persist_execution_progress_fn is None:
+        raise RuntimeError(
+            "Continuous DAG execution requires a durable progress persistence callback; "
+            "use the runner-state transaction API."
+        )
+    receipt = context.persist_execution_progress_fn(state)
+    if receipt is not _DURABLE_CLAIM_RECEIPT:
+        raise RuntimeError(
+            "Continuous DAG execution did not receive a durable progress receipt; "
+            "use the runner-state transaction API."
+        )
+
+
 def _unit_idempotency_token(context: DagExecutionContext, unit_id: str) -> str:
     attempt_id = str(context.execution_attempt_id).strip()
     if not attempt_id:
@@ -187,10 +216,11 @@ def run_ready_adapter_stages(
     *,
     max_workers: int | None = None,
     execution_backend: str = DAG_STAGE_BACKEND_LOCAL,
+    schedule: str = DAG_STAGE_SCHEDULE_WAVE,
 ) -> DagBatchExecutionResult:
     """Reject public batch execution that cannot own the state transaction."""
 
-    del adapter_id, state, context, max_workers, execution_backend
+    del adapter_id, state, context, max_workers, execution_backend, schedule
     raise RuntimeError(
         "Direct DAG adapter batch execution is disabled; use "
         "DagRunEngine.run_ready_controlled_stages() so the durable claim and "
@@ -205,8 +235,16 @@ def _run_ready_adapter_stages_uncommitted(
     *,
     max_workers: int | None = None,
     execution_backend: str = DAG_STAGE_BACKEND_LOCAL,
+    schedule: str = DAG_STAGE_SCHEDULE_WAVE,
 ) -> DagBatchExecutionResult:
     if adapter_id == CONTROLLED_CONTRACT_ADAPTER:
+        if _normalize_stage_schedule(schedule) == DAG_STAGE_SCHEDULE_CONTINUOUS:
+            return _run_controlled_contract_dag_stages_continuously(
+                state,
+                context=context,
+                max_workers=max_workers,
+                execution_backend=execution_backend,
+            )
         return _run_ready_controlled_contract_dag_stages(
             state,
             context=context,
@@ -486,13 +524,16 @@ def _run_next_controlled_contract_dag_stage(
             execution_attempt_id=context.execution_attempt_id,
             idempotency_token=idempotency_token,
         )
+        upstream_artifacts = _upstream_artifact_records(mutable_state, unit)
         _persist_execution_claim(context, mutable_state)
         try:
-            result = _contract_stage_result(
+            result, stage_timing = _timed_stage_execution_result(
                 context,
                 unit=unit,
                 artifact=artifact,
                 timestamp=timestamp,
+                execution_backend=DAG_STAGE_BACKEND_LOCAL,
+                upstream_artifacts=upstream_artifacts,
             )
         except DagExternalExecutionUncertainError:
             raise
@@ -523,6 +564,7 @@ def _run_next_controlled_contract_dag_stage(
             execution_payload_key="contract_execution",
             operator_message=f"{unit_id} completed through the controlled DAG contract adapter.",
             artifact_available_detail=f"{artifact_id} became available after controlled contract execution",
+            stage_timing=stage_timing,
         )
         _unblock_ready_units(mutable_state, timestamp=timestamp)
         _update_real_execution_provenance(
@@ -569,7 +611,7 @@ def _run_ready_controlled_contract_dag_stages(
             state=mutable_state,
         )
 
-    jobs: list[tuple[dict[str, Any], dict[str, str], str, str]] = []
+    jobs: list[tuple[dict[str, Any], dict[str, str], str, str, list[dict[str, str]]]] = []
     failed_unit_ids: list[str] = []
     failure_messages_by_unit_id: dict[str, str] = {}
     for unit in runnable_units:
@@ -604,29 +646,38 @@ def _run_ready_controlled_contract_dag_stages(
                 artifact,
                 artifact["kind"],
                 _artifact_path_result_key(artifact["kind"]),
+                _upstream_artifact_records(mutable_state, unit),
             )
         )
 
-    results_by_unit_id: dict[str, dict[str, Any]] = {}
+    results_by_unit_id: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
     uncertain_errors: list[DagExternalExecutionUncertainError] = []
     if jobs:
         _persist_execution_claim(context, mutable_state)
         worker_count = max(1, min(max_workers or len(jobs), len(jobs)))
+        if worker_count < len(jobs):
+            # The executor starts jobs in submission order, so submit the
+            # stages on the longest remaining path first.
+            ranked = _prioritized_units(mutable_state, [job[0] for job in jobs])
+            rank_by_unit_id = {str(unit.get("id", "")): index for index, unit in enumerate(ranked)}
+            jobs.sort(key=lambda job: rank_by_unit_id[str(job[0].get("id", ""))])
         with ThreadPoolExecutor(max_workers=worker_count) as executor:
             futures = {
                 executor.submit(
-                    _stage_execution_result,
+                    _timed_stage_execution_result,
                     context,
                     unit=deepcopy(unit),
                     artifact=artifact,
                     timestamp=timestamp,
                     execution_backend=backend,
+                    upstream_artifacts=upstream_artifacts,
                 ): str(unit.get("id", ""))
-                for unit, artifact, _artifact_kind, _artifact_path_key in jobs
+                for unit, artifact, _artifact_kind, _artifact_path_key, upstream_artifacts in jobs
             }
             for future, unit_id in futures.items():
                 try:
-                    results_by_unit_id[unit_id] = dict(future.result())
+                    result, stage_timing = future.result()
+                    results_by_unit_id[unit_id] = (dict(result), stage_timing)
                 except DagExternalExecutionUncertainError as exc:
                     uncertain_errors.append(exc)
                 except Exception as exc:
@@ -639,10 +690,10 @@ def _run_ready_controlled_contract_dag_stages(
         raise uncertain_errors[0]
 
     executed_unit_ids: list[str] = []
-    for unit, artifact, artifact_kind, artifact_path_key in jobs:
+    for unit, artifact, artifact_kind, artifact_path_key, _upstream_artifacts in jobs:
         unit_id = str(unit.get("id", ""))
-        result = results_by_unit_id.get(unit_id)
-        if result is None:
+        completed = results_by_unit_id.get(unit_id)
+        if completed is None:
             message = failure_messages_by_unit_id.get(unit_id, "Controlled contract stage failed.")
             _mark_controlled_stage_failure(
                 mutable_state,
@@ -653,6 +704,7 @@ def _run_ready_controlled_contract_dag_stages(
             )
             failed_unit_ids.append(unit_id)
             continue
+        result, stage_timing = completed
         _mark_controlled_stage_execution(
             mutable_state,
             unit,
@@ -669,6 +721,7 @@ def _run_ready_controlled_contract_dag_stages(
                 f"{artifact['artifact']} became available after {_stage_backend_artifact_detail(backend)}"
             ),
             completion_detail=_stage_backend_completed_message(unit_id, backend),
+            stage_timing=stage_timing,
         )
         _update_real_execution_provenance(
             mutable_state,
@@ -682,6 +735,193 @@ def _run_ready_controlled_contract_dag_stages(
 
     _unblock_ready_units(mutable_state, timestamp=timestamp)
     _refresh_summary(mutable_state)
+    return _ready_batch_result(
+        mutable_state,
+        backend=backend,
+        executed_unit_ids=executed_unit_ids,
+        failed_unit_ids=failed_unit_ids,
+        failure_messages_by_unit_id=failure_messages_by_unit_id,
+    )
+
+
+def _run_controlled_contract_dag_stages_continuously(
+    state: Mapping[str, Any],
+    *,
+    context: DagExecutionContext,
+    max_workers: int | None = None,
+    execution_backend: str = DAG_STAGE_BACKEND_LOCAL,
+) -> DagBatchExecutionResult:
+    """Launch each contract stage as soon as its artifacts are available.
+
+    Unlike the wave runner, there is no barrier: a completion unblocks its
+    successors immediately and at most ``max_workers`` stages are in flight.
+    The first launch persists the attempt claim; later launches and
+    completions are persisted as per-unit progress before the next launch,
+    so a crash only leaves the still-running units to exact-token recovery.
+    """
+
+    mutable_state = deepcopy(dict(state))
+    backend = _normalize_stage_backend(execution_backend)
+    execution_mode = _stage_backend_execution_mode(backend)
+    _unblock_ready_units(mutable_state, timestamp=context.now_fn())
+    if not _runnable_units(mutable_state):
+        _refresh_summary(mutable_state)
+        return DagBatchExecutionResult(
+            ok=False,
+            message="No controlled contract DAG stages are ready to run.",
+            state=mutable_state,
+        )
+
+    worker_count = max(1, max_workers or len(dag_units(mutable_state)))
+    in_flight: dict[
+        Future[tuple[dict[str, Any], dict[str, Any]]],
+        tuple[dict[str, Any], dict[str, str], str],
+    ] = {}
+    executed_unit_ids: list[str] = []
+    failed_unit_ids: list[str] = []
+    failure_messages_by_unit_id: dict[str, str] = {}
+    uncertain_errors: list[DagExternalExecutionUncertainError] = []
+    claim_persisted = False
+    unpersisted_transitions = False
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        while True:
+            launches: list[tuple[dict[str, Any], dict[str, str], str, list[dict[str, str]]]] = []
+            # After an uncertain outcome nothing new starts; in-flight siblings
+            # still finish and are committed before the error surfaces.
+            ready_units = [] if uncertain_errors else _runnable_units(mutable_state)
+            if len(in_flight) + len(ready_units) > worker_count:
+                ready_units = _prioritized_units(mutable_state, ready_units)
+            for unit in ready_units:
+                if len(in_flight) + len(launches) >= worker_count:
+                    break
+                unit_id = str(unit.get("id", ""))
+                timestamp = context.now_fn()
+                contract_issue = _controlled_contract_unit_issue(unit)
+                if contract_issue:
+                    _mark_controlled_stage_failure(
+                        mutable_state,
+                        unit,
+                        timestamp=timestamp,
+                        message=contract_issue,
+                        execution_mode=execution_mode,
+                    )
+                    failed_unit_ids.append(unit_id)
+                    failure_messages_by_unit_id[unit_id] = contract_issue
+                    unpersisted_transitions = True
+                    continue
+                artifact = _primary_contract_artifact(mutable_state, unit)
+                _mark_controlled_stage_running(
+                    mutable_state,
+                    unit,
+                    timestamp=timestamp,
+                    execution_mode=execution_mode,
+                    operator_message=_stage_backend_running_message(unit_id, backend),
+                    event_detail=_stage_backend_dispatch_detail(unit_id, backend),
+                    execution_attempt_id=context.execution_attempt_id,
+                    idempotency_token=_unit_idempotency_token(context, unit_id),
+                )
+                launches.append((unit, artifact, timestamp, _upstream_artifact_records(mutable_state, unit)))
+
+            if launches or (unpersisted_transitions and in_flight):
+                if claim_persisted:
+                    _persist_execution_progress(context, mutable_state)
+                else:
+                    _persist_execution_claim(context, mutable_state)
+                    claim_persisted = True
+                unpersisted_transitions = False
+            for unit, artifact, timestamp, upstream_artifacts in launches:
+                future = executor.submit(
+                    _timed_stage_execution_result,
+                    context,
+                    unit=deepcopy(unit),
+                    artifact=artifact,
+                    timestamp=timestamp,
+                    execution_backend=backend,
+                    upstream_artifacts=upstream_artifacts,
+                )
+                in_flight[future] = (unit, artifact, timestamp)
+            if not in_flight:
+                break
+
+            done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in [future for future in in_flight if future in done]:
+                unit, artifact, started_at = in_flight.pop(future)
+                unit_id = str(unit.get("id", ""))
+                timestamp = context.now_fn()
+                try:
+                    result, stage_timing = future.result()
+                except DagExternalExecutionUncertainError as exc:
+                    # The unit stays claimed as running for exact-token recovery.
+                    uncertain_errors.append(exc)
+                    continue
+                except Exception as exc:
+                    message = str(exc) or "Controlled contract stage failed."
+                    _mark_controlled_stage_failure(
+                        mutable_state,
+                        unit,
+                        timestamp=timestamp,
+                        message=message,
+                        execution_mode=execution_mode,
+                        started_at=started_at,
+                    )
+                    failed_unit_ids.append(unit_id)
+                    failure_messages_by_unit_id[unit_id] = message
+                    unpersisted_transitions = True
+                    continue
+                _mark_controlled_stage_execution(
+                    mutable_state,
+                    unit,
+                    result=result,
+                    timestamp=timestamp,
+                    artifact_id=artifact["artifact"],
+                    reduce_artifact_id=None,
+                    artifact_kind=artifact["kind"],
+                    artifact_path_key=_artifact_path_result_key(artifact["kind"]),
+                    execution_mode=execution_mode,
+                    execution_payload_key=_stage_backend_payload_key(backend),
+                    operator_message=_stage_backend_completed_message(unit_id, backend),
+                    artifact_available_detail=(
+                        f"{artifact['artifact']} became available after {_stage_backend_artifact_detail(backend)}"
+                    ),
+                    completion_detail=_stage_backend_completed_message(unit_id, backend),
+                    started_at=started_at,
+                    stage_timing=stage_timing,
+                )
+                _update_real_execution_provenance(
+                    mutable_state,
+                    executed_unit_id=unit_id,
+                    timestamp=timestamp,
+                    dispatch_mode=CONTROLLED_CONTRACT_RUNNER_STATUS,
+                    real_app_execution=False,
+                    execution_scope=_stage_backend_execution_scope(backend),
+                )
+                executed_unit_ids.append(unit_id)
+                unpersisted_transitions = True
+                _unblock_ready_units(mutable_state, timestamp=timestamp)
+
+    if uncertain_errors:
+        if unpersisted_transitions:
+            _persist_execution_progress(context, mutable_state)
+        raise uncertain_errors[0]
+
+    _refresh_summary(mutable_state)
+    return _ready_batch_result(
+        mutable_state,
+        backend=backend,
+        executed_unit_ids=executed_unit_ids,
+        failed_unit_ids=failed_unit_ids,
+        failure_messages_by_unit_id=failure_messages_by_unit_id,
+    )
+
+
+def _ready_batch_result(
+    mutable_state: dict[str, Any],
+    *,
+    backend: str,
+    executed_unit_ids: list[str],
+    failed_unit_ids: list[str],
+    failure_messages_by_unit_id: Mapping[str, str],
+) -> DagBatchExecutionResult:
     backend_label = _stage_backend_label(backend)
     if executed_unit_ids and not failed_unit_ids:
         stage_text = ", ".join(f"`{unit_id}`" for unit_id in executed_unit_ids)
@@ -720,6 +960,12 @@ def _failed_stage_text(unit_ids: list[str], messages_by_unit_id: Mapping[str, st
     return "; ".join(parts)
 
 
+def _normalize_stage_schedule(value: str) -> str:
+    if str(value).strip().lower() == DAG_STAGE_SCHEDULE_CONTINUOUS:
+        return DAG_STAGE_SCHEDULE_CONTINUOUS
+    return DAG_STAGE_SCHEDULE_WAVE
+
+
 def _normalize_stage_backend(value: str) -> str:
     if str(value).strip().lower() == DAG_STAGE_BACKEND_DISTRIBUTED:
         return DAG_STAGE_BACKEND_DISTRIBUTED
@@ -768,6 +1014,41 @@ def _stage_backend_artifact_detail(backend: str) -> str:
     return "controlled contract execution"
 
 
+def _prioritized_units(state: Mapping[str, Any], units: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order contending ready units by their longest estimated remaining path."""
+
+    return prioritize_ready_units(
+        state,
+        units,
+        StageDurationModel.from_state(state),
+        input_bytes_by_unit_id={
+            str(unit.get("id", "")): artifact_input_bytes(_upstream_artifact_records(state, unit))
+            for unit in units
+        },
+    )
+
+
+def _timed_stage_execution_result(
+    context: DagExecutionContext,
+    *,
+    upstream_artifacts: list[dict[str, str]] | None = None,
+    **kwargs: Any,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Run ``_stage_execution_result`` and measure it for the duration model."""
+
+    input_bytes = artifact_input_bytes(upstream_artifacts or [])
+    started_epoch = time.time()
+    started = time.monotonic()
+    result = _stage_execution_result(context, upstream_artifacts=upstream_artifacts, **kwargs)
+    duration = time.monotonic() - started
+    return dict(result), {
+        "started_epoch_seconds": started_epoch,
+        "completed_epoch_seconds": started_epoch + duration,
+        "duration_seconds": duration,
+        "input_bytes": input_bytes,
+    }
+
+
 def _stage_execution_result(
     context: DagExecutionContext,
     *,
@@ -775,10 +1056,106 @@ def _stage_execution_result(
     artifact: Mapping[str, str],
     timestamp: str,
     execution_backend: str,
+    upstream_artifacts: list[dict[str, str]] | None = None,
 ) -> dict[str, Any]:
+    cache = context.stage_cache
+    stage_key = (
+        _stage_cache_key(
+            context,
+            cache,
+            unit=unit,
+            artifact=artifact,
+            execution_backend=execution_backend,
+            upstream_artifacts=upstream_artifacts or [],
+        )
+        if cache is not None
+        else None
+    )
+    unit_id = str(unit.get("id", "")).strip() or "stage"
+    run_root = _real_run_root(context.lab_dir, unit_id)
+    if cache is not None and stage_key is not None:
+        cached = cache.lookup(stage_key, run_root=run_root)
+        if cached is not None:
+            # The outputs come from an earlier attempt; the unit is still
+            # completed under this attempt's token for state and evidence.
+            if "idempotency_token" in cached:
+                cached["idempotency_token"] = _unit_persisted_idempotency_token(unit)
+            return cached
+
     if execution_backend == DAG_STAGE_BACKEND_DISTRIBUTED:
-        return _distributed_stage_result(context, unit=unit, artifact=artifact, timestamp=timestamp)
-    return _contract_stage_result(context, unit=unit, artifact=artifact, timestamp=timestamp)
+        result = _distributed_stage_result(context, unit=unit, artifact=artifact, timestamp=timestamp)
+    else:
+        result = _contract_stage_result(context, unit=unit, artifact=artifact, timestamp=timestamp)
+    if cache is None:
+        return result
+    if stage_key is None:
+        result["build_cache"] = {"status": "uncacheable", "reason": "an upstream artifact or data_in has no hashable content"}
+        return result
+    try:
+        stored = cache.store(stage_key, run_root=run_root, unit_id=unit_id, result=result)
+    except OSError:
+        stored = False
+    result["build_cache"] = {"status": "stored" if stored else "not_stored", "stage_key": stage_key}
+    return result
+
+
+def _stage_cache_key(
+    context: DagExecutionContext,
+    cache: DagStageCache,
+    *,
+    unit: Mapping[str, Any],
+    artifact: Mapping[str, str],
+    execution_backend: str,
+    upstream_artifacts: list[dict[str, str]],
+) -> str | None:
+    unit_id = str(unit.get("id", "")).strip() or "stage"
+    contract = _unit_execution_contract(unit)
+    runner = (
+        _stage_contract_runner(context, unit_id=unit_id, contract=contract)
+        if execution_backend == DAG_STAGE_BACKEND_LOCAL
+        else None
+    )
+    source = (
+        cache.callable_fingerprint(runner)
+        if runner is not None
+        else cache.app_source_fingerprint(context.repo_root, str(unit.get("app", "")).strip())
+    )
+    return cache.stage_key(
+        unit_id=unit_id,
+        artifact=artifact,
+        execution_backend=execution_backend,
+        execution_contract=contract,
+        source=source,
+        upstream_artifacts=upstream_artifacts,
+    )
+
+
+def _upstream_artifact_records(state: Mapping[str, Any], unit: Mapping[str, Any]) -> list[dict[str, str]]:
+    """Return the published artifacts a unit consumes, as hashed into its stage key."""
+
+    artifacts = state.get("artifacts", [])
+    published = {
+        str(artifact.get("artifact", "")): artifact
+        for artifact in (artifacts if isinstance(artifacts, list) else [])
+        if isinstance(artifact, Mapping)
+    }
+    records: list[dict[str, str]] = []
+    dependencies = unit.get("artifact_dependencies", [])
+    for dependency in dependencies if isinstance(dependencies, list) else []:
+        if not isinstance(dependency, Mapping):
+            continue
+        artifact_id = str(dependency.get("artifact", "")).strip()
+        if not artifact_id:
+            continue
+        artifact = published.get(artifact_id, {})
+        records.append(
+            {
+                "artifact": artifact_id,
+                "producer": str(artifact.get("producer", "") or dependency.get("from", "")),
+                "path": str(artifact.get("path", "")),
+            }
+        )
+    return records
 
 
 def _distributed_stage_result(
@@ -1251,6 +1628,8 @@ def _mark_controlled_stage_execution(
     operator_message: str | None = None,
     artifact_available_detail: str | None = None,
     completion_detail: str | None = None,
+    started_at: str | None = None,
+    stage_timing: Mapping[str, Any] | None = None,
 ) -> None:
     unit_id = str(unit.get("id", ""))
     previous_status = str(unit.get("dispatch_status", ""))
@@ -1259,7 +1638,7 @@ def _mark_controlled_stage_execution(
     timestamps = unit.setdefault("timestamps", {})
     if isinstance(timestamps, dict):
         timestamps.setdefault("created_at", state.get("created_at", timestamp))
-        timestamps["started_at"] = timestamp
+        timestamps["started_at"] = started_at or timestamp
         timestamps["completed_at"] = timestamp
         timestamps["updated_at"] = timestamp
     unit["operator_ui"] = {
@@ -1318,6 +1697,18 @@ def _mark_controlled_stage_execution(
         artifact_record["packets_generated"] = int(metrics.get("packets_generated", 0) or 0)
     if "packets_delivered" in metrics:
         artifact_record["packets_delivered"] = int(metrics.get("packets_delivered", 0) or 0)
+    build_cache = result.get("build_cache")
+    build_cache = build_cache if isinstance(build_cache, Mapping) else {}
+    if build_cache.get("stage_key"):
+        artifact_record["stage_key"] = str(build_cache["stage_key"])
+    if stage_timing is not None:
+        record_stage_duration(
+            state,
+            unit,
+            timing=stage_timing,
+            execution_mode=execution_mode,
+            cache_hit=build_cache.get("status") == "hit",
+        )
     _replace_artifact(
         state,
         artifact_record,
@@ -1344,6 +1735,19 @@ def _mark_controlled_stage_execution(
         to_status="completed",
         detail=completion_detail or f"{unit_id} completed through the controlled AGILAB app entrypoint",
     )
+    if build_cache.get("status") == "hit":
+        _append_event(
+            state,
+            timestamp=timestamp,
+            kind="unit_cache_hit",
+            unit_id=unit_id,
+            from_status="running",
+            to_status="completed",
+            detail=(
+                f"{unit_id} reused cached outputs for stage key {build_cache['stage_key']} "
+                f"produced by {build_cache.get('source_idempotency_token') or 'an earlier attempt'}"
+            ),
+        )
     _append_event(
         state,
         timestamp=timestamp,
@@ -1362,6 +1766,7 @@ def _mark_controlled_stage_failure(
     timestamp: str,
     message: str,
     execution_mode: str = "contract_adapter",
+    started_at: str | None = None,
 ) -> None:
     unit_id = str(unit.get("id", ""))
     previous_status = str(unit.get("dispatch_status", ""))
@@ -1370,7 +1775,7 @@ def _mark_controlled_stage_failure(
     timestamps = unit.setdefault("timestamps", {})
     if isinstance(timestamps, dict):
         timestamps.setdefault("created_at", state.get("created_at", timestamp))
-        timestamps["started_at"] = timestamp
+        timestamps["started_at"] = started_at or timestamp
         timestamps["completed_at"] = timestamp
         timestamps["updated_at"] = timestamp
     unit["operator_ui"] = {
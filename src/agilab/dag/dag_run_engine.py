@@ -15,6 +15,8 @@ from uuid import uuid4
 from .dag_execution_adapters import (
     DAG_STAGE_BACKEND_DISTRIBUTED,
     DAG_STAGE_BACKEND_LOCAL,
+    DAG_STAGE_SCHEDULE_CONTINUOUS,
+    DAG_STAGE_SCHEDULE_WAVE,
     GLOBAL_DAG_DISTRIBUTED_EXECUTION_SCOPE,
     GLOBAL_DAG_REAL_EXECUTION_SCOPE,  # noqa: F401 - re-exported for pipeline_lab compatibility
     GLOBAL_DAG_REAL_RUN_DIRNAME,  # noqa: F401 - re-exported for pipeline_lab compatibility
@@ -30,6 +32,8 @@ from .dag_execution_adapters import (
     _run_ready_adapter_stages_uncommitted,
 )
 from .dag_idempotency import DagExternalExecutionUncertainError  # noqa: F401 - public failure contract
+from .dag_stage_cache import DagStageCache, resolve_dag_stage_cache
+from .dag_stage_durations import carry_stage_duration_history, simulate_dag_schedule
 from .dag_execution_registry import (
     CONTROLLED_CONTRACT_ADAPTER,
     CONTROLLED_CONTRACT_RUNNER_STATUS,
@@ -58,7 +62,7 @@ from agilab.global_pipeline.global_pipeline_runner_state import (
     RunnerStateRecoveryRequiredError,  # noqa: F401 - re-exported for Streamlit compatibility
     build_persisted_runner_state,
     dispatch_next_runnable as dispatch_next_runnable_state,
-    load_runner_state,  # noqa: F401 - re-exported for pipeline_lab compatibility
+    load_runner_state,
     load_runner_state_snapshot,
     persist_runner_state,  # noqa: F401 - re-exported for pipeline_lab compatibility
     runner_state_active_attempt,
@@ -79,6 +83,8 @@ GLOBAL_DAG_CONTROLLED_RUNNER_STATUS = CONTROLLED_RUNNER_STATUS
 GLOBAL_DAG_CONTROLLED_CONTRACT_RUNNER_STATUS = CONTROLLED_CONTRACT_RUNNER_STATUS
 GLOBAL_DAG_STAGE_BACKEND_LOCAL = DAG_STAGE_BACKEND_LOCAL
 GLOBAL_DAG_STAGE_BACKEND_DISTRIBUTED = DAG_STAGE_BACKEND_DISTRIBUTED
+GLOBAL_DAG_STAGE_SCHEDULE_WAVE = DAG_STAGE_SCHEDULE_WAVE
+GLOBAL_DAG_STAGE_SCHEDULE_CONTINUOUS = DAG_STAGE_SCHEDULE_CONTINUOUS
 GLOBAL_DAG_DISTRIBUTED_CONTRACT_EXECUTION_SCOPE = GLOBAL_DAG_DISTRIBUTED_EXECUTION_SCOPE
 GLOBAL_DAG_QUEUE_UNIT_ID = QUEUE_UNIT_ID
 GLOBAL_DAG_RELAY_UNIT_ID = RELAY_UNIT_ID
@@ -343,6 +349,7 @@ class DagRunEngine:
     stage_submit_fn: Callable[..., Mapping[str, Any]] | None = None
     now_fn: Callable[[], str] = lambda: _now_iso()
     attempt_id_fn: Callable[[], str] = lambda: uuid4().hex
+    stage_cache: DagStageCache | None = None
 
     @property
     def state_path(self) -> Path:
@@ -360,6 +367,7 @@ class DagRunEngine:
             repo_root=self.repo_root,
             dag_path=self.dag_path,
         )
+        carry_stage_duration_history(state, replacement)
         try:
             with runner_state_write_transaction(
                 self.state_path,
@@ -430,6 +438,7 @@ class DagRunEngine:
             lab_dir=self.lab_dir,
             dag_path=self.dag_path,
             trigger=trigger,
+            load_state_fn=load_runner_state,
         )
 
     def dispatch_next_runnable(self, state: Mapping[str, Any]) -> RunnerDispatchResult:
@@ -477,6 +486,7 @@ class DagRunEngine:
             now_fn=self.now_fn,
             execution_attempt_id=execution_attempt_id,
             persist_execution_claim_fn=persist_execution_claim_fn,
+            stage_cache=self.stage_cache,
         )
 
     def run_next_controlled_stage_transaction(
@@ -485,7 +495,7 @@ class DagRunEngine:
     ) -> DagStageExecutionResult:
         return self._run_execution_state_transaction(
             state,
-            action=lambda current, attempt_id, persist_claim: self._run_next_controlled_stage_uncommitted(
+            action=lambda current, attempt_id, persist_claim, _persist_progress: self._run_next_controlled_stage_uncommitted(
                 current,
                 execution_attempt_id=attempt_id,
                 persist_execution_claim_fn=persist_claim,
@@ -499,13 +509,20 @@ class DagRunEngine:
         *,
         max_workers: int | None = None,
         execution_backend: str = GLOBAL_DAG_STAGE_BACKEND_LOCAL,
+        schedule: str = GLOBAL_DAG_STAGE_SCHEDULE_WAVE,
     ) -> DagBatchExecutionResult:
-        """Run all ready stages through the durable runner-state transaction boundary."""
+        """Run ready stages through the durable runner-state transaction boundary.
+
+        ``schedule="wave"`` runs the currently ready stages and stops;
+        ``schedule="continuous"`` keeps launching stages as their artifacts
+        become available until no stage is ready or running.
+        """
 
         return self.run_ready_controlled_stages_transaction(
             state,
             max_workers=max_workers,
             execution_backend=execution_backend,
+            schedule=schedule,
         )
 
     def _run_ready_controlled_stages_uncommitted(
@@ -514,8 +531,10 @@ class DagRunEngine:
         *,
         max_workers: int | None,
         execution_backend: str,
+        schedule: str,
         execution_attempt_id: str,
         persist_execution_claim_fn: Callable[[Mapping[str, Any]], object],
+        persist_execution_progress_fn: Callable[[Mapping[str, Any]], object],
     ) -> DagBatchExecutionResult:
         return _run_ready_controlled_stages_uncommitted(
             state,
@@ -529,8 +548,11 @@ class DagRunEngine:
             now_fn=self.now_fn,
             max_workers=max_workers,
             execution_backend=execution_backend,
+            schedule=schedule,
             execution_attempt_id=execution_attempt_id,
             persist_execution_claim_fn=persist_execution_claim_fn,
+            persist_execution_progress_fn=persist_execution_progress_fn,
+            stage_cache=self.stage_cache,
         )
 
     def run_ready_controlled_stages_transaction(
@@ -539,25 +561,45 @@ class DagRunEngine:
         *,
         max_workers: int | None = None,
         execution_backend: str = GLOBAL_DAG_STAGE_BACKEND_LOCAL,
+        schedule: str = GLOBAL_DAG_STAGE_SCHEDULE_WAVE,
     ) -> DagBatchExecutionResult:
         return self._run_execution_state_transaction(
             state,
-            action=lambda current, attempt_id, persist_claim: self._run_ready_controlled_stages_uncommitted(
-                current,
-                max_workers=max_workers,
-                execution_backend=execution_backend,
-                execution_attempt_id=attempt_id,
-                persist_execution_claim_fn=persist_claim,
+            action=lambda current, attempt_id, persist_claim, persist_progress: (
+                self._run_ready_controlled_stages_uncommitted(
+                    current,
+                    max_workers=max_workers,
+                    execution_backend=execution_backend,
+                    schedule=schedule,
+                    execution_attempt_id=attempt_id,
+                    persist_execution_claim_fn=persist_claim,
+                    persist_execution_progress_fn=persist_progress,
+                )
             ),
             trigger_action="controlled_stages_executed",
         )
 
+    def schedule_simulation_report(
+        self,
+        state: Mapping[str, Any],
+        *,
+        max_workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Predicted critical-path makespan for ``max_workers`` versus the recorded run."""
+
+        return simulate_dag_schedule(state, max_workers=max_workers)
+
     def _run_execution_state_transaction(
         self,
         state: Mapping[str, Any],
         *,
         action: Callable[
-            [Mapping[str, Any], str, Callable[[Mapping[str, Any]], object]],
+            [
+                Mapping[str, Any],
+                str,
+                Callable[[Mapping[str, Any]], object],
+                Callable[[Mapping[str, Any]], object],
+            ],
             _RunnerStateResultT,
         ],
         trigger_action: str,
@@ -567,7 +609,11 @@ class DagRunEngine:
         _raise_if_active_attempt(self.state_path, state)
         claim_persisted = False
         claim_revision = ""
+        # ``claimed_tokens`` mirrors the persisted active_execution.unit_tokens;
+        # ``attempt_tokens`` keeps every unit ever claimed by this attempt.
         claimed_tokens: dict[str, str] = {}
+        attempt_tokens: dict[str, str] = {}
+        active_execution_record: dict[str, Any] = {}
         owner_registered = False
 
         def _persist_claim(claim_state: Mapping[str, Any]) -> object:
@@ -581,13 +627,18 @@ class DagRunEngine:
             if len(set(claimed_tokens.values())) != len(claimed_tokens):
                 raise RuntimeError("A DAG execution attempt produced duplicate per-unit idempotency tokens.")
             owner = _current_execution_owner()
+            active_execution_record.update(
+                {
+                    "attempt_id": attempt_id,
+                    "status": "running",
+                    "claimed_at": str(mutable_claim.get("updated_at", "")),
+                    "recovery_policy": "exact_unit_token_required",
+                    "owner": owner,
+                }
+            )
             mutable_claim["active_execution"] = {
-                "attempt_id": attempt_id,
-                "status": "running",
-                "claimed_at": str(mutable_claim.get("updated_at", "")),
+                **active_execution_record,
                 "unit_tokens": claimed_tokens,
-                "recovery_policy": "exact_unit_token_required",
-                "owner": owner,
             }
             with runner_state_write_transaction(
                 self.state_path,
@@ -598,6 +649,7 @@ class DagRunEngine:
                 pass
             claim_revision = runner_state_revision(mutable_claim)
             claim_persisted = True
+            attempt_tokens.update(claimed_tokens)
             _register_execution_owner(
                 self.state_path,
                 attempt_id,
@@ -616,6 +668,43 @@ class DagRunEngine:
             )
             return _DURABLE_CLAIM_RECEIPT
 
+        def _persist_progress(progress_state: Mapping[str, Any]) -> object:
+            """Commit per-unit transitions of a claimed attempt (continuous runs)."""
+            nonlocal claim_revision, claimed_tokens
+            if not claim_persisted:
+                raise RuntimeError("A DAG execution attempt must persist its claim before progress.")
+            mutable_progress = progress_state if isinstance(progress_state, dict) else dict(progress_state)
+            running_tokens = _claimed_unit_tokens(mutable_progress, attempt_id)
+            if len(set(running_tokens.values())) != len(running_tokens):
+                raise RuntimeError("A DAG execution attempt produced duplicate per-unit idempotency tokens.")
+            if any(attempt_tokens.get(unit_id, token) != token for unit_id, token in running_tokens.items()):
+                raise RuntimeError("A DAG execution attempt changed a claimed unit idempotency token.")
+            mutable_progress["active_execution"] = {
+                **active_execution_record,
+                "unit_tokens": running_tokens,
+            }
+            with runner_state_write_transaction(
+                self.state_path,
+                mutable_progress,
+                expected_revision=claim_revision,
+                require_directory_fsync=True,
+            ) as state_path:
+                pass
+            claim_revision = runner_state_revision(mutable_progress)
+            claimed_tokens = running_tokens
+            attempt_tokens.update(running_tokens)
+            self.write_evidence(
+                mutable_progress,
+                state_path=state_path,
+                trigger={
+                    "surface": "workflow",
+                    "action": "controlled_stage_progress",
+                    "attempt_id": attempt_id,
+                    "idempotency_tokens": running_tokens,
+                },
+            )
+            return _DURABLE_CLAIM_RECEIPT
+
         def _persist_recovery_required(exc: BaseException) -> None:
             error_detail = (
                 exc.detail
@@ -668,7 +757,7 @@ class DagRunEngine:
                 )
 
         try:
-            result = action(state, attempt_id, _persist_claim)
+            result = action(state, attempt_id, _persist_claim, _persist_progress)
         except BaseException as exc:
             _persist_recovery_required(exc)
             if owner_registered:
@@ -694,7 +783,7 @@ class DagRunEngine:
                     )
                 for unit in dag_units(final_state):
                     unit_id = str(unit.get("id", ""))
-                    if unit_id not in claimed_tokens:
+                    if unit_id not in attempt_tokens:
                         continue
                     attempt = unit.get("execution_attempt")
                     token = (
@@ -702,7 +791,7 @@ class DagRunEngine:
                         if isinstance(attempt, Mapping)
                         else ""
                     )
-                    if token != claimed_tokens[unit_id] or unit.get(
+                    if token != attempt_tokens[unit_id] or unit.get(
                         "dispatch_status"
                     ) not in {"completed", "failed"}:
                         raise RunnerStateAttemptConflictError(
@@ -739,13 +828,14 @@ class DagRunEngine:
                         "surface": "workflow",
                         "action": trigger_action,
                         "attempt_id": attempt_id,
-                        "idempotency_tokens": claimed_tokens,
+                        "idempotency_tokens": attempt_tokens,
                     },
                 )
                 finalization_succeeded = True
                 return result
 
-            if runner_state_revision(result.state) != expected_revision:
+            # Journaled revisions are commit counters, so detect changes by content.
+            if result.state != state:
                 with runner_state_transaction(
                     self.state_path,
                     expected_revision=expected_revision,
@@ -783,7 +873,7 @@ class DagRunEngine:
             expected_revision=expected_revision,
         ) as transaction:
             result = action(transaction.state)
-            if runner_state_revision(result.state) != transaction.revision:
+            if result.state != transaction.state:
                 state_path = transaction.commit(result.state)
             else:
                 state_path = None
@@ -955,6 +1045,7 @@ def _run_next_controlled_stage_uncommitted(
     run_relay_fn: Callable[..., Mapping[str, Any]] | None = None,
     stage_run_fns: Mapping[str, Callable[..., Mapping[str, Any]]] | None = None,
     now_fn: Callable[[], str] = _now_iso,
+    stage_cache: DagStageCache | None = None,
 ) -> DagStageExecutionResult:
     support = controlled_real_run_support(state, dag_path, repo_root)
     if not support.supported:
@@ -976,6 +1067,7 @@ def _run_next_controlled_stage_uncommitted(
             now_fn=now_fn,
             execution_attempt_id=execution_attempt_id,
             persist_execution_claim_fn=persist_execution_claim_fn,
+            stage_cache=stage_cache if stage_cache is not None else resolve_dag_stage_cache(lab_dir),
         ),
     )
 
@@ -993,6 +1085,7 @@ def run_ready_controlled_stages(
     now_fn: Callable[[], str] = _now_iso,
     max_workers: int | None = None,
     execution_backend: str = GLOBAL_DAG_STAGE_BACKEND_LOCAL,
+    schedule: str = GLOBAL_DAG_STAGE_SCHEDULE_WAVE,
 ) -> DagBatchExecutionResult:
     """Run ready controlled stages with one durable multi-unit transaction."""
 
@@ -1009,6 +1102,7 @@ def run_ready_controlled_stages(
         state,
         max_workers=max_workers,
         execution_backend=execution_backend,
+        schedule=schedule,
     )
 
 
@@ -1020,6 +1114,7 @@ def _run_ready_controlled_stages_uncommitted(
     lab_dir: Path,
     execution_attempt_id: str,
     persist_execution_claim_fn: Callable[[Mapping[str, Any]], object],
+    persist_execution_progress_fn: Callable[[Mapping[str, Any]], object] | None = None,
     run_queue_fn: Callable[..., Mapping[str, Any]] | None = None,
     run_relay_fn: Callable[..., Mapping[str, Any]] | None = None,
     stage_run_fns: Mapping[str, Callable[..., Mapping[str, Any]]] | None = None,
@@ -1027,6 +1122,8 @@ def _run_ready_controlled_stages_uncommitted(
     now_fn: Callable[[], str] = _now_iso,
     max_workers: int | None = None,
     execution_backend: str = GLOBAL_DAG_STAGE_BACKEND_LOCAL,
+    schedule: str = GLOBAL_DAG_STAGE_SCHEDULE_WAVE,
+    stage_cache: DagStageCache | None = None,
 ) -> DagBatchExecutionResult:
     support = controlled_real_run_support(state, dag_path, repo_root)
     if not support.supported:
@@ -1049,7 +1146,10 @@ def _run_ready_controlled_stages_uncommitted(
             now_fn=now_fn,
             execution_attempt_id=execution_attempt_id,
             persist_execution_claim_fn=persist_execution_claim_fn,
+            persist_execution_progress_fn=persist_execution_progress_fn,
+            stage_cache=stage_cache if stage_cache is not None else resolve_dag_stage_cache(lab_dir),
         ),
         max_workers=max_workers,
         execution_backend=execution_backend,
+        schedule=schedule,
     )
@@ -0,0 +1,341 @@
+"""Content-addressed build cache for controlled DAG stage outputs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Mapping, Sequence
+
+DAG_STAGE_CACHE_ENV = "AGILAB_DAG_STAGE_CACHE"
+DAG_STAGE_CACHE_MAX_MB_ENV = "AGILAB_DAG_STAGE_CACHE_MAX_MB"
+DAG_STAGE_CACHE_DIRNAME = "dag_stage_cache"
+DAG_STAGE_CACHE_SCHEMA = "agilab.dag_stage_cache.v1"
+DEFAULT_DAG_STAGE_CACHE_MAX_MB = 2048
+_ENTRY_FILENAME = "entry.json"
+_ENTRY_FILES_DIRNAME = "files"
+_APP_SOURCE_SUFFIXES = frozenset({".py", ".toml", ".cfg", ".yaml", ".yml"})
+# DAG templates live inside app trees; editing one must not invalidate every
+# stage of that app, only the stages whose contract actually changed.
+_APP_SOURCE_SKIPPED_DIRNAMES = frozenset(
+    {"__pycache__", ".git", ".venv", ".pytest_cache", "build", "dist", "dag_templates"}
+)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _sha256_json(payload: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def resolve_dag_stage_cache(lab_dir: Path) -> DagStageCache | None:
+    """Return the stage cache configured by ``AGILAB_DAG_STAGE_CACHE``, if any.
+
+    ``1``/``true`` selects ``<lab_dir>/.agilab/dag_stage_cache``; any other
+    non-false value is used as the cache directory.
+    """
+
+    raw = str(os.environ.get(DAG_STAGE_CACHE_ENV, "")).strip()
+    if raw.lower() in {"", "0", "false", "no", "off"}:
+        return None
+    if raw.lower() in {"1", "true", "yes", "on"}:
+        root = lab_dir / ".agilab" / DAG_STAGE_CACHE_DIRNAME
+    else:
+        root = Path(raw).expanduser()
+    max_mb_raw = str(os.environ.get(DAG_STAGE_CACHE_MAX_MB_ENV, "")).strip()
+    try:
+        max_mb = float(max_mb_raw) if max_mb_raw else DEFAULT_DAG_STAGE_CACHE_MAX_MB
+    except ValueError:
+        max_mb = DEFAULT_DAG_STAGE_CACHE_MAX_MB
+    if max_mb <= 0:
+        max_mb = DEFAULT_DAG_STAGE_CACHE_MAX_MB
+    return DagStageCache(root=root, max_bytes=int(max_mb * 1024 * 1024))
+
+
+@dataclass
+class DagStageCache:
+    """Stage results and output files keyed by everything that determines them.
+
+    A stage key covers the upstream artifact contents, the content of the
+    contract's ``data_in``, the execution contract and the fingerprint of the
+    code that runs the stage. Entries live at
+    ``<root>/<key[:2]>/<key>/`` and are evicted least-recently-used once the
+    store grows beyond ``max_bytes``.
+    """
+
+    root: Path
+    max_bytes: int = DEFAULT_DAG_STAGE_CACHE_MAX_MB * 1024 * 1024
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _file_digests: dict[Path, tuple[tuple[int, int], str]] = field(default_factory=dict, repr=False)
+
+    def _file_sha256(self, path: Path) -> str:
+        """Hash one file, reusing the digest while its size and mtime are unchanged."""
+
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._file_digests.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        digest = hashlib.sha256()
+        with path.open("rb") as stream:
+            for block in iter(lambda: stream.read(1024 * 1024), b""):
+                digest.update(block)
+        value = digest.hexdigest()
+        with self._lock:
+            self._file_digests[path] = (signature, value)
+        return value
+
+    def _tree_sha256(self, root: Path, *, suffixes: frozenset[str] | None = None) -> str:
+        entries: list[tuple[str, str]] = []
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(
+                name for name in dirnames if suffixes is None or name not in _APP_SOURCE_SKIPPED_DIRNAMES
+            )
+            for filename in sorted(filenames):
+                path = Path(directory) / filename
+                if suffixes is not None and path.suffix not in suffixes:
+                    continue
+                entries.append((path.relative_to(root).as_posix(), self._file_sha256(path)))
+        return _sha256_json(entries)
+
+    def artifact_sha256(self, path_text: str) -> str | None:
+        """Return the content digest of an artifact file or directory, if it exists."""
+
+        path = Path(path_text) if path_text else None
+        if path is None or not path.is_absolute():
+            return None
+        if path.is_file():
+            return self._file_sha256(path)
+        if path.is_dir():
+            return self._tree_sha256(path)
+        return None
+
+    def callable_fingerprint(self, fn: Callable[..., Any]) -> dict[str, str]:
+        """Fingerprint an in-process stage runner by its source, like the distribution planner cache."""
+
+        callable_obj = getattr(fn, "__func__", fn)
+        digest = hashlib.sha256()
+        name = f"{getattr(callable_obj, '__module__', '')}.{getattr(callable_obj, '__qualname__', type(callable_obj).__qualname__)}"
+        digest.update(name.encode("utf-8"))
+        try:
+            digest.update(inspect.getsource(callable_obj).encode("utf-8"))
+        except (OSError, TypeError):
+            code = getattr(callable_obj, "__code__", None)
+            if code is not None:
+                digest.update(code.co_code)
+                digest.update(repr(code.co_consts).encode("utf-8"))
+        try:
+            source_path_raw = inspect.getsourcefile(callable_obj)
+        except TypeError:
+            source_path_raw = None
+        if source_path_raw and Path(source_path_raw).is_file():
+            digest.update(self._file_sha256(Path(source_path_raw).resolve()).encode("ascii"))
+        return {"callable": name, "sha256": digest.hexdigest()}
+
+    def app_source_fingerprint(self, repo_root: Path, app_name: str) -> dict[str, str]:
+        """Fingerprint the source tree of the app that owns a stage."""
+
+        for apps_path in (repo_root / "src" / "agilab" / "apps" / "builtin", repo_root / "src" / "agilab" / "apps"):
+            app_root = apps_path / app_name
+            if app_name and app_root.is_dir():
+                return {
+                    "app": app_name,
+                    "sha256": self._tree_sha256(app_root, suffixes=_APP_SOURCE_SUFFIXES),
+                }
+        return {"app": app_name, "sha256": ""}
+
+    def stage_key(
+        self,
+        *,
+        unit_id: str,
+        artifact: Mapping[str, str],
+        execution_backend: str,
+        execution_contract: Mapping[str, Any],
+        source: Mapping[str, str],
+        upstream_artifacts: Sequence[Mapping[str, str]],
+    ) -> str | None:
+        """Return the stage key, or ``None`` when an input cannot be hashed.
+
+        Inputs are the upstream artifacts and the contract's ``data_in``. A
+        relative ``data_in`` resolves against the cluster share at run time,
+        which the cache cannot see, so such stages are not cached.
+        """
+
+        data_in = str(execution_contract.get("data_in") or "").strip()
+        data_in_sha256 = self.artifact_sha256(os.path.expanduser(data_in)) if data_in else ""
+        if data_in_sha256 is None:
+            return None
+        upstream: list[dict[str, str]] = []
+        for record in upstream_artifacts:
+            digest = self.artifact_sha256(str(record.get("path", "")))
+            if digest is None:
+                return None
+            upstream.append(
+                {
+                    "artifact": str(record.get("artifact", "")),
+                    "producer": str(record.get("producer", "")),
+                    "sha256": digest,
+                }
+            )
+        return _sha256_json(
+            {
+                "schema": DAG_STAGE_CACHE_SCHEMA,
+                "unit_id": unit_id,
+                "artifact": dict(artifact),
+                "execution_backend": execution_backend,
+                "execution_contract": dict(execution_contract),
+                "source": dict(source),
+                "upstream": sorted(upstream, key=lambda item: (item["artifact"], item["producer"])),
+                **({"data_in_sha256": data_in_sha256} if data_in_sha256 else {}),
+            }
+        )
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def lookup(self, key: str, *, run_root: Path) -> dict[str, Any] | None:
+        """Restore a cached stage into ``run_root`` and return its result, or ``None``."""
+
+        entry_dir = self._entry_dir(key)
+        entry_path = entry_dir / _ENTRY_FILENAME
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+            if not isinstance(entry, dict) or entry.get("schema") != DAG_STAGE_CACHE_SCHEMA:
+                return None
+            result = dict(entry["result"])
+            files = dict(entry.get("files", {}))
+            for result_key, relative in files.items():
+                _restore_output(entry_dir / _ENTRY_FILES_DIRNAME / relative, run_root / relative)
+                result[result_key] = str(run_root / relative)
+            os.utime(entry_path)
+        except (OSError, KeyError, TypeError, ValueError):
+            # A concurrent eviction or a damaged entry is just a miss.
+            return None
+        result["build_cache"] = {
+            "status": "hit",
+            "stage_key": key,
+            "stored_at": str(entry.get("stored_at", "")),
+            "source_idempotency_token": str(entry["result"].get("idempotency_token", "")),
+        }
+        return result
+
+    def store(self, key: str, *, run_root: Path, unit_id: str, result: Mapping[str, Any]) -> bool:
+        """Store a stage result and its run-root outputs; return whether it was cached.
+
+        Results that point at existing outputs outside ``run_root`` are not
+        cached, since a hit could not restore them.
+        """
+
+        files: dict[str, str] = {}
+        resolved_root = run_root.resolve(strict=False)
+        for result_key, value in result.items():
+            if not result_key.endswith("_path") or not isinstance(value, str) or not value:
+                continue
+            path = Path(value)
+            if not path.is_absolute() or not path.exists():
+                continue
+            try:
+                files[result_key] = path.resolve().relative_to(resolved_root).as_posix()
+            except ValueError:
+                return False
+
+        entry_dir = self._entry_dir(key)
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=entry_dir.parent))
+        try:
+            for relative in sorted(set(files.values())):
+                source = run_root / relative
+                target = staging / _ENTRY_FILES_DIRNAME / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if source.is_dir():
+                    shutil.copytree(source, target)
+                else:
+                    shutil.copy2(source, target)
+            (staging / _ENTRY_FILENAME).write_text(
+                json.dumps(
+                    {
+                        "schema": DAG_STAGE_CACHE_SCHEMA,
+                        "stage_key": key,
+                        "unit_id": unit_id,
+                        "stored_at": _now_iso(),
+                        "files": files,
+                        "result": dict(result),
+                    },
+                    indent=2,
+                    sort_keys=True,
+                    default=str,
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+            try:
+                os.replace(staging, entry_dir)
+            except OSError:
+                # Another worker stored the same key first; its entry is equivalent.
+                return entry_dir.is_dir()
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict(keep=key)
+        return True
+
+    def evict(self, *, keep: str = "") -> list[str]:
+        """Drop least-recently-used entries until the store fits ``max_bytes``."""
+
+        with self._lock:
+            entries: list[tuple[float, int, str, Path]] = []
+            for entry_path in self.root.glob(f"*/*/{_ENTRY_FILENAME}"):
+                entry_dir = entry_path.parent
+                try:
+                    used_at = entry_path.stat().st_mtime
+                    size = sum(
+                        path.stat().st_size for path in entry_dir.rglob("*") if path.is_file()
+                    )
+                except OSError:
+                    continue
+                entries.append((used_at, size, entry_dir.name, entry_dir))
+            total = sum(size for _used_at, size, _key, _path in entries)
+            evicted: list[str] = []
+            # The entry just stored goes last: it is evicted only when it alone
+            # does not fit.
+            for _used_at, size, key, entry_dir in sorted(entries, key=lambda item: (item[2] == keep, item[0])):
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total -= size
+                evicted.append(key)
+            return evicted
+
+
+def _restore_output(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.restore")
+    shutil.rmtree(staging, ignore_errors=True)
+    if source.is_dir():
+        shutil.copytree(source, staging)
+        shutil.rmtree(target, ignore_errors=True)
+    else:
+        shutil.copy2(source, staging)
+    os.replace(staging, target)
+
+
+__all__ = [
+    "DAG_STAGE_CACHE_DIRNAME",
+    "DAG_STAGE_CACHE_ENV",
+    "DAG_STAGE_CACHE_MAX_MB_ENV",
+    "DAG_STAGE_CACHE_SCHEMA",
+    "DEFAULT_DAG_STAGE_CACHE_MAX_MB",
+    "DagStageCache",
+    "resolve_dag_stage_cache",
+]
@@ -0,0 +1,383 @@
+"""Learned stage durations and critical-path scheduling for global DAG runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import heapq
+import os
+from pathlib import Path
+from statistics import fmean, median
+from typing import Any, Mapping, Sequence
+
+STAGE_DURATION_HISTORY_KEY = "stage_duration_history"
+STAGE_DURATION_HISTORY_LIMIT = 512
+# Only the most recent runs of an app inform its estimate, so the model
+# follows code and data changes instead of averaging over all of history.
+STAGE_DURATION_APP_WINDOW = 32
+DEFAULT_STAGE_DURATION_SECONDS = 1.0
+DAG_SCHEDULE_SIMULATION_SCHEMA = "agilab.dag_schedule_simulation.v1"
+
+
+def artifact_input_bytes(upstream_artifacts: Sequence[Mapping[str, Any]]) -> int | None:
+    """Return the on-disk size of the artifacts a stage consumes.
+
+    Root stages consume nothing and report ``0``; ``None`` means an upstream
+    artifact exists in the DAG but its size cannot be measured.
+    """
+
+    total = 0
+    for record in upstream_artifacts:
+        path_text = str(record.get("path", "") or "")
+        path = Path(path_text) if path_text else None
+        if path is None or not path.is_absolute():
+            return None
+        try:
+            if path.is_file():
+                total += path.stat().st_size
+            elif path.is_dir():
+                for directory, _dirnames, filenames in os.walk(path):
+                    total += sum((Path(directory) / name).stat().st_size for name in filenames)
+            else:
+                return None
+        except OSError:
+            return None
+    return total
+
+
+def stage_duration_history(state: Mapping[str, Any]) -> list[dict[str, Any]]:
+    history = state.get(STAGE_DURATION_HISTORY_KEY, [])
+    if not isinstance(history, list):
+        return []
+    return [record for record in history if isinstance(record, dict)]
+
+
+def record_stage_duration(
+    state: dict[str, Any],
+    unit: dict[str, Any],
+    *,
+    timing: Mapping[str, Any],
+    execution_mode: str,
+    cache_hit: bool = False,
+) -> None:
+    """Attach ``timing`` to the unit and learn from it unless it was a cache hit."""
+
+    unit_timing = {
+        "started_epoch_seconds": float(timing["started_epoch_seconds"]),
+        "completed_epoch_seconds": float(timing["completed_epoch_seconds"]),
+        "duration_seconds": float(timing["duration_seconds"]),
+        "input_bytes": timing.get("input_bytes"),
+        "cache_hit": bool(cache_hit),
+    }
+    unit["stage_timing"] = unit_timing
+    if cache_hit:
+        # A restored cache entry says nothing about how long the stage computes.
+        return
+    attempt = unit.get("execution_attempt")
+    history = stage_duration_history(state)
+    history.append(
+        {
+            "unit_id": str(unit.get("id", "")),
+            "app": str(unit.get("app", "")),
+            "execution_mode": execution_mode,
+            "input_bytes": unit_timing["input_bytes"],
+            "duration_seconds": unit_timing["duration_seconds"],
+            "idempotency_token": (
+                str(attempt.get("idempotency_token", "")) if isinstance(attempt, Mapping) else ""
+            ),
+        }
+    )
+    state[STAGE_DURATION_HISTORY_KEY] = history[-STAGE_DURATION_HISTORY_LIMIT:]
+
+
+def carry_stage_duration_history(previous: Mapping[str, Any] | None, replacement: dict[str, Any]) -> None:
+    """Keep learned durations when a runner state is reset or rebuilt."""
+
+    history = stage_duration_history(previous) if previous is not None else []
+    if history:
+        replacement[STAGE_DURATION_HISTORY_KEY] = history[-STAGE_DURATION_HISTORY_LIMIT:]
+
+
+@dataclass(frozen=True)
+class StageDurationModel:
+    """Estimate stage durations per app, scaled by input size when it varies."""
+
+    records: tuple[Mapping[str, Any], ...] = ()
+    default_seconds: float = DEFAULT_STAGE_DURATION_SECONDS
+
+    @classmethod
+    def from_state(
+        cls,
+        state: Mapping[str, Any],
+        *,
+        exclude_tokens: frozenset[str] = frozenset(),
+    ) -> StageDurationModel:
+        records = tuple(
+            record
+            for record in stage_duration_history(state)
+            if str(record.get("idempotency_token", "")) not in exclude_tokens
+            and isinstance(record.get("duration_seconds"), (int, float))
+        )
+        return cls(records=records)
+
+    def estimate(self, *, app: str, unit_id: str = "", input_bytes: int | None = None) -> float:
+        app_records = [record for record in self.records if str(record.get("app", "")) == app]
+        app_records = app_records[-STAGE_DURATION_APP_WINDOW:]
+        if not app_records:
+            if not self.records:
+                return self.default_seconds
+            return float(median(float(record["duration_seconds"]) for record in self.records))
+        if input_bytes is not None:
+            sized = [
+                (float(record["input_bytes"]), float(record["duration_seconds"]))
+                for record in app_records
+                if isinstance(record.get("input_bytes"), (int, float))
+            ]
+            fit = _linear_fit(sized)
+            if fit is not None:
+                intercept, slope = fit
+                return max(0.0, intercept + slope * float(input_bytes))
+        unit_records = [record for record in app_records if str(record.get("unit_id", "")) == unit_id]
+        return fmean(float(record["duration_seconds"]) for record in unit_records or app_records)
+
+    def estimate_unit(self, unit: Mapping[str, Any], *, input_bytes: int | None = None) -> float:
+        return self.estimate(
+            app=str(unit.get("app", "")),
+            unit_id=str(unit.get("id", "")),
+            input_bytes=input_bytes,
+        )
+
+
+def _linear_fit(points: Sequence[tuple[float, float]]) -> tuple[float, float] | None:
+    """Least-squares ``duration = intercept + slope * input_bytes``, if informative."""
+
+    if len({x for x, _y in points}) < 2:
+        return None
+    mean_x = fmean(x for x, _y in points)
+    mean_y = fmean(y for _x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _y in points)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+    if slope < 0:
+        # Bigger inputs do not make a stage faster; treat it as noise.
+        return None
+    return mean_y - slope * mean_x, slope
+
+
+def _dag_units(state: Mapping[str, Any]) -> list[dict[str, Any]]:
+    units = state.get("units", [])
+    return [unit for unit in units if isinstance(unit, dict)] if isinstance(units, list) else []
+
+
+def _unit_predecessors(state: Mapping[str, Any]) -> dict[str, set[str]]:
+    units = _dag_units(state)
+    producers: dict[str, str] = {}
+    for unit in units:
+        for artifact in unit.get("produces", []) if isinstance(unit.get("produces"), list) else []:
+            if isinstance(artifact, Mapping) and str(artifact.get("artifact", "")):
+                producers.setdefault(str(artifact["artifact"]), str(unit.get("id", "")))
+    predecessors: dict[str, set[str]] = {}
+    for unit in units:
+        unit_id = str(unit.get("id", ""))
+        upstream: set[str] = set()
+        dependencies = unit.get("artifact_dependencies", [])
+        for dependency in dependencies if isinstance(dependencies, list) else []:
+            if not isinstance(dependency, Mapping):
+                continue
+            producer = str(dependency.get("from", "") or producers.get(str(dependency.get("artifact", "")), ""))
+            if producer and producer != unit_id:
+                upstream.add(producer)
+        predecessors[unit_id] = upstream
+    return predecessors
+
+
+def _unit_input_bytes(unit: Mapping[str, Any]) -> int | None:
+    timing = unit.get("stage_timing")
+    value = timing.get("input_bytes") if isinstance(timing, Mapping) else None
+    return int(value) if isinstance(value, (int, float)) else None
+
+
+def remaining_path_seconds(
+    state: Mapping[str, Any],
+    model: StageDurationModel,
+    *,
+    input_bytes_by_unit_id: Mapping[str, int | None] | None = None,
+) -> dict[str, float]:
+    """Return each unit's estimate plus the longest estimated path below it."""
+
+    units = {str(unit.get("id", "")): unit for unit in _dag_units(state)}
+    successors: dict[str, set[str]] = {unit_id: set() for unit_id in units}
+    for unit_id, upstream in _unit_predecessors(state).items():
+        for producer in upstream:
+            successors.setdefault(producer, set()).add(unit_id)
+    sizes = input_bytes_by_unit_id or {}
+    remaining: dict[str, float] = {}
+
+    def _visit(unit_id: str, path: frozenset[str]) -> float:
+        if unit_id in remaining:
+            return remaining[unit_id]
+        unit = units.get(unit_id, {})
+        own = model.estimate_unit(unit, input_bytes=sizes.get(unit_id, _unit_input_bytes(unit)))
+        below = [
+            _visit(successor, path | {unit_id})
+            for successor in successors.get(unit_id, ())
+            if successor not in path and successor in units
+        ]
+        remaining[unit_id] = own + max(below, default=0.0)
+        return remaining[unit_id]
+
+    for unit_id in units:
+        _visit(unit_id, frozenset())
+    return remaining
+
+
+def prioritize_ready_units(
+    state: Mapping[str, Any],
+    ready_units: Sequence[dict[str, Any]],
+    model: StageDurationModel,
+    *,
+    input_bytes_by_unit_id: Mapping[str, int | None] | None = None,
+) -> list[dict[str, Any]]:
+    """Order ready units longest-remaining-path first, keeping list order on ties."""
+
+    remaining = remaining_path_seconds(state, model, input_bytes_by_unit_id=input_bytes_by_unit_id)
+    ranked = sorted(
+        enumerate(ready_units),
+        key=lambda item: (-remaining.get(str(item[1].get("id", "")), 0.0), item[0]),
+    )
+    return [unit for _index, unit in ranked]
+
+
+def _simulated_makespan(
+    unit_ids: Sequence[str],
+    predecessors: Mapping[str, set[str]],
+    durations: Mapping[str, float],
+    *,
+    max_workers: int,
+    priority: Mapping[str, float] | None = None,
+) -> tuple[float, dict[str, tuple[float, float]]]:
+    order = {unit_id: index for index, unit_id in enumerate(unit_ids)}
+    pending = {unit_id: {p for p in predecessors.get(unit_id, set()) if p in order} for unit_id in unit_ids}
+    schedule: dict[str, tuple[float, float]] = {}
+    running: list[tuple[float, str]] = []
+    now = 0.0
+    while len(schedule) < len(unit_ids):
+        ready = [unit_id for unit_id, upstream in pending.items() if not upstream and unit_id not in schedule]
+        ready.sort(key=lambda unit_id: (-(priority or {}).get(unit_id, 0.0), order[unit_id]))
+        for unit_id in ready[: max(0, max_workers - len(running))]:
+            finish = now + durations.get(unit_id, 0.0)
+            schedule[unit_id] = (now, finish)
+            heapq.heappush(running, (finish, unit_id))
+        if not running:
+            # The remaining units wait on a cycle or a missing producer.
+            break
+        now, finished = heapq.heappop(running)
+        for upstream in pending.values():
+            upstream.discard(finished)
+    return max((finish for _start, finish in schedule.values()), default=0.0), schedule
+
+
+def simulate_dag_schedule(
+    state: Mapping[str, Any],
+    *,
+    max_workers: int | None = None,
+    model: StageDurationModel | None = None,
+) -> dict[str, Any]:
+    """Compare the predicted critical-path makespan of a run with what happened.
+
+    Unless a model is given, the prediction only learns from history recorded
+    before this run, so completed stages cannot predict themselves.
+    """
+
+    units = _dag_units(state)
+    unit_ids = [str(unit.get("id", "")) for unit in units]
+    if model is None:
+        own_tokens = frozenset(
+            str(unit["execution_attempt"].get("idempotency_token", ""))
+            for unit in units
+            if isinstance(unit.get("execution_attempt"), Mapping)
+        )
+        model = StageDurationModel.from_state(state, exclude_tokens=own_tokens - {""})
+    workers = max(1, int(max_workers or len(units) or 1))
+    predecessors = _unit_predecessors(state)
+    predicted = {
+        str(unit.get("id", "")): model.estimate_unit(unit, input_bytes=_unit_input_bytes(unit)) for unit in units
+    }
+    remaining = remaining_path_seconds(state, model)
+    predicted_makespan, predicted_schedule = _simulated_makespan(
+        unit_ids, predecessors, predicted, max_workers=workers, priority=remaining
+    )
+    list_order_makespan, _list_schedule = _simulated_makespan(
+        unit_ids, predecessors, predicted, max_workers=workers
+    )
+
+    timings = {
+        str(unit.get("id", "")): unit["stage_timing"]
+        for unit in units
+        if str(unit.get("dispatch_status", "")) == "completed" and isinstance(unit.get("stage_timing"), Mapping)
+    }
+    actual_makespan: float | None = None
+    if timings and len(timings) == len(units):
+        actual_makespan = max(float(t["completed_epoch_seconds"]) for t in timings.values()) - min(
+            float(t["started_epoch_seconds"]) for t in timings.values()
+        )
+
+    critical_path: list[str] = []
+    successors = {unit_id: [u for u in unit_ids if unit_id in predecessors.get(u, set())] for unit_id in unit_ids}
+    current = max(
+        (unit_id for unit_id in unit_ids if not predecessors.get(unit_id)),
+        key=lambda unit_id: remaining.get(unit_id, 0.0),
+        default=None,
+    )
+    while current is not None and current not in critical_path:
+        critical_path.append(current)
+        current = max(successors.get(current, []), key=lambda unit_id: remaining.get(unit_id, 0.0), default=None)
+
+    stages = []
+    for unit in units:
+        unit_id = str(unit.get("id", ""))
+        start, finish = predicted_schedule.get(unit_id, (None, None))
+        timing = timings.get(unit_id, {})
+        stages.append(
+            {
+                "unit_id": unit_id,
+                "app": str(unit.get("app", "")),
+                "predicted_seconds": round(predicted[unit_id], 6),
+                "actual_seconds": (
+                    round(float(timing["duration_seconds"]), 6) if "duration_seconds" in timing else None
+                ),
+                "cache_hit": bool(timing.get("cache_hit", False)),
+                "predicted_start_seconds": None if start is None else round(start, 6),
+                "predicted_finish_seconds": None if finish is None else round(finish, 6),
+                "remaining_path_seconds": round(remaining.get(unit_id, 0.0), 6),
+            }
+        )
+    return {
+        "schema": DAG_SCHEDULE_SIMULATION_SCHEMA,
+        "policy": "critical_path",
+        "max_workers": workers,
+        "history_records": len(model.records),
+        "predicted_makespan_seconds": round(predicted_makespan, 6),
+        "list_order_makespan_seconds": round(list_order_makespan, 6),
+        "actual_makespan_seconds": None if actual_makespan is None else round(actual_makespan, 6),
+        "prediction_error_seconds": (
+            None if actual_makespan is None else round(predicted_makespan - actual_makespan, 6)
+        ),
+        "critical_path": critical_path,
+        "critical_path_seconds": round(remaining.get(critical_path[0], 0.0), 6) if critical_path else 0.0,
+        "stages": stages,
+    }
+
+
+__all__ = [
+    "DAG_SCHEDULE_SIMULATION_SCHEMA",
+    "DEFAULT_STAGE_DURATION_SECONDS",
+    "STAGE_DURATION_HISTORY_KEY",
+    "STAGE_DURATION_HISTORY_LIMIT",
+    "StageDurationModel",
+    "artifact_input_bytes",
+    "carry_stage_duration_history",
+    "prioritize_ready_units",
+    "record_stage_duration",
+    "remaining_path_seconds",
+    "simulate_dag_schedule",
+    "stage_duration_history",
+]
@@ -0,0 +1,348 @@
+"""Warm stage-runner processes for distributed DAG stages.
+
+A cold distributed stage pays interpreter start-up and the ``agi_env`` /
+``agi_cluster`` imports before it does any work. A stage runner is a
+long-lived interpreter that pre-imports those modules once, listens on a
+loopback socket and forks a fresh child for every stage script it is sent, so
+each stage still gets its own process state, working directory, environment,
+exit code and log files.
+
+This module only depends on the standard library: runners execute it directly
+as a script (``python dag_stage_runner_pool.py --serve``).
+"""
+
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass, field
+import json
+from multiprocessing.connection import Client, Connection, Listener
+import os
+from pathlib import Path
+import runpy
+import secrets
+import select
+import subprocess
+import sys
+import threading
+import traceback
+from typing import Any, Mapping, Sequence
+
+DAG_STAGE_RUNNER_POOL_ENV = "AGILAB_DAG_STAGE_RUNNER_POOL"
+DEFAULT_STAGE_RUNNER_PRELOAD = ("asyncio", "json", "agi_env", "agi_cluster.agi_distributor")
+_STAGE_RUNNER_AUTHKEY_ENV = "AGILAB_STAGE_RUNNER_AUTHKEY"
+# Pre-importing the cluster framework is exactly the cost the pool amortises,
+# so the first handshake is allowed to take as long as a cold stage start-up.
+_HANDSHAKE_TIMEOUT_SECONDS = 120.0
+
+
+class StageRunnerUnavailable(RuntimeError):
+    """Raised when a stage could not be handed to a warm runner.
+
+    The stage has not started, so the caller can safely run it in a cold
+    process instead.
+    """
+
+
+@dataclass(frozen=True)
+class StageRunnerOutcome:
+    returncode: int
+    runner_pid: int
+    stage_pid: int
+
+
+class _StageRunner:
+    """Parent-side handle on one warm runner process."""
+
+    def __init__(self, process: subprocess.Popen[str], connection: Connection) -> None:
+        self.process = process
+        self.connection = connection
+
+    @classmethod
+    def spawn(cls, preload: Sequence[str]) -> _StageRunner:
+        authkey = secrets.token_bytes(32)
+        runner_env = os.environ.copy()
+        runner_env[_STAGE_RUNNER_AUTHKEY_ENV] = authkey.hex()
+        command = [sys.executable, str(Path(__file__).resolve()), "--serve", *preload]
+        try:
+            process = subprocess.Popen(
+                command,
+                env=runner_env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+        except OSError as exc:
+            raise StageRunnerUnavailable(f"Could not start a DAG stage runner: {exc}") from exc
+        try:
+            address = _read_handshake(process)
+            connection = Client(tuple(address), authkey=authkey)
+        except (OSError, ValueError, EOFError, TimeoutError) as exc:
+            process.kill()
+            process.wait()
+            raise StageRunnerUnavailable(f"DAG stage runner did not become ready: {exc}") from exc
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+        return cls(process, connection)
+
+    @property
+    def pid(self) -> int:
+        return int(self.process.pid)
+
+    def alive(self) -> bool:
+        return self.process.poll() is None and not self.connection.closed
+
+    def run(self, request: Mapping[str, Any]) -> StageRunnerOutcome:
+        try:
+            self.connection.send(dict(request))
+        except (OSError, ValueError) as exc:
+            raise StageRunnerUnavailable(f"DAG stage runner {self.pid} rejected the stage: {exc}") from exc
+        try:
+            reply = self.connection.recv()
+        except (EOFError, OSError) as exc:
+            raise RuntimeError(f"DAG stage runner {self.pid} exited while running a stage.") from exc
+        if not isinstance(reply, Mapping) or "returncode" not in reply:
+            raise RuntimeError(f"DAG stage runner {self.pid} sent an invalid reply: {reply!r}")
+        return StageRunnerOutcome(
+            returncode=int(reply["returncode"]),
+            runner_pid=self.pid,
+            stage_pid=int(reply.get("stage_pid", 0) or 0),
+        )
+
+    def close(self) -> None:
+        try:
+            if not self.connection.closed:
+                self.connection.send({"op": "shutdown"})
+                self.connection.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            self.process.wait(timeout=5.0)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+@dataclass
+class DagStageRunnerPool:
+    """Up to ``size`` warm runners, started lazily and reused across stages.
+
+    ``run_stage`` never queues: when every runner is busy it raises
+    :class:`StageRunnerUnavailable` so the caller keeps its usual parallelism
+    by falling back to a cold process.
+    """
+
+    size: int
+    preload: tuple[str, ...] = DEFAULT_STAGE_RUNNER_PRELOAD
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _idle: list[_StageRunner] = field(default_factory=list, repr=False)
+    _claimed: int = field(default=0, repr=False)
+    _closed: bool = field(default=False, repr=False)
+
+    def run_stage(
+        self,
+        *,
+        script_path: Path,
+        cwd: Path,
+        env: Mapping[str, str],
+        stdout_path: Path,
+        stderr_path: Path,
+    ) -> StageRunnerOutcome:
+        """Run ``script_path`` as ``__main__`` in a child of a warm runner.
+
+        Stage output is appended to ``stdout_path`` / ``stderr_path`` at the
+        file-descriptor level, so processes the stage launches inherit them.
+        """
+
+        runner = self._acquire()
+        healthy = False
+        try:
+            outcome = runner.run(
+                {
+                    "op": "run",
+                    "script": str(script_path),
+                    "cwd": str(cwd),
+                    "env": dict(env),
+                    "stdout": str(stdout_path),
+                    "stderr": str(stderr_path),
+                }
+            )
+            healthy = True
+            return outcome
+        finally:
+            self._release(runner, healthy=healthy)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            runners, self._idle = self._idle, []
+        for runner in runners:
+            runner.close()
+
+    def _acquire(self) -> _StageRunner:
+        with self._lock:
+            if self._closed:
+                raise StageRunnerUnavailable("The DAG stage runner pool is closed.")
+            while self._idle:
+                runner = self._idle.pop()
+                if runner.alive():
+                    self._claimed += 1
+                    return runner
+                runner.close()
+            if self._claimed >= self.size:
+                raise StageRunnerUnavailable("Every DAG stage runner is busy.")
+            self._claimed += 1
+        try:
+            return _StageRunner.spawn(self.preload)
+        except BaseException:
+            with self._lock:
+                self._claimed -= 1
+            raise
+
+    def _release(self, runner: _StageRunner, *, healthy: bool) -> None:
+        with self._lock:
+            self._claimed -= 1
+            if healthy and not self._closed and runner.alive():
+                self._idle.append(runner)
+                return
+        runner.close()
+
+
+_POOL_LOCK = threading.Lock()
+_POOL: DagStageRunnerPool | None = None
+
+
+def dag_stage_runner_pool() -> DagStageRunnerPool | None:
+    """Return the process-wide pool sized by ``AGILAB_DAG_STAGE_RUNNER_POOL``.
+
+    The pool needs ``os.fork`` and is therefore unavailable on Windows.
+    """
+
+    global _POOL
+    raw = str(os.environ.get(DAG_STAGE_RUNNER_POOL_ENV, "")).strip()
+    try:
+        size = int(raw) if raw else 0
+    except ValueError:
+        size = 0
+    if size <= 0 or not hasattr(os, "fork"):
+        return None
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL.size != size:
+            _POOL.close()
+            _POOL = None
+        if _POOL is None:
+            _POOL = DagStageRunnerPool(size=size)
+        return _POOL
+
+
+def shutdown_dag_stage_runner_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_dag_stage_runner_pool)
+
+
+def _read_handshake(process: subprocess.Popen[str]) -> list[Any]:
+    stream = process.stdout
+    if stream is None:
+        raise ValueError("runner has no handshake pipe")
+    ready, _, _ = select.select([stream], [], [], _HANDSHAKE_TIMEOUT_SECONDS)
+    if not ready:
+        raise TimeoutError(f"no handshake within {_HANDSHAKE_TIMEOUT_SECONDS:g}s")
+    line = stream.readline()
+    if not line:
+        raise EOFError(f"runner exited with {process.wait()}")
+    handshake = json.loads(line)
+    address = handshake.get("address") if isinstance(handshake, Mapping) else None
+    if not isinstance(address, list) or len(address) != 2:
+        raise ValueError(f"malformed handshake {line.strip()!r}")
+    return address
+
+
+def _serve(preload: Sequence[str]) -> int:
+    for module_name in preload:
+        try:
+            __import__(module_name)
+        except ImportError:
+            # A missing optional package fails the stage the same way it
+            # would fail a cold process; the runner itself stays usable.
+            continue
+    authkey = bytes.fromhex(os.environ.pop(_STAGE_RUNNER_AUTHKEY_ENV))
+    with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+        host, port = listener.address
+        sys.stdout.write(json.dumps({"address": [host, port], "pid": os.getpid()}) + "\n")
+        sys.stdout.flush()
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.close(devnull)
+        with listener.accept() as connection:
+            while True:
+                try:
+                    request = connection.recv()
+                except (EOFError, OSError):
+                    return 0
+                if not isinstance(request, Mapping) or request.get("op") != "run":
+                    return 0
+                stage_pid = os.fork()
+                if stage_pid == 0:
+                    listener.close()
+                    connection.close()
+                    os._exit(_run_forked_stage(request))
+                _, status = os.waitpid(stage_pid, 0)
+                connection.send({"returncode": os.waitstatus_to_exitcode(status), "stage_pid": stage_pid})
+
+
+def _run_forked_stage(request: Mapping[str, Any]) -> int:
+    try:
+        for fd, key in ((1, "stdout"), (2, "stderr")):
+            log_fd = os.open(str(request[key]), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            os.dup2(log_fd, fd)
+            os.close(log_fd)
+        sys.stdout.reconfigure(line_buffering=True)
+        sys.stderr.reconfigure(line_buffering=True)
+        os.chdir(str(request["cwd"]))
+        os.environ.clear()
+        os.environ.update({str(key): str(value) for key, value in dict(request["env"]).items()})
+        script_path = str(request["script"])
+        sys.argv = [script_path]
+        sys.path[0] = os.path.dirname(script_path)
+        runpy.run_path(script_path, run_name="__main__")
+        returncode = 0
+    except SystemExit as exc:
+        code = exc.code
+        if code is None:
+            returncode = 0
+        elif isinstance(code, int):
+            returncode = code
+        else:
+            print(code, file=sys.stderr)
+            returncode = 1
+    except BaseException:
+        traceback.print_exc()
+        returncode = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except (OSError, ValueError):
+        pass
+    return returncode
+
+
+__all__ = [
+    "DAG_STAGE_RUNNER_POOL_ENV",
+    "DEFAULT_STAGE_RUNNER_PRELOAD",
+    "DagStageRunnerPool",
+    "StageRunnerOutcome",
+    "StageRunnerUnavailable",
+    "dag_stage_runner_pool",
+    "shutdown_dag_stage_runner_pool",
+]
+
+
+if __name__ == "__main__" and sys.argv[1:2] == ["--serve"]:
+    raise SystemExit(_serve(sys.argv[2:]))
@@ -51,6 +51,11 @@ _WINDOWS_FILE_SHARING_RETRY_TIMEOUT_SECONDS = 0.5
 _WINDOWS_FILE_SHARING_RETRY_INTERVAL_SECONDS = 0.01
 _RUNNER_STATE_LOCK_TIMEOUT_SECONDS = 5.0
 _RUNNER_STATE_LOCK_RETRY_INTERVAL_SECONDS = 0.05
+RUNNER_STATE_JOURNAL_ENV = "AGILAB_RUNNER_STATE_JOURNAL"
+RUNNER_STATE_COMPACT_EVERY_ENV = "AGILAB_RUNNER_STATE_COMPACT_EVERY"
+RUNNER_STATE_REVISION_KEY = "state_revision"
+DEFAULT_RUNNER_STATE_COMPACT_EVERY = 64
+_RUNNER_STATE_JOURNAL_READ_ATTEMPTS = 5
 _T = TypeVar("_T")
 
 
@@ -499,8 +504,15 @@ def build_persisted_runner_state(
 
 
 def runner_state_revision(state: Mapping[str, Any]) -> str:
-    """Return a deterministic revision used for optimistic state checks."""
+    """Return a deterministic revision used for optimistic state checks.
 
+    Journaled states carry a monotonic commit counter, so their revision costs
+    O(1); plain JSON states fall back to a digest of the whole document.
+    """
+
+    counter = _runner_state_counter(state)
+    if counter:
+        return f"journal:{counter}"
     payload = json.dumps(
         state,
         ensure_ascii=False,
@@ -756,6 +768,336 @@ def _write_runner_state_atomic(
     return path
 
 
+def _runner_state_counter(state: Mapping[str, Any]) -> int:
+    counter = state.get(RUNNER_STATE_REVISION_KEY)
+    if isinstance(counter, int) and not isinstance(counter, bool) and counter > 0:
+        return counter
+    return 0
+
+
+def _runner_state_journal_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.journal")
+
+
+def runner_state_journal_enabled(path: Path) -> bool:
+    """Return whether ``path`` is stored as a snapshot plus an append-only journal.
+
+    ``AGILAB_RUNNER_STATE_JOURNAL`` opts new stores in. An existing journal keeps
+    the store journaled for every process, including ones started without it.
+    """
+
+    raw = str(os.environ.get(RUNNER_STATE_JOURNAL_ENV, "")).strip().lower()
+    if raw in {"1", "true", "yes", "on"}:
+        return True
+    return _runner_state_journal_path(path.expanduser()).exists()
+
+
+def _runner_state_compact_every() -> int:
+    raw = str(os.environ.get(RUNNER_STATE_COMPACT_EVERY_ENV, "")).strip()
+    if not raw:
+        return DEFAULT_RUNNER_STATE_COMPACT_EVERY
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_RUNNER_STATE_COMPACT_EVERY
+    return value if value > 0 else DEFAULT_RUNNER_STATE_COMPACT_EVERY
+
+
+def _runner_state_patch(previous: Mapping[str, Any], current: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the top-level changes that turn ``previous`` into ``current``.
+
+    Lists such as ``units`` and ``events`` are diffed per item, so updating one
+    unit or appending one event journals only that item.
+    """
+
+    assign: dict[str, Any] = {}
+    items: dict[str, Any] = {}
+    for key, value in current.items():
+        if key == RUNNER_STATE_REVISION_KEY:
+            continue
+        if key in previous:
+            old = previous[key]
+            if old == value:
+                continue
+            if isinstance(old, list) and isinstance(value, list):
+                items[key] = {
+                    "length": len(value),
+                    "set": {
+                        str(index): item
+                        for index, item in enumerate(value)
+                        if index >= len(old) or old[index] != item
+                    },
+                }
+                continue
+        assign[key] = value
+    remove = sorted(
+        key for key in previous if key not in current and key != RUNNER_STATE_REVISION_KEY
+    )
+    patch: dict[str, Any] = {}
+    if assign:
+        patch["assign"] = assign
+    if items:
+        patch["items"] = items
+    if remove:
+        patch["remove"] = remove
+    return patch
+
+
+def _apply_runner_state_patch(state: dict[str, Any], record: Mapping[str, Any]) -> None:
+    for key, value in dict(record.get("assign", {})).items():
+        state[key] = value
+    for key in record.get("remove", []):
+        state.pop(key, None)
+    for key, change in dict(record.get("items", {})).items():
+        current = state.get(key)
+        values = list(current) if isinstance(current, list) else []
+        del values[int(change["length"]):]
+        for index, item in sorted((int(index), item) for index, item in change["set"].items()):
+            if index < len(values):
+                values[index] = item
+            else:
+                values.append(item)
+        state[key] = values
+    state[RUNNER_STATE_REVISION_KEY] = int(record["revision"])
+
+
+@dataclass
+class _RunnerStateJournalView:
+    """Replayed journaled state plus the file positions it was built from."""
+
+    snapshot_signature: tuple[int, int, int]
+    snapshot_revision: int
+    journal_offset: int
+    state: dict[str, Any]
+
+
+_RUNNER_STATE_JOURNAL_VIEWS: dict[Path, _RunnerStateJournalView] = {}
+_RUNNER_STATE_JOURNAL_VIEWS_GUARD = threading.Lock()
+
+
+def _runner_state_file_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = _run_with_windows_file_sharing_retry(path.stat)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _read_runner_state_journal_tail(path: Path, offset: int) -> bytes | None:
+    """Return journal bytes after ``offset``, or ``None`` when it was truncated below it."""
+
+    try:
+        with _run_with_windows_file_sharing_retry(lambda: path.open("rb")) as stream:
+            stream.seek(0, os.SEEK_END)
+            if stream.tell() < offset:
+                return None
+            stream.seek(offset)
+            return stream.read()
+    except FileNotFoundError:
+        return b"" if offset == 0 else None
+
+
+def _load_runner_state_journal_view(path: Path) -> _RunnerStateJournalView:
+    """Replay new journal records on top of the cached or freshly read snapshot.
+
+    Only the journal tail written since the previous load is parsed. A compaction
+    racing an unlocked reader shows up as a changed snapshot or a revision gap,
+    and the replay restarts from the new snapshot.
+    """
+
+    key = path.resolve(strict=False)
+    journal_path = _runner_state_journal_path(path)
+    with _RUNNER_STATE_JOURNAL_VIEWS_GUARD:
+        for _attempt in range(_RUNNER_STATE_JOURNAL_READ_ATTEMPTS):
+            signature = _runner_state_file_signature(path)
+            if signature is None:
+                _RUNNER_STATE_JOURNAL_VIEWS.pop(key, None)
+                raise FileNotFoundError(path)
+            view = _RUNNER_STATE_JOURNAL_VIEWS.get(key)
+            if view is None or view.snapshot_signature != signature:
+                state = _read_runner_state_document(path)
+                view = _RunnerStateJournalView(
+                    snapshot_signature=signature,
+                    snapshot_revision=_runner_state_counter(state),
+                    journal_offset=0,
+                    state=state,
+                )
+            tail = _read_runner_state_journal_tail(journal_path, view.journal_offset)
+            if tail is None:
+                _RUNNER_STATE_JOURNAL_VIEWS.pop(key, None)
+                continue
+            consistent = True
+            consumed = 0
+            # A trailing line without a newline is an append still in flight or
+            # torn by a crash; it is not committed and the next writer drops it.
+            while consistent:
+                end = tail.find(b"\n", consumed)
+                if end < 0:
+                    break
+                line = tail[consumed:end]
+                try:
+                    record = json.loads(line)
+                    revision = int(record["revision"])
+                except (ValueError, KeyError, TypeError) as exc:
+                    raise ValueError(f"runner state journal is corrupt: {journal_path}") from exc
+                current = _runner_state_counter(view.state)
+                if revision > current + 1:
+                    consistent = False
+                    break
+                if revision == current + 1:
+                    _apply_runner_state_patch(view.state, record)
+                consumed = end + 1
+            if not consistent or _runner_state_file_signature(path) != signature:
+                _RUNNER_STATE_JOURNAL_VIEWS.pop(key, None)
+                continue
+            view.journal_offset += consumed
+            _RUNNER_STATE_JOURNAL_VIEWS[key] = view
+            return _RunnerStateJournalView(
+                snapshot_signature=view.snapshot_signature,
+                snapshot_revision=view.snapshot_revision,
+                journal_offset=view.journal_offset,
+                state=deepcopy(view.state),
+            )
+    raise TimeoutError(
+        f"Runner state {path} kept changing while its journal was replayed; retry the read."
+    )
+
+
+def _remember_runner_state_journal_view(path: Path, view: _RunnerStateJournalView) -> None:
+    with _RUNNER_STATE_JOURNAL_VIEWS_GUARD:
+        _RUNNER_STATE_JOURNAL_VIEWS[path.resolve(strict=False)] = view
+
+
+def _truncate_runner_state_journal(journal_path: Path, length: int) -> bool:
+    """Cut the journal to ``length`` bytes; return whether it already existed."""
+
+    existed = journal_path.exists()
+    fd = os.open(journal_path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.ftruncate(fd, length)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return existed
+
+
+def _append_runner_state_journal(
+    path: Path,
+    state: Mapping[str, Any],
+    *,
+    require_directory_fsync: bool = False,
+) -> dict[str, Any]:
+    """Commit ``state`` as one fsynced journal record; compact periodically.
+
+    Each commit appends only the changed keys and list items. Every
+    ``AGILAB_RUNNER_STATE_COMPACT_EVERY`` records the full state is rewritten
+    as the snapshot and the journal is emptied. The snapshot carries its own
+    revision, so records left behind by a crash mid-compaction are skipped.
+    """
+
+    hierarchy_durable = _ensure_directory_hierarchy_durable(path.parent)
+    if require_directory_fsync and not hierarchy_durable:
+        raise RunnerStateDurabilityError(path)
+    journal_path = _runner_state_journal_path(path)
+    try:
+        view = _load_runner_state_journal_view(path)
+    except FileNotFoundError:
+        committed = {**dict(state), RUNNER_STATE_REVISION_KEY: 1}
+        _compact_runner_state_journal(
+            path,
+            committed,
+            require_directory_fsync=require_directory_fsync,
+        )
+        return committed
+
+    revision = _runner_state_counter(view.state) + 1
+    committed = {**dict(state), RUNNER_STATE_REVISION_KEY: revision}
+    record = {"revision": revision, **_runner_state_patch(view.state, committed)}
+    line = (
+        json.dumps(record, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n"
+    ).encode("utf-8")
+    created = not journal_path.exists()
+    fd = os.open(
+        journal_path,
+        os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+        0o644,
+    )
+    try:
+        if os.fstat(fd).st_size != view.journal_offset:
+            os.ftruncate(fd, view.journal_offset)
+        written = 0
+        while written < len(line):
+            written += os.write(fd, line[written:])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    if created:
+        directory_durable = _fsync_runner_state_directory(path.parent)
+        if require_directory_fsync and not directory_durable:
+            raise RunnerStateDurabilityError(path)
+
+    _apply_runner_state_patch(view.state, json.loads(line))
+    view.journal_offset += len(line)
+    if revision - view.snapshot_revision >= _runner_state_compact_every():
+        _compact_runner_state_journal(
+            path,
+            view.state,
+            require_directory_fsync=require_directory_fsync,
+        )
+    else:
+        _remember_runner_state_journal_view(path, view)
+    return committed
+
+
+def _compact_runner_state_journal(
+    path: Path,
+    state: Mapping[str, Any],
+    *,
+    require_directory_fsync: bool = False,
+) -> None:
+    snapshot = deepcopy(dict(state))
+    _write_runner_state_atomic(path, snapshot, require_directory_fsync=require_directory_fsync)
+    created = not _truncate_runner_state_journal(_runner_state_journal_path(path), 0)
+    if created:
+        directory_durable = _fsync_runner_state_directory(path.parent)
+        if require_directory_fsync and not directory_durable:
+            raise RunnerStateDurabilityError(path)
+    signature = _runner_state_file_signature(path)
+    if signature is not None:
+        _remember_runner_state_journal_view(
+            path,
+            _RunnerStateJournalView(
+                snapshot_signature=signature,
+                snapshot_revision=_runner_state_counter(snapshot),
+                journal_offset=0,
+                state=snapshot,
+            ),
+        )
+
+
+def _commit_runner_state(
+    path: Path,
+    state: Mapping[str, Any],
+    *,
+    require_directory_fsync: bool = False,
+) -> dict[str, Any]:
+    """Persist ``state`` through the journal or as a full atomic rewrite."""
+
+    if not runner_state_journal_enabled(path):
+        _write_runner_state_atomic(path, state, require_directory_fsync=require_directory_fsync)
+        return dict(state)
+    committed = _append_runner_state_journal(
+        path,
+        state,
+        require_directory_fsync=require_directory_fsync,
+    )
+    if isinstance(state, dict):
+        # Keep the caller's document equal to the persisted one so its revision
+        # and evidence publication match the committed journal record.
+        state[RUNNER_STATE_REVISION_KEY] = committed[RUNNER_STATE_REVISION_KEY]
+    return committed
+
+
 def _raise_runner_state_conflict(
     path: Path,
     *,
@@ -794,14 +1136,14 @@ class RunnerStateTransaction:
             expected_revision=self.revision,
             actual_revision=actual_revision,
         )
-        path = _write_runner_state_atomic(
+        committed = _commit_runner_state(
             self.path,
             state,
             require_directory_fsync=require_directory_fsync,
         )
-        self.state = dict(state)
-        self.revision = runner_state_revision(state)
-        return path
+        self.state = committed
+        self.revision = runner_state_revision(committed)
+        return self.path
 
 
 @contextmanager
@@ -860,12 +1202,12 @@ def runner_state_write_transaction(
                 expected_revision=expected_revision,
                 actual_revision=actual_revision,
             )
-        written_path = _write_runner_state_atomic(
+        _commit_runner_state(
             state_path,
             state,
             require_directory_fsync=require_directory_fsync,
         )
-        yield written_path
+        yield state_path
 
 
 def write_runner_state(
@@ -885,14 +1227,21 @@ def write_runner_state(
                 expected_revision=expected_revision,
                 actual_revision=runner_state_revision(current),
             )
-        return _write_runner_state_atomic(state_path, state)
+        _commit_runner_state(state_path, state)
+        return state_path
 
 
 def load_runner_state(path: Path) -> dict[str, Any]:
     state_path = path.expanduser()
+    if runner_state_journal_enabled(state_path):
+        return _load_runner_state_journal_view(state_path).state
+    return _read_runner_state_document(state_path)
+
+
+def _read_runner_state_document(path: Path) -> dict[str, Any]:
     state = json.loads(
         _run_with_windows_file_sharing_retry(
-            lambda: state_path.read_text(encoding="utf-8")
+            lambda: path.read_text(encoding="utf-8")
         )
     )
     if not isinstance(state, dict):
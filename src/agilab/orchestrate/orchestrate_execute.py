@@ -5,6 +5,7 @@ import os
 import re
 import shutil
 import stat
+import time
 import importlib
 import importlib.util
 from dataclasses import dataclass, replace
@@ -155,6 +156,10 @@ _orchestrate_page_helpers = import_agilab_module(
 finish_action_elapsed = _orchestrate_page_helpers.finish_action_elapsed
 start_action_elapsed = _orchestrate_page_helpers.start_action_elapsed
 update_action_elapsed_status = _orchestrate_page_helpers.update_action_elapsed_status
+read_worker_progress = _orchestrate_page_helpers.read_worker_progress
+worker_progress_caption = _orchestrate_page_helpers.worker_progress_caption
+WORKER_PROGRESS_FILENAME = _orchestrate_page_helpers.WORKER_PROGRESS_FILENAME
+WORKER_PROGRESS_POLL_SECONDS = _orchestrate_page_helpers.WORKER_PROGRESS_POLL_SECONDS
 
 _pinned_expander = import_agilab_module(
     "agilab.pinned_expander",
@@ -603,6 +608,7 @@ async def render_execute_section(
         with target_expander:
             log_placeholder = st.empty()
             elapsed_placeholder = st.empty()
+            progress_placeholder = st.empty()
         _reset_traceback_skip()
         log_dir = Path(env.runenv or (Path.home() / "log" / "execute" / env.app))
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -669,6 +675,21 @@ async def render_execute_section(
         async def _run_and_stream():
             nonlocal log_file_path
             runtime_root = orchestrate_snippet_runtime_root(env, Path(project_path))
+            wenv_abs = getattr(env, "wenv_abs", None)
+            progress_path = Path(wenv_abs) / WORKER_PROGRESS_FILENAME if wenv_abs else None
+            progress_state = {"started_at": time.time(), "polled_at": 0.0}
+
+            def _poll_worker_progress() -> None:
+                # DASK runs stream worker progress into wenv; the snippet runs in
+                # a subprocess, so the page polls the snapshot file it writes.
+                now = time.monotonic()
+                if progress_path is None or now - progress_state["polled_at"] < WORKER_PROGRESS_POLL_SECONDS:
+                    return
+                progress_state["polled_at"] = now
+                payload = read_worker_progress(progress_path, started_after=progress_state["started_at"])
+                if payload is not None:
+                    progress_placeholder.caption(worker_progress_caption(payload))
+
             with log_file_path.open("w", encoding="utf-8") as log_file:
                 def _fanout(message: str) -> None:
                     clean = strip_ansi(message or "").rstrip()
@@ -683,6 +704,7 @@ async def render_execute_section(
                         ORCHESTRATE_ACTION_LABELS["run"],
                         started_monotonic=elapsed_started,
                     )
+                    _poll_worker_progress()
 
                 _, stderr_text = await env.run_agi(
                     cmd.replace("asyncio.run(main())", env.snippet_tail),
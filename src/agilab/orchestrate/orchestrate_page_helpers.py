@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import time
 from datetime import datetime
 from pathlib import Path
@@ -308,6 +309,54 @@ def finish_action_elapsed(
     return elapsed
 
 
+WORKER_PROGRESS_FILENAME = "worker_progress.json"
+WORKER_PROGRESS_POLL_SECONDS = 1.0
+
+
+def read_worker_progress(path: Path, *, started_after: float = 0.0) -> Optional[dict[str, Any]]:
+    """Return the worker progress snapshot at ``path`` if it belongs to this run."""
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get("workers"), list):
+        return None
+    try:
+        if float(payload.get("started_at") or 0.0) < started_after:
+            return None
+    except (TypeError, ValueError):
+        return None
+    return payload
+
+
+def worker_progress_caption(payload: Mapping[str, Any], *, max_workers: int = 8) -> str:
+    """Summarize a worker progress snapshot on one caption line."""
+    total = int(payload.get("items_total") or 0)
+    done = int(payload.get("items_done") or 0)
+    failed = int(payload.get("items_failed") or 0)
+    parts = [f"Workers: {done}/{total} items" if total else "Workers: waiting for progress"]
+    if failed:
+        parts.append(f"{failed} failed")
+    rate = float(payload.get("items_per_second") or 0.0)
+    if rate > 0:
+        parts.append(f"{rate:.1f} items/s")
+    rows = []
+    for worker in list(payload.get("workers") or [])[:max_workers]:
+        worker_total = int(worker.get("items_total") or 0)
+        if not worker_total:
+            continue
+        row = f"{worker.get('worker')} {int(worker.get('items_done') or 0)}/{worker_total}"
+        eta = worker.get("eta_seconds")
+        if eta is not None:
+            row += f" eta {format_elapsed_seconds(eta)}"
+        if worker.get("straggler"):
+            row += " (straggler)"
+        rows.append(row)
+    if rows:
+        parts.append(" | ".join(rows))
+    return " · ".join(parts)
+
+
 def display_log(
     stdout: str,
     stderr: str,
@@ -3129,6 +3129,7 @@ def _write_pipeline_stages_runner_state_with_evidence(
         lab_dir=lab_dir,
         dag_path=None,
         trigger=trigger,
+        load_state_fn=load_runner_state,
     )
     return written_path
 
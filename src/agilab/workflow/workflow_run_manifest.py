@@ -128,9 +128,14 @@ def build_workflow_run_manifest(
     dag_path: Path | None = None,
     trigger: Mapping[str, Any] | None = None,
     created_at: str | None = None,
+    load_state_fn: Callable[[Path], Mapping[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Build a stable workflow/DAG run manifest from persisted runner state."""
-    persisted_state = _read_matching_runner_state(state=state, state_path=state_path)
+    persisted_state = _read_matching_runner_state(
+        state=state,
+        state_path=state_path,
+        load_state_fn=load_state_fn,
+    )
     return _build_workflow_run_manifest(
         state=persisted_state,
         state_path=state_path,
@@ -335,8 +340,13 @@ def write_workflow_run_evidence(
     dag_path: Path | None = None,
     trigger: Mapping[str, Any] | None = None,
     created_at: str | None = None,
+    load_state_fn: Callable[[Path], Mapping[str, Any]] | None = None,
 ) -> WorkflowEvidenceBundle:
-    persisted_state = _read_matching_runner_state(state=state, state_path=state_path)
+    persisted_state = _read_matching_runner_state(
+        state=state,
+        state_path=state_path,
+        load_state_fn=load_state_fn,
+    )
     manifest = _build_workflow_run_manifest(
         state=persisted_state,
         state_path=state_path,
@@ -550,18 +560,29 @@ def _read_matching_runner_state(
     *,
     state: Mapping[str, Any],
     state_path: Path,
+    load_state_fn: Callable[[Path], Mapping[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    """Read persisted runner state once and reject stale caller snapshots."""
+    """Read persisted runner state once and reject stale caller snapshots.
+
+    ``load_state_fn`` lets journaled stores, whose file at ``state_path`` is
+    only the last compacted snapshot, supply their replayed state.
+    """
 
     expanded = state_path.expanduser()
-    try:
-        raw_payload = _run_with_windows_sharing_retry(expanded.read_bytes)
-    except OSError as exc:
-        raise ValueError(f"Runner state could not be read for evidence: {expanded}") from exc
-    try:
-        persisted = json.loads(raw_payload)
-    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-        raise ValueError(f"Runner state is not valid JSON: {expanded}") from exc
+    if load_state_fn is not None:
+        try:
+            persisted = load_state_fn(expanded)
+        except OSError as exc:
+            raise ValueError(f"Runner state could not be read for evidence: {expanded}") from exc
+    else:
+        try:
+            raw_payload = _run_with_windows_sharing_retry(expanded.read_bytes)
+        except OSError as exc:
+            raise ValueError(f"Runner state could not be read for evidence: {expanded}") from exc
+        try:
+            persisted = json.loads(raw_payload)
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError(f"Runner state is not valid JSON: {expanded}") from exc
     if not isinstance(persisted, Mapping):
         raise ValueError(f"Runner state must be a JSON object: {expanded}")
 
@@ -16,6 +16,9 @@ if str(REPO_ROOT) not in sys.path:
 from tools import benchmark_execution_mode_matrix as matrix
 from tools import benchmark_execution_pandas_cython_kernel as cython_kernel
 from tools import benchmark_execution_playground as playground
+from tools import benchmark_make_chunks_partitioning as partitioning
+from tools import benchmark_pool_result_transport as pool_transport
+from tools import benchmark_service_submit as service_submit
 from tools import cython_worker_verify as verify_tool
 
 
@@ -62,6 +65,74 @@ def test_cython_kernel_benchmark_csv_rows_report_speedup() -> None:
     assert rows[1]["rows_per_second"] == "200"
 
 
+def test_pool_transport_benchmark_csv_rows_report_speedup_and_rss() -> None:
+    results = {
+        "transports": {
+            "pipe": {
+                "median_seconds": 2.0,
+                "min_seconds": 1.5,
+                "max_seconds": 2.5,
+                "result_bytes": 4 * 2**20,
+                "parent_peak_rss_delta_bytes": 8 * 2**20,
+            },
+            "shm": {
+                "median_seconds": 1.0,
+                "min_seconds": 1.0,
+                "max_seconds": 1.0,
+                "result_bytes": 4 * 2**20,
+                "parent_peak_rss_delta_bytes": 4 * 2**20,
+            },
+        },
+        "speedup_vs_pipe": {"pipe": 1.0, "shm": 2.0},
+    }
+
+    rows = pool_transport._rows_for_csv(results)
+
+    assert [row["transport"] for row in rows] == ["pipe", "shm"]
+    assert rows[1]["speedup_vs_pipe"] == "2.00"
+    assert rows[1]["result_mib_per_second"] == "4.0"
+    assert rows[0]["parent_peak_rss_delta_mib"] == "8.0"
+
+
+def test_partitioning_benchmark_reports_makespan_against_lpt() -> None:
+    results = partitioning.run_benchmark(
+        sizes=(5, 40),
+        profiles=("heterogeneous",),
+        time_budget=0.1,
+        seed=3,
+    )
+
+    rows = partitioning._rows_for_csv(results)
+
+    assert [(row["profile"], row["items"]) for row in rows] == [
+        ("heterogeneous", 5),
+        ("heterogeneous", 40),
+    ]
+    for case in results["cases"]:
+        assert case["anytime_makespan"] <= case["lpt_makespan"] + 1e-9
+        assert case["anytime_makespan"] >= case["lower_bound"] - 1e-9
+    assert float(rows[1]["makespan_reduction_pct"]) >= 0
+
+
+def test_service_submit_benchmark_reports_batched_throughput() -> None:
+    results = service_submit.run_benchmark(
+        requests=6,
+        distinct_args=2,
+        workers=2,
+        plan_ms=0.0,
+        done_files=3,
+        repeats=1,
+    )
+
+    rows = service_submit._rows_for_csv(results)
+
+    assert [row["mode"] for row in rows] == ["submit", "submit_many"]
+    assert rows[0]["speedup_vs_submit"] == "1.00"
+    for stats in results["modes"].values():
+        assert stats["queued_files"] == 12
+        assert stats["submissions_per_second"] > 0
+
+
 def test_committed_benchmark_csv_matches_json_via_tool_helpers(tmp_path) -> None:
     """The committed CSV must be reproducible from the committed JSON.
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import builtins
 import importlib.util
 import json
+import os
 import subprocess
 import sys
 import time
@@ -725,3 +726,103 @@ def test_stage_subprocess_runner_raises_with_trimmed_failure(monkeypatch, tmp_pa
     message = str(err.value)
     assert "Distributed DAG stage `flight_telemetry_project` failed" in message
     assert len(message) < 4100
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="warm stage runners fork per stage")
+def test_stage_runner_pool_reuses_a_warm_runner_per_stage(tmp_path: Path) -> None:
+    runner_pool = importlib.import_module("agilab.dag.dag_stage_runner_pool")
+    script_path = tmp_path / "run" / "run_distributed_stage.py"
+    script_path.parent.mkdir()
+    script_path.write_text(
+        "import os, sys\n"
+        "print(os.environ['AGILAB_IDEMPOTENCY_TOKEN'], os.getcwd())\n"
+        "print('stage stderr', file=sys.stderr)\n"
+        "sys.exit(int(os.environ.get('STAGE_EXIT', '0')))\n",
+        encoding="utf-8",
+    )
+    pool = runner_pool.DagStageRunnerPool(size=1, preload=("json",))
+    try:
+        outcomes = []
+        for index, exit_code in enumerate((0, 3)):
+            stdout_path = tmp_path / f"stage{index}.stdout.log"
+            stderr_path = tmp_path / f"stage{index}.stderr.log"
+            outcomes.append(
+                pool.run_stage(
+                    script_path=script_path,
+                    cwd=tmp_path,
+                    env={**os.environ, "AGILAB_IDEMPOTENCY_TOKEN": f"warm:{index}", "STAGE_EXIT": str(exit_code)},
+                    stdout_path=stdout_path,
+                    stderr_path=stderr_path,
+                )
+            )
+            assert stdout_path.read_text(encoding="utf-8") == f"warm:{index} {tmp_path}\n"
+            assert stderr_path.read_text(encoding="utf-8") == "stage stderr\n"
+    finally:
+        pool.close()
+
+    assert [outcome.returncode for outcome in outcomes] == [0, 3]
+    assert outcomes[0].runner_pid == outcomes[1].runner_pid
+    assert outcomes[0].stage_pid != outcomes[1].stage_pid
+    with pytest.raises(runner_pool.StageRunnerUnavailable):
+        pool.run_stage(
+            script_path=script_path,
+            cwd=tmp_path,
+            env=dict(os.environ),
+            stdout_path=tmp_path / "closed.stdout.log",
+            stderr_path=tmp_path / "closed.stderr.log",
+        )
+
+
+def test_stage_subprocess_runner_prefers_warm_runner_and_falls_back_cold(monkeypatch, tmp_path: Path) -> None:
+    warm_requests: list[dict[str, object]] = []
+    cold_commands: list[list[str]] = []
+
+    class _FakePool:
+        available = True
+
+        def run_stage(self, **kwargs):
+            if not self.available:
+                raise dag_distributed_submitter.StageRunnerUnavailable("busy")
+            warm_requests.append(kwargs)
+            kwargs["stdout_path"].write_text('{"result": "ok"}\n', encoding="utf-8")
+            return SimpleNamespace(returncode=0, runner_pid=101, stage_pid=202)
+
+    def _fake_run(command, **kwargs):
+        cold_commands.append(command)
+        kwargs["stdout"].write('{"result": "ok"}\n')
+        return subprocess.CompletedProcess(command, 0)
+
+    pool = _FakePool()
+    monkeypatch.setattr(dag_distributed_submitter, "dag_stage_runner_pool", lambda: pool)
+    monkeypatch.setattr(dag_distributed_submitter.subprocess, "run", _fake_run)
+    config = dag_distributed_submitter.DagDistributedStageConfig(
+        scheduler="192.168.20.111:8786",
+        workers={"192.168.20.111": 1},
+        workers_data_path="clustershare/agi",
+        mode=7,
+    )
+
+    def _run(token: str):
+        return dag_distributed_submitter.run_agilab_stage_subprocess(
+            config=config,
+            repo_root=tmp_path,
+            run_root=tmp_path / token,
+            apps_path=tmp_path / "src/agilab/apps/builtin",
+            app_name="flight_telemetry_project",
+            request_payload={"params": {}, "stages": []},
+            timestamp="2026-05-07T00:00:00Z",
+            idempotency_token=token,
+        )
+
+    warm = _run("warm-attempt")
+    pool.available = False
+    cold = _run("cold-attempt")
+
+    assert len(warm_requests) == 1
+    assert warm_requests[0]["script_path"] == tmp_path / "warm-attempt/run_distributed_stage.py"
+    assert warm_requests[0]["cwd"] == tmp_path
+    assert warm_requests[0]["env"]["AGILAB_IDEMPOTENCY_TOKEN"] == "warm-attempt"
+    assert warm["stage_runner"] == {"mode": "warm", "runner_pid": 101, "stage_pid": 202}
+    assert warm["stdout_tail"] == '{"result": "ok"}\n'
+    assert "stage_runner" not in cold
+    assert cold_commands == [[sys.executable, str(tmp_path / "cold-attempt/run_distributed_stage.py")]]
@@ -1158,6 +1158,449 @@ def test_batch_callback_failure_preserves_claim_for_exact_token_recovery(tmp_pat
     assert replacement["run_status"] == "planned"
 
 
+def _write_branching_contract_repo(tmp_path: Path) -> Path:
+    """Parallel-roots DAG where only ``flight_context`` feeds ``joined_review``."""
+
+    dag_path = _write_parallel_contract_repo(tmp_path)
+    payload = json.loads(dag_path.read_text(encoding="utf-8"))
+    review = next(node for node in payload["nodes"] if node["id"] == "joined_review")
+    review["consumes"] = [item for item in review["consumes"] if item["id"] == "flight_metrics"]
+    payload["edges"] = [edge for edge in payload["edges"] if edge["from"] == "flight_context"]
+    dag_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return dag_path
+
+
+def _contract_stage(unit_id: str, before_return=None):
+    def _run(
+        *, repo_root: Path, run_root: Path, idempotency_token: str
+    ) -> dict[str, object]:
+        del repo_root, run_root, idempotency_token
+        if before_return is not None:
+            before_return()
+        return {
+            "summary_metrics_path": f"{unit_id}/summary.json",
+            "summary_metrics": {"stage_completed": 1},
+        }
+
+    return _run
+
+
+@pytest.mark.parametrize("journaled", [False, True])
+def test_continuous_schedule_launches_successors_without_waiting_for_siblings(
+    tmp_path,
+    monkeypatch,
+    journaled,
+):
+    if journaled:
+        monkeypatch.setenv("AGILAB_RUNNER_STATE_JOURNAL", "1")
+    dag_path = _write_branching_contract_repo(tmp_path)
+    review_started = threading.Event()
+    observed: dict[str, object] = {}
+
+    def _review_running() -> None:
+        # The slow sibling is still running while its unrelated successor
+        # stage runs; the finished root is already committed.
+        observed["persisted"] = dag_run_engine.load_runner_state(engine.state_path)
+        review_started.set()
+
+    engine = dag_run_engine.DagRunEngine(
+        repo_root=tmp_path / "repo",
+        lab_dir=tmp_path / "lab",
+        dag_path=dag_path,
+        stage_run_fns={
+            "uav_queue_project.queue_context": _contract_stage(
+                "queue_context",
+                lambda: observed.setdefault("queue_saw_review", review_started.wait(timeout=5.0)),
+            ),
+            "flight_telemetry_project.flight_context": _contract_stage("flight_context"),
+            "weather_forecast_project.joined_review": _contract_stage("joined_review", _review_running),
+        },
+        attempt_id_fn=lambda: "continuous",
+    )
+    state, _state_path, _dag_path = engine.load_or_create_state()
+
+    result = engine.run_ready_controlled_stages(
+        state,
+        max_workers=2,
+        schedule=dag_run_engine.GLOBAL_DAG_STAGE_SCHEDULE_CONTINUOUS,
+    )
+
+    assert result.ok
+    assert observed["queue_saw_review"] is True
+    assert sorted(result.executed_unit_ids) == ["flight_context", "joined_review", "queue_context"]
+    assert result.state["run_status"] == "completed"
+    assert "active_execution" not in result.state
+    assert dag_run_engine.load_runner_state(engine.state_path) == result.state
+    persisted = observed["persisted"]
+    assert _unit_by_id(persisted, "flight_context")["dispatch_status"] == "completed"
+    assert _unit_by_id(persisted, "queue_context")["dispatch_status"] == "running"
+    assert persisted["active_execution"]["unit_tokens"] == {
+        "joined_review": "continuous:joined_review",
+        "queue_context": "continuous:queue_context",
+    }
+    journal_path = engine.state_path.with_name(f".{engine.state_path.name}.journal")
+    assert journal_path.exists() is journaled
+    if journaled:
+        # Claim, progress commits and finalization were each appended as a
+        # counter revision instead of rewriting the whole document.
+        assert dag_run_engine.runner_state_revision(result.state) == (
+            f"journal:{result.state['state_revision']}"
+        )
+        assert result.state["state_revision"] >= 4
+
+
+def test_continuous_schedule_bounds_stages_in_flight(tmp_path):
+    dag_path = _write_parallel_contract_repo(tmp_path)
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def _track() -> None:
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        with lock:
+            running["now"] -= 1
+
+    engine = dag_run_engine.DagRunEngine(
+        repo_root=tmp_path / "repo",
+        lab_dir=tmp_path / "lab",
+        dag_path=dag_path,
+        stage_run_fns={
+            "uav_queue_project.queue_context": _contract_stage("queue_context", _track),
+            "flight_telemetry_project.flight_context": _contract_stage("flight_context", _track),
+            "weather_forecast_project.joined_review": _contract_stage("joined_review", _track),
+        },
+        attempt_id_fn=lambda: "serial-continuous",
+    )
+    state, _state_path, _dag_path = engine.load_or_create_state()
+
+    result = engine.run_ready_controlled_stages(
+        state,
+        max_workers=1,
+        schedule=dag_run_engine.GLOBAL_DAG_STAGE_SCHEDULE_CONTINUOUS,
+    )
+
+    assert result.ok
+    # Units launch in list order as slots free up; the join runs last.
+    assert result.executed_unit_ids == ("flight_context", "queue_context", "joined_review")
+    assert running["peak"] == 1
+    for unit_id in result.executed_unit_ids:
+        attempt = _unit_by_id(result.state, unit_id)["execution_attempt"]
+        assert attempt["idempotency_token"] == f"serial-continuous:{unit_id}"
+        assert attempt["status"] == "completed"
+
+
+def test_continuous_schedule_commits_finished_units_before_uncertain_failure(tmp_path):
+    dag_path = _write_branching_contract_repo(tmp_path)
+    flight_done = threading.Event()
+
+    def _fail_queue() -> None:
+        flight_done.wait(timeout=5.0)
+        raise RuntimeError("synthetic queue failure")
+
+    engine = dag_run_engine.DagRunEngine(
+        repo_root=tmp_path / "repo",
+        lab_dir=tmp_path / "lab",
+        dag_path=dag_path,
+        stage_run_fns={
+            "uav_queue_project.queue_context": _contract_stage("queue_context", _fail_queue),
+            "flight_telemetry_project.flight_context": _contract_stage("flight_context", flight_done.set),
+            "weather_forecast_project.joined_review": _contract_stage("joined_review"),
+        },
+        attempt_id_fn=lambda: "continuous-failure",
+    )
+    state, _state_path, _dag_path = engine.load_or_create_state()
+
+    with pytest.raises(
+        dag_run_engine.DagExternalExecutionUncertainError,
+        match="synthetic queue failure",
+    ):
+        engine.run_ready_controlled_stages(
+            state,
+            max_workers=2,
+            schedule=dag_run_engine.GLOBAL_DAG_STAGE_SCHEDULE_CONTINUOUS,
+        )
+
+    persisted = dag_run_engine.load_runner_state(engine.state_path)
+    assert persisted["active_execution"]["status"] == "recovery_required"
+    assert persisted["active_execution"]["unit_tokens"] == {
+        "queue_context": "continuous-failure:queue_context",
+    }
+    assert _unit_by_id(persisted, "flight_context")["dispatch_status"] == "completed"
+    assert _unit_by_id(persisted, "queue_context")["dispatch_status"] == "running"
+    recovered = engine.recover_execution_attempt_transaction(
+        persisted,
+        unit_id="queue_context",
+        idempotency_token="continuous-failure:queue_context",
+    )
+    assert "active_execution" not in recovered
+    assert _unit_by_id(recovered, "flight_context")["dispatch_status"] == "completed"
+
+
+def _writing_contract_stage(unit_id: str, outputs: dict[str, str], calls: list[str]):
+    def _run(
+        *, repo_root: Path, run_root: Path, idempotency_token: str
+    ) -> dict[str, object]:
+        del repo_root
+        calls.append(unit_id)
+        output = run_root / "metrics.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(outputs[unit_id], encoding="utf-8")
+        return {
+            "summary_metrics_path": str(output),
+            "summary_metrics": {"stage_completed": 1},
+            "idempotency_token": idempotency_token,
+        }
+
+    return _run
+
+
+def test_stage_cache_recomputes_only_the_affected_subgraph(tmp_path):
+    dag_path = _write_parallel_contract_repo(tmp_path)
+    outputs = {"queue_context": "queue-v1", "flight_context": "flight-v1", "joined_review": "review-v1"}
+    calls: list[str] = []
+    attempts = iter(["first", "second", "third"])
+    engine = dag_run_engine.DagRunEngine(
+        repo_root=tmp_path / "repo",
+        lab_dir=tmp_path / "lab",
+        dag_path=dag_path,
+        stage_run_fns={
+            "uav_queue_project.queue_context": _writing_contract_stage("queue_context", outputs, calls),
+            "flight_telemetry_project.flight_context": _writing_contract_stage("flight_context", outputs, calls),
+            "weather_forecast_project.joined_review": _writing_contract_stage("joined_review", outputs, calls),
+        },
+        attempt_id_fn=lambda: next(attempts),
+        stage_cache=dag_run_engine.DagStageCache(root=tmp_path / "stage-cache"),
+    )
+
+    def _run_all() -> dict[str, object]:
+        state, _state_path, _dag_path = engine.load_or_create_state(reset=True)
+        result = engine.run_ready_controlled_stages(
+            state,
+            schedule=dag_run_engine.GLOBAL_DAG_STAGE_SCHEDULE_CONTINUOUS,
+        )
+        assert result.ok
+        assert result.state["run_status"] == "completed"
+        return result.state
+
+    first = _run_all()
+    assert sorted(calls) == ["flight_context", "joined_review", "queue_context"]
+    assert {
+        _unit_by_id(first, unit_id)["contract_execution"]["build_cache"]["status"]
+        for unit_id in outputs
+    } == {"stored"}
+
+    calls.clear()
+    second = _run_all()
+    assert calls == []
+    review = _unit_by_id(second, "joined_review")
+    assert review["contract_execution"]["build_cache"]["status"] == "hit"
+    assert review["contract_execution"]["build_cache"]["source_idempotency_token"] == "first:joined_review"
+    assert review["contract_execution"]["idempotency_token"] == "second:joined_review"
+    assert review["execution_attempt"]["idempotency_token"] == "second:joined_review"
+    assert sorted(
+        event["unit_id"] for event in second["events"] if event["kind"] == "unit_cache_hit"
+    ) == ["flight_context", "joined_review", "queue_context"]
+    assert dag_run_engine.load_runner_state(engine.state_path) == second
+    assert Path(review["contract_execution"]["summary_metrics_path"]).read_text(encoding="utf-8") == "review-v1"
+
+    # Editing one root's contract invalidates it and, through its changed
+    # output, the review stage; the untouched root is still served from cache.
+    payload = json.loads(dag_path.read_text(encoding="utf-8"))
+    flight = next(node for node in payload["nodes"] if node["id"] == "flight_context")
+    flight["execution"]["params"] = {"window": 2}
+    dag_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    outputs["flight_context"] = "flight-v2"
+    calls.clear()
+    third = _run_all()
+    assert sorted(calls) == ["flight_context", "joined_review"]
+    assert _unit_by_id(third, "queue_context")["contract_execution"]["build_cache"]["status"] == "hit"
+
+
+def test_stage_cache_key_follows_data_in_content(tmp_path):
+    dag_path = _write_parallel_contract_repo(tmp_path)
+    dataset = tmp_path / "external" / "queue.csv"
+    dataset.parent.mkdir()
+    dataset.write_text("id\n1\n", encoding="utf-8")
+    payload = json.loads(dag_path.read_text(encoding="utf-8"))
+    nodes = {node["id"]: node for node in payload["nodes"]}
+    nodes["queue_context"]["execution"]["data_in"] = str(dataset)
+    nodes["flight_context"]["execution"]["data_in"] = "flight_telemetry/dataset"
+    dag_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    outputs = {"queue_context": "queue-v1", "flight_context": "flight-v1", "joined_review": "review-v1"}
+    calls: list[str] = []
+    attempts = iter(["first", "second", "third"])
+    engine = dag_run_engine.DagRunEngine(
+        repo_root=tmp_path / "repo",
+        lab_dir=tmp_path / "lab",
+        dag_path=dag_path,
+        stage_run_fns={
+            "uav_queue_project.queue_context": _writing_contract_stage("queue_context", outputs, calls),
+            "flight_telemetry_project.flight_context": _writing_contract_stage("flight_context", outputs, calls),
+            "weather_forecast_project.joined_review": _writing_contract_stage("joined_review", outputs, calls),
+        },
+        attempt_id_fn=lambda: next(attempts),
+        stage_cache=dag_run_engine.DagStageCache(root=tmp_path / "stage-cache"),
+    )
+
+    def _run_all() -> dict[str, object]:
+        state, _state_path, _dag_path = engine.load_or_create_state(reset=True)
+        result = engine.run_ready_controlled_stages(state)
+        assert result.ok
+        return result.state
+
+    first = _run_all()
+    # A relative data_in lives on the cluster share the cache cannot hash.
+    assert _unit_by_id(first, "flight_context")["contract_execution"]["build_cache"]["status"] == "uncacheable"
+    calls.clear()
+    second = _run_all()
+    assert sorted(calls) == ["flight_context"]
+    assert _unit_by_id(second, "queue_context")["contract_execution"]["build_cache"]["status"] == "hit"
+
+    dataset.write_text("id\n1\n2\n", encoding="utf-8")
+    calls.clear()
+    _run_all()
+    assert sorted(calls) == ["flight_context", "queue_context"]
+
+
+def test_stage_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = dag_run_engine.DagStageCache(root=tmp_path / "stage-cache", max_bytes=3200)
+    run_root = tmp_path / "run"
+    run_root.mkdir()
+    output = run_root / "out.bin"
+    for index, key in enumerate(["a" * 64, "b" * 64, "c" * 64]):
+        output.write_bytes(bytes([index]) * 1000)
+        assert cache.store(key, run_root=run_root, unit_id="stage", result={"artifact_path": str(output)})
+        if key == "b" * 64:
+            # Touch the oldest entry so the middle one becomes least recently used.
+            assert cache.lookup("a" * 64, run_root=run_root) is not None
+
+    assert cache.lookup("b" * 64, run_root=run_root) is None
+    restored = cache.lookup("c" * 64, run_root=run_root)
+    assert restored is not None
+    assert restored["build_cache"]["status"] == "hit"
+    assert output.read_bytes() == bytes([2]) * 1000
+    assert cache.lookup("a" * 64, run_root=run_root) is not None
+    assert output.read_bytes() == bytes([0]) * 1000
+
+
+@pytest.mark.parametrize(
+    ("schedule", "expected_order"),
+    [
+        (dag_run_engine.GLOBAL_DAG_STAGE_SCHEDULE_WAVE, ("queue_context", "flight_context")),
+        (
+            dag_run_engine.GLOBAL_DAG_STAGE_SCHEDULE_CONTINUOUS,
+            ("queue_context", "flight_context", "joined_review"),
+        ),
+    ],
+)
+def test_learned_durations_prioritise_the_longest_remaining_path(tmp_path, schedule, expected_order):
+    dag_path = _write_branching_contract_repo(tmp_path)
+    engine = dag_run_engine.DagRunEngine(
+        repo_root=tmp_path / "repo",
+        lab_dir=tmp_path / "lab",
+        dag_path=dag_path,
+        stage_run_fns={
+            "uav_queue_project.queue_context": _contract_stage("queue_context"),
+            "flight_telemetry_project.flight_context": _contract_stage("flight_context"),
+            "weather_forecast_project.joined_review": _contract_stage("joined_review"),
+        },
+        attempt_id_fn=lambda: "critical-path",
+    )
+    state, _state_path, _dag_path = engine.load_or_create_state()
+    observed_revision = dag_run_engine.runner_state_revision(state)
+    # List order (and, without history, path length) would start flight first.
+    state["stage_duration_history"] = [
+        {"unit_id": "queue_context", "app": "uav_queue_project", "input_bytes": 0, "duration_seconds": 10.0},
+        {"unit_id": "flight_context", "app": "flight_telemetry_project", "input_bytes": 0, "duration_seconds": 1.0},
+        {"unit_id": "joined_review", "app": "weather_forecast_project", "input_bytes": 0, "duration_seconds": 2.0},
+    ]
+    engine.write_state(state, expected_revision=observed_revision)
+
+    result = engine.run_ready_controlled_stages(state, max_workers=1, schedule=schedule)
+
+    assert result.ok
+    assert result.executed_unit_ids == expected_order
+    history = result.state["stage_duration_history"]
+    assert [record["unit_id"] for record in history[3:]] == list(expected_order)
+    assert history[3]["idempotency_token"] == "critical-path:queue_context"
+    timing = _unit_by_id(result.state, "queue_context")["stage_timing"]
+    assert timing["duration_seconds"] >= 0.0
+    assert timing["completed_epoch_seconds"] >= timing["started_epoch_seconds"]
+    assert timing["input_bytes"] == 0
+
+    # Resetting the run keeps what was learned.
+    reset_state, _state_path, _dag_path = engine.load_or_create_state(reset=True)
+    assert reset_state["stage_duration_history"] == history
+    assert "stage_timing" not in _unit_by_id(reset_state, "queue_context")
+
+
+def test_schedule_simulation_report_compares_predicted_and_actual_makespan(tmp_path):
+    dag_path = _write_branching_contract_repo(tmp_path)
+    engine = dag_run_engine.DagRunEngine(
+        repo_root=tmp_path / "repo",
+        lab_dir=tmp_path / "lab",
+        dag_path=dag_path,
+        stage_run_fns={
+            "uav_queue_project.queue_context": _contract_stage("queue_context"),
+            "flight_telemetry_project.flight_context": _contract_stage("flight_context"),
+            "weather_forecast_project.joined_review": _contract_stage("joined_review"),
+        },
+        attempt_id_fn=lambda: "simulated",
+    )
+    state, _state_path, _dag_path = engine.load_or_create_state()
+    observed_revision = dag_run_engine.runner_state_revision(state)
+    state["stage_duration_history"] = [
+        {"unit_id": "queue_context", "app": "uav_queue_project", "duration_seconds": 3.0},
+        {"unit_id": "flight_context", "app": "flight_telemetry_project", "duration_seconds": 1.0},
+        {"unit_id": "joined_review", "app": "weather_forecast_project", "duration_seconds": 4.0},
+    ]
+    engine.write_state(state, expected_revision=observed_revision)
+
+    planned = engine.schedule_simulation_report(state, max_workers=1)
+    assert planned["schema"] == "agilab.dag_schedule_simulation.v1"
+    assert planned["critical_path"] == ["flight_context", "joined_review"]
+    assert planned["critical_path_seconds"] == 5.0
+    assert planned["predicted_makespan_seconds"] == 8.0
+    assert planned["actual_makespan_seconds"] is None
+    assert {stage["unit_id"]: stage["predicted_start_seconds"] for stage in planned["stages"]} == {
+        "flight_context": 0.0,
+        "joined_review": 1.0,
+        "queue_context": 5.0,
+    }
+
+    result = engine.run_ready_controlled_stages(
+        state,
+        max_workers=2,
+        schedule=dag_run_engine.GLOBAL_DAG_STAGE_SCHEDULE_CONTINUOUS,
+    )
+    report = engine.schedule_simulation_report(result.state, max_workers=2)
+
+    # The run's own records do not predict themselves.
+    assert report["history_records"] == 3
+    assert report["predicted_makespan_seconds"] == 5.0
+    assert report["actual_makespan_seconds"] is not None
+    assert report["prediction_error_seconds"] == pytest.approx(5.0 - report["actual_makespan_seconds"])
+    assert all(stage["actual_seconds"] is not None for stage in report["stages"])
+
+
+def test_stage_duration_model_scales_with_input_size():
+    durations = importlib.import_module("agilab.dag.dag_stage_durations")
+    model = durations.StageDurationModel(
+        records=(
+            {"unit_id": "a", "app": "flight_telemetry_project", "input_bytes": 1000, "duration_seconds": 2.0},
+            {"unit_id": "b", "app": "flight_telemetry_project", "input_bytes": 3000, "duration_seconds": 6.0},
+            {"unit_id": "c", "app": "uav_queue_project", "input_bytes": None, "duration_seconds": 5.0},
+        )
+    )
+
+    assert model.estimate(app="flight_telemetry_project", input_bytes=2000) == pytest.approx(4.0)
+    assert model.estimate(app="flight_telemetry_project", unit_id="a") == pytest.approx(2.0)
+    assert model.estimate(app="uav_queue_project", input_bytes=10) == pytest.approx(5.0)
+    assert model.estimate(app="unknown_project") == pytest.approx(5.0)
+    assert durations.StageDurationModel().estimate(app="unknown_project") == 1.0
+
+
 def test_dag_run_engine_runs_ready_contract_stages_through_distributed_submitter(tmp_path):
     dag_path = _write_parallel_contract_repo(tmp_path)
     repo_root = tmp_path / "repo"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import multiprocessing
 import os
 import stat
@@ -567,3 +568,92 @@ def test_runner_state_transaction_serializes_stale_multiprocess_sessions(tmp_pat
         {"kind": "created"},
         {"kind": "completed"},
     ]
+
+
+def test_journaled_runner_state_appends_one_record_per_commit(monkeypatch, tmp_path: Path) -> None:
+    module = _load_core_module()
+    monkeypatch.setenv(module.RUNNER_STATE_JOURNAL_ENV, "1")
+    monkeypatch.setenv(module.RUNNER_STATE_COMPACT_EVERY_ENV, "100")
+    state_path = tmp_path / "runner_state.json"
+    journal_path = tmp_path / ".runner_state.json.journal"
+    initial = {"units": [{"id": f"unit-{index}", "status": "runnable"} for index in range(50)], "events": []}
+    module.write_runner_state(state_path, initial)
+    snapshot_text = state_path.read_text(encoding="utf-8")
+    assert module.runner_state_revision(initial) == "journal:1"
+
+    for index in range(3):
+        with module.runner_state_transaction(
+            state_path,
+            expected_revision=f"journal:{index + 1}",
+        ) as transaction:
+            next_state = dict(transaction.state)
+            next_state["units"] = [dict(unit) for unit in transaction.state["units"]]
+            next_state["units"][index]["status"] = "completed"
+            next_state["events"] = [*transaction.state["events"], {"unit": index}]
+            transaction.commit(next_state)
+        assert transaction.revision == f"journal:{index + 2}"
+
+    records = [json.loads(line) for line in journal_path.read_text(encoding="utf-8").splitlines()]
+    assert [record["revision"] for record in records] == [2, 3, 4]
+    assert records[-1]["items"] == {
+        "events": {"length": 3, "set": {"2": {"unit": 2}}},
+        "units": {"length": 50, "set": {"2": {"id": "unit-2", "status": "completed"}}},
+    }
+    assert state_path.read_text(encoding="utf-8") == snapshot_text
+    loaded, revision = module.load_runner_state_snapshot(state_path)
+    assert revision == "journal:4"
+    assert [unit["status"] for unit in loaded["units"][:4]] == ["completed"] * 3 + ["runnable"]
+
+    with pytest.raises(module.RunnerStateConflictError, match="another session"):
+        module.write_runner_state(state_path, {"units": []}, expected_revision="journal:3")
+
+
+def test_journaled_runner_state_compacts_into_the_snapshot(monkeypatch, tmp_path: Path) -> None:
+    module = _load_core_module()
+    monkeypatch.setenv(module.RUNNER_STATE_JOURNAL_ENV, "1")
+    monkeypatch.setenv(module.RUNNER_STATE_COMPACT_EVERY_ENV, "3")
+    state_path = tmp_path / "runner_state.json"
+    journal_path = tmp_path / ".runner_state.json.journal"
+    module.write_runner_state(state_path, {"generation": 0})
+
+    for generation in range(1, 5):
+        module.write_runner_state(state_path, {"generation": generation})
+
+    # Revisions 2 and 3 were journaled, revision 4 triggered compaction and
+    # revision 5 starts the next journal segment.
+    assert json.loads(state_path.read_text(encoding="utf-8")) == {"generation": 3, "state_revision": 4}
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 1
+    assert module.load_runner_state(state_path) == {"generation": 4, "state_revision": 5}
+
+    # Without the environment flag the existing journal keeps the store journaled.
+    monkeypatch.delenv(module.RUNNER_STATE_JOURNAL_ENV)
+    module._RUNNER_STATE_JOURNAL_VIEWS.clear()
+    assert module.load_runner_state(state_path) == {"generation": 4, "state_revision": 5}
+
+
+def test_journaled_runner_state_recovers_from_torn_and_stale_records(monkeypatch, tmp_path: Path) -> None:
+    module = _load_core_module()
+    monkeypatch.setenv(module.RUNNER_STATE_JOURNAL_ENV, "1")
+    state_path = tmp_path / "runner_state.json"
+    journal_path = tmp_path / ".runner_state.json.journal"
+    module.write_runner_state(state_path, {"generation": 1})
+    module.write_runner_state(state_path, {"generation": 2})
+
+    # A crash mid-append leaves a line without its newline: it is not committed.
+    with journal_path.open("ab") as stream:
+        stream.write(b'{"assign":{"generation":')
+    module._RUNNER_STATE_JOURNAL_VIEWS.clear()
+    state, revision = module.load_runner_state_snapshot(state_path)
+    assert (state, revision) == ({"generation": 2, "state_revision": 2}, "journal:2")
+
+    module.write_runner_state(state_path, {"generation": 3}, expected_revision=revision)
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    # A crash between the snapshot replace and the journal truncation leaves
+    # records the snapshot already contains; replay skips them.
+    state_path.write_text(json.dumps({"generation": 3, "state_revision": 3}), encoding="utf-8")
+    module._RUNNER_STATE_JOURNAL_VIEWS.clear()
+    assert module.load_runner_state(state_path) == {"generation": 3, "state_revision": 3}
+    module.write_runner_state(state_path, {"generation": 4}, expected_revision="journal:3")
+    module._RUNNER_STATE_JOURNAL_VIEWS.clear()
+    assert module.load_runner_state(state_path) == {"generation": 4, "state_revision": 4}
@@ -652,6 +652,30 @@ def test_orchestrate_action_elapsed_status_updates_non_widget_state():
     assert captions[-1] == "RUN: completed in 1m 6s"
 
 
+def test_orchestrate_worker_progress_caption_reads_current_run_snapshot(tmp_path):
+    module = _load_orchestrate_page_helpers_module()
+    path = tmp_path / module.WORKER_PROGRESS_FILENAME
+    payload = {
+        "started_at": 50.0,
+        "items_total": 10,
+        "items_done": 6,
+        "items_failed": 1,
+        "items_per_second": 2.0,
+        "workers": [
+            {"worker": "w1", "items_total": 5, "items_done": 5, "eta_seconds": None},
+            {"worker": "w2", "items_total": 5, "items_done": 1, "eta_seconds": 75, "straggler": True},
+        ],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert module.read_worker_progress(path, started_after=60.0) is None
+    assert module.read_worker_progress(tmp_path / "missing.json") is None
+    snapshot = module.read_worker_progress(path, started_after=40.0)
+    assert module.worker_progress_caption(snapshot) == (
+        "Workers: 6/10 items · 1 failed · 2.0 items/s · w1 5/5 | w2 1/5 eta 1m 15s (straggler)"
+    )
+
+
 def test_orchestrate_action_label_case_policy_is_explicit():
     support = _import_agilab_module("agilab.orchestrate_page_support")
 
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from agi_node.agi_dispatcher import WorkDispatcher
+from agi_node.agi_dispatcher import partition_support
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000)
+CAPACITY_PROFILES = {
+    "uniform": (1.0,) * 8,
+    "heterogeneous": (4.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0, 0.5),
+}
+
+
+def _weighted_items(size: int, seed: int) -> list[tuple[str, float]]:
+    """Heavy-tailed work sizes, like file sizes on a shared telemetry store."""
+    rng = np.random.default_rng(seed)
+    weights = rng.lognormal(mean=0.0, sigma=1.5, size=size)
+    return [(f"work-{index}", float(weight)) for index, weight in enumerate(weights)]
+
+
+def _makespan(chunks: list[list[Any]], capacities: tuple[float, ...]) -> float:
+    return max(
+        sum(float(weight) for _label, weight in chunk) / capacity
+        for chunk, capacity in zip(chunks, capacities)
+    )
+
+
+def _timed(partitioner, items, capacities) -> tuple[float, float]:
+    started = time.perf_counter()
+    chunks = partitioner(list(items), list(capacities))
+    elapsed = time.perf_counter() - started
+    placed = sorted(item for chunk in chunks for item in chunk)
+    if placed != sorted(items):
+        raise RuntimeError("partitioner dropped or duplicated work items")
+    return _makespan(chunks, capacities), elapsed
+
+
+def run_benchmark(
+    *,
+    sizes: tuple[int, ...],
+    profiles: tuple[str, ...],
+    time_budget: float,
+    seed: int,
+) -> dict[str, Any]:
+    cases: list[dict[str, Any]] = []
+    for profile in profiles:
+        capacities = CAPACITY_PROFILES[profile]
+        for size in sizes:
+            items = _weighted_items(size, seed)
+            lower_bound = partition_support.makespan_lower_bound(
+                [weight for _label, weight in items], np.array(capacities)
+            )
+            lpt_makespan, lpt_seconds = _timed(WorkDispatcher._make_chunks_fastest, items, capacities)
+            anytime_makespan, anytime_seconds = _timed(
+                lambda subsets, caps: WorkDispatcher._make_chunks_anytime(subsets, caps, time_budget),
+                items,
+                capacities,
+            )
+            cases.append(
+                {
+                    "profile": profile,
+                    "items": size,
+                    "lower_bound": lower_bound,
+                    "lpt_makespan": lpt_makespan,
+                    "lpt_seconds": lpt_seconds,
+                    "anytime_makespan": anytime_makespan,
+                    "anytime_seconds": anytime_seconds,
+                }
+            )
+
+    return {
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "time_budget_seconds": time_budget,
+            "seed": seed,
+            "capacity_profiles": {profile: list(CAPACITY_PROFILES[profile]) for profile in profiles},
+            "workload": "lognormal(0, 1.5) work sizes",
+        },
+        "cases": cases,
+    }
+
+
+def _rows_for_csv(results: dict[str, Any]) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for case in results["cases"]:
+        lower_bound = float(case["lower_bound"])
+        lpt = float(case["lpt_makespan"])
+        anytime = float(case["anytime_makespan"])
+        rows.append(
+            {
+                "profile": case["profile"],
+                "items": case["items"],
+                "lpt_makespan": f"{lpt:.6f}",
+                "anytime_makespan": f"{anytime:.6f}",
+                "lpt_gap_pct": f"{(lpt / lower_bound - 1) * 100:.4f}" if lower_bound else "",
+                "anytime_gap_pct": f"{(anytime / lower_bound - 1) * 100:.4f}" if lower_bound else "",
+                "makespan_reduction_pct": f"{(1 - anytime / lpt) * 100:.4f}" if lpt else "",
+                "lpt_seconds": f"{float(case['lpt_seconds']):.6f}",
+                "anytime_seconds": f"{float(case['anytime_seconds']):.6f}",
+            }
+        )
+    return rows
+
+
+def _write_csv(path: Path, results: dict[str, Any]) -> None:
+    rows = _rows_for_csv(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(
+            fh,
+            fieldnames=[
+                "profile",
+                "items",
+                "lpt_makespan",
+                "anytime_makespan",
+                "lpt_gap_pct",
+                "anytime_gap_pct",
+                "makespan_reduction_pct",
+                "lpt_seconds",
+                "anytime_seconds",
+            ],
+            lineterminator="\n",
+        )
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the makespan of WorkDispatcher's LPT and anytime "
+            "partitioners against the capacity lower bound."
+        )
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=int,
+        help="Number of weighted work items (repeatable); defaults to 10..100k.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=sorted(CAPACITY_PROFILES),
+        help="Worker capacity profile (repeatable); defaults to all of them.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=partition_support.DEFAULT_PARTITION_TIME_BUDGET,
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json-out", type=Path)
+    parser.add_argument("--csv-out", type=Path)
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        sizes=tuple(args.size or DEFAULT_SIZES),
+        profiles=tuple(args.profile or CAPACITY_PROFILES),
+        time_budget=args.time_budget,
+        seed=args.seed,
+    )
+    payload = json.dumps(results, indent=2, sort_keys=True)
+    print(payload)
+
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(payload + "\n", encoding="utf-8")
+    if args.csv_out:
+        _write_csv(args.csv_out, results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
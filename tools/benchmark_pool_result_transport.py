@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import psutil
+
+from agi_node.agi_dispatcher import worker_pool_support
+from agi_node.pandas_worker import PandasWorker
+
+DEFAULT_ITEMS = 16
+DEFAULT_ROWS_PER_ITEM = 250_000
+DEFAULT_TRANSPORTS = ("pipe", "shm", "mmap")
+_SEGMENTS = ("alpha", "beta", "gamma", "delta")
+_RSS_SAMPLE_SECONDS = 0.01
+
+
+class TransportBenchWorker(PandasWorker):
+    """PandasWorker producing execution_pandas-shaped scored partitions.
+
+    Each work item is a partition index; ``work_pool`` returns the row-level
+    frame the execution_pandas worker builds before aggregation (dataset
+    columns plus the first/last score columns), which is the large result a
+    pool child would ship back to the parent.
+    """
+
+    def __init__(self, rows_per_item: int, transport: str, width: int) -> None:
+        self._worker_id = 0
+        self._mode = 1
+        self.verbose = 0
+        self.args = {
+            worker_pool_support.POOL_RESULT_TRANSPORT_ARG: transport,
+            worker_pool_support.POOL_MAX_WORKERS_ARG: width,
+        }
+        self.pool_vars = {"rows_per_item": rows_per_item}
+        self.rows_per_item = rows_per_item
+        self.result_rows = 0
+        self.result_bytes = 0
+        self.checksum = 0.0
+
+    def pool_init(self, pool_vars: dict[str, Any]) -> None:
+        self.rows_per_item = int(pool_vars["rows_per_item"])
+
+    def work_init(self) -> None:
+        return None
+
+    def stop(self) -> None:
+        return None
+
+    def _actual_work_pool(self, partition: int) -> pd.DataFrame:
+        rows = self.rows_per_item
+        rng = np.random.default_rng(partition)
+        row_idx = np.arange(rows, dtype=np.int64)
+        group_id = row_idx % 64
+        x = rng.random(rows) * 100.0 + group_id * 0.3
+        y = rng.random(rows) * 50.0
+        signal = ((row_idx % 97) - 48) * 0.15
+        weight = 1.0 + (row_idx % 11) * 0.05 + partition * 0.01
+        weighted_signal = signal * weight
+        return pd.DataFrame(
+            {
+                "row_id": row_idx + partition * rows,
+                "group_id": group_id,
+                "bucket": (group_id + partition) % 8,
+                "segment": pd.Categorical.from_codes(group_id % 4, _SEGMENTS),
+                "x": x,
+                "y": y,
+                "signal": signal,
+                "weight": weight,
+                "score_0": np.abs(x * 1.3 - y * 0.35 + weighted_signal),
+                "score_last": np.abs(x * 32.3 - y * 1.9 + weighted_signal),
+            }
+        )
+
+    def work_done(self, df: pd.DataFrame | None = None) -> None:
+        if df is None or df.empty:
+            return
+        self.result_rows += len(df)
+        self.result_bytes += int(df.memory_usage(deep=False).sum())
+        self.checksum += float(df["score_last"].sum())
+
+
+class _PeakRssSampler:
+    """Sample the parent's RSS in a background thread while a run is active."""
+
+    def __init__(self) -> None:
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self.baseline = self._process.memory_info().rss
+        self.peak = self.baseline
+
+    def _sample(self) -> None:
+        while not self._stop.wait(_RSS_SAMPLE_SECONDS):
+            self.peak = max(self.peak, self._process.memory_info().rss)
+
+    def __enter__(self) -> _PeakRssSampler:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._process.memory_info().rss)
+
+
+def _run_once(transport: str, *, items: int, rows_per_item: int, width: int, chunks: int) -> dict[str, Any]:
+    worker = TransportBenchWorker(rows_per_item, transport, width)
+    partitions = list(range(items))
+    plan = {0: [partitions[offset::chunks] for offset in range(chunks)]}
+    with _PeakRssSampler() as sampler:
+        started = time.perf_counter()
+        worker._exec_multi_process(plan, None)
+        elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "parent_peak_rss_delta_bytes": sampler.peak - sampler.baseline,
+        "result_rows": worker.result_rows,
+        "result_bytes": worker.result_bytes,
+        "checksum": worker.checksum,
+    }
+
+
+def _summarise(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    seconds = [run["seconds"] for run in runs]
+    return {
+        "median_seconds": statistics.median(seconds),
+        "min_seconds": min(seconds),
+        "max_seconds": max(seconds),
+        "parent_peak_rss_delta_bytes": max(run["parent_peak_rss_delta_bytes"] for run in runs),
+        "result_rows": runs[0]["result_rows"],
+        "result_bytes": runs[0]["result_bytes"],
+        "checksum": runs[0]["checksum"],
+    }
+
+
+def run_benchmark(
+    *,
+    transports: tuple[str, ...],
+    items: int,
+    rows_per_item: int,
+    width: int,
+    chunks: int,
+    repeats: int,
+    warmups: int,
+) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for transport in transports:
+        for _ in range(warmups):
+            _run_once(transport, items=items, rows_per_item=rows_per_item, width=width, chunks=chunks)
+        runs = [
+            _run_once(transport, items=items, rows_per_item=rows_per_item, width=width, chunks=chunks)
+            for _ in range(repeats)
+        ]
+        results[transport] = _summarise(runs)
+
+    checksums = {transport: data["checksum"] for transport, data in results.items()}
+    reference = next(iter(checksums.values()))
+    if not all(np.isclose(value, reference, rtol=1e-12) for value in checksums.values()):
+        raise RuntimeError(f"Transports produced different results: {checksums}")
+
+    baseline = results.get("pipe")
+    return {
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "items": items,
+            "rows_per_item": rows_per_item,
+            "pool_width": width,
+            "chunks": chunks,
+            "repeats": repeats,
+            "warmups": warmups,
+            "workload": "execution_pandas scored partitions",
+        },
+        "transports": results,
+        "speedup_vs_pipe": {
+            transport: baseline["median_seconds"] / data["median_seconds"]
+            for transport, data in results.items()
+            if baseline and data["median_seconds"]
+        },
+    }
+
+
+def _rows_for_csv(results: dict[str, Any]) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    speedups = results.get("speedup_vs_pipe", {})
+    for transport, data in results["transports"].items():
+        median = float(data["median_seconds"])
+        speedup = speedups.get(transport)
+        rows.append(
+            {
+                "transport": transport,
+                "median_seconds": f"{median:.6f}",
+                "min_seconds": f"{float(data['min_seconds']):.6f}",
+                "max_seconds": f"{float(data['max_seconds']):.6f}",
+                "result_mib_per_second": (
+                    f"{int(data['result_bytes']) / median / 2**20:.1f}" if median else ""
+                ),
+                "parent_peak_rss_delta_mib": f"{int(data['parent_peak_rss_delta_bytes']) / 2**20:.1f}",
+                "speedup_vs_pipe": f"{speedup:.2f}" if speedup else "",
+            }
+        )
+    return rows
+
+
+def _write_csv(path: Path, results: dict[str, Any]) -> None:
+    rows = _rows_for_csv(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(
+            fh,
+            fieldnames=[
+                "transport",
+                "median_seconds",
+                "min_seconds",
+                "max_seconds",
+                "result_mib_per_second",
+                "parent_peak_rss_delta_mib",
+                "speedup_vs_pipe",
+            ],
+            lineterminator="\n",
+        )
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare pickle-over-pipe and shared-memory result transports of the "
+            "PandasWorker process pool on execution_pandas-shaped results."
+        )
+    )
+    parser.add_argument("--items", type=int, default=DEFAULT_ITEMS)
+    parser.add_argument("--rows-per-item", type=int, default=DEFAULT_ROWS_PER_ITEM)
+    parser.add_argument("--width", type=int, default=min(os.cpu_count() or 1, 8))
+    parser.add_argument("--chunks", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--warmups", type=int, default=1)
+    parser.add_argument(
+        "--transport",
+        action="append",
+        choices=worker_pool_support.POOL_RESULT_TRANSPORTS,
+        help="Transport to measure (repeatable); defaults to all of them.",
+    )
+    parser.add_argument("--json-out", type=Path)
+    parser.add_argument("--csv-out", type=Path)
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        transports=tuple(args.transport or DEFAULT_TRANSPORTS),
+        items=args.items,
+        rows_per_item=args.rows_per_item,
+        width=args.width,
+        chunks=args.chunks,
+        repeats=args.repeats,
+        warmups=args.warmups,
+    )
+    payload = json.dumps(results, indent=2, sort_keys=True)
+    print(payload)
+
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(payload + "\n", encoding="utf-8")
+    if args.csv_out:
+        _write_csv(args.csv_out, results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
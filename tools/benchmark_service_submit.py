@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from agi_cluster.agi_distributor.service import service_lifecycle_support, service_runtime_support
+from agi_node.agi_dispatcher import WorkDispatcher
+
+DEFAULT_REQUESTS = 200
+DEFAULT_DISTINCT_ARGS = 4
+DEFAULT_WORKERS = 4
+DEFAULT_PLAN_MS = 5.0
+DEFAULT_DONE_FILES = 2000
+DEFAULT_REPEATS = 3
+
+
+class _BenchService:
+    """Service state of a running ``AGI`` for ``service_lifecycle_support``.
+
+    The queue lives in a temporary directory and the Dask client is a stub:
+    only the submission path (planning, task files, cleanup) is measured.
+    """
+
+    def __init__(self, queue_root: Path, workers: list[str]) -> None:
+        self.env = SimpleNamespace()
+        self._args: dict[str, Any] = {}
+        self._workers = {"127.0.0.1": len(workers)}
+        self._worker_default = dict(self._workers)
+        self._work_plan = None
+        self._work_plan_metadata = None
+        self._dask_client = SimpleNamespace(status="running")
+        self._service_workers = list(workers)
+        self._service_futures = {worker: None for worker in workers}
+        self._service_submit_counter = 0
+        self._service_queue_root = None
+        self._service_cleanup_done_ttl_sec = 7 * 86400.0
+        self._service_cleanup_failed_ttl_sec = 14 * 86400.0
+        self._service_cleanup_heartbeat_ttl_sec = 86400.0
+        self._service_cleanup_done_max_files = 1_000_000
+        self._service_cleanup_failed_max_files = 1_000_000
+        self._service_cleanup_heartbeat_max_files = 1_000_000
+        service_runtime_support.service_apply_queue_root(self, queue_root, create=True)
+
+    def _init_service_queue(self, _env: Any) -> None:
+        return None
+
+    def _service_public_args(self, args: dict[str, Any] | None) -> dict[str, Any]:
+        return service_runtime_support.service_public_args(args)
+
+    def _service_safe_worker_name(self, worker: str) -> str:
+        return service_runtime_support.service_safe_worker_name(worker)
+
+    def _wrap_worker_chunk(self, payload: Any, worker_index: int) -> Any:
+        return service_runtime_support.wrap_worker_chunk(payload, worker_index)
+
+    def _service_cleanup_artifacts(self) -> dict[str, int]:
+        return service_runtime_support.service_cleanup_artifacts(self)
+
+
+def _synthetic_planner(plan_ms: float, nb_workers: int):
+    """Stand-in for ``WorkDispatcher._do_distrib``: blocks like target planning does."""
+
+    async def _do_distrib(_env: Any, workers: dict[str, int], args: dict[str, Any]):
+        time.sleep(plan_ms / 1000.0)
+        seed = int(args.get("seed", 0))
+        plan = [[[f"item-{seed}-{worker}-{step}" for step in range(8)]] for worker in range(nb_workers)]
+        metadata = [[{"seed": seed, "worker": worker}] for worker in range(nb_workers)]
+        return workers, plan, metadata
+
+    return _do_distrib
+
+
+def _requests(count: int, distinct_args: int) -> list[dict[str, Any]]:
+    return [
+        {"task_id": f"bench-{index:06d}", "seed": index % max(distinct_args, 1), "scale": 2}
+        for index in range(count)
+    ]
+
+
+def _seed_done_files(service: _BenchService, count: int) -> None:
+    done_dir = service._service_queue_done
+    for index in range(count):
+        (done_dir / f"{index:06d}-done-000-worker.task.json").write_text("{}", encoding="utf-8")
+
+
+async def _submit_each(service: _BenchService, requests: list[dict[str, Any]]) -> None:
+    for request in requests:
+        await service_lifecycle_support.submit(service, service.env, **request)
+
+
+async def _submit_many(service: _BenchService, requests: list[dict[str, Any]]) -> None:
+    await service_lifecycle_support.submit_many(service, requests, service.env)
+
+
+def _measure(
+    mode: str,
+    *,
+    requests: list[dict[str, Any]],
+    workers: list[str],
+    done_files: int,
+) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="agilab-submit-bench-") as tmp:
+        service = _BenchService(Path(tmp) / "queue", workers)
+        _seed_done_files(service, done_files)
+        runner = _submit_each if mode == "submit" else _submit_many
+        started_at = time.perf_counter()
+        asyncio.run(runner(service, requests))
+        seconds = time.perf_counter() - started_at
+        queued = sum(1 for _ in service._service_queue_pending.glob("*/*.task.json"))
+    return {"seconds": seconds, "queued_files": queued}
+
+
+def run_benchmark(
+    *,
+    requests: int = DEFAULT_REQUESTS,
+    distinct_args: int = DEFAULT_DISTINCT_ARGS,
+    workers: int = DEFAULT_WORKERS,
+    plan_ms: float = DEFAULT_PLAN_MS,
+    done_files: int = DEFAULT_DONE_FILES,
+    repeats: int = DEFAULT_REPEATS,
+) -> dict[str, Any]:
+    worker_names = [f"127.0.0.1:{8787 + index}" for index in range(workers)]
+    batch = _requests(requests, distinct_args)
+    original = WorkDispatcher.__dict__["_do_distrib"]
+    WorkDispatcher._do_distrib = staticmethod(_synthetic_planner(plan_ms, workers))
+    try:
+        modes: dict[str, Any] = {}
+        for mode in ("submit", "submit_many"):
+            runs = [
+                _measure(mode, requests=batch, workers=worker_names, done_files=done_files)
+                for _ in range(repeats)
+            ]
+            seconds = [run["seconds"] for run in runs]
+            median_seconds = statistics.median(seconds)
+            modes[mode] = {
+                "median_seconds": median_seconds,
+                "min_seconds": min(seconds),
+                "max_seconds": max(seconds),
+                "submissions_per_second": requests / median_seconds if median_seconds else None,
+                "queued_files": runs[-1]["queued_files"],
+            }
+    finally:
+        WorkDispatcher._do_distrib = original
+
+    baseline = modes["submit"]["median_seconds"]
+    return {
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "parameters": {
+            "requests": requests,
+            "distinct_args": distinct_args,
+            "workers": workers,
+            "plan_ms": plan_ms,
+            "done_files": done_files,
+            "repeats": repeats,
+        },
+        "modes": modes,
+        "speedup_vs_submit": {
+            mode: baseline / stats["median_seconds"] if stats["median_seconds"] else None
+            for mode, stats in modes.items()
+        },
+    }
+
+
+def _rows_for_csv(results: dict[str, Any]) -> list[dict[str, Any]]:
+    rows = []
+    for mode, stats in results["modes"].items():
+        speedup = results["speedup_vs_submit"].get(mode)
+        rows.append(
+            {
+                "mode": mode,
+                "median_seconds": f"{stats['median_seconds']:.4f}",
+                "min_seconds": f"{stats['min_seconds']:.4f}",
+                "max_seconds": f"{stats['max_seconds']:.4f}",
+                "submissions_per_second": f"{stats['submissions_per_second']:.1f}",
+                "queued_files": stats["queued_files"],
+                "speedup_vs_submit": f"{speedup:.2f}" if speedup else "",
+            }
+        )
+    return rows
+
+
+def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-request AGI service submit with one batched submit_many call."
+    )
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--distinct-args", type=int, default=DEFAULT_DISTINCT_ARGS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--plan-ms",
+        type=float,
+        default=DEFAULT_PLAN_MS,
+        help="Simulated planning cost of one work plan, in milliseconds.",
+    )
+    parser.add_argument(
+        "--done-files",
+        type=int,
+        default=DEFAULT_DONE_FILES,
+        help="Completed task files already in the queue, scanned by every cleanup pass.",
+    )
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--json-out", type=Path)
+    parser.add_argument("--csv-out", type=Path)
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        requests=args.requests,
+        distinct_args=args.distinct_args,
+        workers=args.workers,
+        plan_ms=args.plan_ms,
+        done_files=args.done_files,
+        repeats=args.repeats,
+    )
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.csv_out:
+        _write_csv(args.csv_out, _rows_for_csv(results))
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())